@@ -10,7 +10,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import StreamingResponse, FileResponse, JSONResponse
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 from datetime import date, datetime, timedelta
 import json
 import asyncio
@@ -52,7 +52,17 @@ supabase: Client = create_client(
     os.environ['SUPABASE_SERVICE_ROLE_KEY']
 )
 
-from show_dashboard_data import run_dashboard_backtest, run_multi_strategy_backtest, dashboard_data, format_value_for_display, substitute_condition_values
+from show_dashboard_data import dashboard_data, format_value_for_display, substitute_condition_values
+from src.backtesting.backtest_session import new_session_id
+from src.backtesting.parallel_day_executor import (
+    MAX_DAY_WORKERS,
+    DayResult,
+    merge_overall_summary,
+    run_dashboard_day,
+)
+from src.jobs.job_executor import JobRejectedError, get_job_executor, run_multi_strategy_day
+from src.storage import day_results_store
+from src.storage.results_catalog import get_results_catalog
 
 # ============================================================================
 # HELPER FUNCTIONS
@@ -182,15 +192,20 @@ def map_position_to_trade(pos: dict, diagnostics: dict) -> dict:
         'exit_reason': pos.get('exit_reason')
     }
 
-def save_daily_files(strategy_id: str, date_str: str, daily_data: dict):
+def save_daily_files(strategy_id: str, date_str: str, daily_data: dict, backtest_id: Optional[str] = None):
     """
-    Save trades_daily.json.gz, diagnostics_export.json.gz
-    and update summary.jsonl for tracking completed days.
+    Save the day's trades, positions and diagnostics
+    and record the completed day in the results catalog.
+    
+    Files created (RESULTS_FORMAT=arrow, default):
+    - trades.arrow, positions.arrow, events.arrow (see day_results_store)
     
-    Files created:
+    Files created (RESULTS_FORMAT=json, legacy):
     - trades_daily.json.gz (full trades data)
     - diagnostics_export.json.gz (diagnostics data)
-    - summary.jsonl (appends line for this day with summary)
+    
+    Always:
+    - results catalog row for (strategy_id, date) with this day's summary
     """
     dir_path = get_day_dir(strategy_id, date_str)
     os.makedirs(dir_path, exist_ok=True)
@@ -211,40 +226,30 @@ def save_daily_files(strategy_id: str, date_str: str, daily_data: dict):
         ]
     }
     
-    with gzip.open(f"{dir_path}/trades_daily.json.gz", 'wt', encoding='utf-8') as f:
-        json.dump(trades_data, f, indent=2, cls=DateTimeEncoder)
-    
-    # diagnostics_export.json
-    diagnostics_data = {
-        'events_history': daily_data.get('diagnostics', {}).get('events_history', {})
-    }
+    events_history = daily_data.get('diagnostics', {}).get('events_history', {})
     
-    with gzip.open(f"{dir_path}/diagnostics_export.json.gz", 'wt', encoding='utf-8') as f:
-        json.dump(diagnostics_data, f, indent=2, cls=DateTimeEncoder)
-    
-    # Update summary.jsonl (append this day's summary)
-    # JSONL file is at the backtest ID level, same level as day folders
-    backtest_dir = os.path.dirname(dir_path)  # Goes up one level from day folder to backtest ID folder
-    summary_jsonl_path = os.path.join(backtest_dir, "summary.jsonl")
-    
-    # Create summary entry for JSONL
-    summary_entry = {
-        "date": date_str,
-        "summary": {
-            "total_trades": daily_data['summary']['total_positions'],
-            "total_pnl": f"{daily_data['summary']['total_pnl']:.2f}",
-            "winning_trades": daily_data['summary']['winning_trades'],
-            "losing_trades": daily_data['summary']['losing_trades'],
-            "win_rate": f"{daily_data['summary']['win_rate']:.2f}"
+    if day_results_store.results_format() == 'arrow':
+        day_results_store.write_day_results(dir_path, trades_data, daily_data['positions'], events_history)
+    else:
+        with gzip.open(f"{dir_path}/trades_daily.json.gz", 'wt', encoding='utf-8') as f:
+            json.dump(trades_data, f, indent=2, cls=DateTimeEncoder)
+        
+        # diagnostics_export.json
+        diagnostics_data = {
+            'events_history': events_history
         }
-    }
+        
+        with gzip.open(f"{dir_path}/diagnostics_export.json.gz", 'wt', encoding='utf-8') as f:
+            json.dump(diagnostics_data, f, indent=2, cls=DateTimeEncoder)
     
-    with open(summary_jsonl_path, 'a', encoding='utf-8') as f:
-        json.dump(summary_entry, f)
-        f.write('\n')  # Newline for JSONL format
+    # Record the completed day (one transaction; last write wins per date)
+    size_bytes = sum(entry.stat().st_size for entry in os.scandir(dir_path) if entry.is_file())
+    get_results_catalog().record_day(
+        strategy_id, date_str, summary=trades_data['summary'], path=dir_path, size_bytes=size_bytes,
+        backtest_id=backtest_id
+    )
     
     print(f"[API] Saved files for {date_str} to {dir_path}")
-    print(f"[API] Updated summary.jsonl at {summary_jsonl_path} with {date_str}")
 
 # ============================================================================
 # UI FILES GENERATION (Legacy)
@@ -389,6 +394,7 @@ class BacktestRequest(BaseModel):
     end_date: Optional[str] = Field(None, description="End date in YYYY-MM-DD format (defaults to start_date)")
     mode: str = Field("backtesting", description="Execution mode (currently only 'backtesting' supported)")
     include_diagnostics: bool = Field(True, description="Include diagnostic text in response")
+    user_id: str = Field(..., min_length=1, description="User UUID (owner of the job for per-user limits)")
 
 class BacktestResponse(BaseModel):
     success: bool
@@ -845,10 +851,23 @@ async def health_check():
         "status": "healthy",
         "service": "Backtest API",
         "version": "1.0.0",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": datetime.now().isoformat(),
+        "jobs": get_job_executor().metrics()
     }
 
 
+@app.get("/api/v1/jobs/metrics")
+async def get_job_metrics():
+    """Job executor pool size, queue depth and job counters"""
+    return get_job_executor().metrics()
+
+
+@app.on_event("shutdown")
+async def shutdown_job_executor():
+    """Stop the job executor's worker processes"""
+    get_job_executor().shutdown(wait=False)
+
+
 # ============================================================================
 # MULTI-STRATEGY BACKTEST ENDPOINT
 # ============================================================================
@@ -858,17 +877,53 @@ class MultiStrategyRequest(BaseModel):
     strategy_ids: List[str] = Field(..., description="List of strategy UUIDs to backtest")
     backtest_date: str = Field(..., description="Single date for backtesting (YYYY-MM-DD)")
     scales: Optional[Dict[str, float]] = Field(default=None, description="Optional scale multipliers per strategy_id")
+    user_id: str = Field(..., min_length=1, description="User UUID (owner of the job for per-user limits)")
 
 class MultiStrategyQueueRequest(BaseModel):
     """Request model for multi-strategy backtest from queue"""
     backtest_date: str = Field(..., description="Single date for backtesting (YYYY-MM-DD)")
+    user_id: Optional[str] = Field(None, description="User UUID owning the job (default: owner of the active queue rows)")
+
+
+def submit_job(fn, calls: list, user_id: str, **details):
+    """
+    Run backtest work in the shared job executor (process pool).
+    
+    Raises HTTPException 429 when the user is at their job limit and
+    503 when the executor queue is full.
+    """
+    try:
+        return get_job_executor().submit(fn, calls, user_id, **details)
+    except JobRejectedError as e:
+        raise HTTPException(status_code=429 if e.reason == 'user_limit' else 503, detail=str(e))
+
+
+def _split_columns(columns: Optional[str]) -> Optional[List[str]]:
+    """Comma-separated column list query parameter -> list (None = all columns)"""
+    if not columns:
+        return None
+    return [column.strip() for column in columns.split(',') if column.strip()]
 
 
 @app.get("/api/v1/backtest/trades/{strategy_id}/{date}")
-async def get_backtest_trades(strategy_id: str, date: str):
-    """Get trades_daily.json.gz for a specific backtest day."""
+async def get_backtest_trades(
+    strategy_id: str,
+    date: str,
+    columns: Optional[str] = Query(None, description="Comma-separated trade fields (default: all)"),
+    offset: int = Query(0, ge=0, description="First trade to return"),
+    limit: Optional[int] = Query(None, ge=0, description="Maximum trades to return (default: all)")
+):
+    """Get the trades_daily document for a specific backtest day."""
     try:
         dir_path = get_day_dir(strategy_id, date)
+        
+        if day_results_store.has_day_results(dir_path):
+            # Reads the file here (errors -> 500 below); only the encoding is streamed
+            return StreamingResponse(
+                day_results_store.iter_trades_json(dir_path, columns=_split_columns(columns), offset=offset, limit=limit),
+                media_type='application/json'
+            )
+        
         trades_file = f"{dir_path}/trades_daily.json.gz"
 
         if not os.path.exists(trades_file):
@@ -880,6 +935,11 @@ async def get_backtest_trades(strategy_id: str, date: str):
         with gzip.open(trades_file, 'rt', encoding='utf-8') as f:
             trades_data = json.load(f)
 
+        trades = trades_data.get('trades', [])
+        trades_data['trades'] = trades[offset:offset + limit if limit is not None else None]
+        selected = _split_columns(columns)
+        if selected is not None:
+            trades_data['trades'] = [{k: v for k, v in t.items() if k in selected} for t in trades_data['trades']]
         return trades_data
 
     except HTTPException:
@@ -890,14 +950,59 @@ async def get_backtest_trades(strategy_id: str, date: str):
             detail=f"Error loading trades: {str(e)}"
         )
 
+@app.get("/api/v1/backtest/positions/{strategy_id}/{date}")
+async def get_backtest_positions(
+    strategy_id: str,
+    date: str,
+    columns: Optional[str] = Query(None, description="Comma-separated position fields (default: all)"),
+    offset: int = Query(0, ge=0, description="First position to return"),
+    limit: Optional[int] = Query(None, ge=0, description="Maximum positions to return (default: all)")
+):
+    """Get raw positions for a specific backtest day (Arrow results only)."""
+    dir_path = get_day_dir(strategy_id, date)
+    if not day_results_store.has_day_results(dir_path):
+        raise HTTPException(
+            status_code=404,
+            detail=f"Positions not found for {strategy_id} on {date}"
+        )
+    
+    try:
+        return {'positions': day_results_store.read_positions(
+            dir_path, columns=_split_columns(columns), offset=offset, limit=limit
+        )}
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error loading positions: {str(e)}"
+        )
+
 @app.get("/api/v1/backtest/diagnostics/{strategy_id}/{date}")
-async def get_backtest_diagnostics(strategy_id: str, date: str):
+async def get_backtest_diagnostics(
+    strategy_id: str,
+    date: str,
+    node_id: Optional[str] = Query(None, description="Only this node's events"),
+    event_type: Optional[str] = Query(None, description="Only events of this type"),
+    columns: Optional[str] = Query(None, description="Comma-separated event fields (default: all)"),
+    offset: int = Query(0, ge=0, description="First event to return"),
+    limit: Optional[int] = Query(None, ge=0, description="Maximum events to return (default: all)")
+):
     """
     Get diagnostics data for a specific backtest.
     Returns the diagnostics_export.json data from saved files.
     """
     try:
         dir_path = get_day_dir(strategy_id, date)
+        filters = {key: value for key, value in (('node_id', node_id), ('event_type', event_type)) if value}
+        
+        if day_results_store.has_day_results(dir_path):
+            # Reads the file here (errors -> 500 below); only the encoding is streamed
+            return StreamingResponse(
+                day_results_store.iter_diagnostics_json(
+                    dir_path, columns=_split_columns(columns), filters=filters, offset=offset, limit=limit
+                ),
+                media_type='application/json'
+            )
+        
         diag_file = f"{dir_path}/diagnostics_export.json.gz"
         
         if not os.path.exists(diag_file):
@@ -909,6 +1014,16 @@ async def get_backtest_diagnostics(strategy_id: str, date: str):
         with gzip.open(diag_file, 'rt', encoding='utf-8') as f:
             diagnostics_data = json.load(f)
         
+        events = [
+            (exec_id, event) for exec_id, event in diagnostics_data.get('events_history', {}).items()
+            if all(event.get(key) == value for key, value in filters.items())
+        ]
+        events = events[offset:offset + limit if limit is not None else None]
+        selected = _split_columns(columns)
+        if selected is not None:
+            events = [(exec_id, {k: v for k, v in event.items() if k in selected or k == 'execution_id'})
+                      for exec_id, event in events]
+        diagnostics_data['events_history'] = dict(events)
         return diagnostics_data
         
     except HTTPException:
@@ -928,7 +1043,8 @@ async def multi_strategy_backtest(request: MultiStrategyRequest):
     Request Body:
     {
         "strategy_ids": ["uuid1", "uuid2", "uuid3"],
-        "backtest_date": "2024-10-01"
+        "backtest_date": "2024-10-01",
+        "user_id": "user-uuid"
     }
     
     Response:
@@ -978,12 +1094,21 @@ async def multi_strategy_backtest(request: MultiStrategyRequest):
         else:
             print(f"[API] Scales from request: {scales}")
         
-        # Run multi-strategy backtest
-        results = run_multi_strategy_backtest(
-            strategy_ids=request.strategy_ids,
-            backtest_date=backtest_dt,
-            scales=scales
+        # Run multi-strategy backtest in the job executor
+        job = submit_job(
+            run_multi_strategy_day,
+            [(request.strategy_ids, backtest_dt, scales)],
+            user_id=request.user_id,
+            start_date=request.backtest_date,
+            end_date=request.backtest_date
         )
+        try:
+            task = (await job.results())[0]
+        finally:
+            job.cancel()
+        if not task.ok:
+            raise Exception(task.error)
+        results = task.result
         
         print(f"[API] Multi-strategy backtest completed: {results.get('combined_summary', {})}")
         
@@ -1009,7 +1134,8 @@ async def multi_strategy_backtest_from_queue(request: MultiStrategyQueueRequest)
     
     Request Body:
     {
-        "backtest_date": "2024-10-01"
+        "backtest_date": "2024-10-01",
+        "user_id": "user-uuid"  // Optional when all active entries belong to one user
     }
     """
     try:
@@ -1054,22 +1180,39 @@ async def multi_strategy_backtest_from_queue(request: MultiStrategyQueueRequest)
                 'scale': scale
             }
         
+        # The job counts against one user's limit: the requester, else the rows' single owner
+        owners = {entry['user_id'] for entry in queue_entries.values() if entry['user_id']}
+        owner = request.user_id or (owners.pop() if len(owners) == 1 else None)
+        if not owner:
+            raise HTTPException(
+                status_code=400,
+                detail="user_id is required (active queue entries have no single owner)"
+            )
+        
         print(f"[API] Found {len(queue_ids)} active queue entries")
         print(f"[API] Queue entries: {[(qid, qe['actual_strategy_id'], qe.get('broker_connection_id')) for qid, qe in queue_entries.items()]}")
         print(f"[API] Scales: {scales}")
         
-        # Update status to 'running' for all active strategies
-        supabase.table('multi_strategy_queue').update({'status': 'running'}).eq('is_active', 1).execute()
-        
         # Run multi-strategy backtest with queue_entries
         # queue_ids are used as strategy_ids, queue_entries provides mapping to actual strategy configs
-        results = run_multi_strategy_backtest(
-            strategy_ids=queue_ids,  # queue_ids become strategy_ids
-            backtest_date=backtest_dt,
-            scales=scales,
-            queue_entries=queue_entries  # Mapping for actual strategy loading
+        job = submit_job(
+            run_multi_strategy_day,
+            [(queue_ids, backtest_dt, scales, queue_entries)],  # queue_ids become strategy_ids
+            user_id=owner,
+            start_date=request.backtest_date,
+            end_date=request.backtest_date
         )
         
+        # Update status to 'running' for all active strategies
+        supabase.table('multi_strategy_queue').update({'status': 'running'}).eq('is_active', 1).execute()
+        try:
+            task = (await job.results())[0]
+        finally:
+            job.cancel()
+        if not task.ok:
+            raise Exception(task.error)
+        results = task.result
+        
         # Update status to 'completed' for all processed strategies
         supabase.table('multi_strategy_queue').update({'status': 'completed'}).eq('is_active', 1).execute()
         
@@ -1102,7 +1245,8 @@ async def run_backtest(request: BacktestRequest):
         "start_date": "2024-10-29",
         "end_date": "2024-10-31",  // Optional, defaults to start_date
         "mode": "backtesting",
-        "include_diagnostics": true  // Optional, defaults to true
+        "include_diagnostics": true,  // Optional, defaults to true
+        "user_id": "user-uuid"
     }
     
     Response includes:
@@ -1159,11 +1303,30 @@ async def run_backtest(request: BacktestRequest):
             'days_tested': len(date_range)
         }
         
-        for test_date in date_range:
-            print(f"[API] Running backtest for {test_date}")
+        # Run the days in the job executor (process pool, off the event loop);
+        # the days of this request share one BacktestSession per worker
+        session_id = new_session_id()
+        job = submit_job(
+            run_dashboard_day,
+            [(request.strategy_id, test_date, session_id) for test_date in date_range],
+            user_id=request.user_id,
+            strategy_id=request.strategy_id,
+            start_date=request.start_date,
+            end_date=request.end_date or request.start_date
+        )
+        
+        try:
+            day_tasks = await job.results()
+        finally:
+            job.cancel()
+        
+        for task in day_tasks:
+            test_date = task.args[1]
+            print(f"[API] Backtest finished for {test_date}")
             
-            # Run backtest for this date
-            daily_data = run_dashboard_backtest(request.strategy_id, test_date)
+            if not task.ok:
+                raise Exception(f"Backtest failed for {test_date}: {task.error}")
+            daily_data = task.result
             
             # Generate diagnostic text for each transaction
             position_numbers = {}
@@ -1229,7 +1392,7 @@ async def run_backtest(request: BacktestRequest):
         
         # Generate UI files (trades_daily.json and diagnostics_export.json) for reference
         print("[API] Backtest complete. Generating UI files...")
-        ui_files_generated = generate_ui_files_from_diagnostics()
+        ui_files_generated = await asyncio.to_thread(generate_ui_files_from_diagnostics)
         
         # Prepare response
         response_data = {
@@ -1286,6 +1449,7 @@ async def stream_backtest(request: BacktestRequest):
     {"type": "complete", "overall_summary": {...}}
     """
     async def generate_backtest_stream():
+        job = None
         try:
             # Parse dates
             try:
@@ -1345,6 +1509,22 @@ async def stream_backtest(request: BacktestRequest):
                 'days_completed': 0
             }
             
+            # Run the days in the job executor; results are streamed in date order
+            try:
+                session_id = new_session_id()
+                job = get_job_executor().submit(
+                    run_dashboard_day,
+                    [(request.strategy_id, test_date, session_id) for test_date in date_range],
+                    user_id=request.user_id,
+                    strategy_id=request.strategy_id,
+                    start_date=request.start_date,
+                    end_date=request.end_date or request.start_date
+                )
+            except JobRejectedError as e:
+                yield json.dumps({"type": "error", "message": str(e)}) + "\n"
+                return
+            day_tasks = job.ordered()
+            
             # Stream results for each date
             for idx, test_date in enumerate(date_range, 1):
                 # Send day start event
@@ -1358,8 +1538,11 @@ async def stream_backtest(request: BacktestRequest):
                 await asyncio.sleep(0)
                 
                 try:
-                    # Run backtest for this date
-                    daily_data = run_dashboard_backtest(request.strategy_id, test_date)
+                    # Wait for this date's result
+                    task = await day_tasks.__anext__()
+                    if not task.ok:
+                        raise Exception(task.error)
+                    daily_data = task.result
                     
                     # Track position numbers for this day
                     position_numbers = {}
@@ -1431,7 +1614,7 @@ async def stream_backtest(request: BacktestRequest):
             
             # Generate UI files after completion
             print("[API] Stream complete. Generating UI files...")
-            ui_files_generated = generate_ui_files_from_diagnostics()
+            ui_files_generated = await asyncio.to_thread(generate_ui_files_from_diagnostics)
             
             # Send completion event
             complete_event = {
@@ -1450,6 +1633,10 @@ async def stream_backtest(request: BacktestRequest):
                 "traceback": traceback.format_exc()
             }
             yield json.dumps(error_event) + "\n"
+        finally:
+            # Client disconnected - drop days that have not started
+            if job is not None:
+                job.cancel()
     
     return StreamingResponse(
         generate_backtest_stream(),
@@ -1482,10 +1669,9 @@ async def get_backtest_status():
 async def get_specific_backtest_status(backtest_id: str):
     """
     Get status of a specific backtest for polling.
-    Simply reads summary.jsonl to check completion status.
+    Reads the completed days of the date range from the results catalog.
     """
     import os
-    import json
     from datetime import datetime, timedelta
     
     # Parse backtest_id to extract strategy info
@@ -1509,20 +1695,12 @@ async def get_specific_backtest_status(backtest_id: str):
     end_date_obj = datetime.strptime(end_date, '%Y-%m-%d')
     total_days = (end_date_obj - start_date_obj).days + 1
     
-    # Check summary.jsonl for completed days
-    summary_jsonl_path = os.path.join(results_dir, "summary.jsonl")
-    completed_days = []
-    
-    if os.path.exists(results_dir) and os.path.exists(summary_jsonl_path):
-        try:
-            with open(summary_jsonl_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        summary_entry = json.loads(line)
-                        completed_days.append(summary_entry)
-        except Exception as e:
-            print(f"Error reading summary.jsonl: {e}")
+    # Completed days of this date range, in date order
+    catalog = get_results_catalog()
+    if not catalog.has_days(strategy_id_only):
+        # Results written before the catalog existed
+        catalog.import_summary_jsonl(strategy_id_only, os.path.join(results_dir, "summary.jsonl"))
+    completed_days = catalog.list_days(strategy_id_only, start=start_date, end=end_date)
     
     completed_days_count = len(completed_days)
     
@@ -1846,11 +2024,17 @@ class BacktestStartRequest(BaseModel):
     initial_capital: Optional[float] = Field(100000, description="Initial capital")
     slippage_percentage: Optional[float] = Field(0.05, description="Slippage percentage")
     commission_percentage: Optional[float] = Field(0.01, description="Commission percentage")
+    max_workers: Optional[int] = Field(None, ge=1, le=MAX_DAY_WORKERS,
+                                       description="Days run in parallel (default / cap: BACKTEST_JOB_WORKERS or CPU count)")
+    user_id: str = Field(..., min_length=1, description="User UUID (owner of the job for per-user limits)")
+
+# Result-saving tasks of /start backtests (kept referenced until they finish)
+started_backtests: Set[asyncio.Task] = set()
 
 def cleanup_backtest_data(strategy_id: str):
     """
     Clean up all existing backtest data for a strategy before starting new backtest.
-    Deletes all day folders, .gz files, and resets summary.jsonl.
+    Deletes all day folders, .gz files, and the strategy's results catalog rows.
     """
     import shutil
     import glob
@@ -1870,26 +2054,19 @@ def cleanup_backtest_data(strategy_id: str):
                 except Exception as e:
                     print(f"[API WARNING] Failed to delete folder {folder}: {e}")
         
-        # Reset summary.jsonl (delete and create empty)
+        # Pre-catalog summary.jsonl (would be re-imported by the status endpoint)
         summary_file = os.path.join(strategy_dir, "summary.jsonl")
-        try:
-            if os.path.exists(summary_file):
-                os.remove(summary_file)
-                print(f"[API] Deleted old summary.jsonl")
-            
-            # Create empty summary.jsonl
-            with open(summary_file, 'w', encoding='utf-8') as f:
-                pass  # Create empty file
-            print(f"[API] Created fresh summary.jsonl")
-            
-        except Exception as e:
-            print(f"[API WARNING] Failed to reset summary.jsonl: {e}")
+        if os.path.exists(summary_file):
+            os.remove(summary_file)
         
         print(f"[API] Cleanup completed for strategy {strategy_id}")
     else:
         # Create directory if it doesn't exist
         os.makedirs(strategy_dir, exist_ok=True)
         print(f"[API] Created new directory for strategy {strategy_id}")
+    
+    deleted = get_results_catalog().delete_strategy(strategy_id)
+    print(f"[API] Removed {deleted['days']} days from results catalog")
 
 
 @app.post("/api/v1/backtest/start")
@@ -1935,84 +2112,65 @@ async def start_backtest(request: BacktestStartRequest):
         
         print(f"[API] Backtest started: {backtest_id} ({total_days} days)")
         
-        # Clean up existing data before starting new backtest
-        cleanup_backtest_data(request.strategy_id)
-        
-        # Run in background thread (non-blocking)
-        import threading
         import traceback
         
-        def run_backtest_background():
-            """Run the actual backtest processing in background"""
+        # Run the days in the shared job executor (admission control, crash recovery);
+        # rejected requests leave earlier results in place
+        session_id = new_session_id()
+        job = submit_job(
+            run_dashboard_day,
+            [(request.strategy_id, test_date, session_id) for test_date in date_range],
+            user_id=request.user_id,
+            strategy_id=request.strategy_id,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            max_in_flight=request.max_workers
+        )
+        
+        # Clean up existing data before starting new backtest
+        try:
+            cleanup_backtest_data(request.strategy_id)
+        except Exception:
+            job.cancel()
+            raise
+        
+        async def save_backtest_days():
+            """Save each day as it finishes (polled via the status endpoint)"""
             try:
-                print(f"[API] Background thread started for {backtest_id}")
-                
-                # Create results directory using existing function
-                try:
-                    results_dir = get_backtest_dir(request.strategy_id)
-                    os.makedirs(results_dir, exist_ok=True)
-                    print(f"[API] Results directory created: {results_dir}")
-                except Exception as e:
-                    print(f"[API ERROR] Failed to create results directory: {e}")
-                    # Fallback: use strategy_id directory
-                    strategy_id_only = backtest_id.split('_')[0]
-                    results_dir = os.path.join("backtest_results", strategy_id_only)
-                    os.makedirs(results_dir, exist_ok=True)
-                    print(f"[API] Using fallback directory: {results_dir}")
-                
-                # Overall tracking
-                overall_summary = {
-                    'total_positions': 0,
-                    'total_pnl': 0,
-                    'total_winning_trades': 0,
-                    'total_losing_trades': 0,
-                    'total_breakeven_trades': 0,
-                    'largest_win': 0,
-                    'largest_loss': 0,
-                    'days_tested': total_days
-                }
-                
-                # Process each day
-                for idx, test_date in enumerate(date_range, 1):
-                    print(f"[API] Processing day {idx}/{total_days}: {test_date}")
+                day_results = []
+                async for task in job:
+                    result = DayResult(task.args[1], task.index + 1, task.result, task.error)
+                    print(f"[API] Day {len(day_results) + 1}/{total_days} finished: {result.date}")
+                    
+                    if not result.ok:
+                        print(f"[API ERROR] Failed to process day {result.date}: {result.error}")
+                        continue
+                    
+                    daily_data = result.daily_data
+                    print(f"[API] Backtest completed for {result.date}, positions: {daily_data['summary']['total_positions']}")
+                    day_results.append(result)
                     
+                    # Save files to disk (records the day in the results catalog)
                     try:
-                        # Run backtest for this day
-                        print(f"[API] Running backtest for {request.strategy_id} on {test_date}")
-                        daily_data = run_dashboard_backtest(request.strategy_id, test_date)
-                        print(f"[API] Backtest completed for {test_date}, positions: {daily_data['summary']['total_positions']}")
-                        
-                        # Save files to disk (includes summary.jsonl update)
-                        try:
-                            print(f"[API] Saving files for {test_date}")
-                            save_daily_files(request.strategy_id, test_date.strftime('%Y-%m-%d'), daily_data)
-                            print(f"[API] Files saved for {test_date}")
-                        except Exception as save_error:
-                            print(f"[API WARNING] Failed to save files for {test_date}: {str(save_error)}")
-                            traceback.print_exc()
-                        
-                        # Update overall summary
-                        overall_summary['total_positions'] += daily_data['summary']['total_positions']
-                        overall_summary['total_pnl'] += daily_data['summary']['total_pnl']
-                        overall_summary['total_winning_trades'] += daily_data['summary']['winning_trades']
-                        overall_summary['total_losing_trades'] += daily_data['summary']['losing_trades']
-                        overall_summary['total_breakeven_trades'] += daily_data['summary']['breakeven_trades']
-                        overall_summary['largest_win'] = max(overall_summary['largest_win'], daily_data['summary']['largest_win'])
-                        overall_summary['largest_loss'] = min(overall_summary['largest_loss'], daily_data['summary']['largest_loss'])
-                        
-                    except Exception as e:
-                        print(f"[API ERROR] Failed to process day {test_date}: {str(e)}")
+                        await asyncio.to_thread(save_daily_files, request.strategy_id, result.date_str, daily_data, backtest_id)
+                        print(f"[API] Files saved for {result.date}")
+                    except Exception as save_error:
+                        print(f"[API WARNING] Failed to save files for {result.date}: {str(save_error)}")
                         traceback.print_exc()
                 
+                overall_summary = merge_overall_summary(day_results, total_days)
+                print(f"[API] Overall: {overall_summary['total_positions']} positions, P&L {overall_summary['total_pnl']:.2f}")
                 print(f"[API] Backtest completed: {backtest_id}")
                 
             except Exception as e:
                 print(f"[API ERROR] Background backtest failed: {str(e)}")
                 traceback.print_exc()
+                job.cancel()
         
-        background_thread = threading.Thread(target=run_backtest_background, daemon=True)
-        background_thread.start()
-        print(f"[API] Background thread started for backtest {backtest_id}")
+        saving = asyncio.create_task(save_backtest_days())
+        started_backtests.add(saving)
+        saving.add_done_callback(started_backtests.discard)
+        print(f"[API] Backtest job {job.job_id} started for {backtest_id}")
         
         return {
             "backtest_id": backtest_id,
@@ -2027,9 +2185,15 @@ async def start_backtest(request: BacktestStartRequest):
         raise HTTPException(status_code=500, detail=f"Failed to start backtest: {str(e)}")
 
 @app.get("/api/v1/backtest/{backtest_id}/stream")
-async def stream_backtest_progress(backtest_id: str):
+async def stream_backtest_progress(
+    backtest_id: str,
+    max_workers: Optional[int] = Query(None, ge=1, le=MAX_DAY_WORKERS,
+                                       description="Days run in parallel (default: BACKTEST_JOB_WORKERS or CPU count)"),
+    user_id: str = Query(..., min_length=1, description="User UUID (owner of the job for per-user limits)")
+):
     """
     Server-Sent Events stream for backtest progress.
+    Days run in parallel in the job executor; day_completed events arrive in completion order.
     
     Events:
     - day_started: {"date": "2024-10-24", "day_number": 1}
@@ -2038,6 +2202,7 @@ async def stream_backtest_progress(backtest_id: str):
     - error: {"message": "..."}
     """
     async def event_generator():
+        job = None
         try:
             # Parse backtest_id
             strategy_id, start_date, end_date = parse_backtest_id(backtest_id)
@@ -2055,21 +2220,8 @@ async def stream_backtest_progress(backtest_id: str):
             
             total_days = len(date_range)
             
-            # Overall tracking
-            overall_summary = {
-                'total_positions': 0,
-                'total_pnl': 0,
-                'total_winning_trades': 0,
-                'total_losing_trades': 0,
-                'total_breakeven_trades': 0,
-                'largest_win': 0,
-                'largest_loss': 0,
-                'days_tested': total_days
-            }
-            
-            # Process each day
+            # Queue every day up front; workers pick them up as they free
             for idx, test_date in enumerate(date_range, 1):
-                # Send day_started event
                 yield {
                     "event": "day_started",
                     "data": json.dumps({
@@ -2078,69 +2230,70 @@ async def stream_backtest_progress(backtest_id: str):
                         "total_days": total_days
                     })
                 }
+            
+            await asyncio.sleep(0)  # Allow other tasks
+            
+            # Run days in parallel in the job executor (one BacktestSession per request)
+            session_id = new_session_id()
+            job = get_job_executor().submit(
+                run_dashboard_day,
+                [(strategy_id, test_date, session_id) for test_date in date_range],
+                user_id=user_id,
+                strategy_id=strategy_id,
+                start_date=start_date,
+                end_date=end_date,
+                max_in_flight=max_workers
+            )
+            day_results = []
+            
+            async for task in job:
+                result = DayResult(task.args[1], task.index + 1, task.result, task.error)
                 
-                await asyncio.sleep(0)  # Allow other tasks
-                
-                print(f"[API] Processing day {idx}/{total_days}: {test_date}")
+                print(f"[API] Day {len(day_results) + 1}/{total_days} finished: {result.date}")
                 
-                try:
-                    # Run backtest for this day
-                    daily_data = run_dashboard_backtest(strategy_id, test_date)
-                    
-                    # Save files to disk
-                    try:
-                        save_daily_files(strategy_id, test_date.strftime('%Y-%m-%d'), daily_data)
-                    except Exception as save_error:
-                        print(f"[API WARNING] Failed to save files for {test_date}: {str(save_error)}")
-                        import traceback
-                        traceback.print_exc()
-                    
-                    # Update overall summary
-                    overall_summary['total_positions'] += daily_data['summary']['total_positions']
-                    overall_summary['total_pnl'] += daily_data['summary']['total_pnl']
-                    overall_summary['total_winning_trades'] += daily_data['summary']['winning_trades']
-                    overall_summary['total_losing_trades'] += daily_data['summary']['losing_trades']
-                    overall_summary['total_breakeven_trades'] += daily_data['summary']['breakeven_trades']
-                    overall_summary['largest_win'] = max(overall_summary['largest_win'], daily_data['summary']['largest_win'])
-                    overall_summary['largest_loss'] = min(overall_summary['largest_loss'], daily_data['summary']['largest_loss'])
-                    
-                    # Send day_completed event with summary only
-                    yield {
-                        "event": "day_completed",
-                        "data": json.dumps({
-                            "date": test_date.strftime('%Y-%m-%d'),
-                            "day_number": idx,
-                            "total_days": total_days,
-                            "summary": {
-                                "total_trades": daily_data['summary']['total_positions'],
-                                "total_pnl": f"{daily_data['summary']['total_pnl']:.2f}",
-                                "winning_trades": daily_data['summary']['winning_trades'],
-                                "losing_trades": daily_data['summary']['losing_trades'],
-                                "win_rate": f"{daily_data['summary']['win_rate']:.2f}"
-                            },
-                            "has_detail_data": True
-                        })
-                    }
-                    
-                except Exception as day_error:
-                    print(f"[API ERROR] Day {test_date} failed: {str(day_error)}")
+                if not result.ok:
+                    print(f"[API ERROR] Day {result.date} failed: {result.error}")
                     yield {
                         "event": "error",
                         "data": json.dumps({
-                            "date": test_date.strftime('%Y-%m-%d'),
-                            "error": str(day_error)
+                            "date": result.date_str,
+                            "error": result.error
                         })
                     }
+                    continue
+                
+                daily_data = result.daily_data
+                day_results.append(result)
+                
+                # Save files to disk
+                try:
+                    await asyncio.to_thread(save_daily_files, strategy_id, result.date_str, daily_data, backtest_id)
+                except Exception as save_error:
+                    print(f"[API WARNING] Failed to save files for {result.date}: {str(save_error)}")
+                    import traceback
+                    traceback.print_exc()
+                
+                # Send day_completed event with summary only
+                yield {
+                    "event": "day_completed",
+                    "data": json.dumps({
+                        "date": result.date_str,
+                        "day_number": result.day_number,
+                        "total_days": total_days,
+                        "summary": {
+                            "total_trades": daily_data['summary']['total_positions'],
+                            "total_pnl": f"{daily_data['summary']['total_pnl']:.2f}",
+                            "winning_trades": daily_data['summary']['winning_trades'],
+                            "losing_trades": daily_data['summary']['losing_trades'],
+                            "win_rate": f"{daily_data['summary']['win_rate']:.2f}"
+                        },
+                        "has_detail_data": True
+                    })
+                }
                 
                 await asyncio.sleep(0)
             
-            # Calculate overall averages
-            if overall_summary['total_winning_trades'] > 0:
-                overall_summary['overall_win_rate'] = (
-                    overall_summary['total_winning_trades'] / overall_summary['total_positions'] * 100
-                ) if overall_summary['total_positions'] > 0 else 0
-            else:
-                overall_summary['overall_win_rate'] = 0
+            overall_summary = merge_overall_summary(day_results, total_days)
             
             # Send completion event
             yield {
@@ -2168,17 +2321,29 @@ async def stream_backtest_progress(backtest_id: str):
                 "event": "error",
                 "data": json.dumps({"error": str(e)})
             }
+        finally:
+            # Client disconnected - drop days that have not started
+            if job is not None:
+                job.cancel()
     
     return EventSourceResponse(event_generator())
 
 @app.get("/api/v1/backtest/{backtest_id}/day/{date}")
-async def download_day_details(backtest_id: str, date: str):
+async def download_day_details(
+    backtest_id: str,
+    date: str,
+    file_format: str = Query('json', alias='format', description="'json' (legacy .json.gz files) or 'arrow'")
+):
     """
     Download detailed trades and diagnostics for a specific day as ZIP file.
     
     Returns: ZIP containing:
     - trades_daily.json.gz
     - diagnostics_export.json.gz
+    or, with format=arrow (days saved in the Arrow format):
+    - trades.arrow, positions.arrow, events.arrow
+    
+    Entries are stored, not deflated again: they are already compressed.
     """
     try:
         # Parse backtest_id to get strategy_id
@@ -2193,11 +2358,16 @@ async def download_day_details(backtest_id: str, date: str):
         # Get day directory
         day_dir = get_day_dir(strategy_id, date)
         
+        if file_format not in ('json', 'arrow'):
+            raise HTTPException(status_code=400, detail="Invalid format. Use 'json' or 'arrow'")
+        
         # Check if files exist
         trades_file = f"{day_dir}/trades_daily.json.gz"
         diagnostics_file = f"{day_dir}/diagnostics_export.json.gz"
+        arrow_results = day_results_store.has_day_results(day_dir)
         
-        if not os.path.exists(trades_file) or not os.path.exists(diagnostics_file):
+        if not arrow_results and (file_format == 'arrow' or not os.path.exists(trades_file)
+                                  or not os.path.exists(diagnostics_file)):
             raise HTTPException(
                 status_code=404,
                 detail=f"Data not found for {date}. Run backtest first."
@@ -2205,9 +2375,21 @@ async def download_day_details(backtest_id: str, date: str):
         
         # Create ZIP in memory
         zip_buffer = BytesIO()
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
-            zf.write(trades_file, 'trades_daily.json.gz')
-            zf.write(diagnostics_file, 'diagnostics_export.json.gz')
+        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_STORED) as zf:
+            if not arrow_results:
+                zf.write(trades_file, 'trades_daily.json.gz')
+                zf.write(diagnostics_file, 'diagnostics_export.json.gz')
+            elif file_format == 'arrow':
+                for name in (day_results_store.TRADES_FILE, day_results_store.POSITIONS_FILE,
+                             day_results_store.EVENTS_FILE):
+                    zf.write(os.path.join(day_dir, name), name)
+            else:
+                # Legacy clients: JSON streamed from the Arrow files straight into gzip entries
+                for name, chunks in (('trades_daily.json.gz', day_results_store.iter_trades_json(day_dir)),
+                                     ('diagnostics_export.json.gz', day_results_store.iter_diagnostics_json(day_dir))):
+                    with zf.open(name, 'w') as entry, gzip.GzipFile(fileobj=entry, mode='wb') as gz:
+                        for chunk in chunks:
+                            gz.write(chunk)
         
         zip_buffer.seek(0)
         
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-day setup overhead, cold engine vs warm BacktestSession
+=====================================================================
+
+Runs the same strategy over N consecutive calendar days twice in one
+process and reports the per-day setup time (engine start until tick
+loading: strategy load, strategies_agg, DataManager initialization,
+subscriptions) and the whole-day wall time.
+
+    cold - a new BacktestSession per day, with the process-wide symbol
+           cache and ClickHouse table check reset before each day
+           (the behaviour before sessions)
+    warm - one BacktestSession for all days
+
+Needs the Supabase strategy and ClickHouse data the backtests normally use.
+Days without data (weekends, holidays) still pay the setup cost and are
+included.
+
+Usage:
+    python scripts/benchmark_backtest_session.py --strategy-id <uuid> --start 2024-10-01
+    python scripts/benchmark_backtest_session.py --strategy-id <uuid> --start 2024-10-01 --days 30 \\
+        --output benchmarks/backtest_session.jsonl
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.backtesting.backtest_session import BacktestSession  # noqa: E402
+from src.backtesting.data_manager import DataManager  # noqa: E402
+from src.symbol_mapping.symbol_cache_manager import get_symbol_cache_manager  # noqa: E402
+
+
+def _reset_process_caches() -> None:
+    """Forget the symbol cache and ClickHouse table check (cold baseline)."""
+    cache = get_symbol_cache_manager()
+    cache.df = None
+    cache.df_by_broker_symbol = {}
+    cache.df_by_unified = None
+    cache.brokers_loaded = []
+    DataManager._clickhouse_tables_checked = False
+
+
+def run(strategy_id: str, dates: list, warm: bool) -> dict:
+    """Run every day; per-day setup and wall seconds."""
+    session = BacktestSession([strategy_id])
+    setup, wall = [], []
+    for test_date in dates:
+        if not warm:
+            _reset_process_caches()
+            session = BacktestSession([strategy_id])
+        started = time.perf_counter()
+        engine = session.run_day(test_date)
+        wall.append(time.perf_counter() - started)
+        setup.append(engine.setup_seconds)
+    return {
+        'mode': 'warm' if warm else 'cold',
+        'days': len(dates),
+        'median_setup_s': round(statistics.median(setup), 3),
+        'mean_setup_s': round(statistics.mean(setup), 3),
+        'first_day_setup_s': round(setup[0], 3),
+        'total_wall_s': round(sum(wall), 2),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Per-day setup overhead: cold engine vs warm session")
+    parser.add_argument('--strategy-id', required=True)
+    parser.add_argument('--start', required=True, help="first day (YYYY-MM-DD)")
+    parser.add_argument('--days', type=int, default=30)
+    parser.add_argument('--output', help="append results as one JSON line to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    start = date.fromisoformat(args.start)
+    dates = [start + timedelta(days=i) for i in range(args.days)]
+
+    results = [run(args.strategy_id, dates, warm=False), run(args.strategy_id, dates, warm=True)]
+
+    print(f"{'mode':<6} {'days':>5} {'median setup s':>15} {'mean setup s':>13} {'day 1 setup s':>14} {'total s':>9}")
+    for r in results:
+        print(f"{r['mode']:<6} {r['days']:>5} {r['median_setup_s']:>15.3f} {r['mean_setup_s']:>13.3f} "
+              f"{r['first_day_setup_s']:>14.3f} {r['total_wall_s']:>9.2f}")
+    cold, warm = results
+    saved = cold['mean_setup_s'] - warm['mean_setup_s']
+    print(f"Per-day setup saved: {saved:.3f}s ({saved * args.days:.1f}s over {args.days} days)")
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'a') as f:
+            f.write(json.dumps({
+                'timestamp': datetime.now().isoformat(timespec='seconds'),
+                'strategy_id': args.strategy_id,
+                'start': args.start,
+                'results': results,
+            }) + '\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Benchmark: row-loop vs vectorized calculate_bulk
+================================================
+
+Times the previous row-by-row (.iloc/.loc) calculate_bulk implementations
+of the pivot indicators and SupportResistanceIndicator against the current
+vectorized / kernel versions on intraday 1m frames, and checks that both
+produce the same values.
+
+The legacy_* functions are the replaced implementations, kept here as the
+reference (the only change: fillna(method='ffill') -> ffill(), which newer
+pandas requires).
+
+Usage:
+    python scripts/benchmark_bulk_kernels.py                  # 10k and 100k candles
+    python scripts/benchmark_bulk_kernels.py --sizes 10000 --legacy-limit 10000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SESSION_MINUTES = 375  # 09:15 - 15:30
+
+
+def intraday_frame(count: int, seed: int = 7) -> pd.DataFrame:
+    """Random-walk 1m candles over consecutive trading sessions (DatetimeIndex)."""
+    rng = np.random.default_rng(seed)
+    close = 22000.0 + np.cumsum(rng.normal(0.0, 8.0, count))
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    spread = np.abs(rng.normal(0.0, 4.0, count))
+
+    days = pd.bdate_range('2023-01-02', periods=count // SESSION_MINUTES + 1)
+    minute = np.arange(count)
+    timestamps = (days[minute // SESSION_MINUTES]
+                  + pd.Timedelta(hours=9, minutes=15)
+                  + pd.to_timedelta(minute % SESSION_MINUTES, unit='min'))
+
+    return pd.DataFrame({
+        'timestamp': timestamps,
+        'open': open_,
+        'high': np.maximum(open_, close) + spread,
+        'low': np.minimum(open_, close) - spread,
+        'close': close,
+        'volume': rng.integers(1_000, 50_000, count).astype(float),
+    }, index=pd.DatetimeIndex(timestamps))
+
+
+# ============================================================================
+# LEGACY IMPLEMENTATIONS (row loops)
+# ============================================================================
+
+def _legacy_period_key(df, timeframe):
+    if timeframe == 'D':
+        return df.index.date
+    elif timeframe == 'W':
+        return df.index.to_period('W')
+    elif timeframe == 'M':
+        return df.index.to_period('M')
+    return df.index.date
+
+
+def _pivot_levels(high, low, close):
+    pp = (high + low + close) / 3
+    return {'PP': pp, 'R1': (2 * pp) - low, 'R2': pp + (high - low), 'R3': high + 2 * (pp - low),
+            'S1': (2 * pp) - high, 'S2': pp - (high - low), 'S3': low - 2 * (high - pp)}
+
+
+def _cpr_levels(high, low, close):
+    pivot = (high + low + close) / 3
+    bc = (high + low) / 2
+    return {'TC': (pivot - bc) + pivot, 'PIVOT': pivot, 'BC': bc}
+
+
+def _camarilla_levels(high, low, close):
+    range_val = high - low
+    return {'H4': close + (range_val * 1.1 / 2), 'H3': close + (range_val * 1.1 / 4),
+            'H2': close + (range_val * 1.1 / 6), 'H1': close + (range_val * 1.1 / 12),
+            'L1': close - (range_val * 1.1 / 12), 'L2': close - (range_val * 1.1 / 6),
+            'L3': close - (range_val * 1.1 / 4), 'L4': close - (range_val * 1.1 / 2)}
+
+
+def _fibonacci_levels(high, low, close):
+    pp = (high + low + close) / 3
+    range_val = high - low
+    return {'PP': pp, 'R1': pp + 0.382 * range_val, 'R2': pp + 0.618 * range_val, 'R3': pp + 1.000 * range_val,
+            'S1': pp - 0.382 * range_val, 'S2': pp - 0.618 * range_val, 'S3': pp - 1.000 * range_val}
+
+
+LEGACY_PERIOD_LEVELS = {
+    'PIVOTIndicator': _pivot_levels,
+    'CPRIndicator': _cpr_levels,
+    'CAMARILLAIndicator': _camarilla_levels,
+    'FIBONACCIPIVOTIndicator': _fibonacci_levels,
+}
+
+
+def legacy_period_bulk(indicator, df: pd.DataFrame) -> pd.DataFrame:
+    """Row loop shared by the four pivot indicators (levels_fn = per-class formulas)."""
+    levels_fn = LEGACY_PERIOD_LEVELS[type(indicator).__name__]
+    columns = list(levels_fn(1.0, 1.0, 1.0))
+    result = pd.DataFrame(index=df.index)
+    period_key = _legacy_period_key(df, indicator.timeframe)
+
+    for i in range(len(df)):
+        if i == 0:
+            result.loc[df.index[i], columns] = [None] * len(columns)
+            continue
+
+        current_period = period_key[i]
+        prev_period = period_key[i-1]
+
+        if current_period != prev_period:
+            prev_data = df[period_key == prev_period]
+            high = prev_data['high'].max()
+            low = prev_data['low'].min()
+            close = prev_data['close'].iloc[-1]
+            for name, value in levels_fn(high, low, close).items():
+                result.loc[df.index[i], name] = value
+        else:
+            result.loc[df.index[i]] = result.iloc[i-1]
+
+    return result
+
+
+def legacy_support_resistance_bulk(indicator, df: pd.DataFrame) -> pd.DataFrame:
+    """Previous SupportResistanceIndicator.calculate_bulk."""
+    self = indicator
+    result = pd.DataFrame(index=df.index)
+    for col in ('support_1', 'support_2', 'support_3', 'resistance_1', 'resistance_2', 'resistance_3'):
+        result[col] = np.nan
+
+    levels = []
+
+    for i in range(len(df)):
+        if i < self.left_bars + self.right_bars:
+            continue
+
+        is_swing_high = True
+        pivot_high = df['high'].iloc[i - self.right_bars]
+        for j in range(self.left_bars):
+            if df['high'].iloc[i - self.right_bars - self.left_bars + j] >= pivot_high:
+                is_swing_high = False
+                break
+        if is_swing_high:
+            for j in range(self.right_bars):
+                if df['high'].iloc[i - self.right_bars + j + 1] >= pivot_high:
+                    is_swing_high = False
+                    break
+        if is_swing_high:
+            volume_weight = 1.0
+            if self.use_volume:
+                avg_volume = df['volume'].iloc[i - self.right_bars - self.left_bars:i].mean()
+                pivot_volume = df['volume'].iloc[i - self.right_bars]
+                volume_weight = pivot_volume / avg_volume if avg_volume > 0 else 1.0
+            levels.append({'price': pivot_high, 'type': 'resistance', 'strength': 1 * volume_weight,
+                           'touches': 1, 'index': i})
+
+        is_swing_low = True
+        pivot_low = df['low'].iloc[i - self.right_bars]
+        for j in range(self.left_bars):
+            if df['low'].iloc[i - self.right_bars - self.left_bars + j] <= pivot_low:
+                is_swing_low = False
+                break
+        if is_swing_low:
+            for j in range(self.right_bars):
+                if df['low'].iloc[i - self.right_bars + j + 1] <= pivot_low:
+                    is_swing_low = False
+                    break
+        if is_swing_low:
+            volume_weight = 1.0
+            if self.use_volume:
+                avg_volume = df['volume'].iloc[i - self.right_bars - self.left_bars:i].mean()
+                pivot_volume = df['volume'].iloc[i - self.right_bars]
+                volume_weight = pivot_volume / avg_volume if avg_volume > 0 else 1.0
+            levels.append({'price': pivot_low, 'type': 'support', 'strength': 1 * volume_weight,
+                           'touches': 1, 'index': i})
+
+        current_price = df['close'].iloc[i]
+        current_high = df['high'].iloc[i]
+        current_low = df['low'].iloc[i]
+
+        for level in levels:
+            tolerance = (df['high'].iloc[i] - df['low'].iloc[i]) * 0.02
+            if abs(current_price - level['price']) <= tolerance:
+                level['touches'] += 1
+                level['strength'] += 0.5
+            if level['type'] == 'resistance' and current_high > level['price'] * 1.01:
+                level['broken'] = True
+            elif level['type'] == 'support' and current_low < level['price'] * 0.99:
+                level['broken'] = True
+
+        levels = [l for l in levels if not l.get('broken', False)]
+        levels = sorted(levels, key=lambda x: x['strength'], reverse=True)[:self.max_levels]
+
+        support_levels = [l for l in levels if l['type'] == 'support' and l['strength'] >= self.min_strength]
+        resistance_levels = [l for l in levels if l['type'] == 'resistance' and l['strength'] >= self.min_strength]
+        support_levels = sorted(support_levels, key=lambda x: x['price'], reverse=True)[:3]
+        resistance_levels = sorted(resistance_levels, key=lambda x: x['price'])[:3]
+
+        for idx, level in enumerate(support_levels):
+            result.loc[df.index[i], f'support_{idx+1}'] = level['price']
+        for idx, level in enumerate(resistance_levels):
+            result.loc[df.index[i], f'resistance_{idx+1}'] = level['price']
+
+    return result.ffill()
+
+
+def legacy_bulk(indicator, df: pd.DataFrame) -> pd.DataFrame:
+    if type(indicator).__name__ == 'SupportResistanceIndicator':
+        return legacy_support_resistance_bulk(indicator, df)
+    return legacy_period_bulk(indicator, df)
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def _indicators():
+    from src.indicators_hybrid import (
+        PIVOTIndicator, CPRIndicator, CAMARILLAIndicator, FIBONACCIPIVOTIndicator,
+        SupportResistanceIndicator
+    )
+    return [
+        PIVOTIndicator(timeframe='D'),
+        CPRIndicator(timeframe='D'),
+        CAMARILLAIndicator(timeframe='D'),
+        FIBONACCIPIVOTIndicator(timeframe='W'),
+        SupportResistanceIndicator(),
+    ]
+
+
+def _timed(func, *args):
+    started = time.perf_counter()
+    value = func(*args)
+    return value, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Row-loop vs vectorized calculate_bulk")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000], help="candle counts")
+    parser.add_argument('--legacy-limit', type=int, default=100_000,
+                        help="skip the (slow) legacy run above this many candles")
+    args = parser.parse_args()
+
+    from src.indicators_hybrid.kernels import NUMBA_AVAILABLE
+    print(f"Numba: {'enabled' if NUMBA_AVAILABLE else 'not installed (uncompiled kernels)'}")
+
+    # Compile (or warm) kernels outside the timed runs
+    warm = intraday_frame(2 * SESSION_MINUTES)
+    for indicator in _indicators():
+        indicator.calculate_bulk(warm)
+
+    print(f"{'indicator':<28} {'candles':>8} {'legacy s':>10} {'new s':>10} {'speedup':>9} {'max abs diff':>13}")
+    for size in args.sizes:
+        df = intraday_frame(size)
+        for indicator in _indicators():
+            new, new_seconds = _timed(indicator.calculate_bulk, df)
+            if size > args.legacy_limit:
+                print(f"{type(indicator).__name__:<28} {size:>8,} {'-':>10} {new_seconds:>10.4f}")
+                continue
+
+            old, old_seconds = _timed(legacy_bulk, indicator, df)
+            diff = np.nanmax(np.abs(new.to_numpy(dtype=float) - old[new.columns].to_numpy(dtype=float)),
+                             initial=0.0)
+            print(f"{type(indicator).__name__:<28} {size:>8,} {old_seconds:>10.3f} {new_seconds:>10.4f} "
+                  f"{old_seconds / max(new_seconds, 1e-9):>8.0f}x {diff:>13.3g}")
+
+
+if __name__ == '__main__':
+    main()
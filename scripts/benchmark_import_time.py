@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cold-start import time
+=================================
+
+Imports each target in a fresh interpreter (nothing cached in sys.modules)
+and reports the median wall time, the number of modules loaded and whether
+pandas_ta got imported. API workers and backtest subprocesses pay this cost
+on every start.
+
+Targets:
+    ta_hybrid          - `import ta_hybrid` (manifest only)
+    ta_hybrid_lookup   - import + resolve one indicator class (one module)
+    indicators_hybrid  - `import src.indicators_hybrid`
+    engine             - `import src.backtesting.centralized_backtest_engine`
+
+Results can be appended to a JSON-lines file to track them over time, and
+--max-ms turns the run into a regression check.
+
+Usage:
+    python scripts/benchmark_import_time.py
+    python scripts/benchmark_import_time.py --repeat 7 --output benchmarks/import_time.jsonl
+    python scripts/benchmark_import_time.py --targets ta_hybrid --max-ms 100
+"""
+
+import argparse
+import ast
+import json
+import os
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TARGETS = {
+    'ta_hybrid': "import ta_hybrid",
+    'ta_hybrid_lookup': "import ta_hybrid; ta_hybrid._INDICATOR_REGISTRY['rsi']",
+    'indicators_hybrid': "import src.indicators_hybrid",
+    'engine': "import src.backtesting.centralized_backtest_engine",
+}
+
+_PROBE = """
+import sys, time
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+print('@@' + repr((elapsed, len(sys.modules), 'pandas_ta' in sys.modules)))
+"""
+
+
+def measure(statement: str) -> dict:
+    """Run `statement` in a fresh interpreter from the repo root."""
+    completed = subprocess.run(
+        [sys.executable, '-c', _PROBE.format(statement=statement)],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    for line in completed.stdout.splitlines():
+        if line.startswith('@@'):
+            elapsed, modules, pandas_ta_loaded = ast.literal_eval(line[2:])
+            return {'ms': elapsed * 1000, 'modules': modules, 'pandas_ta': pandas_ta_loaded}
+    raise RuntimeError(f"{statement!r} failed:\n{completed.stderr.strip()}")
+
+
+def benchmark(target: str, repeat: int) -> dict:
+    """Median of `repeat` cold imports."""
+    runs = [measure(TARGETS[target]) for _ in range(repeat)]
+    return {
+        'target': target,
+        'median_ms': round(statistics.median(r['ms'] for r in runs), 1),
+        'min_ms': round(min(r['ms'] for r in runs), 1),
+        'modules': runs[-1]['modules'],
+        'pandas_ta': runs[-1]['pandas_ta'],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Cold-start import time")
+    parser.add_argument('--targets', nargs='+', choices=sorted(TARGETS), default=list(TARGETS))
+    parser.add_argument('--repeat', type=int, default=5, help="fresh interpreters per target")
+    parser.add_argument('--output', help="append results as one JSON line to this file")
+    parser.add_argument('--max-ms', type=float, help="exit 1 if any target's median exceeds this")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'target':<20} {'median ms':>10} {'min ms':>8} {'modules':>8} {'pandas_ta':>10}")
+    for target in args.targets:
+        try:
+            result = benchmark(target, args.repeat)
+        except RuntimeError as e:
+            print(f"{target:<20} failed: {e}")
+            continue
+        results.append(result)
+        print(f"{target:<20} {result['median_ms']:>10.1f} {result['min_ms']:>8.1f} "
+              f"{result['modules']:>8} {str(result['pandas_ta']):>10}")
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'a') as f:
+            f.write(json.dumps({
+                'timestamp': datetime.now().isoformat(timespec='seconds'),
+                'python': sys.version.split()[0],
+                'results': results,
+            }) + '\n')
+
+    if args.max_ms is not None:
+        slow = [r['target'] for r in results if r['median_ms'] > args.max_ms]
+        if slow:
+            print(f"Over {args.max_ms} ms: {', '.join(slow)}")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
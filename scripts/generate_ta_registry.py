@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Generate ta_hybrid/registry_manifest.json
+=========================================
+
+The manifest lets `import ta_hybrid` resolve indicator names without
+importing src.indicators_hybrid (see ta_hybrid/registry.py). Rerun after
+adding, renaming or moving an indicator class or editing its JSON config.
+
+Usage:
+    python scripts/generate_ta_registry.py            # write the manifest
+    python scripts/generate_ta_registry.py --check    # exit 1 if it is stale
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ta_hybrid.registry import MANIFEST_PATH, build_manifest, load_manifest, write_manifest
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate the ta_hybrid registry manifest")
+    parser.add_argument('--check', action='store_true',
+                        help="exit 1 if the manifest differs from the indicator classes / configs")
+    args = parser.parse_args()
+
+    manifest = build_manifest()
+    if args.check:
+        current = load_manifest() if MANIFEST_PATH.exists() else None
+        if current != manifest:
+            print(f"{MANIFEST_PATH} is stale; run: python scripts/generate_ta_registry.py")
+            return 1
+        print(f"{MANIFEST_PATH} is up to date ({len(manifest['indicators'])} indicators)")
+        return 0
+
+    write_manifest(manifest)
+    print(f"Wrote {MANIFEST_PATH} ({len(manifest['indicators'])} indicators)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -14,6 +14,7 @@ os.environ['SUPABASE_SERVICE_ROLE_KEY'] = 'eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.
 
 from src.backtesting.centralized_backtest_engine import CentralizedBacktestEngine
 from src.backtesting.backtest_config import BacktestConfig
+from src.backtesting.backtest_session import get_backtest_session
 from datetime import date
 from src.core.gps import GlobalPositionStore
 
@@ -155,13 +156,14 @@ def track_close(self, pos_id, exit_data, tick_time=None):
 GlobalPositionStore.add_position = track_add
 GlobalPositionStore.close_position = track_close
 
-def run_dashboard_backtest(strategy_id: str, backtest_date):
+def run_dashboard_backtest(strategy_id: str, backtest_date, session_id: str = None):
     """
     Run a backtest for a specific strategy and date, returning dashboard data.
     
     Args:
         strategy_id: UUID string of the strategy
         backtest_date: date object for the backtest
+        session_id: Optional id shared by the days of one request (reuses their BacktestSession)
         
     Returns:
         Dictionary with strategy_id, positions, and summary
@@ -171,15 +173,8 @@ def run_dashboard_backtest(strategy_id: str, backtest_date):
     dashboard_data['strategy_id'] = strategy_id
     dashboard_data['backtest_date'] = backtest_date.strftime('%Y-%m-%d') if hasattr(backtest_date, 'strftime') else str(backtest_date)
     
-    # Run the backtest
-    config = BacktestConfig(
-        strategy_ids=[strategy_id],
-        backtest_date=backtest_date if isinstance(backtest_date, date) else date.fromisoformat(str(backtest_date)),
-        debug_mode=None
-    )
-    
-    engine = CentralizedBacktestEngine(config)
-    engine.run()
+    # Run the backtest (session reuses strategies / metadata loaded for earlier days of the request)
+    engine = get_backtest_session([strategy_id], session_id=session_id).run_day(backtest_date)
     
     # Extract diagnostics from engine
     diagnostics_export = {}
@@ -300,7 +295,8 @@ def _extract_flow_ids(events_history: dict, node_id: str, timestamp: str) -> lis
     
     return []
 
-def run_multi_strategy_backtest(strategy_ids: list, backtest_date, scales: dict = None, queue_entries: dict = None):
+def run_multi_strategy_backtest(strategy_ids: list, backtest_date, scales: dict = None, queue_entries: dict = None,
+                                session_id: str = None):
     """
     MULTI-STRATEGY: Run backtest for multiple strategies simultaneously.
     
@@ -310,6 +306,7 @@ def run_multi_strategy_backtest(strategy_ids: list, backtest_date, scales: dict
         scales: Optional dict of strategy_id -> scale multiplier
         queue_entries: Optional dict of queue_id -> {actual_strategy_id, broker_connection_id, user_id, scale}
                       When provided, strategy_ids should contain queue_ids
+        session_id: Optional id shared by the days of one request (reuses their BacktestSession)
         
     Returns:
         Dictionary with:
@@ -323,16 +320,9 @@ def run_multi_strategy_backtest(strategy_ids: list, backtest_date, scales: dict
     dashboard_data['backtest_date'] = backtest_date.strftime('%Y-%m-%d') if hasattr(backtest_date, 'strftime') else str(backtest_date)
     
     # Run the backtest with ALL strategies
-    config = BacktestConfig(
-        strategy_ids=strategy_ids,
-        backtest_date=backtest_date if isinstance(backtest_date, date) else date.fromisoformat(str(backtest_date)),
-        debug_mode=None,
-        scales=scales,  # Pass scales to engine config
-        queue_entries=queue_entries  # Pass queue_entries for multi-broker support
-    )
-    
-    engine = CentralizedBacktestEngine(config)
-    engine.run()
+    # (scales / queue_entries go to the engine config; queue_entries enable multi-broker support)
+    session = get_backtest_session(strategy_ids, scales=scales, queue_entries=queue_entries, session_id=session_id)
+    engine = session.run_day(backtest_date)
     
     # Build per-strategy results
     results = {
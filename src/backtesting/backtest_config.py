@@ -26,6 +26,24 @@ class BacktestConfig:
         debug_breakpoint_time: For breakpoint mode - pause at specific time (HH:MM:SS)
         strategies_agg: Optional pre-built metadata (for optimization)
         scales: Optional dict of strategy_id -> scale multiplier for quantity
+        tick_replay_mode: 'columnar' (NumPy arrays, lazy per-second dicts),
+            'streaming' (ClickHouse block stream, bounded memory) or
+            'rows' (legacy list of tick dicts grouped by second)
+        signal_prescreen: Columnar mode only - screen candle-only entry/exit
+            conditions once per day (vectorized) so signal nodes skip seconds
+            where they cannot be true
+        option_prefetch: Columnar/rows modes - load every option contract the
+            day's patterns can resolve to (spot range ATM band) in one query
+        indicator_state_resume: Restore the saved warm-up state when the
+            historical candles end on the same candles as a snapshot (skips
+            warm-up; same values as warming up)
+        indicator_state_carry_over: Also snapshot state at the end of the day
+            and let the next day continue from it. Indicator values then
+            depend on whether the previous day was replayed first - use for
+            sequential multi-day runs only
+        verify_indicator_replay: After warm-up, replay the history through a
+            fresh instance's update() and log bulk vs incremental mismatches
+            (O(candles) per indicator - debugging only)
     """
     
     # Required
@@ -47,7 +65,25 @@ class BacktestConfig:
     # Maps queue_id -> {actual_strategy_id, broker_connection_id, user_id, scale}
     # When provided, strategy_ids contains queue_ids, and actual_strategy_id is used for loading
     queue_entries: Optional[Dict[str, Dict]] = None
-    
+
+    # Optional - Tick replay mode ('columnar', 'streaming' or 'rows')
+    tick_replay_mode: str = 'columnar'
+
+    # Optional - Whole-day signal pre-screen (columnar replay only)
+    signal_prescreen: bool = True
+
+    # Optional - Batched option contract loading (columnar/rows replay)
+    option_prefetch: bool = True
+
+    # Optional - Indicator state snapshots instead of per-day warm-up
+    indicator_state_resume: bool = True
+
+    # Optional - Continue indicator state from the previous day's end (order-dependent)
+    indicator_state_carry_over: bool = False
+
+    # Optional - Bulk vs incremental replay check at warm-up (slow)
+    verify_indicator_replay: bool = False
+
     def __post_init__(self):
         """Validate configuration after initialization."""
         if not self.strategy_ids:
@@ -66,3 +102,6 @@ class BacktestConfig:
         
         if self.debug_mode == 'breakpoint' and not self.debug_breakpoint_time:
             raise ValueError("debug_breakpoint_time is required when debug_mode='breakpoint'")
+
+        if self.tick_replay_mode not in ['columnar', 'streaming', 'rows']:
+            raise ValueError("tick_replay_mode must be 'columnar', 'streaming' or 'rows'")
@@ -36,17 +36,18 @@ class BacktestEngine:
     - Generate final results
     """
     
-    def __init__(self, config: BacktestConfig):
+    def __init__(self, config: BacktestConfig, strategy_manager: StrategyManager = None):
         """
         Initialize backtest engine.
         
         Args:
             config: Backtest configuration
+            strategy_manager: Optional StrategyManager to reuse (keeps its Supabase client)
         """
         self.config = config
         
         # Initialize managers
-        self.strategy_manager = StrategyManager()
+        self.strategy_manager = strategy_manager or StrategyManager()
         self.node_manager = NodeManager()
         
         # Data components (will be initialized in run())
@@ -0,0 +1,172 @@
+"""
+Backtest Session
+================
+
+Warm state for running many days of the same strategies.
+
+Every run_dashboard_backtest call used to build a CentralizedBacktestEngine
+from scratch, so each day re-fetched the strategies from Supabase (and
+dumped them to /tmp/strategy_full_config.json), rebuilt strategies_agg,
+re-created the Supabase client and re-scanned the node graph for
+indicator / option requirements.
+
+A BacktestSession keeps what does not depend on the day:
+    - loaded strategies (StrategyMetadata) and the StrategyManager / Supabase client
+    - strategies_agg metadata
+    - per-strategy subscription templates: the strategy config with its
+      metadata already built and the scanner results (copied for each day)
+
+Each day still gets a fresh engine, so day-scoped state (GPS, node
+instances and states, candle buffers, DataManager) starts clean. The symbol
+cache and the ClickHouse client are process-wide and are loaded once per
+process by DataManager.
+
+A session belongs to one request / job and is never shared across them, so
+every request loads the strategies from Supabase as they are at that moment.
+Day tasks of the same request carry a session_id (new_session_id()); worker
+processes of the day executor / job executor keep the session for that id
+(get_backtest_session), so a worker running several days of the request
+loads the strategies once.
+
+Configuration (environment):
+    BACKTEST_SESSION_MAX  - sessions kept per process (default: 8, least recently used dropped)
+
+Usage:
+    session_id = new_session_id()
+    for test_date in dates:
+        engine = get_backtest_session(['strategy-uuid'], session_id=session_id).run_day(test_date)
+"""
+
+import copy
+import json
+import logging
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from src.backtesting.backtest_config import BacktestConfig
+
+logger = logging.getLogger(__name__)
+
+
+class BacktestSession:
+    """Strategies, metadata and subscription templates shared by the days of a run"""
+
+    def __init__(
+        self,
+        strategy_ids: List[str],
+        scales: Optional[Dict[str, float]] = None,
+        queue_entries: Optional[Dict[str, Dict]] = None,
+        **config_options: Any
+    ):
+        """
+        Initialize session (nothing is loaded until the first day runs).
+
+        Args:
+            strategy_ids: Strategy IDs (or queue_ids with queue_entries)
+            scales: Optional strategy_id -> scale multiplier
+            queue_entries: Optional queue_id -> {actual_strategy_id, broker_connection_id, user_id, scale}
+            **config_options: Other BacktestConfig fields used for every day
+        """
+        self.strategy_ids = list(strategy_ids)
+        self.scales = scales
+        self.queue_entries = queue_entries
+        self.config_options = config_options
+
+        # Filled by the first day's engine
+        self.strategy_manager = None
+        self.strategies: Optional[List[Any]] = None
+        self.strategies_agg: Optional[Dict[str, Any]] = None
+        self._subscription_templates: Dict[str, Dict[str, Any]] = {}
+
+        self.days_run = 0
+
+    def config_for(self, backtest_date: Any) -> BacktestConfig:
+        """BacktestConfig for one day (the engine takes strategies_agg from the session itself)."""
+        return BacktestConfig(
+            strategy_ids=self.strategy_ids,
+            backtest_date=backtest_date if isinstance(backtest_date, date) else date.fromisoformat(str(backtest_date)),
+            scales=self.scales,
+            queue_entries=self.queue_entries,
+            **self.config_options
+        )
+
+    def run_day(self, backtest_date: Any):
+        """
+        Run one day with a fresh engine.
+
+        Returns:
+            The CentralizedBacktestEngine after run() (for diagnostics / results)
+        """
+        from src.backtesting.centralized_backtest_engine import CentralizedBacktestEngine
+
+        engine = CentralizedBacktestEngine(self.config_for(backtest_date), session=self)
+        engine.run()
+        self.days_run += 1
+        return engine
+
+    def subscription_template(self, strategy_id: str) -> Optional[Dict[str, Any]]:
+        """Copy of the strategy's prepared config and scan results (None before the first day)."""
+        template = self._subscription_templates.get(strategy_id)
+        return copy.deepcopy(template) if template is not None else None
+
+    def save_subscription_template(self, strategy_id: str, subscription: Dict[str, Any]) -> None:
+        """Keep the config / scan results a synced subscription ended up with."""
+        if strategy_id in self._subscription_templates or 'scan_results' not in subscription:
+            return
+        self._subscription_templates[strategy_id] = copy.deepcopy({
+            'config': subscription['config'],
+            'scan_results': subscription['scan_results']
+        })
+
+
+# Per-process sessions of the requests this process is running days for
+_sessions: 'OrderedDict[str, BacktestSession]' = OrderedDict()
+_sessions_lock = threading.Lock()
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def new_session_id() -> str:
+    """Id shared by the day tasks of one request / job."""
+    return uuid.uuid4().hex
+
+
+def get_backtest_session(
+    strategy_ids: List[str],
+    scales: Optional[Dict[str, float]] = None,
+    queue_entries: Optional[Dict[str, Dict]] = None,
+    session_id: Optional[str] = None
+) -> BacktestSession:
+    """
+    Session for the days of one request.
+
+    Without session_id a fresh, uncached session is returned. Calls with the
+    same session_id (and strategies) in this process share one session;
+    other requests never see it.
+    """
+    if session_id is None:
+        return BacktestSession(strategy_ids, scales=scales, queue_entries=queue_entries)
+
+    key = json.dumps([session_id, list(strategy_ids), scales, queue_entries], sort_keys=True, default=str)
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = BacktestSession(strategy_ids, scales=scales, queue_entries=queue_entries)
+            _sessions[key] = session
+        _sessions.move_to_end(key)
+        while len(_sessions) > max(1, _env_int('BACKTEST_SESSION_MAX', 8)):
+            _sessions.popitem(last=False)
+        return session
+
+
+def clear_backtest_sessions() -> None:
+    """Drop all sessions kept by this process."""
+    with _sessions_lock:
+        _sessions.clear()
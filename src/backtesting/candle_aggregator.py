@@ -0,0 +1,350 @@
+"""
+Multi-Timeframe Candle Aggregator
+=================================
+
+Builds candles for every timeframe from one base-resolution bar per symbol.
+
+DataManager used to run one CandleBuilder per timeframe, so every index
+tick went through each builder and each recomputed its bucket start from
+the tick's datetime fields. The aggregator instead:
+
+- keeps one base bar per symbol, at the greatest common divisor of the
+  requested timeframes (1m for 1m/3m/5m, 5m for 5m/15m/1h). A tick inside
+  the current base bar is one range check plus OHLCV field updates -
+  constant in the number of timeframes;
+- rolls higher timeframes up from completed base bars. Only when a base
+  bar closes are the higher buckets resolved, with integer minute
+  arithmetic (day ordinal * 1440 + bucket minute);
+- materializes a higher timeframe's forming candle (rolled bars + current
+  base bar) only when it is read, into a dict reused per symbol.
+
+Buckets are aligned to the exchange's market open exactly like
+CandleBuilder._get_candle_start_time (NSE/BSE 09:15, MCX/NCDEX 09:00;
+ticks before the open belong to the first candle), and completed /
+forming candles are identical to running one CandleBuilder per timeframe.
+
+DataManager exposes one TimeframeCandles view per timeframe in
+candle_builders, with the CandleBuilder reading interface
+(get_current_candle, current_candles, force_complete, interval_minutes,
+market_open_hour / market_open_minute).
+"""
+
+import logging
+from datetime import timedelta
+from math import gcd
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.backtesting.candle_builder import CandleBuilder
+
+logger = logging.getLogger(__name__)
+
+_MINUTES_PER_DAY = 1440
+
+
+def bucket_start_minute(minute_of_day: int, market_open: int, interval: int) -> int:
+    """
+    Candle start (minutes after midnight) for a wall-clock minute.
+
+    Same alignment as CandleBuilder._get_candle_start_time: buckets of
+    `interval` minutes counted from `market_open`; minutes before the open
+    map to the open.
+    """
+    since_open = minute_of_day - market_open
+    if since_open < 0:
+        return market_open
+    return market_open + (since_open // interval) * interval
+
+
+class _SymbolBars:
+    """Per-symbol base bar, its time range and the rolled higher-timeframe bars."""
+
+    __slots__ = ('base', 'base_lo', 'base_hi', 'rolled', 'bucket_ids', 'forming', 'detached')
+
+    def __init__(self, timeframes: List[str]):
+        self.base: Optional[dict] = None          # Forming base bar
+        self.base_lo = None                       # Ticks in [base_lo, base_hi) belong to it
+        self.base_hi = None
+        self.rolled: Dict[str, Optional[dict]] = {tf: None for tf in timeframes}   # Completed base bars merged
+        self.bucket_ids: Dict[str, Optional[int]] = {tf: None for tf in timeframes}
+        self.forming: Dict[str, dict] = {}        # Reused forming-candle dicts per timeframe
+        self.detached: set = set()                # Force-completed mid base bar: take ticks directly
+
+
+def _new_candle(symbol: str, timeframe: str, timestamp: Any, ltp: float, volume: float) -> dict:
+    return {
+        'symbol': symbol,
+        'timeframe': timeframe,
+        'timestamp': timestamp,
+        'open': ltp,
+        'high': ltp,
+        'low': ltp,
+        'close': ltp,
+        'volume': volume
+    }
+
+
+def _merge_into(target: dict, bar: dict):
+    """Fold a later bar into an accumulated candle."""
+    if bar['high'] > target['high']:
+        target['high'] = bar['high']
+    if bar['low'] < target['low']:
+        target['low'] = bar['low']
+    target['close'] = bar['close']
+    target['volume'] += bar['volume']
+
+
+class MultiTimeframeCandleAggregator:
+    """Single base-resolution candle builder feeding every timeframe"""
+
+    def __init__(self, timeframes: List[str], exchange: str = 'NSE'):
+        """
+        Initialize aggregator.
+
+        Args:
+            timeframes: Timeframes to build (e.g., ['1m', '5m', '15m'])
+            exchange: Exchange name ('NSE', 'BSE', 'MCX') - determines market opening time
+        """
+        # Timeframe parsing and market-open table shared with CandleBuilder
+        reference = CandleBuilder(timeframe='1m', exchange=exchange)
+        self.exchange = reference.exchange
+        self.market_open_hour = reference.market_open_hour
+        self.market_open_minute = reference.market_open_minute
+        self.market_open = self.market_open_hour * 60 + self.market_open_minute
+
+        intervals = {tf: reference._parse_timeframe(tf) for tf in dict.fromkeys(timeframes)}
+        # Smallest first, so completed candles come out base -> higher
+        self.intervals: Dict[str, int] = dict(sorted(intervals.items(), key=lambda item: item[1]))
+
+        self.base_minutes = 0
+        for interval in self.intervals.values():
+            self.base_minutes = gcd(self.base_minutes, interval)
+        self.base_minutes = self.base_minutes or 1
+
+        # Requested timeframe served directly by the base bar (if any)
+        self.base_timeframe = next(
+            (tf for tf, interval in self.intervals.items() if interval == self.base_minutes), None
+        )
+        self.higher: List[str] = [tf for tf in self.intervals if tf != self.base_timeframe]
+
+        self._symbols: Dict[str, _SymbolBars] = {}
+        self.views: Dict[str, 'TimeframeCandles'] = {
+            tf: TimeframeCandles(self, tf) for tf in self.intervals
+        }
+
+        logger.debug(
+            f"MultiTimeframeCandleAggregator: {list(self.intervals)} from {self.base_minutes}m base bars, "
+            f"Exchange: {self.exchange}, Market Open: {self.market_open_hour:02d}:{self.market_open_minute:02d}"
+        )
+
+    # ------------------------------------------------------------------
+    # Tick path
+    # ------------------------------------------------------------------
+
+    def process_tick(self, tick: dict) -> List[Tuple[str, dict]]:
+        """
+        Process a tick for every timeframe.
+
+        Args:
+            tick: Tick data with symbol, timestamp, ltp (volume optional)
+
+        Returns:
+            [(timeframe, completed_candle), ...] for candles this tick closed
+            (smallest timeframe first); empty in the common case
+        """
+        symbol = tick.get('symbol')
+        timestamp = tick.get('timestamp')
+        if not symbol or not timestamp:
+            return []
+        ltp = tick.get('ltp', 0.0)
+        volume = tick.get('volume', 0)
+
+        state = self._symbols.get(symbol)
+        if state is None:
+            state = self._symbols[symbol] = _SymbolBars(self.higher)
+
+        base = state.base
+        if base is not None and state.base_lo <= timestamp < state.base_hi:
+            # Same base bar: no bucket arithmetic, no per-timeframe work
+            if ltp > base['high']:
+                base['high'] = ltp
+            if ltp < base['low']:
+                base['low'] = ltp
+            base['close'] = ltp
+            base['volume'] += volume
+            if state.detached:
+                self._update_detached(state, ltp, volume)
+            return []
+
+        return self._roll(symbol, state, timestamp, ltp, volume)
+
+    def _update_detached(self, state: _SymbolBars, ltp: float, volume: float):
+        for timeframe in state.detached:
+            rolled = state.rolled[timeframe]
+            if rolled is None:
+                state.rolled[timeframe] = _new_candle(
+                    state.base['symbol'], timeframe, self._start_for(timeframe, state.base['timestamp']),
+                    ltp, volume
+                )
+            else:
+                _merge_into(rolled, {'high': ltp, 'low': ltp, 'close': ltp, 'volume': volume})
+
+    def _roll(self, symbol: str, state: _SymbolBars, timestamp: Any, ltp: float, volume: float):
+        """Base bar boundary: close the base bar, resolve higher buckets, start the next bar."""
+        completed = []
+
+        # 1. Close the base bar and fold it into the higher timeframes
+        base = state.base
+        if base is not None:
+            if self.base_timeframe is not None:
+                completed.append((self.base_timeframe, dict(base, timeframe=self.base_timeframe)))
+            self._fold_base(state)
+
+        # 2. New base bucket (CandleBuilder alignment, on the base interval)
+        minute_of_day = timestamp.hour * 60 + timestamp.minute
+        start_minute = bucket_start_minute(minute_of_day, self.market_open, self.base_minutes)
+        start = timestamp.replace(hour=start_minute // 60, minute=start_minute % 60, second=0, microsecond=0)
+        midnight = timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+        state.base_lo = midnight if start_minute == self.market_open else start
+        state.base_hi = min(start + timedelta(minutes=self.base_minutes), midnight + timedelta(days=1))
+        day = timestamp.toordinal() * _MINUTES_PER_DAY
+
+        # 3. Higher timeframes whose bucket changed are complete
+        for timeframe in self.higher:
+            bucket_id = day + bucket_start_minute(minute_of_day, self.market_open, self.intervals[timeframe])
+            if bucket_id != state.bucket_ids[timeframe]:
+                rolled = state.rolled[timeframe]
+                if rolled is not None:
+                    completed.append((timeframe, rolled))
+                state.rolled[timeframe] = None
+                state.bucket_ids[timeframe] = bucket_id
+
+        state.base = _new_candle(symbol, self.base_timeframe, start, ltp, volume)
+        return completed
+
+    def _fold_base(self, state: _SymbolBars):
+        """Merge the finished base bar into every (non-detached) higher timeframe."""
+        base = state.base
+        for timeframe in self.higher:
+            if timeframe in state.detached:
+                continue
+            rolled = state.rolled[timeframe]
+            if rolled is None:
+                state.rolled[timeframe] = _new_candle(
+                    base['symbol'], timeframe, self._start_for(timeframe, base['timestamp']),
+                    base['open'], base['volume']
+                )
+                rolled = state.rolled[timeframe]
+                rolled['high'] = base['high']
+                rolled['low'] = base['low']
+                rolled['close'] = base['close']
+            else:
+                _merge_into(rolled, base)
+        state.detached.clear()
+        state.base = None
+
+    def _start_for(self, timeframe: str, base_start: Any) -> Any:
+        """Higher-timeframe candle start containing a base bar start."""
+        minute = bucket_start_minute(base_start.hour * 60 + base_start.minute, self.market_open,
+                                     self.intervals[timeframe])
+        return base_start.replace(hour=minute // 60, minute=minute % 60, second=0, microsecond=0)
+
+    # ------------------------------------------------------------------
+    # Forming candles
+    # ------------------------------------------------------------------
+
+    def get_current_candle(self, symbol: str, timeframe: str) -> Optional[dict]:
+        """
+        Forming candle for symbol/timeframe (None if there is none).
+
+        Higher timeframes return a dict reused across calls - copy it to keep it.
+        """
+        state = self._symbols.get(symbol)
+        if state is None:
+            return None
+        base = state.base
+        if timeframe == self.base_timeframe:
+            return base
+
+        rolled = state.rolled[timeframe]
+        if base is None or timeframe in state.detached:
+            return rolled
+
+        forming = state.forming.get(timeframe)
+        if forming is None:
+            forming = state.forming[timeframe] = {'symbol': symbol, 'timeframe': timeframe}
+        if rolled is None:
+            forming['timestamp'] = self._start_for(timeframe, base['timestamp'])
+            forming['open'] = base['open']
+            forming['high'] = base['high']
+            forming['low'] = base['low']
+            forming['volume'] = base['volume']
+        else:
+            forming['timestamp'] = rolled['timestamp']
+            forming['open'] = rolled['open']
+            forming['high'] = base['high'] if base['high'] > rolled['high'] else rolled['high']
+            forming['low'] = base['low'] if base['low'] < rolled['low'] else rolled['low']
+            forming['volume'] = rolled['volume'] + base['volume']
+        forming['close'] = base['close']
+        return forming
+
+    def force_complete(self, symbol: str, timeframe: str) -> Optional[dict]:
+        """
+        Complete the forming candle of one timeframe now.
+
+        The next tick starts a new candle for that timeframe (as with
+        CandleBuilder.force_complete); other timeframes are unaffected.
+        """
+        state = self._symbols.get(symbol)
+        if state is None:
+            return None
+
+        forming = self.get_current_candle(symbol, timeframe)
+        if forming is None:
+            return None
+        completed = dict(forming)
+
+        if timeframe == self.base_timeframe:
+            self._fold_base(state)
+            state.base_lo = state.base_hi = None
+        else:
+            # Ticks until the next base bar go straight to this timeframe
+            state.rolled[timeframe] = None
+            if state.base is not None:
+                state.detached.add(timeframe)
+        return completed
+
+
+class TimeframeCandles:
+    """CandleBuilder-compatible, read-side view of one aggregator timeframe"""
+
+    def __init__(self, aggregator: MultiTimeframeCandleAggregator, timeframe: str):
+        self.aggregator = aggregator
+        self.timeframe = timeframe
+        self.interval_minutes = aggregator.intervals[timeframe]
+        self.exchange = aggregator.exchange
+        self.market_open_hour = aggregator.market_open_hour
+        self.market_open_minute = aggregator.market_open_minute
+
+    def get_current_candle(self, symbol: str) -> Optional[dict]:
+        return self.aggregator.get_current_candle(symbol, self.timeframe)
+
+    @property
+    def current_candles(self) -> Dict[str, dict]:
+        """{symbol: forming candle} (built on access)"""
+        candles = {}
+        for symbol in self.aggregator._symbols:
+            candle = self.get_current_candle(symbol)
+            if candle is not None:
+                candles[symbol] = candle
+        return candles
+
+    def force_complete(self, symbol: str) -> Optional[dict]:
+        return self.aggregator.force_complete(symbol, self.timeframe)
+
+    def force_complete_all(self) -> Dict[str, dict]:
+        completed = {}
+        for symbol in list(self.aggregator._symbols):
+            candle = self.force_complete(symbol)
+            if candle:
+                completed[symbol] = candle
+        return completed
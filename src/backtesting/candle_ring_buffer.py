@@ -0,0 +1,339 @@
+"""
+Candle Ring Buffer
+==================
+
+Fixed-capacity, array-backed candle buffer per symbol:timeframe.
+
+DataManager used to keep the rolling candle window as a list of dicts in
+the cache: every completed candle and every forming-candle update did
+get_candles() -> rebuild list -> slice -> set_candles(). The forming path
+ran that round trip on every tick for every timeframe.
+
+CandleRingBuffer keeps the same window as float64 column arrays (OHLCV plus
+one column per indicator output) and mutates them in place:
+
+- Completed candles are appended into a 2x-capacity array; when the write
+  position reaches the end, the live window is moved back to the front
+  (amortized O(1)). The window is therefore always one contiguous slice,
+  so column() returns a zero-copy view in chronological order.
+- The forming candle lives in its own slot with an explicit flag, so the
+  "is there a forming candle?" check is O(1) instead of a dict key scan.
+  A buffer can instead read its forming candle from a source on access
+  (set_forming_source): higher timeframes built from a base bar then cost
+  nothing per tick, only per read.
+
+Readers get a CandleBufferView: a read-only sequence with the same shape
+as the old list ([completed..., forming], forming last). Indexing
+materializes a plain candle dict on demand; value() and column() read the
+arrays directly without building dicts.
+"""
+
+import math
+from collections.abc import Sequence
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+
+OHLCV_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+
+class CandleRingBuffer:
+    """Rolling window of completed candles plus one forming candle"""
+
+    def __init__(self, max_candles: int = 20):
+        """
+        Initialize ring buffer.
+
+        Args:
+            max_candles: Window size including the forming candle
+                (max_candles - 1 completed candles are retained)
+        """
+        self.max_candles = max(2, int(max_candles))
+        self.capacity = self.max_candles - 1  # Completed candles retained
+
+        size = 2 * self.capacity
+        self._columns: Dict[str, np.ndarray] = {
+            name: np.full(size, np.nan) for name in OHLCV_FIELDS
+        }
+        self._indicator_columns: Dict[str, np.ndarray] = {}
+        self._timestamps: List[Any] = [None] * size
+        self._start = 0
+        self._end = 0
+
+        # Forming candle slot (OHLCV only, never has indicators)
+        self._has_forming = False
+        self._forming: Dict[str, Any] = {}
+        self._forming_source: Optional[Callable[[], Optional[Dict[str, Any]]]] = None
+
+        # Bumped on every mutation (lets readers detect changes cheaply)
+        self.version = 0
+
+    # ========================================================================
+    # WRITES
+    # ========================================================================
+
+    def append_completed(self, candle: Dict[str, Any], indicators: Optional[Dict[str, Any]] = None):
+        """
+        Append a completed candle, evicting the oldest beyond capacity.
+
+        The forming slot is left as is (the builder replaces it on the next tick).
+
+        Args:
+            candle: Candle dict with timestamp and OHLCV
+            indicators: {indicator_key: value} computed for this candle
+        """
+        if self._end == len(self._timestamps):
+            self._compact()
+
+        pos = self._end
+        columns = self._columns
+        for name in OHLCV_FIELDS:
+            columns[name][pos] = candle[name]
+        self._timestamps[pos] = candle['timestamp']
+
+        for name, array in self._indicator_columns.items():
+            array[pos] = np.nan
+        if indicators:
+            for name, value in indicators.items():
+                self._indicator_column(name)[pos] = np.nan if value is None else value
+
+        self._end += 1
+        if self._end - self._start > self.capacity:
+            self._start += 1
+        self.version += 1
+
+    def set_forming(self, candle: Dict[str, Any]) -> bool:
+        """
+        Replace (or create) the forming candle in place.
+
+        Returns:
+            True if the forming candle changed
+        """
+        forming = self._forming
+        if (self._has_forming
+                and forming['close'] == candle['close']
+                and forming['timestamp'] == candle['timestamp']
+                and forming['high'] == candle['high']
+                and forming['low'] == candle['low']
+                and forming['volume'] == candle['volume']):
+            return False
+
+        forming['timestamp'] = candle['timestamp']
+        forming['open'] = candle['open']
+        forming['high'] = candle['high']
+        forming['low'] = candle['low']
+        forming['close'] = candle['close']
+        forming['volume'] = candle['volume']
+        self._has_forming = True
+        self.version += 1
+        return True
+
+    def set_forming_source(self, source: Optional[Callable[[], Optional[Dict[str, Any]]]]):
+        """
+        Read the forming candle from `source()` whenever it is accessed.
+
+        The source returns the current forming candle (or None to keep the
+        last one), so nobody has to push it into the buffer on every tick.
+        None detaches the source.
+        """
+        self._forming_source = source
+
+    def clear_forming(self):
+        """Drop the forming candle."""
+        self._has_forming = False
+        self._forming = {}
+        self.version += 1
+
+    def load_completed(self, candles: List[Dict[str, Any]]):
+        """
+        Replace the buffer contents with completed candles.
+
+        Args:
+            candles: Candle dicts (oldest first); indicator values nested
+                under 'indicators' as in the legacy list format
+        """
+        self._start = self._end = 0
+        self._has_forming = False
+        self._forming = {}
+        for candle in candles[-self.capacity:]:
+            self.append_completed(candle, candle.get('indicators'))
+
+    def _indicator_column(self, name: str) -> np.ndarray:
+        array = self._indicator_columns.get(name)
+        if array is None:
+            array = np.full(len(self._timestamps), np.nan)
+            self._indicator_columns[name] = array
+        return array
+
+    def _compact(self):
+        """Move the live window to the front of the arrays."""
+        start, end = self._start, self._end
+        count = end - start
+        for array in self._columns.values():
+            array[:count] = array[start:end]
+        for array in self._indicator_columns.values():
+            array[:count] = array[start:end]
+        self._timestamps[:count] = self._timestamps[start:end]
+        self._timestamps[count:] = [None] * (len(self._timestamps) - count)
+        self._start, self._end = 0, count
+
+    # ========================================================================
+    # READS
+    # ========================================================================
+
+    @property
+    def has_forming(self) -> bool:
+        if self._forming_source is not None:
+            candle = self._forming_source()
+            if candle:
+                self.set_forming(candle)
+        return self._has_forming
+
+    @property
+    def completed_count(self) -> int:
+        return self._end - self._start
+
+    def __len__(self) -> int:
+        return self.completed_count + (1 if self.has_forming else 0)
+
+    @property
+    def indicator_names(self) -> List[str]:
+        return list(self._indicator_columns)
+
+    @property
+    def last_completed_timestamp(self) -> Any:
+        """Timestamp of the newest completed candle (None if empty)."""
+        return self._timestamps[self._end - 1] if self._end > self._start else None
+
+    def view(self) -> 'CandleBufferView':
+        """Read-only view for strategies / expression evaluator."""
+        return CandleBufferView(self)
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Materialize as the legacy list of candle dicts."""
+        return [self._row(i) for i in range(len(self))]
+
+    def _resolve(self, index: int) -> int:
+        """Normalize a (possibly negative) window index."""
+        length = len(self)
+        if index < 0:
+            index += length
+        if index < 0 or index >= length:
+            raise IndexError("candle index out of range")
+        return index
+
+    def _row(self, index: int) -> Dict[str, Any]:
+        """Build a candle dict for window position `index` (non-negative)."""
+        if index == self.completed_count:
+            return dict(self._forming)
+
+        pos = self._start + index
+        row = {'timestamp': self._timestamps[pos]}
+        for name in OHLCV_FIELDS:
+            row[name] = float(self._columns[name][pos])
+
+        indicators = {}
+        for name, array in self._indicator_columns.items():
+            value = array[pos]
+            if not math.isnan(value):
+                indicators[name] = float(value)
+        row['indicators'] = indicators
+        return row
+
+    def value(self, field: str, index: int = -1) -> Optional[float]:
+        """
+        Read one field without building a candle dict.
+
+        Args:
+            field: OHLCV field or indicator key
+            index: Window index (-1 = forming/latest, -2 = previous, ...)
+
+        Returns:
+            Value, or None if missing (indicators are None on the forming candle)
+        """
+        index = self._resolve(index)
+        if index == self.completed_count:
+            value = self._forming.get(field)
+            return None if value is None else float(value)
+
+        pos = self._start + index
+        array = self._columns.get(field)
+        if array is None:
+            array = self._indicator_columns.get(field)
+            if array is None:
+                return None
+        value = array[pos]
+        return None if math.isnan(value) else float(value)
+
+    def column(self, field: str) -> Optional[np.ndarray]:
+        """
+        Read-only array of a field over the completed candles (oldest first).
+
+        Zero-copy: the returned array is a view into the buffer and is only
+        valid until the next append.
+        """
+        array = self._columns.get(field)
+        if array is None:
+            array = self._indicator_columns.get(field)
+            if array is None:
+                return None
+        window = array[self._start:self._end]
+        window.flags.writeable = False
+        return window
+
+
+class CandleBufferView(Sequence):
+    """
+    Read-only sequence over a CandleRingBuffer.
+
+    Behaves like the legacy list of candle dicts (len, negative indexing,
+    slicing, iteration); each indexed candle is a fresh dict, so callers
+    can keep or modify it without touching the buffer.
+    """
+
+    __slots__ = ('_buffer',)
+
+    def __init__(self, buffer: CandleRingBuffer):
+        self._buffer = buffer
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def __getitem__(self, index):
+        buffer = self._buffer
+        if isinstance(index, slice):
+            return [buffer._row(i) for i in range(*index.indices(len(buffer)))]
+        return buffer._row(buffer._resolve(index))
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        buffer = self._buffer
+        for i in range(len(buffer)):
+            yield buffer._row(i)
+
+    def __repr__(self) -> str:
+        return f"CandleBufferView({len(self)} candles, forming={self.has_forming})"
+
+    @property
+    def has_forming(self) -> bool:
+        return self._buffer.has_forming
+
+    @property
+    def version(self) -> int:
+        return self._buffer.version
+
+    @property
+    def completed_count(self) -> int:
+        return self._buffer.completed_count
+
+    @property
+    def last_completed_timestamp(self) -> Any:
+        return self._buffer.last_completed_timestamp
+
+    def value(self, field: str, index: int = -1) -> Optional[float]:
+        return self._buffer.value(field, index)
+
+    def column(self, field: str) -> Optional[np.ndarray]:
+        return self._buffer.column(field)
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        return self._buffer.to_list()
@@ -16,6 +16,7 @@ from typing import Dict, Any, List
 
 from src.backtesting.backtest_engine import BacktestEngine
 from src.backtesting.backtest_config import BacktestConfig
+from src.backtesting.indicator_series_registry import series_key
 from src.backtesting.results_manager import BacktestResults
 from src.core.cache_manager import CacheManager
 from src.core.centralized_tick_processor import CentralizedTickProcessor
@@ -30,15 +31,23 @@ class CentralizedBacktestEngine(BacktestEngine):
     Extends BacktestEngine to integrate CentralizedTickProcessor.
     """
     
-    def __init__(self, config: BacktestConfig, live_simulation_session=None):
+    def __init__(self, config: BacktestConfig, live_simulation_session=None, session=None):
         """
         Initialize centralized backtest engine.
         
         Args:
             config: Backtest configuration
             live_simulation_session: Optional LiveSimulationSession for real-time state updates
+            session: Optional BacktestSession - reuses strategies, strategies_agg and
+                subscription templates loaded by an earlier day
         """
-        super().__init__(config)
+        super().__init__(config, strategy_manager=session.strategy_manager if session else None)
+        
+        # Warm state shared by the days of a run
+        self.session = session
+        if session is not None and session.strategy_manager is None:
+            session.strategy_manager = self.strategy_manager
+        self.setup_seconds: float = None
         
         # Centralized components
         self.cache_manager: CacheManager = None
@@ -73,40 +82,16 @@ class CentralizedBacktestEngine(BacktestEngine):
         print("🚀 BACKTEST WITH CENTRALIZED TICK PROCESSOR")
         print("=" * 80)
         
+        run_started = datetime.now()
+        
         # Step 1: Load strategies (always as list, even for single strategy)
-        # If queue_entries provided, use actual_strategy_id for loading, then override strategy_id with queue_id
-        strategies = []
-        for strategy_id in self.config.strategy_ids:
-            # Check if this is a queue_id with queue_entries mapping
-            queue_entry = None
-            actual_strategy_id = strategy_id
-            broker_connection_id = None
-            
-            if self.config.queue_entries and strategy_id in self.config.queue_entries:
-                queue_entry = self.config.queue_entries[strategy_id]
-                actual_strategy_id = queue_entry.get('actual_strategy_id', strategy_id)
-                broker_connection_id = queue_entry.get('broker_connection_id')
-                logger.info(f"📋 Queue entry: queue_id={strategy_id}, actual_strategy_id={actual_strategy_id}, broker={broker_connection_id}")
-            
-            # Fetch strategy record using actual_strategy_id
-            strategy = self.strategy_manager.load_strategy(
-                strategy_id=actual_strategy_id,
-                broker_connection_id=broker_connection_id
-            )
-            
-            # Override strategy_id with queue_id (so all downstream uses queue_id as unique identifier)
-            if queue_entry:
-                print(f"[DEBUG] Setting strategy_id: {strategy_id} (was {strategy.strategy_id}), actual_strategy_id: {actual_strategy_id}")
-                strategy.strategy_id = strategy_id  # queue_id becomes the strategy_id
-                strategy.actual_strategy_id = actual_strategy_id  # preserve original
-                strategy.broker_connection_id = broker_connection_id
-                # Also inject user_id if provided in queue_entry
-                if queue_entry.get('user_id'):
-                    strategy.user_id = queue_entry['user_id']
-            else:
-                print(f"[DEBUG] No queue_entry for strategy_id: {strategy_id}, keeping original strategy_id: {strategy.strategy_id}")
-            
-            strategies.append(strategy)
+        if self.session is not None and self.session.strategies is not None:
+            strategies = self.session.strategies
+            logger.info(f"♻️  Reusing {len(strategies)} loaded strategy(ies) from session")
+        else:
+            strategies = self._load_strategies()
+            if self.session is not None:
+                self.session.strategies = strategies
         
         # MULTI-STRATEGY: Process ALL strategies
         self.strategies = strategies  # Store all strategies for later reference
@@ -121,12 +106,23 @@ class CentralizedBacktestEngine(BacktestEngine):
         
         # Step 2: Build metadata (strategies_agg) FROM loaded strategies
         # IMPORTANT: This metadata contains symbols, timeframes, indicators, options
-        self.strategies_agg = self._build_metadata(strategies)
+        if self.session is not None and self.session.strategies_agg is not None:
+            self.strategies_agg = self.session.strategies_agg
+            logger.info("♻️  Reusing strategies_agg from session")
+        else:
+            self.strategies_agg = self._build_metadata(strategies)
+            if self.session is not None:
+                self.session.strategies_agg = self.strategies_agg
         
         # Step 3: Initialize data components
         self._initialize_data_components(strategy)
         
         # Step 4: Initialize DataManager (uses strategies_agg)
+        if getattr(self.config, 'indicator_state_resume', True):
+            from src.storage.indicator_state_store import get_indicator_state_store
+            self.data_manager.indicator_state_store = get_indicator_state_store()
+            self.data_manager.indicator_state_carry_over = getattr(self.config, 'indicator_state_carry_over', False)
+        self.data_manager.verify_indicator_replay = getattr(self.config, 'verify_indicator_replay', False)
         self.data_manager.initialize(
             strategy=strategy,
             backtest_date=self.config.backtest_date,
@@ -149,6 +145,9 @@ class CentralizedBacktestEngine(BacktestEngine):
         for strat in strategies:
             self._subscribe_strategy_to_cache(strat)
         
+        self.setup_seconds = (datetime.now() - run_started).total_seconds()
+        logger.info(f"⏱️  Day setup took {self.setup_seconds:.2f}s")
+        
         # Step 8: Load ticks for ALL symbols across ALL strategies (MULTI-STRATEGY)
         all_symbols = set()
         for strat in strategies:
@@ -156,11 +155,34 @@ class CentralizedBacktestEngine(BacktestEngine):
         
         logger.info(f"📊 Loading ticks for {len(all_symbols)} unique symbols across {len(strategies)} strategies")
         
-        ticks = self.data_manager.load_ticks(
-            date=self.config.backtest_date,
-            symbols=list(all_symbols)
-        )
-        logger.info(f"✅ Loaded {len(ticks):,} ticks for symbols: {', '.join(sorted(all_symbols))}")
+        tick_replay_mode = getattr(self.config, 'tick_replay_mode', 'columnar')
+        if tick_replay_mode == 'columnar':
+            ticks = self.data_manager.load_ticks_columnar(
+                date=self.config.backtest_date,
+                symbols=list(all_symbols)
+            )
+        elif tick_replay_mode == 'streaming':
+            # Ticks arrive block by block while processing runs (count known at the end)
+            ticks = self.data_manager.stream_ticks(
+                date=self.config.backtest_date,
+                symbols=list(all_symbols)
+            )
+        else:
+            ticks = self.data_manager.load_ticks(
+                date=self.config.backtest_date,
+                symbols=list(all_symbols)
+            )
+        if tick_replay_mode == 'streaming':
+            logger.info(f"📡 Streaming ticks for symbols: {', '.join(sorted(all_symbols))}")
+        else:
+            logger.info(f"✅ Loaded {len(ticks):,} ticks for symbols: {', '.join(sorted(all_symbols))}")
+        
+        if tick_replay_mode == 'columnar' and getattr(self.config, 'signal_prescreen', True):
+            self._build_signal_prescreen(ticks)
+        
+        # Streaming mode has no day spot range up front: contracts load on demand
+        if tick_replay_mode != 'streaming' and getattr(self.config, 'option_prefetch', True):
+            self._prefetch_option_contracts(ticks)
         
         # Step 9: Process ticks → Update cache → Invoke strategies
         # DEBUG START: Snapshot mode support
@@ -172,10 +194,19 @@ class CentralizedBacktestEngine(BacktestEngine):
         self._process_ticks_centralized(ticks)
         end_time = datetime.now()
         
+        # End-of-day indicator state seeds the next trading day (full replays only)
+        if not self.debug_mode:
+            self.data_manager.save_indicator_states()
+        
         # Step 10: Finalize and return results
         self._finalize()
         self.centralized_processor.print_status()
         
+        prescreen = self.data_manager.signal_prescreen
+        if prescreen is not None:
+            logger.info(f"🔎 Signal pre-screen: {prescreen.stats['skipped']:,}/{prescreen.stats['checks']:,} "
+                        f"evaluations skipped, {prescreen.stats['disabled_columns']} columns disabled")
+        
         results = self.results_manager.generate_results(
             ticks_processed=len(ticks),
             duration_seconds=(end_time - start_time).total_seconds(),
@@ -184,6 +215,96 @@ class CentralizedBacktestEngine(BacktestEngine):
         
         return results
     
+    def _load_strategies(self) -> List:
+        """
+        Load every configured strategy from Supabase.
+        
+        If queue_entries are provided, actual_strategy_id is used for loading,
+        then strategy_id is overridden with the queue_id.
+        
+        Returns:
+            List of StrategyMetadata objects
+        """
+        strategies = []
+        for strategy_id in self.config.strategy_ids:
+            # Check if this is a queue_id with queue_entries mapping
+            queue_entry = None
+            actual_strategy_id = strategy_id
+            broker_connection_id = None
+            
+            if self.config.queue_entries and strategy_id in self.config.queue_entries:
+                queue_entry = self.config.queue_entries[strategy_id]
+                actual_strategy_id = queue_entry.get('actual_strategy_id', strategy_id)
+                broker_connection_id = queue_entry.get('broker_connection_id')
+                logger.info(f"📋 Queue entry: queue_id={strategy_id}, actual_strategy_id={actual_strategy_id}, broker={broker_connection_id}")
+            
+            # Fetch strategy record using actual_strategy_id
+            strategy = self.strategy_manager.load_strategy(
+                strategy_id=actual_strategy_id,
+                broker_connection_id=broker_connection_id
+            )
+            
+            # Override strategy_id with queue_id (so all downstream uses queue_id as unique identifier)
+            if queue_entry:
+                print(f"[DEBUG] Setting strategy_id: {strategy_id} (was {strategy.strategy_id}), actual_strategy_id: {actual_strategy_id}")
+                strategy.strategy_id = strategy_id  # queue_id becomes the strategy_id
+                strategy.actual_strategy_id = actual_strategy_id  # preserve original
+                strategy.broker_connection_id = broker_connection_id
+                # Also inject user_id if provided in queue_entry
+                if queue_entry.get('user_id'):
+                    strategy.user_id = queue_entry['user_id']
+            else:
+                print(f"[DEBUG] No queue_entry for strategy_id: {strategy_id}, keeping original strategy_id: {strategy.strategy_id}")
+            
+            strategies.append(strategy)
+        
+        return strategies
+    
+    def _build_signal_prescreen(self, ticks: Any):
+        """
+        Build whole-day candle-only condition screens for the signal nodes.
+        
+        Optional optimization: any failure leaves per-second evaluation as is.
+        
+        Args:
+            ticks: ColumnarTicks for the day
+        """
+        from src.backtesting.signal_prescreen import SignalPrescreen
+        
+        try:
+            self.data_manager.signal_prescreen = SignalPrescreen.from_columnar_ticks(ticks, self.data_manager)
+        except Exception as e:
+            logger.warning(f"⚠️  Signal pre-screen disabled: {e}")
+            self.data_manager.signal_prescreen = None
+    
+    def _prefetch_option_contracts(self, ticks: Any):
+        """
+        Load every option contract the day's patterns can resolve to in one query.
+        
+        Optional optimization: any failure leaves per-contract loading as is.
+        
+        Args:
+            ticks: ColumnarTicks or list of tick dicts for the day
+        """
+        option_patterns = self.strategies_agg.get('options') or []
+        if not option_patterns or not self.data_manager.clickhouse_client:
+            return
+        
+        from src.backtesting.option_prefetch import OptionPrefetchPlanner, spot_ranges_from_ticks
+        from src.data.fo_dynamic_resolver import FODynamicResolver
+        
+        try:
+            planner = OptionPrefetchPlanner(FODynamicResolver(
+                clickhouse_client=self.data_manager.clickhouse_client,
+                mode='backtesting'
+            ))
+            contract_keys = planner.plan(option_patterns, spot_ranges_from_ticks(ticks), self.config.backtest_date)
+            self.data_manager.prefetch_option_contracts(contract_keys, self.config.backtest_date)
+        except Exception as e:
+            logger.warning(f"⚠️  Option prefetch disabled: {e}")
+            self.data_manager.prefetched_option_ticks.clear()
+            self.data_manager.prefetched_option_contracts.clear()
+    
     def _build_metadata(self, strategies: List) -> Dict[str, Any]:
         """
         Build strategies_agg metadata from loaded strategies.
@@ -210,6 +331,7 @@ class CentralizedBacktestEngine(BacktestEngine):
         # Aggregate data across all strategies
         all_timeframes = set()
         all_indicators = {}  # Key: symbol, Value: {timeframe: [indicator_metadata]}
+        indicator_by_series = {}  # Key: series_key(symbol, timeframe, name, params) → indicator_metadata
         all_options = []
         strategy_metadata = []
         
@@ -230,24 +352,27 @@ class CentralizedBacktestEngine(BacktestEngine):
                 if timeframe not in all_indicators[symbol]:
                     all_indicators[symbol][timeframe] = []
                 
-                # Add indicator metadata (avoiding duplicates)
+                # Add indicator metadata once per unique series; every strategy's
+                # database key is kept in 'refs' so DataManager can map all of them
                 for indicator in instrument_config.indicators:
-                    # Convert IndicatorMetadata to dict format expected by DataManager
-                    indicator_dict = {
-                        'name': indicator.name,
-                        'params': indicator.params,
-                        'key': indicator.key  # Include database key for mapping
-                    }
-                    
-                    # Check if indicator already exists (by name and params)
-                    exists = any(
-                        ind.get('name') == indicator_dict['name'] and 
-                        ind.get('params') == indicator_dict['params']
-                        for ind in all_indicators[symbol][timeframe]
-                    )
+                    ref = {'strategy_id': strategy.strategy_id, 'key': indicator.key}
+                    series = series_key(symbol, timeframe, indicator.name, indicator.params)
                     
-                    if not exists:
+                    indicator_dict = indicator_by_series.get(series)
+                    if indicator_dict is None:
+                        # Convert IndicatorMetadata to dict format expected by DataManager
+                        indicator_dict = {
+                            'name': indicator.name,
+                            'params': indicator.params,
+                            'key': indicator.key,  # Include database key for mapping
+                            'series_key': series,
+                            'refs': []
+                        }
+                        indicator_by_series[series] = indicator_dict
                         all_indicators[symbol][timeframe].append(indicator_dict)
+                    
+                    if ref not in indicator_dict['refs']:
+                        indicator_dict['refs'].append(ref)
             
             # Collect option patterns
             for option_pattern in strategy.option_patterns:
@@ -318,6 +443,8 @@ class CentralizedBacktestEngine(BacktestEngine):
         for symbol, tfs in all_indicators.items():
             for tf, indicators in tfs.items():
                 logger.info(f"      {symbol}:{tf} → {len(indicators)} indicator(s)")
+        shared = sum(1 for ind in indicator_by_series.values() if len(ind['refs']) > 1)
+        logger.info(f"   Indicator series: {len(indicator_by_series)} unique ({shared} shared by several strategies)")
         logger.info(f"   Option patterns: {len(all_options)}")
         logger.info(f"   Strategies: {len(strategy_metadata)}")
         
@@ -384,6 +511,9 @@ class CentralizedBacktestEngine(BacktestEngine):
             scale = self.config.scales[strategy.strategy_id]
             print(f"   📊 Scale for strategy {strategy.strategy_id}: {scale}")
         
+        # Prepared config / scan results from an earlier day of the session
+        template = self.session.subscription_template(strategy.strategy_id) if self.session else None
+        
         # Create subscription data
         subscription_data = {
             'user_id': strategy.user_id,
@@ -392,12 +522,15 @@ class CentralizedBacktestEngine(BacktestEngine):
             'broker_connection_id': getattr(strategy, 'broker_connection_id', None),  # For live trading
             'account_id': 'backtest_account',
             'instance_id': instance_id,
-            'config': strategy.config,
+            'config': template['config'] if template else strategy.config,
             'scale': scale,  # Include scale in subscription data
             'status': 'active',
             'subscribed_at': datetime.now().isoformat()
         }
         
+        if template:
+            subscription_data['scan_results'] = template['scan_results']
+        
         # Add to cache
         self.cache_manager.set_strategy_subscription(instance_id, subscription_data)
         
@@ -408,28 +541,55 @@ class CentralizedBacktestEngine(BacktestEngine):
         
         if success:
             print(f"   ✅ Strategy synced immediately")
+            if self.session is not None and template is None:
+                self.session.save_subscription_template(
+                    strategy.strategy_id, self.cache_manager.get_strategy_subscription(instance_id)
+                )
         else:
             print(f"   ❌ Strategy sync failed")
     
-    def _process_ticks_centralized(self, ticks: list):
+    def _batch_ticks_by_second(self, ticks):
         """
-        Process all ticks through centralized processor using SECOND-BY-SECOND batching.
+        Build the per-second batch plan for the replay loop.
         
-        Flow:
-        1. Group ticks by second (batch all ticks in same second)
-        2. For each second:
-           a. Process all ticks in batch → Update candles & LTP
-           b. Execute strategy ONCE with final state of that second
+        ColumnarTicks already knows its second boundaries (computed with NumPy)
+        and materializes tick dicts lazily per batch. A plain list of tick dicts
+        is grouped by floored timestamp (legacy 'rows' mode).
+        
+        A TickBatchStream is consumed as it downloads; only its first batch is
+        peeked here, so total_seconds and last_second are unknown (None).
         
         Args:
-            ticks: List of tick data
+            ticks: ColumnarTicks, TickBatchStream or list of tick dicts
+        
+        Returns:
+            Tuple of (total_seconds, first_second, last_second, batch iterator
+            yielding (second_timestamp, tick_batch))
         """
-        from collections import defaultdict
+        from itertools import chain
+        from src.backtesting.columnar_ticks import ColumnarTicks
+        from src.backtesting.tick_stream import TickBatchStream
+        
+        if isinstance(ticks, TickBatchStream):
+            batches = iter(ticks)
+            first_batch = next(batches, None)
+            if first_batch is None:
+                return 0, None, None, iter(())
+            return None, first_batch[0], None, chain([first_batch], batches)
+        
+        if isinstance(ticks, ColumnarTicks):
+            total_seconds = ticks.second_count
+            if total_seconds == 0:
+                return 0, None, None, iter(())
+            return (
+                total_seconds,
+                ticks.second_timestamp(0),
+                ticks.second_timestamp(total_seconds - 1),
+                ticks.iter_second_batches()
+            )
         
-        print(f"\n⚡ Processing {len(ticks):,} ticks through centralized processor...")
-        print(f"📦 Batching ticks by second for efficient processing...")
+        from collections import defaultdict
         
-        # Step 1: Group ticks by second
         ticks_by_second = defaultdict(list)
         for tick in ticks:
             # Floor timestamp to second (remove microseconds)
@@ -439,21 +599,51 @@ class CentralizedBacktestEngine(BacktestEngine):
         
         # Get sorted list of seconds
         sorted_seconds = sorted(ticks_by_second.keys())
-        total_seconds = len(sorted_seconds)
+        if not sorted_seconds:
+            return 0, None, None, iter(())
         
-        print(f"📊 Batched {len(ticks):,} ticks into {total_seconds:,} seconds")
+        batches = ((second, ticks_by_second[second]) for second in sorted_seconds)
+        return len(sorted_seconds), sorted_seconds[0], sorted_seconds[-1], batches
+    
+    def _process_ticks_centralized(self, ticks):
+        """
+        Process all ticks through centralized processor using SECOND-BY-SECOND batching.
+        
+        Flow:
+        1. Group ticks by second (batch all ticks in same second)
+        2. For each second:
+           a. Process all ticks in batch → Update candles & LTP
+           b. Execute strategy ONCE with final state of that second
+        
+        Args:
+            ticks: ColumnarTicks (columnar replay) or list of tick data
+        """
+        from src.backtesting.tick_stream import TickBatchStream
+        
+        # Streamed ticks are counted as they arrive (0 before iteration starts)
+        if not isinstance(ticks, TickBatchStream):
+            print(f"\n⚡ Processing {len(ticks):,} ticks through centralized processor...")
+            print(f"📦 Batching ticks by second for efficient processing...")
+        
+        # Step 1: Group ticks by second
+        total_seconds, first_second, last_second, second_batches = self._batch_ticks_by_second(ticks)
         
         # Defensive check for empty ticks
         if total_seconds == 0:
             print(f"⚠️  No ticks to process")
             return
         
-        print(f"   Average: {len(ticks)/total_seconds:.1f} ticks/second")
-        print(f"   Time range: {sorted_seconds[0].strftime('%H:%M:%S')} → {sorted_seconds[-1].strftime('%H:%M:%S')}")
+        if total_seconds is None:
+            # Streaming: batches are produced while the next block downloads
+            print(f"📡 Streaming per-second batches from {first_second.strftime('%H:%M:%S')}")
+        else:
+            print(f"📊 Batched {len(ticks):,} ticks into {total_seconds:,} seconds")
+            print(f"   Average: {len(ticks)/total_seconds:.1f} ticks/second")
+            print(f"   Time range: {first_second.strftime('%H:%M:%S')} → {last_second.strftime('%H:%M:%S')}")
         
         # DEBUG START: Snapshot capture - initial state before any ticks
         if self.debug_mode == 'snapshots':
-            first_timestamp = sorted_seconds[0]
+            first_timestamp = first_second
             self._capture_snapshot(
                 timestamp=first_timestamp,
                 is_initial=True,
@@ -469,12 +659,12 @@ class CentralizedBacktestEngine(BacktestEngine):
         
         # DEBUG START: Track start time for stop_after_seconds feature
         if self.debug_mode == 'snapshots' and self.debug_snapshot_seconds:
-            start_timestamp = sorted_seconds[0]
+            start_timestamp = first_second
             stop_timestamp = start_timestamp + __import__('datetime').timedelta(seconds=self.debug_snapshot_seconds)
             logger.info(f"⏱️  Will stop after {self.debug_snapshot_seconds}s ({start_timestamp.strftime('%H:%M:%S')} → {stop_timestamp.strftime('%H:%M:%S')})")
         # DEBUG END: Track start time for stop_after_seconds feature
         
-        for second_idx, second_timestamp in enumerate(sorted_seconds):
+        for second_idx, (second_timestamp, tick_batch) in enumerate(second_batches):
             # DEBUG START: Stop after N seconds if snapshot mode enabled
             if self.debug_mode == 'snapshots' and self.debug_snapshot_seconds:
                 if second_timestamp >= stop_timestamp:
@@ -483,8 +673,6 @@ class CentralizedBacktestEngine(BacktestEngine):
                     break
             # DEBUG END: Stop after N seconds if snapshot mode enabled
             
-            tick_batch = ticks_by_second[second_timestamp]
-            
             # Step 2a: Process all ticks in this second's batch
             # This updates candles and LTP for all instruments
             last_processed_tick = None
@@ -588,7 +776,7 @@ class CentralizedBacktestEngine(BacktestEngine):
                     # Check termination conditions
                     active_strategies = self.centralized_processor.strategy_manager.active_strategies
                     if not active_strategies:
-                        print(f"\n🛑 All strategies terminated at second {second_idx+1}/{total_seconds}")
+                        print(f"\n🛑 All strategies terminated at second {second_idx+1}/{total_seconds or '?'}")
                         print(f"   Timestamp: {second_timestamp.strftime('%H:%M:%S')}")
                         print(f"   Processed {processed_tick_count:,}/{len(ticks):,} ticks ({100*processed_tick_count/len(ticks):.1f}%)")
                         break
@@ -606,7 +794,7 @@ class CentralizedBacktestEngine(BacktestEngine):
                                 break
                     
                     if all_strategies_dead and second_idx > 5:  # Give it at least 5 seconds to start
-                        print(f"\n🛑 All strategies have no active nodes at second {second_idx+1}/{total_seconds}")
+                        print(f"\n🛑 All strategies have no active nodes at second {second_idx+1}/{total_seconds or '?'}")
                         print(f"   Timestamp: {second_timestamp.strftime('%H:%M:%S')}")
                         print(f"   All nodes Inactive - strategy execution complete")
                         print(f"   Processed {processed_tick_count:,}/{len(ticks):,} ticks ({100*processed_tick_count/len(ticks):.1f}%)")
@@ -638,8 +826,18 @@ class CentralizedBacktestEngine(BacktestEngine):
             
             # Progress reporting every 100 seconds
             if (second_idx + 1) % 100 == 0:
-                logger.info(f"Progress: {second_idx + 1}/{total_seconds} seconds ({100*(second_idx+1)/total_seconds:.1f}%)")
+                if total_seconds:
+                    logger.info(f"Progress: {second_idx + 1}/{total_seconds} seconds ({100*(second_idx+1)/total_seconds:.1f}%)")
+                else:
+                    logger.info(f"Progress: {second_idx + 1} seconds streamed")
+        
+        # Release the ClickHouse stream if the loop stopped early
+        if hasattr(second_batches, 'close'):
+            second_batches.close()
+        if hasattr(ticks, 'close'):
+            ticks.close()
         
+        total_seconds = total_seconds if total_seconds is not None else second_idx + 1
         print(f"   ✅ Processed {processed_tick_count:,} ticks in {total_seconds:,} seconds")
         print(f"   ⚡ Strategy executed {total_seconds:,} times (once per second)")
     
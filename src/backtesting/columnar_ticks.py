@@ -0,0 +1,247 @@
+"""
+Columnar Tick Store
+===================
+
+Column-oriented container for one trading day of index ticks.
+
+Instead of materializing one Python dict per tick (millions per day for
+NIFTY + BANKNIFTY), ticks are held as NumPy arrays:
+
+    timestamps_us : int64   - wall-clock epoch in microseconds
+    ltp           : float64
+    ltq           : int64
+    oi            : int64
+    symbol_codes  : int32   - index into `symbols`
+
+Per-second batch boundaries are computed once with NumPy, and tick dicts
+are materialized lazily, only for the second currently being processed.
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+_US_PER_SECOND = 1_000_000
+
+
+class ColumnarTicks:
+    """
+    One day of ticks stored as parallel NumPy arrays, sorted by timestamp.
+
+    Usage:
+        ticks = data_manager.load_ticks_columnar(date, ['NIFTY'])
+        for second_timestamp, batch in ticks.iter_second_batches():
+            for tick in batch:  # dicts built only for this second
+                data_manager.process_tick(tick)
+    """
+
+    def __init__(
+        self,
+        timestamps_us: np.ndarray,
+        ltp: np.ndarray,
+        ltq: np.ndarray,
+        oi: np.ndarray,
+        symbol_codes: np.ndarray,
+        symbols: List[str]
+    ):
+        """
+        Initialize columnar ticks.
+
+        Args:
+            timestamps_us: Wall-clock epoch microseconds (int64)
+            ltp: Last traded prices (float64)
+            ltq: Last traded quantities (int64)
+            oi: Open interest (int64)
+            symbol_codes: Per-tick index into `symbols` (int32)
+            symbols: Symbol table
+        """
+        timestamps_us = np.asarray(timestamps_us, dtype=np.int64)
+
+        # Stable sort keeps intra-second arrival order (ClickHouse already
+        # returns ORDER BY timestamp, so this is normally a no-op check)
+        if len(timestamps_us) > 1 and np.any(timestamps_us[1:] < timestamps_us[:-1]):
+            order = np.argsort(timestamps_us, kind='stable')
+        else:
+            order = None
+
+        def _column(values: np.ndarray, dtype: Any) -> np.ndarray:
+            column = np.asarray(values, dtype=dtype)
+            return column[order] if order is not None else column
+
+        self.timestamps_us = timestamps_us[order] if order is not None else timestamps_us
+        self.ltp = _column(ltp, np.float64)
+        self.ltq = _column(ltq, np.int64)
+        self.oi = _column(oi, np.int64)
+        self.symbol_codes = _column(symbol_codes, np.int32)
+        self.symbols = list(symbols)
+        self.symbol_ids: Optional[List[Optional[int]]] = None  # per symbol, see attach_symbol_ids()
+
+        # Batch boundaries: start offset of every distinct second (+ final end)
+        seconds = self.timestamps_us // _US_PER_SECOND
+        if len(seconds):
+            starts = np.flatnonzero(np.concatenate(([True], seconds[1:] != seconds[:-1])))
+        else:
+            starts = np.empty(0, dtype=np.int64)
+        self._second_starts = starts
+        self._second_ends = np.append(starts[1:], len(seconds)).astype(np.int64)
+        self._seconds = seconds[starts]
+
+    # ========================================================================
+    # CONSTRUCTORS
+    # ========================================================================
+
+    @classmethod
+    def empty(cls) -> 'ColumnarTicks':
+        """Create an empty tick store."""
+        return cls(
+            timestamps_us=np.empty(0, dtype=np.int64),
+            ltp=np.empty(0, dtype=np.float64),
+            ltq=np.empty(0, dtype=np.int64),
+            oi=np.empty(0, dtype=np.int64),
+            symbol_codes=np.empty(0, dtype=np.int32),
+            symbols=[]
+        )
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> 'ColumnarTicks':
+        """
+        Build from a DataFrame with columns symbol, timestamp, ltp, ltq, oi.
+
+        Args:
+            df: Tick DataFrame (e.g., from clickhouse_client.query_df)
+
+        Returns:
+            ColumnarTicks instance
+        """
+        if df is None or df.empty:
+            return cls.empty()
+
+        timestamps = pd.to_datetime(df['timestamp'])
+        if getattr(timestamps.dt, 'tz', None) is not None:
+            timestamps = timestamps.dt.tz_localize(None)
+        timestamps_us = timestamps.to_numpy(dtype='datetime64[us]').astype(np.int64)
+
+        codes, symbols = pd.factorize(df['symbol'], sort=True)
+
+        return cls(
+            timestamps_us=timestamps_us,
+            ltp=df['ltp'].to_numpy(dtype=np.float64, na_value=np.nan),
+            ltq=df['ltq'].fillna(0).to_numpy(dtype=np.int64) if 'ltq' in df else np.zeros(len(df), dtype=np.int64),
+            oi=df['oi'].fillna(0).to_numpy(dtype=np.int64) if 'oi' in df else np.zeros(len(df), dtype=np.int64),
+            symbol_codes=codes.astype(np.int32),
+            symbols=[str(s) for s in symbols]
+        )
+
+    @classmethod
+    def from_ticks(cls, ticks: List[Dict[str, Any]]) -> 'ColumnarTicks':
+        """
+        Build from a list of tick dicts (as returned by DataManager.load_ticks).
+
+        Args:
+            ticks: List of tick dicts with symbol, timestamp, ltp, ltq, oi
+
+        Returns:
+            ColumnarTicks instance
+        """
+        if not ticks:
+            return cls.empty()
+        return cls.from_dataframe(pd.DataFrame(ticks))
+
+    # ========================================================================
+    # ACCESSORS
+    # ========================================================================
+
+    def __len__(self) -> int:
+        return len(self.timestamps_us)
+
+    @property
+    def second_count(self) -> int:
+        """Number of distinct seconds (batches) in the day."""
+        return len(self._seconds)
+
+    def second_timestamp(self, batch_index: int) -> datetime:
+        """Return the floored datetime of a batch."""
+        return np.datetime64(int(self._seconds[batch_index]), 's').astype(datetime)
+
+    def batch_bounds(self, batch_index: int) -> Tuple[int, int]:
+        """Return [start, end) row offsets of a batch."""
+        return int(self._second_starts[batch_index]), int(self._second_ends[batch_index])
+
+    def materialize(self, start: int, end: int) -> List[Dict[str, Any]]:
+        """
+        Build tick dicts for rows [start, end).
+
+        Dict shape matches DataManager.load_ticks() so downstream code
+        (process_tick, candle builders) is unchanged.
+
+        Args:
+            start: First row offset (inclusive)
+            end: Last row offset (exclusive)
+
+        Returns:
+            List of tick dicts
+        """
+        timestamps = self.timestamps_us[start:end].astype('datetime64[us]').tolist()
+        ltps = self.ltp[start:end].tolist()
+        ltqs = self.ltq[start:end].tolist()
+        ois = self.oi[start:end].tolist()
+        symbols = self.symbols
+        codes = self.symbol_codes[start:end].tolist()
+
+        symbol_ids = self.symbol_ids
+        if symbol_ids is not None:
+            return [
+                {
+                    'symbol': symbols[code],
+                    'symbol_id': symbol_ids[code],
+                    'timestamp': timestamp,
+                    'ltp': ltp,
+                    'ltq': ltq,
+                    'oi': oi,
+                }
+                for code, timestamp, ltp, ltq, oi in zip(codes, timestamps, ltps, ltqs, ois)
+            ]
+
+        return [
+            {
+                'symbol': symbols[code],
+                'timestamp': timestamp,
+                'ltp': ltp,
+                'ltq': ltq,
+                'oi': oi,
+            }
+            for code, timestamp, ltp, ltq, oi in zip(codes, timestamps, ltps, ltqs, ois)
+        ]
+
+    def attach_symbol_ids(self, symbol_ids: List[Optional[int]]):
+        """
+        Attach interned symbol ids (one per entry of `symbols`).
+
+        Materialized ticks then carry 'symbol_id', which
+        DataManager.process_tick resolves without string work.
+        """
+        if len(symbol_ids) != len(self.symbols):
+            raise ValueError(f"Expected {len(self.symbols)} symbol ids, got {len(symbol_ids)}")
+        self.symbol_ids = list(symbol_ids)
+
+    def iter_second_batches(self) -> Iterator[Tuple[datetime, List[Dict[str, Any]]]]:
+        """
+        Yield (second_timestamp, tick_batch) in chronological order.
+
+        Only the batch being yielded is materialized as dicts.
+        """
+        for batch_index in range(self.second_count):
+            start, end = self.batch_bounds(batch_index)
+            yield self.second_timestamp(batch_index), self.materialize(start, end)
+
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the column arrays."""
+        return int(
+            self.timestamps_us.nbytes + self.ltp.nbytes + self.ltq.nbytes
+            + self.oi.nbytes + self.symbol_codes.nbytes
+        )
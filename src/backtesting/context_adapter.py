@@ -65,7 +65,7 @@ class ContextAdapter:
         
         # Initialize diagnostics system
         self.diagnostics = NodeDiagnostics(max_events_per_node=100)
-        self.node_events_history = {}  # Will be populated by diagnostics
+        self.node_events_history = self.diagnostics.events  # Populated by diagnostics
         self.node_current_state = {}   # Will be populated by diagnostics
         
         logger.info("📦 Context Adapter initialized")
@@ -14,11 +14,29 @@ Same code works for both backtesting and live trading.
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Set
+import time
+from functools import partial
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Set
 from datetime import datetime
 import pandas as pd
 
 from src.symbol_mapping.symbol_cache_manager import get_symbol_cache_manager
+from src.symbol_mapping.symbol_table import SymbolTable
+from src.core.unified_ltp_store import UnifiedLTPStore
+from src.backtesting.candle_ring_buffer import CandleRingBuffer
+from src.backtesting.market_data_snapshot import MarketDataSnapshot
+from src.backtesting.indicator_series_registry import IndicatorSeriesRegistry
+from src.storage.indicator_state_store import END_OF_DAY, WARMUP, candle_checksum
+
+try:
+    from src.indicators_hybrid.bank import IndicatorBank
+except ImportError:  # src.indicators_hybrid needs pandas_ta - update indicators one by one
+    IndicatorBank = None
+
+if TYPE_CHECKING:
+    from src.backtesting.columnar_ticks import ColumnarTicks
+    from src.backtesting.option_prefetch import OptionTickBuffer
+    from src.backtesting.tick_stream import TickBatchStream
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +55,9 @@ class DataManager:
     Does NOT handle strategy execution - that's onTick()'s job!
     """
     
+    # ClickHouse table existence is checked once per process
+    _clickhouse_tables_checked = False
+    
     def __init__(self, cache: Any, broker_name: str = 'clickhouse', shared_cache: Any = None):
         """
         Initialize data manager.
@@ -49,13 +70,21 @@ class DataManager:
         self.cache = cache
         self.broker_name = broker_name
         self.symbol_cache = get_symbol_cache_manager()
+        
+        # Raw ticker -> id -> universal symbol, normalized once per ticker
+        self.symbol_table = SymbolTable(broker_name, self.symbol_cache)
         self.shared_cache = shared_cache  # NEW: Shared cache across strategies
         
-        # LTP store (all symbols including options) - now uses universal format
-        self.ltp: Dict[str, float] = {}  # {symbol: ltp} for both spot and options
+        # LTP store (all symbols including options) - now uses universal format.
+        # One slot store, shared with the SharedDataCache when there is one;
+        # ltp / ltp_store are views over its slots, not copies
+        self.ltp_slots: UnifiedLTPStore = getattr(shared_cache, 'ltp_slots', None)
+        if self.ltp_slots is None:
+            self.ltp_slots = UnifiedLTPStore()
+        self.ltp = self.ltp_slots.prices  # {symbol: ltp} for both spot and options
         
-        # Legacy LTP store for backward compatibility
-        self.ltp_store: Dict[str, Dict[str, Any]] = {}
+        # Legacy LTP store view for backward compatibility (string timestamps)
+        self.ltp_store = self.ltp_slots.records(timestamp_format='string')
         
         # Candle builders per timeframe
         self.candle_builders: Dict[str, Any] = {}
@@ -63,6 +92,10 @@ class DataManager:
         # Indicator instances: {symbol:timeframe: {indicator_key: indicator_instance}}
         # All indicators are HybridIndicator instances with calculate_bulk() and update_incremental()
         self.indicators: Dict[str, Dict[str, Any]] = {}
+        
+        # Batched incremental updaters, built on the first completed candle:
+        # {symbol:timeframe: IndicatorBank} (owns batched indicator state while live)
+        self.indicator_banks: Dict[str, Any] = {}
 
         # Track which symbol:timeframe pairs have been initialized from historical data.
         # Key format matches self.indicators ("SYMBOL:TF").
@@ -80,21 +113,54 @@ class DataManager:
         # Candle builders per symbol (unified format)
         self.candle_builders: Dict[str, Dict[str, Any]] = {}
         
-        # LTP store
-        self.ltp_store: Dict[str, float] = {}
+        # Builds every timeframe from one base bar per symbol; candle_builders
+        # then holds its per-timeframe views (see _setup_candle_builders)
+        self.candle_aggregator = None
+        # Symbols whose higher-timeframe buffers are linked to the aggregator
+        self._forming_linked_symbols: Set[str] = set()
+        
+        # Rolling candle windows (completed + forming), mutated in place
+        # Format: {"NIFTY:1m": CandleRingBuffer}
+        self.candle_buffers: Dict[str, CandleRingBuffer] = {}
+        self.max_candles: int = getattr(cache, 'max_candles', 20) or 20
+        
+        # Shared, versioned market data referenced by every strategy context
+        self.market_data = MarketDataSnapshot(self.ltp, self.ltp_store)
         
         # Indicator key mappings: database_key → generated_key
         # Format: {"NIFTY:1m": {"rsi_1764509210372": "rsi(14,close)", ...}}
         self.indicator_key_mappings: Dict[str, Dict[str, str]] = {}
         
+        # One entry per unique (symbol, timeframe, indicator, params) series,
+        # with the strategies referencing it and per-series compute counters
+        self.indicator_series = IndicatorSeriesRegistry()
+        
+        # Historical OHLCV the indicators were seeded with: {"NIFTY:1m": DataFrame}
+        self.historical_candles: Dict[str, pd.DataFrame] = {}
+        
+        # Whole-day candle-only condition screens (columnar backtests only)
+        self.signal_prescreen = None
+        
+        # Warmed-up indicator snapshots (IndicatorStateStore); None = always warm up
+        self.indicator_state_store = None
+        
+        # Also snapshot end-of-day state and resume the next day from it (opt-in)
+        self.indicator_state_carry_over = False
+        
+        # Replay history through update() after warm-up and log bulk mismatches (slow)
+        self.verify_indicator_replay = False
+        
         # Backtesting attributes
         self.clickhouse_client = None
         self.backtest_date = None
         
-        # Option tick buffers for on-demand loading
-        # Format: {contract_key: {'ticks': deque, 'current_index': int}}
+        # Option tick buffers being replayed: {contract_key: OptionTickBuffer}
         self.option_tick_buffers = {}
         
+        # Prefetched day ticks of planned option contracts (prefetch_option_contracts)
+        self.prefetched_option_ticks = {}
+        self.prefetched_option_contracts = set()
+        
         # Track loaded options for logging
         self.loaded_option_contracts = set()
         
@@ -105,16 +171,23 @@ class DataManager:
         symbol: str,
         timeframe: str,
         indicator: Any,
-        database_key: Optional[str] = None
+        database_key: Optional[str] = None,
+        strategy_id: Optional[str] = None
     ) -> str:
         """
         Register an indicator for calculation.
         
+        An indicator series already registered for this symbol:timeframe
+        (same name and params, in any order) is shared: the existing
+        instance is kept and `database_key` is mapped onto it, so the
+        series is still computed once per candle.
+        
         Args:
             symbol: Unified symbol (e.g., 'NIFTY')
             timeframe: Timeframe (e.g., '1m', '5m')
             indicator: Indicator object with name and params attributes
             database_key: Original database key (e.g., 'rsi_1764509210372')
+            strategy_id: Strategy referencing the indicator (reference counting)
         
         Returns:
             indicator_key: Generated key (e.g., 'RSI(14)', 'BBAND(14,2)')
@@ -127,11 +200,22 @@ class DataManager:
         if key not in self.indicator_key_mappings:
             self.indicator_key_mappings[key] = {}
         
-        # Generate indicator key (function-like format)
-        indicator_key = self._generate_indicator_key(indicator.name, indicator.params)
+        series, _ = self.indicator_series.acquire(
+            symbol, timeframe, indicator.name, indicator.params, strategy_id, database_key
+        )
         
-        # Store indicator instance
-        self.indicators[key][indicator_key] = indicator
+        if series.indicator_key is not None and series.indicator_key in self.indicators[key]:
+            # Shared series - keep the registered instance
+            indicator_key = series.indicator_key
+        else:
+            self._release_indicator_bank(key)
+            
+            # Generate indicator key (function-like format)
+            indicator_key = self._generate_indicator_key(indicator.name, indicator.params)
+            series.indicator_key = indicator_key
+            
+            # Store indicator instance
+            self.indicators[key][indicator_key] = indicator
         
         # Store mapping: database_key → generated_key
         if database_key:
@@ -142,6 +226,30 @@ class DataManager:
         
         return indicator_key
     
+    def release_strategy_indicators(self, strategy_id: str) -> int:
+        """
+        Drop a strategy's indicator references (e.g. a live strategy stopped).
+        
+        Series still referenced by other strategies keep running; series
+        left without references are unregistered.
+        
+        Args:
+            strategy_id: Strategy whose references are released
+        
+        Returns:
+            Number of indicator series unregistered
+        """
+        orphaned = self.indicator_series.release(strategy_id)
+        for series in orphaned:
+            key = f"{series.symbol}:{series.timeframe}"
+            self._release_indicator_bank(key)
+            self.indicators.get(key, {}).pop(series.indicator_key, None)
+            mappings = self.indicator_key_mappings.get(key, {})
+            for database_key in [db for db, ik in mappings.items() if ik == series.indicator_key]:
+                del mappings[database_key]
+            logger.info(f"📉 Unregistered {series.indicator_key} for {key} (no strategies left)")
+        return len(orphaned)
+    
     def _generate_indicator_key(self, name: str, params: Dict[str, Any]) -> str:
         """
         Generate function-like indicator key.
@@ -186,6 +294,12 @@ class DataManager:
         """
         key = f"{symbol}:{timeframe}"
         
+        # Instances are re-initialized below; the bank is rebuilt from them on the next candle
+        self._release_indicator_bank(key)
+        
+        # Keep plain OHLCV (before indicator columns are added) for the signal pre-screen
+        self.historical_candles[key] = candles[['timestamp', 'open', 'high', 'low', 'close', 'volume']].copy()
+        
         has_indicators = key in self.indicators and self.indicators[key]
         
         if has_indicators:
@@ -195,9 +309,21 @@ class DataManager:
             logger.info(f"📊 Loading {len(candles)} historical candles for {key} (no indicators)")
             print(f"   DEBUG: NO INDICATORS - self.indicators keys = {list(self.indicators.keys())}")
         
+        # Snapshots are only valid for history ending on the same candles
+        anchor = None
+        if has_indicators and self.indicator_state_store is not None and not candles.empty:
+            anchor = self._history_state_anchor(candles)
+        
         # Initialize each ta_hybrid indicator instance (only if indicators registered)
         if has_indicators:
             for indicator_key, indicator in self.indicators[key].items():
+                col_name = indicator_key.replace('(', '_').replace(')', '').replace(',', '_')
+                
+                if anchor is not None and self._restore_indicator_state(
+                        symbol, timeframe, indicator_key, indicator, candles, col_name, anchor):
+                    logger.info(f"♻️  {indicator_key} restored from saved state (warm-up skipped)")
+                    continue
+                
                 try:
                     # Step 1: Bulk calculation on full historical data (fast vectorized)
                     result = indicator.calculate_bulk(candles)
@@ -206,8 +332,6 @@ class DataManager:
                     indicator.initialize_from_dataframe(candles)
                     
                     # Step 3: Add indicator values to DataFrame
-                    col_name = indicator_key.replace('(', '_').replace(')', '').replace(',', '_')
-                    
                     if result is not None:
                         if isinstance(result, pd.Series):
                             candles[col_name] = result
@@ -220,75 +344,14 @@ class DataManager:
                     else:
                         logger.warning(f"⚠️  {indicator_key} returned None from bulk calculation")
 
-                    # Optional debug verification: replay candles incrementally and compare
-                    try:
-                        test_indicator_class = type(indicator)
-                        test_indicator = test_indicator_class(**getattr(indicator, 'params', {}))
-
-                        # Prepare bulk reference values
-                        reference_columns = []
-                        if isinstance(result, pd.Series):
-                            reference_columns = [col_name]
-                        elif isinstance(result, pd.DataFrame):
-                            reference_columns = [f"{col_name}_{c}" for c in result.columns]
-
-                        incremental_values = {col: [] for col in reference_columns}
-
-                        # Replay each candle through update()
-                        for _, row in candles.iterrows():
-                            candle_dict = {
-                                'timestamp': row['timestamp'],
-                                'open': row['open'],
-                                'high': row['high'],
-                                'low': row['low'],
-                                'close': row['close'],
-                                'volume': row['volume'],
-                            }
-
-                            new_value = test_indicator.update(candle_dict)
-
-                            if isinstance(new_value, dict):
-                                for ref_col in reference_columns:
-                                    base = ref_col.replace(f"{col_name}_", "")
-                                    if base in new_value:
-                                        incremental_values[ref_col].append(new_value[base])
-                                    else:
-                                        incremental_values[ref_col].append(None)
-                            else:
-                                # Single-column indicator
-                                if reference_columns:
-                                    incremental_values[reference_columns[0]].append(new_value)
-
-                        # Compare last value of each column (500th candle) with bulk result
-                        for ref_col in reference_columns:
-                            bulk_series = candles[ref_col].tolist()
-                            inc_series = incremental_values.get(ref_col, [])
-                            if not bulk_series or not inc_series:
-                                continue
-
-                            bulk_last = bulk_series[-1]
-                            inc_last = inc_series[-1]
-
-                            # Only compare when both are numeric and not NaN
-                            if pd.notna(bulk_last) and pd.notna(inc_last):
-                                try:
-                                    diff = abs(float(bulk_last) - float(inc_last))
-                                    if diff > 1e-6:
-                                        logger.warning(
-                                            f"⚠️  Bulk vs incremental mismatch for {indicator_key} on {key} "
-                                            f"column {ref_col}: bulk={bulk_last}, incremental={inc_last}, diff={diff}"
-                                        )
-                                except Exception:
-                                    # Fallback: string comparison if casting fails
-                                    if str(bulk_last) != str(inc_last):
-                                        logger.warning(
-                                            f"⚠️  Bulk vs incremental string mismatch for {indicator_key} on {key} "
-                                            f"column {ref_col}: bulk={bulk_last}, incremental={inc_last}"
-                                        )
-
-                    except Exception as debug_e:
-                        # Debug path must never break core flow
-                        logger.debug(f"Bulk/incremental verification skipped for {indicator_key}: {debug_e}")
+                    # Opt-in: replay candles through update() and compare with the bulk result
+                    if self.verify_indicator_replay:
+                        self._verify_incremental_replay(key, indicator_key, indicator, candles, result)
+                    
+                    if anchor is not None:
+                        tail = candles[col_name].tail(anchor[2]).tolist() if col_name in candles.columns else None
+                        self._save_indicator_state(symbol, timeframe, indicator_key, indicator, anchor, tail,
+                                                   kind=WARMUP)
                 
                 except Exception as e:
                     import traceback
@@ -331,7 +394,8 @@ class DataManager:
                 if 'indicators' in candles_list[-1]:
                     print(f"   DEBUG: Indicators in last candle = {candles_list[-1]['indicators']}")
             
-            self.cache.set_candles(symbol, timeframe, candles_list)
+            self._get_candle_buffer(key).load_completed(candles_list)
+            self.market_data.mark_candle(key)
             
             # Mark this symbol:timeframe as initialized from historical data
             self._initialized_symbol_timeframes[key] = True
@@ -366,69 +430,42 @@ class DataManager:
             Processed tick with unified symbol
         """
         # Step 1: Convert symbol to unified format
+        # Loaders attach the interned symbol id; otherwise (or if a tick source
+        # rewrote the symbol since) the raw ticker is normalized once and
+        # looked up in the table from then on
         broker_symbol = tick['symbol']
-        
-        # Check if symbol is already in universal format (has colons like NIFTY:2024-10-03:OPT:25950:CE)
-        # This happens when tick source already converted it
-        if ':' in broker_symbol:
-            # Already in universal format - use as-is
-            unified_symbol = broker_symbol
-        elif self.broker_name == 'clickhouse':
-            # For backtesting: Convert ClickHouse compact ticker format to universal format
-            # if needed (e.g., NIFTY03OCT2425950CE -> NIFTY:2024-10-03:OPT:25950:CE)
-            from src.symbol_mapping.clickhouse_ticker_converter import is_clickhouse_format, to_universal
-            
-            if is_clickhouse_format(broker_symbol):
-                try:
-                    # Convert ClickHouse format to universal format directly
-                    unified_symbol = to_universal(broker_symbol)
-                except ValueError as e:
-                    import traceback
-                    logger.error(f"❌ CRITICAL: Failed to convert ClickHouse ticker: {broker_symbol}")
-                    logger.error(f"   Error: {e}")
-                    logger.error(f"   Full traceback:\n{traceback.format_exc()}")
-                    raise RuntimeError(f"ClickHouse ticker conversion failed: {e}") from e
-            else:
-                # Not ClickHouse format and not universal (probably index symbol like NIFTY)
-                # Use symbol cache for lookup
-                unified_symbol = self.symbol_cache.to_unified(self.broker_name, broker_symbol)
+        symbol_table = self.symbol_table
+        symbol_id = tick.get('symbol_id')
+        if symbol_id is not None and symbol_table.raw[symbol_id] == broker_symbol:
+            unified_symbol = symbol_table.universal[symbol_id]
         else:
-            # For live trading: Use symbol cache lookup (handles AngelOne, AliceBlue, etc.)
-            unified_symbol = self.symbol_cache.to_unified(self.broker_name, broker_symbol)
+            unified_symbol = symbol_table.to_universal(broker_symbol)
         
         tick['symbol'] = unified_symbol
         
-        # Step 2: Update LTP stores (all symbols)
-        # Update new unified LTP dict (simple: symbol -> ltp)
-        self.ltp[unified_symbol] = tick['ltp']
-        
-        # Also update legacy LTP store for backward compatibility
-        self.ltp_store[unified_symbol] = {
-            'ltp': tick['ltp'],
-            'timestamp': self._format_timestamp_microseconds(tick['timestamp']),
-            'volume': tick.get('volume', 0),
-            'oi': tick.get('oi', 0)
-        }
-        
-        # Update shared cache LTP store if available
-        if self.shared_cache:
-            self.shared_cache.update_ltp(
-                symbol=unified_symbol,
-                price=tick['ltp'],
-                timestamp=tick['timestamp']
-            )
+        # Step 2: Update the LTP store (all symbols) - one slot write serves
+        # ltp, ltp_store, the shared cache and the tick processor
+        if self.ltp_slots.set(unified_symbol, tick['ltp'], tick['timestamp'],
+                              tick.get('volume', 0), tick.get('oi', 0)):
+            self.market_data.mark_ltp(unified_symbol)
         
-        # Step 3: Build candles (per timeframe) - ONLY for indices/futures, NOT options
+        # Step 3: Build candles (all timeframes) - ONLY for indices/futures, NOT options
         completed_candles = []
         
         # Only build candles for indices and futures (not options)
         # Options only need LTP tracking, no candle building
-        if self._is_index_or_future(unified_symbol):
-            for timeframe, builder in self.candle_builders.items():
-                candle = builder.process_tick(tick)
-                
-                if candle:  # Candle completed
-                    completed_candles.append((timeframe, candle))
+        is_candle_symbol = self._is_index_or_future(unified_symbol)
+        if is_candle_symbol:
+            if self.candle_aggregator is not None:
+                # One base bar per symbol; higher timeframes roll up when it closes
+                completed_candles = self.candle_aggregator.process_tick(tick)
+            else:
+                # Builders set up by hand (one CandleBuilder per timeframe)
+                for timeframe, builder in self.candle_builders.items():
+                    candle = builder.process_tick(tick)
+                    
+                    if candle:  # Candle completed
+                        completed_candles.append((timeframe, candle))
         
         # Step 4: Update indicators and cache for completed candles
         for timeframe, candle in completed_candles:
@@ -437,11 +474,24 @@ class DataManager:
         
         # Step 5: Update forming candle in buffer (even if no candle completed)
         # This ensures the buffer always has the current forming candle at position -1
-        if self._is_index_or_future(unified_symbol):
-            for timeframe, builder in self.candle_builders.items():
-                forming_candle = builder.get_current_candle(unified_symbol)
-                if forming_candle:
-                    self._update_forming_candle_in_buffer(unified_symbol, timeframe, forming_candle)
+        if is_candle_symbol:
+            if self.candle_aggregator is not None:
+                # Only the base bar changes per tick; higher timeframes read their
+                # forming candle from the aggregator when accessed (_link_forming_source)
+                if unified_symbol not in self._forming_linked_symbols:
+                    self._forming_linked_symbols.add(unified_symbol)
+                    for timeframe in self.candle_aggregator.higher:
+                        self._get_candle_buffer(f"{unified_symbol}:{timeframe}")
+                base_timeframe = self.candle_aggregator.base_timeframe
+                if base_timeframe is not None:
+                    forming_candle = self.candle_aggregator.get_current_candle(unified_symbol, base_timeframe)
+                    if forming_candle:
+                        self._update_forming_candle_in_buffer(unified_symbol, base_timeframe, forming_candle)
+            else:
+                for timeframe, builder in self.candle_builders.items():
+                    forming_candle = builder.get_current_candle(unified_symbol)
+                    if forming_candle:
+                        self._update_forming_candle_in_buffer(unified_symbol, timeframe, forming_candle)
         
         return tick
     
@@ -449,11 +499,211 @@ class DataManager:
     # Old method was redundant and caused duplicate calls to _add_to_candle_buffer
     # New approach: _add_to_candle_buffer handles both buffer management AND incremental indicator updates
     
+    def _verify_incremental_replay(
+        self,
+        key: str,
+        indicator_key: str,
+        indicator: Any,
+        candles: pd.DataFrame,
+        result: Any
+    ):
+        """
+        Replay the history through a fresh instance and log bulk mismatches.
+        
+        O(candles) update() calls per indicator - only runs when
+        verify_indicator_replay is enabled. Never breaks initialization.
+        """
+        try:
+            from src.indicators_hybrid.parity import replay_parity
+            
+            report = replay_parity(indicator, candles, bulk=result)
+        except Exception as e:
+            logger.debug(f"Bulk/incremental verification skipped for {indicator_key}: {e}")
+            return
+        
+        for col, column_report in report['columns'].items():
+            last_error = column_report['last_abs_error']
+            if last_error is not None and last_error > 1e-6:
+                logger.warning(
+                    f"⚠️  Bulk vs incremental mismatch for {indicator_key} on {key} "
+                    f"column {col}: last diff={last_error}, max diff={column_report['max_abs_error']}"
+                )
+        if report['unchecked']:
+            logger.warning(
+                f"⚠️  Bulk vs incremental check could not compare {indicator_key} on {key} "
+                f"columns: {', '.join(map(str, report['unchecked']))}"
+            )
+        max_error = report['max_abs_error']
+        logger.debug(
+            f"Replay check {indicator_key} on {key}: max abs error "
+            f"{'-' if max_error is None else format(max_error, '.3g')}, "
+            f"{report['updates_per_sec']:,.0f} updates/s"
+        )
+    
+    # ========================================================================
+    # INDICATOR STATE SNAPSHOTS
+    # ========================================================================
+    
+    def _history_state_anchor(self, candles: pd.DataFrame) -> tuple:
+        """
+        (as_of, {kind: checksum}, tail length) of the history a snapshot is built from.
+        
+        Warm-up state depends on every candle of the history, so its
+        checksum covers the whole frame. End-of-day snapshots are taken from
+        the candle buffer, so theirs covers the tail kept there.
+        """
+        records = candles[['timestamp', 'open', 'high', 'low', 'close', 'volume']].to_dict('records')
+        tail = records[-(self.max_candles - 1):]
+        checksums = {WARMUP: candle_checksum(records), END_OF_DAY: candle_checksum(tail)}
+        return records[-1]['timestamp'], checksums, len(tail)
+    
+    def _restore_indicator_state(
+        self,
+        symbol: str,
+        timeframe: str,
+        indicator_key: str,
+        indicator: Any,
+        candles: pd.DataFrame,
+        col_name: str,
+        anchor: tuple
+    ) -> bool:
+        """
+        Restore a saved snapshot instead of warming up.
+        
+        Warm-up snapshots give exactly the warm-up result. With
+        indicator_state_carry_over an end-of-day snapshot of the previous
+        day is preferred (continuous state across days).
+        
+        On success the snapshot's tail values are written to `col_name` for
+        the last candles (earlier rows stay NaN - only the buffer reads them).
+        
+        Returns:
+            False if there is no matching snapshot (caller warms up)
+        """
+        if not hasattr(indicator, 'set_state'):
+            return False
+        
+        as_of, checksums, tail_length = anchor
+        kinds = (END_OF_DAY, WARMUP) if self.indicator_state_carry_over else (WARMUP,)
+        for kind in kinds:
+            entry = self.indicator_state_store.load(
+                symbol, timeframe, indicator_key, indicator.params, as_of, checksums[kind], kind=kind
+            )
+            if entry is not None:
+                break
+        else:
+            return False
+        
+        tail = entry.get('tail')
+        if tail is not None and len(tail) != tail_length:
+            return False
+        
+        try:
+            indicator.set_state(entry['state'])
+        except ValueError as e:
+            logger.warning(f"⚠️  Saved state rejected for {indicator_key}, warming up: {e}")
+            return False
+        
+        if tail is not None:
+            candles[col_name] = float('nan')
+            candles.loc[candles.index[-tail_length:], col_name] = tail
+        return True
+    
+    def _save_indicator_state(
+        self,
+        symbol: str,
+        timeframe: str,
+        indicator_key: str,
+        indicator: Any,
+        anchor: tuple,
+        tail: Optional[List[Any]],
+        kind: str
+    ) -> bool:
+        """Snapshot one indicator as `kind` (never fails the run)."""
+        if not hasattr(indicator, 'get_state'):
+            return False
+        
+        as_of, checksums, _ = anchor
+        try:
+            state = indicator.get_state()
+        except Exception as e:
+            logger.debug(f"Indicator state not saved for {indicator_key}: {e}")
+            return False
+        
+        return self.indicator_state_store.save(
+            symbol, timeframe, indicator_key, indicator.params, as_of, checksums[kind], state, tail, kind=kind
+        )
+    
+    def save_indicator_states(self) -> int:
+        """
+        Snapshot every indicator at the end of the replayed day.
+        
+        The next trading day's history ends on the same candles, so with
+        indicator_state_carry_over its initialize_from_historical_data()
+        continues from this state instead of warming up. Written only with
+        indicator_state_carry_over (end-of-day and warm-up snapshots are
+        separate files).
+        
+        Returns:
+            Number of snapshots written
+        """
+        if self.indicator_state_store is None or not self.indicator_state_carry_over:
+            return 0
+        
+        saved = 0
+        for key, indicators in self.indicators.items():
+            buffer = self.candle_buffers.get(key)
+            if not indicators or buffer is None or buffer.completed_count == 0:
+                continue
+            
+            # Batched state lives in the bank until synced
+            self._release_indicator_bank(key)
+            
+            symbol, timeframe = key.rsplit(':', 1)
+            rows = buffer.to_list()[:buffer.completed_count]
+            anchor = (rows[-1]['timestamp'], {END_OF_DAY: candle_checksum(rows)}, len(rows))
+            buffered = set(buffer.indicator_names)
+            
+            for indicator_key, indicator in indicators.items():
+                tail = None
+                if indicator_key in buffered:
+                    tail = [row['indicators'].get(indicator_key, float('nan')) for row in rows]
+                saved += self._save_indicator_state(symbol, timeframe, indicator_key, indicator, anchor, tail,
+                                                    kind=END_OF_DAY)
+        
+        if saved:
+            logger.info(f"💾 Saved {saved} indicator states for the next trading day")
+        return saved
+    
+    def _get_candle_buffer(self, key: str) -> CandleRingBuffer:
+        """Get or create the ring buffer for a symbol:timeframe key."""
+        buffer = self.candle_buffers.get(key)
+        if buffer is None:
+            buffer = CandleRingBuffer(max_candles=self.max_candles)
+            self.candle_buffers[key] = buffer
+            self._link_forming_source(key, buffer)
+            self.market_data.register_candles(key, buffer.view())
+        return buffer
+    
+    def _link_forming_source(self, key: str, buffer: CandleRingBuffer):
+        """
+        Let a higher-timeframe buffer read its forming candle from the aggregator.
+        
+        Those candles change with every base-bar tick; building them on read
+        keeps process_tick independent of the number of timeframes.
+        """
+        aggregator = self.candle_aggregator
+        symbol, timeframe = key.rsplit(':', 1)
+        if aggregator is not None and timeframe in aggregator.higher:
+            buffer.set_forming_source(partial(aggregator.get_current_candle, symbol, timeframe))
+        else:
+            buffer.set_forming_source(None)
+    
     def _add_to_candle_buffer(self, symbol: str, timeframe: str, candle: Dict[str, Any]):
         """
-        Add completed candle to 20-candle buffer with incremental indicator updates.
+        Add completed candle to the candle ring buffer with incremental indicator updates.
         
-        Uses pure list operations (no DataFrame conversions) for optimal performance.
+        Writes straight into the buffer arrays (no list rebuild / cache round trip).
         
         Args:
             symbol: Unified symbol
@@ -462,26 +712,19 @@ class DataManager:
         """
         key = f"{symbol}:{timeframe}"
         
-        # Get current buffer as list of dicts (no conversion needed!)
-        buffer = self.cache.get_candles(symbol, timeframe, count=20)
-        if not buffer:
-            buffer = []
-        
-        # Create new candle dict (OHLCV only initially)
-        new_candle_data = {
-            'timestamp': candle['timestamp'],
-            'open': candle['open'],
-            'high': candle['high'],
-            'low': candle['low'],
-            'close': candle['close'],
-            'volume': candle['volume']
-        }
-        
         # Update indicators incrementally (O(1) - super fast!)
-        if key in self.indicators and self.indicators[key]:
-            # Initialize indicators dict
-            new_candle_data['indicators'] = {}
-            
+        indicator_values = {}
+        started = time.perf_counter()
+        bank = self._get_indicator_bank(key)
+        if bank is not None:
+            # Same-family indicators advance together in one vectorized step
+            try:
+                indicator_values = bank.update(candle)
+            except RuntimeError as e:
+                logger.error(f"❌ CRITICAL: {e}")
+                logger.error(f"   Candle: {candle}")
+                raise
+        elif key in self.indicators and self.indicators[key]:
             for indicator_key, indicator in self.indicators[key].items():
                 try:
                     # ✅ Incremental update (1 calculation, not 20!)
@@ -491,10 +734,10 @@ class DataManager:
                         if isinstance(new_value, dict):
                             # Multi-column result (e.g., MACD)
                             for col, val in new_value.items():
-                                new_candle_data['indicators'][f"{indicator_key}_{col}"] = val
+                                indicator_values[f"{indicator_key}_{col}"] = val
                         else:
-                            # Single value result - nest under 'indicators'
-                            new_candle_data['indicators'][indicator_key] = new_value
+                            # Single value result
+                            indicator_values[indicator_key] = new_value
                 
                 except Exception as e:
                     import traceback
@@ -503,32 +746,32 @@ class DataManager:
                     logger.error(f"   Full traceback:\n{traceback.format_exc()}")
                     # Re-raise - incremental indicator update failure is critical
                     raise RuntimeError(f"Incremental update failed for {indicator_key}: {e}") from e
+        self.indicator_series.record_updates(key, time.perf_counter() - started)
         
-        # Check if buffer has a forming candle at the end (no indicators)
-        has_forming = False
-        if buffer and not any(k for k in buffer[-1].keys() if k not in ['timestamp', 'open', 'high', 'low', 'close', 'volume', 'symbol', 'timeframe']):
-            # Last candle has only OHLCV fields → it's a forming candle
-            has_forming = True
-        
-        if has_forming:
-            # Remove the forming candle temporarily
-            forming_candle = buffer.pop()
-        
-        # Append new completed candle (with indicators)
-        buffer.append(new_candle_data)
-        
-        # Keep last 19 completed candles (to make room for forming candle)
-        buffer = buffer[-19:]
-        
-        if has_forming:
-            # Re-add the forming candle at the end
-            buffer.append(forming_candle)
-        
-        # Store back in cache (no conversion needed!)
-        self.cache.set_candles(symbol, timeframe, buffer)
+        # Forming slot is untouched - it stays last until the next tick replaces it
+        self._get_candle_buffer(key).append_completed(candle, indicator_values)
+        self.market_data.mark_candle(key)
         
         logger.debug(f"📊 Updated {symbol}:{timeframe} buffer with incremental indicators")
     
+    def _get_indicator_bank(self, key: str) -> Optional[Any]:
+        """IndicatorBank for a symbol:timeframe (None without indicators or bank support)."""
+        indicators = self.indicators.get(key)
+        bank = self.indicator_banks.get(key)
+        if bank is not None and not bank.covers(indicators):
+            # Indicator dict replaced or changed without register_indicator()
+            self._release_indicator_bank(key)
+            bank = None
+        if bank is None and IndicatorBank is not None and indicators:
+            bank = self.indicator_banks[key] = IndicatorBank(indicators)
+        return bank
+    
+    def _release_indicator_bank(self, key: str):
+        """Hand batched state back to the indicator instances and drop the bank."""
+        bank = self.indicator_banks.pop(key, None)
+        if bank is not None:
+            bank.sync()
+    
     # NOTE: _add_indicator_columns method removed - replaced with incremental updates
     # Old method recalculated ALL indicators on ALL candles (20x slower + wrong history)
     # New method uses indicator.update() for O(1) incremental calculation
@@ -538,47 +781,16 @@ class DataManager:
         Update the forming candle (last element) in the buffer.
         
         This is called on every tick to ensure the buffer always has up-to-date
-        OHLCV data for the current forming candle.
+        OHLCV data for the current forming candle. Updates the forming slot in place.
         
         Args:
             symbol: Unified symbol
             timeframe: Timeframe
             forming_candle: Current forming candle from CandleBuilder
         """
-        buffer = self.cache.get_candles(symbol, timeframe, count=20)
-        if not buffer:
-            # No buffer yet, create one with just the forming candle
-            buffer = []
-        
-        # Create forming candle dict (OHLCV only, NO indicators)
-        forming_candle_data = {
-            'timestamp': forming_candle['timestamp'],
-            'open': forming_candle['open'],
-            'high': forming_candle['high'],
-            'low': forming_candle['low'],
-            'close': forming_candle['close'],
-            'volume': forming_candle['volume']
-        }
-        
-        if buffer:
-            # Check if last element is a forming candle (no indicators)
-            last_candle = buffer[-1]
-            is_forming = not any(k for k in last_candle.keys() if k not in ['timestamp', 'open', 'high', 'low', 'close', 'volume', 'symbol', 'timeframe'])
-            
-            if is_forming:
-                # Replace the forming candle
-                buffer[-1] = forming_candle_data
-            else:
-                # No forming candle yet, append it
-                buffer.append(forming_candle_data)
-        else:
-            # Empty buffer, add forming candle
-            buffer.append(forming_candle_data)
-        
-        # Store back in cache
-        self.cache.set_candles(symbol, timeframe, buffer)
-        
-        # DEBUG (disabled)
+        key = f"{symbol}:{timeframe}"
+        if self._get_candle_buffer(key).set_forming(forming_candle):
+            self.market_data.mark_candle(key)
     
     def get_context(self) -> Dict[str, Any]:
         """
@@ -590,37 +802,18 @@ class DataManager:
         
         Returns:
             Context dict with:
-                - candle_df_dict: {symbol:timeframe: [list of candle dicts]}
+                - candle_df_dict: {symbol:timeframe: CandleBufferView} (sequence of candle dicts)
+                - market_data: MarketDataSnapshot (version, dirty_candles, dirty_ltp)
                 - ltp: {symbol: price} - Unified LTP store
                 - data_manager: Reference to DataManager for service calls
                 - pattern_resolver: For resolving option patterns
         """
-        # Build candle_df_dict from cache
-        # Include ALL symbols with candles, not just those with indicators
-        candle_df_dict = {}
-        
-        # Get all unique symbol:timeframe combinations from cache
-        # First, try from indicators (if any)
-        keys_to_check = set(self.indicators.keys())
-        
-        # Also check cache directly for any stored candles
-        # DictCache stores candles with keys like "NIFTY:1m"
-        if hasattr(self.cache, 'candles'):
-            keys_to_check.update(self.cache.candles.keys())
-        
-        # Get candles for all keys
-        for key in keys_to_check:
-            if ':' in key:
-                symbol, timeframe = key.split(':', 1)
-                candles = self.cache.get_candles(symbol, timeframe, count=20)
-                if candles is not None and len(candles) > 0:
-                    # DEBUG (disabled)
-                    candle_df_dict[key] = candles
-        
         # SIMPLIFIED: Only expose what strategies actually need
+        # Market data comes from the shared snapshot (updated in place, nothing rebuilt)
         return {
             # Market data
-            'candle_df_dict': candle_df_dict,  # All candles with indicators
+            'candle_df_dict': self.market_data.candle_df_dict,  # All candles with indicators
+            'market_data': self.market_data,   # Version + per-tick dirty keys
             'ltp': self.ltp,                   # Current prices {symbol: price}
             'ltp_store': self.ltp_store,       # Full LTP store with metadata
             
@@ -657,25 +850,6 @@ class DataManager:
         # Indices and futures don't have :OPT:
         return True
     
-    def _format_timestamp_microseconds(self, timestamp: Any) -> str:
-        """
-        Format timestamp to microseconds string.
-        
-        Args:
-            timestamp: Timestamp (datetime, string, or int)
-        
-        Returns:
-            Formatted timestamp string with microseconds
-        """
-        if isinstance(timestamp, datetime):
-            return timestamp.strftime('%Y-%m-%d %H:%M:%S.%f')
-        elif isinstance(timestamp, str):
-            return timestamp
-        elif isinstance(timestamp, (int, float)):
-            dt = datetime.fromtimestamp(timestamp)
-            return dt.strftime('%Y-%m-%d %H:%M:%S.%f')
-        return str(timestamp)
-    
     def get_stats(self) -> Dict[str, Any]:
         """
         Get data manager statistics.
@@ -696,7 +870,9 @@ class DataManager:
             'total_indicators': total_indicators,
             'initialized_indicators': initialized_indicators,
             'ltp_store_size': len(self.ltp_store),
-            'candle_builders': len(self.candle_builders)
+            'candle_builders': len(self.candle_builders),
+            'indicator_series': self.indicator_series.get_summary(),
+            'symbol_table': self.symbol_table.get_summary()
         }
 
     # ========================================================================
@@ -932,7 +1108,12 @@ class DataManager:
         logger.info(f"   ✅ Subscribed to {len(symbols_to_subscribe)} symbols")
     
     def _initialize_symbol_cache(self):
-        """Initialize symbol cache for symbol mapping."""
+        """Initialize symbol cache for symbol mapping (loaded once per process)."""
+        from src.symbol_mapping.symbol_cache_manager import get_symbol_cache_manager
+        if get_symbol_cache_manager().is_loaded():
+            logger.info("   ✅ Symbol cache already loaded")
+            return
+        
         logger.info("   Initializing symbol cache...")
         
         try:
@@ -958,6 +1139,11 @@ class DataManager:
             self.clickhouse_client = client
             logger.info(f"   ✅ ClickHouse client assigned to self.clickhouse_client")
             
+            # The client is process-wide: check the tables for the first day only
+            if DataManager._clickhouse_tables_checked:
+                return
+            DataManager._clickhouse_tables_checked = True
+            
             try:
                 ohlcv_exists = client.command("EXISTS TABLE nse_ohlcv_indices")
                 ticks_exists = client.command("EXISTS TABLE nse_ticks_indices")
@@ -1018,9 +1204,62 @@ class DataManager:
             self.option_loader = None
             self.pattern_resolver = None
     
+    def prefetch_option_contracts(self, contract_keys: List[str], date: Any) -> int:
+        """
+        Load the day's ticks for all planned option contracts in ONE query.
+
+        Contracts come from OptionPrefetchPlanner (every contract the option
+        patterns can resolve to within the day's spot range). Ticks land in
+        per-contract columnar buffers that load_option_contract() serves from
+        instead of issuing a query per contract.
+
+        Args:
+            contract_keys: Universal contract keys (NIFTY:2024-10-03:OPT:25900:CE)
+            date: Trading day
+
+        Returns:
+            Number of contracts with ticks
+        """
+        from src.backtesting.option_prefetch import OptionTickBuffer
+        from src.symbol_mapping.clickhouse_ticker_converter import from_universal
+
+        if not contract_keys or not self.clickhouse_client:
+            return 0
+
+        trading_day = date.strftime('%Y-%m-%d') if hasattr(date, 'strftime') else str(date)
+
+        # Exact ClickHouse tickers (with exchange suffix) -> contract key
+        contracts_by_ticker = {f"{from_universal(key)}.NFO": key for key in contract_keys}
+        tickers = list(contracts_by_ticker)
+
+        df = self._query_tick_frame(
+            table='nse_ticks_options',
+            trading_day=trading_day,
+            variant='raw',
+            symbols=tickers,
+            build_query=lambda syms: self._build_option_contract_ticks_query(trading_day, syms),
+            symbol_column='ticker'
+        )
+        if df is None:
+            df = self.clickhouse_client.query_df(self._build_option_contract_ticks_query(trading_day, tickers))
+
+        # Planned contracts without ticks resolve to None without a re-query
+        self.prefetched_option_contracts.update(contract_keys)
+        if df is not None and not df.empty:
+            for ticker, contract_df in df.groupby('ticker', sort=False):
+                contract_key = contracts_by_ticker.get(ticker)
+                if contract_key is not None:
+                    self.prefetched_option_ticks[contract_key] = OptionTickBuffer.from_frame(contract_key, contract_df)
+
+        logger.info(
+            f"📦 Prefetched {len(self.prefetched_option_ticks)}/{len(contract_keys)} option contracts "
+            f"({0 if df is None else len(df):,} ticks) in one query"
+        )
+        return len(self.prefetched_option_ticks)
+
     def load_option_contract(self, contract_key: str, current_timestamp: Any) -> Optional[float]:
         """
-        Load ALL option ticks for the day and buffer them for tick-by-tick processing.
+        Buffer an option contract's ticks for tick-by-tick processing.
         
         This simulates live trading websocket behavior:
         - In live: Subscribe to option → Get ticks from next tick onwards
@@ -1029,8 +1268,9 @@ class DataManager:
         Workflow:
         1. Entry node resolves: NIFTY:W0:ATM:CE → NIFTY:2024-10-03:OPT:25900:CE
         2. Entry node calls: data_manager.load_option_contract(contract_key, timestamp)
-        3. Load ALL option ticks for the day from ClickHouse
-        4. Store in buffer starting from current_timestamp
+        3. Take the contract's prefetched buffer (prefetch_option_contracts), or
+           load its ticks from ClickHouse if it was not planned
+        4. Replay the buffer from current_timestamp
         5. Return first LTP for immediate order placement
         6. Subsequent ticks processed in main loop via get_option_ticks_for_timestamp()
         
@@ -1041,7 +1281,6 @@ class DataManager:
         Returns:
             First option LTP at/after current_timestamp, or None if unavailable
         """
-        from collections import deque
         from datetime import datetime
         
         # Check if already loaded
@@ -1049,89 +1288,44 @@ class DataManager:
             print(f"   ℹ️  Option contract already loaded: {contract_key}")
             return self.ltp.get(contract_key)
         
-        if not self.clickhouse_client:
-            error_msg = f"⚠️  ClickHouse client not initialized, cannot load {contract_key}"
-            logger.warning(error_msg)
-            print(f"\n{error_msg}")
-            print(f"   System will use fallback pricing (underlying spot price)")
-            return None
+        # Ensure current_timestamp is datetime
+        if isinstance(current_timestamp, str):
+            current_timestamp = datetime.fromisoformat(current_timestamp)
         
         try:
-            # Convert universal format to ClickHouse format
-            # NIFTY:2024-10-03:OPT:25900:CE → NIFTY03OCT2425900CE
-            from src.symbol_mapping.clickhouse_ticker_converter import from_universal
-            ch_symbol = from_universal(contract_key)
-            
-            # Add .NFO suffix as ClickHouse stores tickers with exchange suffix
-            ch_symbol_with_nfo = f"{ch_symbol}.NFO"
-            
-            # Ensure current_timestamp is datetime
-            if isinstance(current_timestamp, str):
-                current_timestamp = datetime.fromisoformat(current_timestamp)
-            
-            # Get trading day
-            trading_day = current_timestamp.strftime('%Y-%m-%d')
-            # Convert datetime to Unix timestamp for comparison
-            timestamp_unix = int(current_timestamp.timestamp())
-            
-            # Load ALL option ticks from current_timestamp onwards
-            # Note: ticker column includes .NFO suffix
-            # timestamp is stored as UInt32 (Unix timestamp in seconds)
-            query = f"""
-                SELECT 
-                    ticker,
-                    timestamp,
-                    ltp,
-                    ltq,
-                    oi
-                FROM nse_ticks_options
-                WHERE trading_day = '{trading_day}'
-                  AND ticker = '{ch_symbol_with_nfo}'
-                  AND timestamp >= {timestamp_unix}
-                ORDER BY timestamp ASC
-            """
-            
-            result = self.clickhouse_client.query(query)
+            if contract_key in self.prefetched_option_contracts:
+                # Planned contract: already in memory (or known to have no ticks)
+                buffer = self.prefetched_option_ticks.pop(contract_key, None)
+            elif not self.clickhouse_client:
+                error_msg = f"⚠️  ClickHouse client not initialized, cannot load {contract_key}"
+                logger.warning(error_msg)
+                print(f"\n{error_msg}")
+                print(f"   System will use fallback pricing (underlying spot price)")
+                return None
+            else:
+                buffer = self._load_option_contract_buffer(contract_key, current_timestamp)
             
-            # Convert to tick dictionaries with universal symbol format
-            option_ticks = []
-            for row in result.result_rows:
-                tick = {
-                    'symbol': contract_key,  # Use universal format
-                    'timestamp': row[1],
-                    'ltp': row[2],
-                    'ltq': row[3],
-                    'oi': row[4],
-                }
-                option_ticks.append(tick)
+            first_tick = None
+            if buffer is not None:
+                buffer.seek(current_timestamp)
+                first_tick = buffer.first_tick()
             
-            if not option_ticks:
-                error_msg = f"⚠️  No option ticks found for {contract_key} from {timestamp_str}"
-                logger.warning(error_msg)
+            if first_tick is None:
+                logger.warning(f"⚠️  No option ticks found for {contract_key} from {current_timestamp}")
                 return None
             
             # Store in buffer for tick-by-tick processing
-            self.option_tick_buffers[contract_key] = {
-                'ticks': deque(option_ticks),
-                'current_index': 0
-            }
+            self.option_tick_buffers[contract_key] = buffer
             
             # Track loaded contract
             self.loaded_option_contracts.add(contract_key)
             
             # Get first LTP for immediate order placement
-            first_tick = option_ticks[0]
             first_ltp = first_tick['ltp']
             
-            # Update LTP stores with first tick
-            self.ltp[contract_key] = first_ltp
-            self.ltp_store[contract_key] = {
-                'ltp': first_ltp,
-                'timestamp': first_tick['timestamp'],
-                'volume': 0,
-                'oi': first_tick['oi']
-            }
-            logger.info(f"✅ Loaded option contract: {contract_key} - {len(option_ticks):,} ticks from {timestamp_str}")
+            # Update LTP store with first tick
+            self.ltp_slots.set(contract_key, first_ltp, first_tick['timestamp'], 0, first_tick['oi'])
+            logger.info(f"✅ Loaded option contract: {contract_key} - {len(buffer):,} ticks from {current_timestamp}")
             
             return first_ltp
                 
@@ -1145,6 +1339,35 @@ class DataManager:
             print(f"   System will use fallback pricing (underlying spot price)")
             return None
     
+    def _load_option_contract_buffer(self, contract_key: str, current_timestamp: datetime) -> 'OptionTickBuffer':
+        """Query one (unplanned) contract's ticks from current_timestamp onwards."""
+        from src.backtesting.option_prefetch import OptionTickBuffer
+        from src.symbol_mapping.clickhouse_ticker_converter import from_universal
+        
+        # Convert universal format to ClickHouse format
+        # NIFTY:2024-10-03:OPT:25900:CE → NIFTY03OCT2425900CE.NFO
+        # (ClickHouse stores tickers with exchange suffix)
+        ch_symbol_with_nfo = f"{from_universal(contract_key)}.NFO"
+        trading_day = current_timestamp.strftime('%Y-%m-%d')
+        
+        # Local tick store caches the contract's full day; the buffer seeks to current_timestamp
+        contract_df = self._query_tick_frame(
+            table='nse_ticks_options',
+            trading_day=trading_day,
+            variant='raw',
+            symbols=[ch_symbol_with_nfo],
+            build_query=lambda syms: self._build_option_contract_ticks_query(trading_day, syms),
+            symbol_column='ticker'
+        )
+        if contract_df is None:
+            # timestamp is stored as UInt32 (Unix timestamp in seconds)
+            query = self._build_option_contract_ticks_query(
+                trading_day, [ch_symbol_with_nfo], from_unix=int(current_timestamp.timestamp())
+            )
+            contract_df = self.clickhouse_client.query_df(query)
+        
+        return OptionTickBuffer.from_frame(contract_key, contract_df)
+    
     def get_option_ticks_for_timestamp(self, current_timestamp: Any) -> List[Dict[str, Any]]:
         """
         Get all option ticks that match the current timestamp.
@@ -1166,30 +1389,10 @@ class DataManager:
         if isinstance(current_timestamp, str):
             current_timestamp = datetime.fromisoformat(current_timestamp)
         
-        # Check each loaded option contract
-        for contract_key, buffer_data in self.option_tick_buffers.items():
-            ticks_deque = buffer_data['ticks']
-            
-            # Peek at ticks without removing them
-            # Get all ticks at current_timestamp
-            while ticks_deque:
-                # Peek at first tick
-                next_tick = ticks_deque[0]
-                tick_timestamp = next_tick['timestamp']
-                
-                # Ensure tick_timestamp is datetime
-                if isinstance(tick_timestamp, str):
-                    tick_timestamp = datetime.fromisoformat(tick_timestamp)
-                
-                if tick_timestamp < current_timestamp:
-                    # This tick is in the past, remove it (should not happen if loaded correctly)
-                    ticks_deque.popleft()
-                elif tick_timestamp == current_timestamp:
-                    # This tick matches current timestamp, add to results and remove
-                    option_ticks.append(ticks_deque.popleft())
-                else:
-                    # Future tick, stop checking this contract
-                    break
+        # Ticks in the past are dropped, future ticks stay buffered
+        for buffer in self.option_tick_buffers.values():
+            if len(buffer):
+                option_ticks.extend(buffer.pop_at(current_timestamp))
         
         return option_ticks
     
@@ -1197,17 +1400,24 @@ class DataManager:
         """
         Setup candle builders for all timeframes.
         
+        A single MultiTimeframeCandleAggregator builds every timeframe;
+        candle_builders maps each timeframe to its CandleBuilder-like view.
+        
         Args:
             timeframes: List of timeframes (e.g., ['1m', '5m'])
         """
         logger.info(f"   Setting up candle builders for {timeframes}...")
         
-        from src.backtesting.candle_builder import CandleBuilder
+        from src.backtesting.candle_aggregator import MultiTimeframeCandleAggregator
         
-        for timeframe in timeframes:
-            self.candle_builders[timeframe] = CandleBuilder(timeframe=timeframe)
+        all_timeframes = list(dict.fromkeys([*self.candle_builders, *timeframes]))
+        self.candle_aggregator = MultiTimeframeCandleAggregator(all_timeframes)
+        self.candle_builders = dict(self.candle_aggregator.views)
+        for key, buffer in self.candle_buffers.items():
+            self._link_forming_source(key, buffer)
         
-        logger.info(f"   ✅ {len(timeframes)} candle builders created")
+        logger.info(f"   ✅ {len(self.candle_builders)} candle builders created "
+                    f"({self.candle_aggregator.base_minutes}m base bars)")
     
     def _register_indicators(self, strategy: Any):
         """
@@ -1253,7 +1463,8 @@ class DataManager:
                         symbol=symbol,
                         timeframe=timeframe,
                         indicator=indicator,
-                        database_key=indicator_metadata.key  # Map database key to generated key
+                        database_key=indicator_metadata.key,  # Map database key to generated key
+                        strategy_id=getattr(strategy, 'strategy_id', None)
                     )
                     
                     if indicator_key:
@@ -1368,16 +1579,20 @@ class DataManager:
                         params = ind_meta.get('params', {})
                         indicator = indicator_class(**params)
                         
-                        # Extract database key (e.g., 'rsi_1764509210372') from metadata
-                        database_key = ind_meta.get('key')
+                        # Every strategy referencing this series, with its database key
+                        # (e.g., 'rsi_1764509210372'); older metadata has just 'key'
+                        refs = ind_meta.get('refs') or [{'strategy_id': None, 'key': ind_meta.get('key')}]
                         
-                        # Register with data manager (pass database key for mapping)
-                        indicator_key = self.register_indicator(
-                            symbol=symbol,
-                            timeframe=timeframe,
-                            indicator=indicator,
-                            database_key=database_key
-                        )
+                        # Register with data manager (pass database keys for mapping) -
+                        # the first reference creates the series, the rest share it
+                        for ref in refs:
+                            indicator_key = self.register_indicator(
+                                symbol=symbol,
+                                timeframe=timeframe,
+                                indicator=indicator,
+                                database_key=ref.get('key'),
+                                strategy_id=ref.get('strategy_id')
+                            )
                         
                         if indicator_key:
                             registered_count += 1
@@ -1430,27 +1645,36 @@ class DataManager:
             for timeframe in timeframes:
                 # Define loader function for SharedDataCache
                 def load_candles(sym: str, tf: str) -> pd.DataFrame:
-                    """Load candles from ClickHouse."""
-                    query = f"""
-                        SELECT 
-                            timestamp,
-                            open,
-                            high,
-                            low,
-                            close,
-                            volume,
-                            symbol,
-                            timeframe
-                        FROM nse_ohlcv_indices
-                        WHERE symbol = '{sym}'
-                          AND timeframe = '{tf}'
-                          AND timestamp < '{backtest_date.strftime('%Y-%m-%d')} 09:15:00'
-                        ORDER BY timestamp DESC
-                        LIMIT 500
-                    """
+                    """Load candles from the local tick store, falling back to ClickHouse."""
+                    def build_query(symbols: List[str]) -> str:
+                        return f"""
+                            SELECT 
+                                timestamp,
+                                open,
+                                high,
+                                low,
+                                close,
+                                volume,
+                                symbol,
+                                timeframe
+                            FROM nse_ohlcv_indices
+                            WHERE symbol = '{symbols[0]}'
+                              AND timeframe = '{tf}'
+                              AND timestamp < '{backtest_date.strftime('%Y-%m-%d')} 09:15:00'
+                            ORDER BY timestamp DESC
+                            LIMIT 500
+                        """
                     
-                    # Direct to DataFrame (10-15x faster than manual iteration)
-                    df = self.clickhouse_client.query_df(query)
+                    df = self._query_tick_frame(
+                        table='nse_ohlcv_indices',
+                        trading_day=backtest_date,
+                        variant=f'{tf}_last500',
+                        symbols=[sym],
+                        build_query=build_query
+                    )
+                    if df is None:
+                        # Direct to DataFrame (10-15x faster than manual iteration)
+                        df = self.clickhouse_client.query_df(build_query([sym]))
                     
                     if not df.empty:
                         # Reverse to chronological order (query was DESC to get most recent)
@@ -1486,47 +1710,64 @@ class DataManager:
         trading_day = date.strftime('%Y-%m-%d')
         logger.info(f"📥 Loading raw ticks from ClickHouse for {trading_day}...")
 
-        symbol_list = ','.join(f"'{s}'" for s in symbols)
+        rows = self._query_tick_rows(
+            table='nse_ticks_indices',
+            trading_day=date,
+            variant='raw',
+            symbols=symbols,
+            build_query=lambda syms: self._build_raw_ticks_query(date, syms)
+        )
 
-        # Convert time strings to Unix timestamps for comparison
-        from datetime import datetime
-        start_time = datetime.strptime(f'{trading_day} 09:15:00', '%Y-%m-%d %H:%M:%S')
-        end_time = datetime.strptime(f'{trading_day} 15:30:00', '%Y-%m-%d %H:%M:%S')
-        start_timestamp = int(start_time.timestamp())
-        end_timestamp = int(end_time.timestamp())
-        
-        query = f"""
-            SELECT 
-                symbol,
-                timestamp,
-                ltp,
-                ltq,
-                oi
-            FROM nse_ticks_indices
-            WHERE trading_day = '{trading_day}'
-              AND timestamp >= {start_timestamp}
-              AND timestamp <= {end_timestamp}
-              AND symbol IN ({symbol_list})
-            ORDER BY timestamp ASC
+        row_to_tick = self._interning(self._raw_tick_from_row)
+        ticks: List[Dict[str, Any]] = [row_to_tick(row) for row in rows]
+
+        logger.info(f"✅ Loaded {len(ticks):,} raw ticks")
+
+        return ticks
+
+    def load_ticks_columnar(self, date: Any, symbols: List[str]) -> 'ColumnarTicks':
         """
+        Load raw ticks from ClickHouse as NumPy columns (no per-tick dicts).
 
-        result = self.clickhouse_client.query(query)
+        Same query as load_ticks(), but the result goes straight to a
+        DataFrame and then into a ColumnarTicks store (int64 epoch, float64
+        ltp, int32 symbol codes). Tick dicts are built lazily per second by
+        the replay loop, so peak memory stays a small multiple of the raw
+        column size.
 
-        ticks: List[Dict[str, Any]] = []
-        for row in result.result_rows:
-            tick = {
-                'symbol': row[0],
-                'timestamp': row[1],
-                'ltp': row[2],
-                'ltq': row[3],
-                'oi': row[4],
-            }
-            ticks.append(tick)
+        Args:
+            date: Date to load ticks for
+            symbols: List of symbols to load
 
-        logger.info(f"✅ Loaded {len(ticks):,} raw ticks")
+        Returns:
+            ColumnarTicks store sorted by timestamp
+        """
+        from src.backtesting.columnar_ticks import ColumnarTicks
+
+        trading_day = date.strftime('%Y-%m-%d')
+        logger.info(f"📥 Loading raw ticks (columnar) from ClickHouse for {trading_day}...")
+
+        # Direct to DataFrame (columnar transfer, no per-row tuples)
+        df = self._query_tick_frame(
+            table='nse_ticks_indices',
+            trading_day=date,
+            variant='raw',
+            symbols=symbols,
+            build_query=lambda syms: self._build_raw_ticks_query(date, syms)
+        )
+        if df is None:
+            df = self.clickhouse_client.query_df(self._build_raw_ticks_query(date, symbols))
+        ticks = ColumnarTicks.from_dataframe(df)
+        del df
+        ticks.attach_symbol_ids(self.symbol_table.intern_all(ticks.symbols))
+
+        logger.info(
+            f"✅ Loaded {len(ticks):,} raw ticks in {ticks.second_count:,} seconds "
+            f"({ticks.memory_bytes() / (1024 * 1024):.1f} MB columnar)"
+        )
 
         return ticks
-    
+
     def load_ticks_aggregated(self, date: Any, symbols: List[str]) -> List[Dict[str, Any]]:
         """
         Load AGGREGATED ticks (OHLC per second) from ClickHouse.
@@ -1548,57 +1789,17 @@ class DataManager:
         logger.info(f"📥 Loading aggregated ticks (OHLC/second) from ClickHouse for {trading_day}...")
         logger.info(f"   Symbols: {symbols}")
 
-        symbol_list = ','.join(f"'{s}'" for s in symbols)
-
-        # Convert time strings to Unix timestamps for comparison
-        from datetime import datetime
-        start_time = datetime.strptime(f'{trading_day} 09:15:00', '%Y-%m-%d %H:%M:%S')
-        end_time = datetime.strptime(f'{trading_day} 15:30:00', '%Y-%m-%d %H:%M:%S')
-        start_timestamp = int(start_time.timestamp())
-        end_timestamp = int(end_time.timestamp())
-        
-        # Aggregate in ClickHouse - MUCH faster than Python!
-        # Use groupArray to collect all ltps, then pick first/last for open/close
-        # Truncate timestamp to seconds manually (compatible with all ClickHouse versions)
-        query = f"""
-            SELECT 
-                symbol,
-                toDateTime(toInt64(timestamp)) as second,
-                groupArray(ltp)[1] as open,             -- First LTP in second
-                max(ltp) as high,                       -- Highest LTP in second
-                min(ltp) as low,                        -- Lowest LTP in second
-                groupArray(ltp)[-1] as close,           -- Last LTP in second
-                sum(ltq) as volume,                     -- Sum of volumes
-                groupArray(oi)[-1] as oi               -- Last OI in second
-            FROM nse_ticks_indices
-            WHERE trading_day = '{trading_day}'
-              AND timestamp >= {start_timestamp}
-              AND timestamp <= {end_timestamp}
-              AND symbol IN ({symbol_list})
-            GROUP BY symbol, toDateTime(toInt64(timestamp))
-            ORDER BY second ASC
-        """
-        
-        logger.debug(f"   Query: {query}")
-
-        result = self.clickhouse_client.query(query)
+        rows = self._query_tick_rows(
+            table='nse_ticks_indices',
+            trading_day=date,
+            variant='ohlc_1s',
+            symbols=symbols,
+            build_query=lambda syms: self._build_aggregated_ticks_query(date, syms),
+            sort_column='second'
+        )
 
-        ticks: List[Dict[str, Any]] = []
-        for row in result.result_rows:
-            # close and ltp are the same value (last traded price)
-            close_ltp = float(row[5]) if row[5] else None
-            tick = {
-                'symbol': row[0],
-                'timestamp': row[1],
-                'open': float(row[2]) if row[2] else None,
-                'high': float(row[3]) if row[3] else None,
-                'low': float(row[4]) if row[4] else None,
-                'close': close_ltp,
-                'ltp': close_ltp,  # Same as close
-                'volume': int(row[6]) if row[6] else 0,
-                'oi': int(row[7]) if row[7] else 0,
-            }
-            ticks.append(tick)
+        row_to_tick = self._interning(self._aggregated_tick_from_row)
+        ticks: List[Dict[str, Any]] = [row_to_tick(row) for row in rows]
 
         logger.info(f"✅ Loaded {len(ticks):,} aggregated ticks (OHLC/second)")
 
@@ -1640,10 +1841,12 @@ class DataManager:
 
         result = self.clickhouse_client.query(query)
 
+        try_intern = self.symbol_table.try_intern
         ticks: List[Dict[str, Any]] = []
         for row in result.result_rows:
             tick = {
                 'symbol': row[0],
+                'symbol_id': try_intern(row[0]),
                 'timestamp': row[1],
                 'ltp': row[2],
                 'volume': 0,  # Not available in nse_ticks_options
@@ -1683,8 +1886,437 @@ class DataManager:
             logger.info("ℹ️  load_option_ticks_aggregated called with empty ticker list; returning []")
             return []
 
+        rows = self._query_option_tick_rows(date, tickers, from_timestamp)
+
+        row_to_tick = self._interning(self._option_tick_from_row)
+        ticks: List[Dict[str, Any]] = [row_to_tick(row) for row in rows]
+
+        logger.info(f"✅ Loaded {len(ticks):,} aggregated option ticks for {len(tickers)} contracts")
+        if ticks:
+            logger.info(f"   Sample tickers: {list(set([t['symbol'] for t in ticks[:10]]))}")
+
+        return ticks
+
+    # ========================================================================
+    # STREAMING LOADERS (bounded memory, overlap processing with network I/O)
+    # ========================================================================
+
+    def stream_ticks(self, date: Any, symbols: List[str], prefetch_blocks: int = 2) -> 'TickBatchStream':
+        """
+        Stream raw ticks from ClickHouse as per-second batches.
+
+        Same rows as load_ticks(), but consumed block by block via
+        query_row_block_stream. The next block is fetched in the background
+        while the current second is processed.
+
+        Args:
+            date: Date to load ticks for
+            symbols: List of symbols to load
+            prefetch_blocks: Blocks to buffer ahead of the consumer
+
+        Returns:
+            TickBatchStream yielding (second_timestamp, tick_batch)
+        """
+        from src.backtesting.tick_stream import TickBatchStream
+
+        logger.info(f"📡 Streaming raw ticks from ClickHouse for {date.strftime('%Y-%m-%d')}...")
+        store_slices = dict(
+            table='nse_ticks_indices',
+            trading_day=date,
+            variant='raw',
+            symbols=symbols
+        )
+
+        # Local tick store only when it holds every slice; otherwise stream
+        # from ClickHouse, storing the streamed slices on the way
+        cached = self._query_tick_frame(**store_slices, cached_only=True)
+
+        return TickBatchStream(
+            block_source=(
+                (lambda: self._frame_row_blocks(cached)) if cached is not None
+                else (lambda: self._stream_blocks_filling_store(self._build_raw_ticks_query(date, symbols),
+                                                                **store_slices))
+            ),
+            row_to_tick=self._interning(self._raw_tick_from_row),
+            prefetch_blocks=prefetch_blocks,
+            description='raw ticks'
+        )
+
+    def stream_ticks_aggregated(self, date: Any, symbols: List[str], prefetch_blocks: int = 2) -> 'TickBatchStream':
+        """
+        Stream AGGREGATED ticks (OHLC per second) as per-second batches.
+
+        Streaming counterpart of load_ticks_aggregated().
+
+        Args:
+            date: Date to load ticks for
+            symbols: List of symbols to load
+            prefetch_blocks: Blocks to buffer ahead of the consumer
+
+        Returns:
+            TickBatchStream yielding (second_timestamp, tick_batch)
+        """
+        from src.backtesting.tick_stream import TickBatchStream
+
+        logger.info(f"📡 Streaming aggregated ticks (OHLC/second) for {date.strftime('%Y-%m-%d')}...")
+        store_slices = dict(
+            table='nse_ticks_indices',
+            trading_day=date,
+            variant='ohlc_1s',
+            symbols=symbols
+        )
+
+        # Local tick store only when it holds every slice; otherwise stream
+        # from ClickHouse, storing the streamed slices on the way
+        cached = self._query_tick_frame(**store_slices, sort_column='second', cached_only=True)
+
+        return TickBatchStream(
+            block_source=(
+                (lambda: self._frame_row_blocks(cached)) if cached is not None
+                else (lambda: self._stream_blocks_filling_store(self._build_aggregated_ticks_query(date, symbols),
+                                                                **store_slices))
+            ),
+            row_to_tick=self._interning(self._aggregated_tick_from_row),
+            prefetch_blocks=prefetch_blocks,
+            description='aggregated ticks'
+        )
+
+    def stream_option_ticks_aggregated(
+        self,
+        date: Any,
+        tickers: List[str],
+        from_timestamp: Any = None,
+        prefetch_blocks: int = 2
+    ) -> 'TickBatchStream':
+        """
+        Stream AGGREGATED option ticks (one per second per contract).
+
+        Streaming counterpart of load_option_ticks_aggregated().
+
+        Args:
+            date: Date to load ticks for
+            tickers: List of option ticker symbols in ClickHouse format
+            from_timestamp: Optional timestamp to load from
+            prefetch_blocks: Blocks to buffer ahead of the consumer
+
+        Returns:
+            TickBatchStream yielding (second_timestamp, tick_batch)
+        """
+        from src.backtesting.tick_stream import TickBatchStream
+
+        if not tickers:
+            return TickBatchStream(
+                block_source=lambda: [],
+                row_to_tick=self._option_tick_from_row,
+                prefetch_blocks=0,
+                description='option ticks'
+            )
+
+        query = self._build_option_ticks_aggregated_query(date, tickers, from_timestamp)
+
+        # Local tick store only when it holds every slice; otherwise stream
+        # from ClickHouse, storing the streamed slices on the way (only full
+        # days: a from_timestamp stream is a partial slice)
+        cached = self._query_option_tick_frame(date, tickers, from_timestamp, cached_only=True)
+
+        return TickBatchStream(
+            block_source=(
+                (lambda: self._frame_row_blocks(cached)) if cached is not None
+                else (lambda: self._stream_blocks_filling_store(
+                    query,
+                    table='nse_ticks_options',
+                    trading_day=date,
+                    variant='last_1s',
+                    symbols=tickers,
+                    symbol_column='ticker',
+                    normalize_symbol=lambda ticker: ticker.replace('.NFO', ''),
+                    store=not from_timestamp
+                ))
+            ),
+            row_to_tick=self._interning(self._option_tick_from_row),
+            prefetch_blocks=prefetch_blocks,
+            description='option ticks'
+        )
+
+    # ========================================================================
+    # LOCAL TICK STORE (on-disk slice cache with ClickHouse fallback)
+    # ========================================================================
+
+    def _query_tick_frame(
+        self,
+        table: str,
+        trading_day: Any,
+        variant: str,
+        symbols: List[str],
+        build_query: Any = None,
+        symbol_column: str = 'symbol',
+        normalize_symbol: Any = None,
+        sort_column: str = 'timestamp',
+        cached_only: bool = False
+    ) -> Optional[pd.DataFrame]:
+        """
+        Read per-symbol slices from the local tick store, querying ClickHouse
+        (via query_df) only for the symbols that are missing.
+
+        With cached_only=True nothing is queried: the slices are returned only
+        if the store holds all of them (streaming loaders).
+
+        Args:
+            table: ClickHouse table the slices come from
+            trading_day: Trading day of the slices
+            variant: Query-shape label (e.g. 'raw', 'ohlc_1s')
+            symbols: Symbols (slice keys) to load
+            build_query: Callable(symbols) -> SQL for the missing symbols
+                (not needed with cached_only)
+            symbol_column: Result column holding the symbol
+            normalize_symbol: Maps a result symbol to its slice key
+            sort_column: Column to restore ordering on after combining slices
+            cached_only: Only return fully stored slices, never query
+
+        Returns:
+            Combined DataFrame, or None if the local tick store is disabled
+            (or, with cached_only, does not hold every slice)
+        """
+        from src.storage.local_tick_store import get_local_tick_store
+
+        store = get_local_tick_store()
+        if not store.enabled:
+            return None
+
+        if cached_only:
+            return store.get_cached(table, trading_day, variant, symbols, sort_column=sort_column)
+
+        return store.get_or_fetch(
+            table=table,
+            trading_day=trading_day,
+            variant=variant,
+            symbols=symbols,
+            fetch=lambda missing: self.clickhouse_client.query_df(build_query(missing)),
+            symbol_column=symbol_column,
+            normalize_symbol=normalize_symbol,
+            sort_column=sort_column
+        )
+
+    def _query_tick_rows(
+        self,
+        table: str,
+        trading_day: Any,
+        variant: str,
+        symbols: List[str],
+        build_query: Any,
+        sort_column: str = 'timestamp'
+    ) -> List[tuple]:
+        """
+        Result rows for a tick query, served from the local tick store when
+        enabled and straight from ClickHouse otherwise.
+        """
+        df = self._query_tick_frame(
+            table=table,
+            trading_day=trading_day,
+            variant=variant,
+            symbols=symbols,
+            build_query=build_query,
+            sort_column=sort_column
+        )
+        if df is None:
+            return self.clickhouse_client.query(build_query(symbols)).result_rows
+        return list(df.itertuples(index=False, name=None))
+
+    def _query_option_tick_frame(
+        self,
+        date: Any,
+        tickers: List[str],
+        from_timestamp: Any = None,
+        cached_only: bool = False
+    ) -> Optional[pd.DataFrame]:
+        """
+        Aggregated option ticks from the local tick store.
+
+        Full-day slices are cached per ticker; the from_timestamp filter that
+        the ClickHouse query applies at source is applied locally instead.
+        Returns None if the local tick store is disabled (or, with
+        cached_only, does not hold every ticker).
+        """
+        df = self._query_tick_frame(
+            table='nse_ticks_options',
+            trading_day=date,
+            variant='last_1s',
+            symbols=tickers,
+            build_query=lambda syms: self._build_option_ticks_aggregated_query(date, syms),
+            symbol_column='ticker',
+            normalize_symbol=lambda ticker: ticker.replace('.NFO', ''),
+            sort_column='second',
+            cached_only=cached_only
+        )
+        if df is not None and from_timestamp and not df.empty:
+            if isinstance(from_timestamp, str):
+                from_timestamp = datetime.fromisoformat(from_timestamp)
+            df = df[df['second'] >= pd.Timestamp(from_timestamp).floor('s')]
+        return df
+
+    def _query_option_tick_rows(self, date: Any, tickers: List[str], from_timestamp: Any = None) -> List[tuple]:
+        """Aggregated option tick rows (local tick store or ClickHouse)."""
+        df = self._query_option_tick_frame(date, tickers, from_timestamp)
+        if df is None:
+            query = self._build_option_ticks_aggregated_query(date, tickers, from_timestamp)
+            return self.clickhouse_client.query(query).result_rows
+        return list(df.itertuples(index=False, name=None))
+
+    def _stream_blocks_filling_store(
+        self,
+        query: str,
+        table: str,
+        trading_day: Any,
+        variant: str,
+        symbols: List[str],
+        symbol_column: str = 'symbol',
+        normalize_symbol: Any = None,
+        store: bool = True
+    ):
+        """
+        Yield query_row_block_stream blocks (TickBatchStream source) while
+        writing them into the local tick store's per-symbol slices.
+
+        The slices are published only once every block was consumed (a stream
+        closed early or failing leaves the store untouched). Nothing is
+        queried again and the streamed day is never held in memory as a whole.
+        store=False only streams (the query does not return whole slices).
+        """
+        from src.storage.local_tick_store import get_local_tick_store
+
+        writer = get_local_tick_store().slice_writer(
+            table, trading_day, variant, symbols,
+            symbol_column=symbol_column,
+            normalize_symbol=normalize_symbol
+        ) if store else None
+        source = self.clickhouse_client.query_row_block_stream(query)
+        try:
+            if hasattr(source, '__enter__'):
+                with source as blocks:
+                    yield from self._blocks_into_store(blocks, writer, source)
+            else:
+                yield from self._blocks_into_store(source, writer, source)
+            if writer is not None:
+                writer.commit(self._stream_column_names(source))
+        finally:
+            if writer is not None:
+                writer.abort()
+
+    def _blocks_into_store(self, blocks: Any, writer: Any, source: Any):
+        """Pass blocks through, handing each to the slice writer first."""
+        column_names = None
+        for block in blocks:
+            if writer is not None and not writer.closed:
+                column_names = column_names or self._stream_column_names(source)
+                if column_names:
+                    writer.write_block(column_names, block)
+                else:
+                    logger.debug("Streamed ticks not stored: result column names unknown")
+                    writer.abort()
+            yield block
+
+    @staticmethod
+    def _stream_column_names(source: Any) -> List[str]:
+        """Result column names of a clickhouse_connect StreamContext ([] if unknown)."""
+        return list(getattr(getattr(source, 'source', None), 'column_names', None) or ())
+
+    @staticmethod
+    def _frame_row_blocks(df: pd.DataFrame, block_size: int = 65536):
+        """Yield a DataFrame as row-tuple blocks (TickBatchStream source)."""
+        for start in range(0, len(df), block_size):
+            yield list(df.iloc[start:start + block_size].itertuples(index=False, name=None))
+
+    # ========================================================================
+    # TICK QUERY BUILDERS AND ROW CONVERTERS
+    # ========================================================================
+
+    @staticmethod
+    def _trading_session_bounds(trading_day: str) -> tuple:
+        """Return (start, end) Unix timestamps of the 09:15-15:30 session."""
+        start_time = datetime.strptime(f'{trading_day} 09:15:00', '%Y-%m-%d %H:%M:%S')
+        end_time = datetime.strptime(f'{trading_day} 15:30:00', '%Y-%m-%d %H:%M:%S')
+        return int(start_time.timestamp()), int(end_time.timestamp())
+
+    def _build_raw_ticks_query(self, date: Any, symbols: List[str]) -> str:
+        """Build the raw index tick query (ordered by timestamp)."""
+        trading_day = date.strftime('%Y-%m-%d')
+        symbol_list = ','.join(f"'{s}'" for s in symbols)
+
+        # Convert time strings to Unix timestamps for comparison
+        start_timestamp, end_timestamp = self._trading_session_bounds(trading_day)
+        
+        return f"""
+            SELECT 
+                symbol,
+                timestamp,
+                ltp,
+                ltq,
+                oi
+            FROM nse_ticks_indices
+            WHERE trading_day = '{trading_day}'
+              AND timestamp >= {start_timestamp}
+              AND timestamp <= {end_timestamp}
+              AND symbol IN ({symbol_list})
+            ORDER BY timestamp ASC
+        """
+
+    def _build_aggregated_ticks_query(self, date: Any, symbols: List[str]) -> str:
+        """Build the OHLC-per-second index tick query (ordered by second)."""
+        trading_day = date.strftime('%Y-%m-%d')
+        symbol_list = ','.join(f"'{s}'" for s in symbols)
+
+        # Convert time strings to Unix timestamps for comparison
+        start_timestamp, end_timestamp = self._trading_session_bounds(trading_day)
+        
+        # Aggregate in ClickHouse - MUCH faster than Python!
+        # Use groupArray to collect all ltps, then pick first/last for open/close
+        # Truncate timestamp to seconds manually (compatible with all ClickHouse versions)
+        return f"""
+            SELECT 
+                symbol,
+                toDateTime(toInt64(timestamp)) as second,
+                groupArray(ltp)[1] as open,             -- First LTP in second
+                max(ltp) as high,                       -- Highest LTP in second
+                min(ltp) as low,                        -- Lowest LTP in second
+                groupArray(ltp)[-1] as close,           -- Last LTP in second
+                sum(ltq) as volume,                     -- Sum of volumes
+                groupArray(oi)[-1] as oi               -- Last OI in second
+            FROM nse_ticks_indices
+            WHERE trading_day = '{trading_day}'
+              AND timestamp >= {start_timestamp}
+              AND timestamp <= {end_timestamp}
+              AND symbol IN ({symbol_list})
+            GROUP BY symbol, toDateTime(toInt64(timestamp))
+            ORDER BY second ASC
+        """
+
+    @staticmethod
+    def _build_option_contract_ticks_query(trading_day: str, tickers: List[str], from_unix: Optional[int] = None) -> str:
+        """Build the raw option tick query for exact tickers (with .NFO suffix)."""
+        ticker_list = ','.join(f"'{t}'" for t in tickers)
+        timestamp_filter = f"AND timestamp >= {from_unix}" if from_unix is not None else ""
+        return f"""
+            SELECT 
+                ticker,
+                timestamp,
+                ltp,
+                ltq,
+                oi
+            FROM nse_ticks_options
+            WHERE trading_day = '{trading_day}'
+              AND ticker IN ({ticker_list})
+              {timestamp_filter}
+            ORDER BY timestamp ASC
+        """
+
+    def _build_option_ticks_aggregated_query(
+        self,
+        date: Any,
+        tickers: List[str],
+        from_timestamp: Any = None
+    ) -> str:
+        """Build the last-LTP-per-second option tick query (ordered by second)."""
         trading_day = date.strftime('%Y-%m-%d') if hasattr(date, 'strftime') else str(date)
-        ticker_list = "', '".join(tickers)
         
         # Build timestamp filter
         timestamp_filter = ""
@@ -1701,42 +2333,71 @@ class DataManager:
         # Aggregate in ClickHouse - get last LTP per second per contract
         # Use groupArray to collect all ltps in a second, then pick the last one
         # Note: ClickHouse tickers have .NFO extension (e.g., NIFTY03OCT2425950CE.NFO)
-        # We generate tickers without extension, so use startsWith for matching
-        
-        # Build ticker filter using OR conditions with startsWith
-        ticker_conditions = " OR ".join([f"startsWith(ticker, '{t}')" for t in tickers])
+        # We generate tickers without extension: match the exact suffixed tickers
+        # (IN uses the primary key, a startsWith OR chain scans the day)
+        ticker_list = ','.join(f"'{t if t.endswith('.NFO') else t + '.NFO'}'" for t in tickers)
         
-        query = f"""
+        return f"""
             SELECT 
                 ticker,
                 toDateTime(toInt64(timestamp)) as second,
                 groupArray(ltp)[-1] as ltp
             FROM nse_ticks_options
             WHERE trading_day = '{trading_day}'
-              AND ({ticker_conditions})
+              AND ticker IN ({ticker_list})
               {timestamp_filter}
             GROUP BY ticker, toDateTime(toInt64(timestamp))
             ORDER BY second ASC
         """
 
-        result = self.clickhouse_client.query(query)
+    def _interning(self, row_to_tick: Any) -> Any:
+        """Wrap a row converter so each tick carries its interned 'symbol_id'."""
+        try_intern = self.symbol_table.try_intern
 
-        ticks: List[Dict[str, Any]] = []
-        for row in result.result_rows:
-            # Strip .NFO extension from ticker to maintain consistent format
-            ticker = row[0].replace('.NFO', '') if row[0] else row[0]
-            
-            tick = {
-                'symbol': ticker,
-                'timestamp': row[1],
-                'ltp': float(row[2]) if row[2] else None,
-                'volume': 0,  # Not tracked for options
-                'oi': 0,      # Not tracked for options
-            }
-            ticks.append(tick)
+        def convert(row: Any) -> Dict[str, Any]:
+            tick = row_to_tick(row)
+            tick['symbol_id'] = try_intern(tick['symbol'])
+            return tick
 
-        logger.info(f"✅ Loaded {len(ticks):,} aggregated option ticks for {len(tickers)} contracts")
-        if ticks:
-            logger.info(f"   Sample tickers: {list(set([t['symbol'] for t in ticks[:10]]))}")
+        return convert
 
-        return ticks
+    @staticmethod
+    def _raw_tick_from_row(row: Any) -> Dict[str, Any]:
+        """Convert a raw index tick row to a tick dict."""
+        return {
+            'symbol': row[0],
+            'timestamp': row[1],
+            'ltp': row[2],
+            'ltq': row[3],
+            'oi': row[4],
+        }
+
+    @staticmethod
+    def _aggregated_tick_from_row(row: Any) -> Dict[str, Any]:
+        """Convert an OHLC-per-second index row to a tick dict."""
+        # close and ltp are the same value (last traded price)
+        close_ltp = float(row[5]) if row[5] else None
+        return {
+            'symbol': row[0],
+            'timestamp': row[1],
+            'open': float(row[2]) if row[2] else None,
+            'high': float(row[3]) if row[3] else None,
+            'low': float(row[4]) if row[4] else None,
+            'close': close_ltp,
+            'ltp': close_ltp,  # Same as close
+            'volume': int(row[6]) if row[6] else 0,
+            'oi': int(row[7]) if row[7] else 0,
+        }
+
+    @staticmethod
+    def _option_tick_from_row(row: Any) -> Dict[str, Any]:
+        """Convert a last-LTP-per-second option row to a tick dict."""
+        # Strip .NFO extension from ticker to maintain consistent format
+        ticker = row[0].replace('.NFO', '') if row[0] else row[0]
+        return {
+            'symbol': ticker,
+            'timestamp': row[1],
+            'ltp': float(row[2]) if row[2] else None,
+            'volume': 0,  # Not tracked for options
+            'oi': 0,      # Not tracked for options
+        }
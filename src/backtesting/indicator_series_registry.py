@@ -0,0 +1,167 @@
+"""
+Indicator Series Registry
+=========================
+
+One canonical entry per unique indicator series - (symbol, timeframe,
+indicator, params) - however many strategies reference it.
+
+Strategies name the same series in different ways: each has its own
+database key ('rsi_1764509210372'), params may arrive in a different
+order or as 14 vs 14.0, and names differ in case. series_key() hashes a
+canonical form of all four, so DataManager keeps a single indicator
+instance (updated once per candle) and maps every strategy's database key
+onto it. The same registry is used by backtests (strategies_agg) and live
+trading (initialize_for_live), and by CentralizedBacktestEngine's
+_build_metadata to dedupe indicators across strategies in O(1).
+
+Per series it tracks the referencing (strategy_id, database_key) pairs -
+the reference count - and compute-cost counters: incremental updates
+run, time spent in them, and updates saved by sharing (one update served
+to every extra reference).
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+def _canonical_value(value: Any) -> Any:
+    """Integral floats as ints, containers recursively (14.0 == 14)."""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, dict):
+        return {str(k): _canonical_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical_value(v) for v in value]
+    return value
+
+
+def series_key(symbol: str, timeframe: str, name: str, params: Optional[Dict[str, Any]]) -> str:
+    """
+    Stable hash of a canonical indicator series.
+
+    Param order, name case and 14 vs 14.0 do not change the key.
+    """
+    canonical = json.dumps(
+        [symbol, timeframe, name.lower(), _canonical_value(params or {})],
+        sort_keys=True, default=str, separators=(',', ':')
+    )
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()[:16]
+
+
+@dataclass
+class IndicatorSeries:
+    """A unique indicator series and who uses it."""
+    series_key: str
+    symbol: str
+    timeframe: str
+    name: str
+    params: Dict[str, Any]
+    indicator_key: Optional[str] = None  # DataManager's generated key, e.g. 'RSI(14,close)'
+    refs: Set[Tuple[Optional[str], Optional[str]]] = field(default_factory=set)  # (strategy_id, database_key)
+    updates: int = 0
+    update_seconds: float = 0.0
+
+    @property
+    def ref_count(self) -> int:
+        return len(self.refs)
+
+    @property
+    def saved_updates(self) -> int:
+        """Updates that would have run again for each extra reference."""
+        return self.updates * max(self.ref_count - 1, 0)
+
+
+class IndicatorSeriesRegistry:
+    """Hash-keyed registry of indicator series with reference counts"""
+
+    def __init__(self):
+        self.series: Dict[str, IndicatorSeries] = {}
+        # {"NIFTY:1m": [series_key, ...]} for per-candle counters
+        self._by_instrument: Dict[str, List[str]] = {}
+
+    def acquire(
+        self,
+        symbol: str,
+        timeframe: str,
+        name: str,
+        params: Optional[Dict[str, Any]],
+        strategy_id: Optional[str] = None,
+        database_key: Optional[str] = None
+    ) -> Tuple[IndicatorSeries, bool]:
+        """
+        Add a reference to a series, creating it on first use.
+
+        Returns:
+            (series, created)
+        """
+        key = series_key(symbol, timeframe, name, params)
+        series = self.series.get(key)
+        created = series is None
+        if created:
+            series = IndicatorSeries(key, symbol, timeframe, name, dict(params or {}))
+            self.series[key] = series
+            self._by_instrument.setdefault(f"{symbol}:{timeframe}", []).append(key)
+        series.refs.add((strategy_id, database_key))
+        return series, created
+
+    def release(self, strategy_id: str) -> List[IndicatorSeries]:
+        """
+        Drop every reference held by a strategy.
+
+        Returns:
+            Series left without references (removed from the registry)
+        """
+        orphaned = []
+        for key, series in list(self.series.items()):
+            series.refs = {ref for ref in series.refs if ref[0] != strategy_id}
+            if not series.refs:
+                orphaned.append(self.series.pop(key))
+                self._by_instrument[f"{series.symbol}:{series.timeframe}"].remove(key)
+        return orphaned
+
+    def get(self, symbol: str, timeframe: str, name: str, params: Optional[Dict[str, Any]]) -> Optional[IndicatorSeries]:
+        return self.series.get(series_key(symbol, timeframe, name, params))
+
+    def ref_count(self, key: str) -> int:
+        series = self.series.get(key)
+        return series.ref_count if series is not None else 0
+
+    def record_updates(self, instrument_key: str, seconds: float):
+        """
+        Count one candle's incremental update for every series of a
+        symbol:timeframe, splitting the elapsed time evenly between them
+        (IndicatorBank advances them together).
+        """
+        keys = self._by_instrument.get(instrument_key)
+        if not keys:
+            return
+        share = seconds / len(keys)
+        for key in keys:
+            series = self.series[key]
+            series.updates += 1
+            series.update_seconds += share
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Totals plus per-series reference counts and compute counters."""
+        series = list(self.series.values())
+        return {
+            'series': len(series),
+            'references': sum(s.ref_count for s in series),
+            'shared_series': sum(1 for s in series if s.ref_count > 1),
+            'updates': sum(s.updates for s in series),
+            'update_seconds': sum(s.update_seconds for s in series),
+            'saved_updates': sum(s.saved_updates for s in series),
+            'per_series': {
+                s.series_key: {
+                    'instrument': f"{s.symbol}:{s.timeframe}",
+                    'indicator_key': s.indicator_key,
+                    'ref_count': s.ref_count,
+                    'updates': s.updates,
+                    'update_seconds': s.update_seconds,
+                    'saved_updates': s.saved_updates,
+                }
+                for s in series
+            },
+        }
@@ -103,22 +103,37 @@ class LazyOptionLoader:
         logger.debug(f"   ClickHouse symbol: {ch_symbol}")
         
         # Query ClickHouse for this contract
-        query = f"""
-        SELECT
-            toUnixTimestamp(timestamp) as ts_unix,
-            timestamp,
-            ltp,
-            volume,
-            oi
-        FROM ticks.option_ticks
-        WHERE trading_day = '{trading_day}'
-          AND symbol = '{ch_symbol}'
-        ORDER BY timestamp ASC
-        """
+        def build_query(symbols: List[str]) -> str:
+            return f"""
+            SELECT
+                toUnixTimestamp(timestamp) as ts_unix,
+                timestamp,
+                ltp,
+                volume,
+                oi,
+                symbol
+            FROM ticks.option_ticks
+            WHERE trading_day = '{trading_day}'
+              AND symbol = '{symbols[0]}'
+            ORDER BY timestamp ASC
+            """
         
         try:
-            result = self.clickhouse_client.query(query)
-            rows = result.result_rows
+            # Served from the local tick store when cached, ClickHouse on a miss
+            from src.storage.local_tick_store import get_local_tick_store
+            store = get_local_tick_store()
+            if store.enabled:
+                df = store.get_or_fetch(
+                    table='ticks.option_ticks',
+                    trading_day=trading_day,
+                    variant='raw',
+                    symbols=[ch_symbol],
+                    fetch=lambda missing: self.clickhouse_client.query_df(build_query(missing))
+                )
+                rows = list(df.itertuples(index=False, name=None))
+            else:
+                result = self.clickhouse_client.query(build_query([ch_symbol]))
+                rows = result.result_rows
             
             # Parse into tick dicts
             ticks = []
@@ -0,0 +1,72 @@
+"""
+Market Data Snapshot
+====================
+
+Versioned, shared view of DataManager's market data for strategy contexts.
+
+DataManager.get_context() used to rebuild candle_df_dict on every call by
+scanning indicator and cache keys, and CentralizedTickProcessor called it
+once per active strategy per second. The snapshot instead holds stable
+objects that DataManager mutates in place:
+
+- candle_df_dict: {symbol:timeframe: CandleBufferView} - a view is added
+  once when the candle buffer is created and stays valid afterwards.
+- ltp / ltp_store: DataManager's views over its LTP slot store.
+
+Every strategy context references these objects directly, so nothing is
+copied per strategy. `version` is bumped whenever a candle or an LTP
+actually changes, and the dirty sets record which keys changed since the
+last strategy pass, so consumers can skip re-reading unchanged keys:
+
+    snapshot = context['market_data']
+    if 'NIFTY:1m' in snapshot.dirty_candles:
+        ...  # candle (or forming candle) changed since last pass
+"""
+
+from typing import Any, Dict, Mapping, Set
+
+
+class MarketDataSnapshot:
+    """Shared candle/LTP references plus change tracking"""
+
+    def __init__(self, ltp: Mapping[str, float], ltp_store: Mapping[str, Any]):
+        """
+        Initialize snapshot.
+
+        Args:
+            ltp: DataManager's {symbol: ltp} view (shared by reference)
+            ltp_store: DataManager's legacy LTP store view (shared by reference)
+        """
+        self.candle_df_dict: Dict[str, Any] = {}
+        self.ltp = ltp
+        self.ltp_store = ltp_store
+
+        # Bumped on every candle / LTP change
+        self.version = 0
+
+        # Keys changed since the last clear_dirty() (one strategy pass)
+        self.dirty_candles: Set[str] = set()
+        self.dirty_ltp: Set[str] = set()
+
+    def register_candles(self, key: str, view: Any):
+        """Expose a candle buffer view under symbol:timeframe."""
+        self.candle_df_dict[key] = view
+        self.mark_candle(key)
+
+    def mark_candle(self, key: str):
+        """Record a completed or forming candle change."""
+        self.dirty_candles.add(key)
+        self.version += 1
+
+    def mark_ltp(self, symbol: str):
+        """Record an LTP change."""
+        self.dirty_ltp.add(symbol)
+        self.version += 1
+
+    def is_dirty(self) -> bool:
+        return bool(self.dirty_candles or self.dirty_ltp)
+
+    def clear_dirty(self):
+        """Called once all strategies have seen the current state."""
+        self.dirty_candles.clear()
+        self.dirty_ltp.clear()
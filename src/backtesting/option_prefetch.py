@@ -0,0 +1,237 @@
+"""
+Option Prefetch - Load every option contract a backtest day can need at once.
+
+Entry nodes resolve option patterns (NIFTY:W0:ATM:CE) against the spot LTP
+of the tick they run on, and each resolved contract used to be loaded with
+its own ClickHouse query. The contract a pattern can resolve to during the
+day is bounded by the day's spot range: every spot in [low, high] rounds to
+an ATM strike in [ATM(low), ATM(high)]. The planner enumerates that band
+for each pattern in strategies_agg['options'], and DataManager loads all
+planned contracts with a single `ticker IN (...)` query into per-contract
+columnar buffers (OptionTickBuffer). Contracts outside the plan still load
+on demand.
+
+Author: UniTrader Team
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.data.fo_config import get_config
+from src.data.fo_dynamic_resolver import StrikeCalculator
+
+logger = logging.getLogger(__name__)
+
+
+class OptionTickBuffer:
+    """
+    One contract's ticks as NumPy columns with a replay cursor.
+
+    Replaces the per-contract deque of tick dicts: dicts are only built for
+    the ticks handed to the replay loop.
+    """
+
+    __slots__ = ('symbol', 'timestamps_us', 'ltp', 'ltq', 'oi', 'cursor')
+
+    def __init__(self, symbol: str, timestamps_us: np.ndarray, ltp: np.ndarray, ltq: np.ndarray, oi: np.ndarray):
+        """
+        Initialize buffer.
+
+        Args:
+            symbol: Universal contract key used as the tick symbol
+            timestamps_us: Naive wall-clock epoch microseconds, ascending (int64)
+            ltp: Last traded prices (float64)
+            ltq: Last traded quantities (int64)
+            oi: Open interest (int64)
+        """
+        self.symbol = symbol
+        self.timestamps_us = timestamps_us
+        self.ltp = ltp
+        self.ltq = ltq
+        self.oi = oi
+        self.cursor = 0
+
+    @classmethod
+    def from_frame(cls, symbol: str, df: pd.DataFrame) -> 'OptionTickBuffer':
+        """
+        Build from a frame with columns timestamp, ltp, ltq, oi.
+
+        Numeric timestamps are Unix seconds (nse_ticks_options stores UInt32)
+        and are converted to local wall-clock time like datetime.fromtimestamp.
+        """
+        if df is None or df.empty:
+            return cls(symbol, np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64),
+                       np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+
+        timestamps = df['timestamp']
+        if pd.api.types.is_numeric_dtype(timestamps):
+            local_tz = datetime.now().astimezone().tzinfo
+            timestamps = pd.to_datetime(timestamps, unit='s', utc=True).dt.tz_convert(local_tz)
+        else:
+            timestamps = pd.to_datetime(timestamps)
+        if getattr(timestamps.dt, 'tz', None) is not None:
+            timestamps = timestamps.dt.tz_localize(None)
+        timestamps_us = timestamps.to_numpy(dtype='datetime64[us]').astype(np.int64)
+
+        order = np.argsort(timestamps_us, kind='stable')
+        return cls(
+            symbol=symbol,
+            timestamps_us=timestamps_us[order],
+            ltp=df['ltp'].to_numpy(dtype=np.float64, na_value=np.nan)[order],
+            ltq=df['ltq'].fillna(0).to_numpy(dtype=np.int64)[order],
+            oi=df['oi'].fillna(0).to_numpy(dtype=np.int64)[order]
+        )
+
+    def __len__(self) -> int:
+        """Ticks not yet replayed."""
+        return len(self.timestamps_us) - self.cursor
+
+    def seek(self, timestamp: datetime):
+        """Drop ticks before timestamp (subscription time)."""
+        position = int(np.searchsorted(self.timestamps_us, _to_us(timestamp), side='left'))
+        self.cursor = max(self.cursor, position)
+
+    def first_tick(self) -> Optional[Dict[str, Any]]:
+        """Next tick to be replayed, or None if exhausted."""
+        if not len(self):
+            return None
+        return self._tick(self.cursor)
+
+    def pop_at(self, timestamp: datetime) -> List[Dict[str, Any]]:
+        """
+        Ticks stamped exactly at timestamp; earlier ticks are dropped.
+
+        Same contract as the deque-based replay it replaces.
+        """
+        target = _to_us(timestamp)
+        timestamps = self.timestamps_us
+        end = len(timestamps)
+
+        start = self.cursor
+        while start < end and timestamps[start] < target:
+            start += 1
+        stop = start
+        while stop < end and timestamps[stop] == target:
+            stop += 1
+
+        self.cursor = stop
+        return [self._tick(index) for index in range(start, stop)]
+
+    def _tick(self, index: int) -> Dict[str, Any]:
+        return {
+            'symbol': self.symbol,
+            'timestamp': np.datetime64(int(self.timestamps_us[index]), 'us').astype(datetime),
+            'ltp': float(self.ltp[index]),
+            'ltq': int(self.ltq[index]),
+            'oi': int(self.oi[index]),
+        }
+
+
+def _to_us(timestamp: Any) -> int:
+    """Naive datetime (or ISO string) -> epoch microseconds, as stored in buffers."""
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp)
+    return int(np.datetime64(timestamp, 'us').astype(np.int64))
+
+
+def spot_ranges_from_ticks(ticks: Any) -> Dict[str, Tuple[float, float]]:
+    """
+    Per-symbol (low, high) LTP of the day's spot ticks.
+
+    Args:
+        ticks: ColumnarTicks or an iterable of tick dicts
+
+    Returns:
+        {symbol: (low, high)} for symbols with at least one priced tick
+    """
+    ranges: Dict[str, Tuple[float, float]] = {}
+
+    if hasattr(ticks, 'symbol_codes'):
+        for code, symbol in enumerate(ticks.symbols):
+            prices = ticks.ltp[ticks.symbol_codes == code]
+            prices = prices[~np.isnan(prices)]
+            if len(prices):
+                ranges[symbol] = (float(prices.min()), float(prices.max()))
+        return ranges
+
+    for tick in ticks:
+        ltp = tick.get('ltp')
+        if ltp is None:
+            continue
+        low, high = ranges.get(tick['symbol'], (ltp, ltp))
+        ranges[tick['symbol']] = (min(low, ltp), max(high, ltp))
+    return ranges
+
+
+class OptionPrefetchPlanner:
+    """
+    Enumerate the contracts option patterns can resolve to during a day.
+
+    Usage:
+        planner = OptionPrefetchPlanner(resolver)
+        contract_keys = planner.plan(strategies_agg['options'], spot_ranges, backtest_date)
+        data_manager.prefetch_option_contracts(contract_keys, backtest_date)
+    """
+
+    def __init__(self, resolver: Any):
+        """
+        Initialize planner.
+
+        Args:
+            resolver: FODynamicResolver (expiry resolution, as the entry node uses)
+        """
+        self.resolver = resolver
+
+    def plan(
+        self,
+        option_patterns: Iterable[Dict[str, Any]],
+        spot_ranges: Dict[str, Tuple[float, float]],
+        reference_date: Any
+    ) -> List[str]:
+        """
+        Universal contract keys for every pattern across its ATM band.
+
+        Args:
+            option_patterns: strategies_agg['options'] entries
+                (underlying, expiry_code, strike_code, option_type)
+            spot_ranges: {underlying: (low, high)} spot LTP range of the day
+            reference_date: Backtest date (expiry resolution reference)
+
+        Returns:
+            Unique contract keys (e.g. NIFTY:2024-10-03:OPT:25900:CE)
+        """
+        contract_keys: List[str] = []
+
+        for pattern in option_patterns:
+            underlying = pattern['underlying']
+            if underlying not in spot_ranges:
+                logger.warning(f"⚠️  No spot range for {underlying}; {pattern} loads on demand")
+                continue
+
+            low, high = spot_ranges[underlying]
+            dynamic_symbol = (
+                f"{underlying}:{pattern['expiry_code']}:{pattern['strike_code']}:{pattern['option_type']}"
+            )
+
+            try:
+                # Expiry does not depend on spot: resolve once, then walk the band
+                resolved = self.resolver.resolve(dynamic_symbol, {underlying: low}, reference_date)
+                expiry = resolved.split(':')[1]
+                strike_interval = get_config(underlying)['strike_interval']
+            except Exception as e:
+                logger.warning(f"⚠️  Option prefetch skipped {dynamic_symbol}: {e}")
+                continue
+
+            low_atm = StrikeCalculator.calculate_atm_strike(low, strike_interval)
+            high_atm = StrikeCalculator.calculate_atm_strike(high, strike_interval)
+            for atm in range(low_atm, high_atm + strike_interval, strike_interval):
+                strike = StrikeCalculator.get_strike_price(
+                    underlying, atm, pattern['strike_code'], pattern['option_type']
+                )
+                contract_keys.append(f"{underlying}:{expiry}:OPT:{strike}:{pattern['option_type']}")
+
+        return list(dict.fromkeys(contract_keys))
@@ -0,0 +1,208 @@
+"""
+Parallel Day Executor
+=====================
+
+Runs independent backtest days concurrently in a process pool.
+
+Each day builds its own CentralizedBacktestEngine, so days share no engine
+state. What they do share inside one process is the module-level
+`dashboard_data` dict and the GlobalPositionStore monkey-patching in
+show_dashboard_data.py - two days in the same process (or in two threads
+of it) would write into the same positions list. Running every day in its
+own worker process gives each day a private copy of that module, so the
+tracking hooks stay correct without changing them.
+
+Days of one run() share a session_id, so a worker process running several
+of them loads the strategies once (BacktestSession); other runs never
+reuse it.
+
+Results are yielded in completion order (for progress events); callers
+merge summaries by date afterwards so the final output is deterministic
+regardless of which day finished first.
+
+Configuration (environment):
+    BACKTEST_DAY_WORKERS - worker processes (default: CPU count);
+                           1 runs days inline, one at a time.
+                           A caller's max_workers never exceeds it.
+"""
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from src.backtesting.backtest_session import new_session_id
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DayResult:
+    """Outcome of one backtest day"""
+    date: date
+    day_number: int
+    daily_data: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    @property
+    def date_str(self) -> str:
+        return self.date.strftime('%Y-%m-%d')
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def run_dashboard_day(strategy_id: str, test_date: date, session_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Worker entry point: run one day via show_dashboard_data.
+
+    Imported lazily so the module (and its GlobalPositionStore patching)
+    is loaded inside the worker process.
+    """
+    from show_dashboard_data import run_dashboard_backtest
+    return run_dashboard_backtest(strategy_id, test_date, session_id=session_id)
+
+
+# Upper bound for a client-supplied max_workers (API validation)
+MAX_DAY_WORKERS = 64
+
+
+def max_day_workers() -> int:
+    """Worker processes allowed per run: BACKTEST_DAY_WORKERS, else CPU count"""
+    env_value = os.getenv('BACKTEST_DAY_WORKERS')
+    return max(1, int(env_value) if env_value else (os.cpu_count() or 1))
+
+
+def resolve_worker_count(max_workers: Optional[int], total_days: int) -> int:
+    """
+    Requested value (default: the limit), capped at the limit and at total_days.
+
+    The limit is BACKTEST_DAY_WORKERS / CPU count, so a request for a long
+    date range cannot spawn a process (and ClickHouse client) per day.
+    """
+    limit = max_day_workers()
+    requested = limit if max_workers is None else int(max_workers)
+    return max(1, min(requested, limit, max(total_days, 1)))
+
+
+class ParallelDayExecutor:
+    """
+    Process-pool scheduler for multi-day backtests.
+
+    Usage:
+        executor = ParallelDayExecutor(max_workers=4)
+        for result in executor.run(strategy_id, date_range):
+            ...  # completion order
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        run_day: Callable[[str, date, str], Dict[str, Any]] = run_dashboard_day,
+        start_method: str = 'spawn'
+    ):
+        """
+        Initialize executor.
+
+        Args:
+            max_workers: Worker processes (None = BACKTEST_DAY_WORKERS / CPU count)
+            run_day: Picklable callable(strategy_id, date, session_id) -> daily_data
+            start_method: multiprocessing start method. 'spawn' avoids forking
+                the API server's threads and open ClickHouse connections.
+        """
+        self.max_workers = max_workers
+        self.run_day = run_day
+        self.start_method = start_method
+
+    def run(self, strategy_id: str, dates: List[date]) -> Iterator[DayResult]:
+        """
+        Run all days, yielding DayResult as each one finishes.
+
+        A failing day yields a result with `error` set; other days continue.
+        """
+        workers = resolve_worker_count(self.max_workers, len(dates))
+        session_id = new_session_id()
+        logger.info(f"🚀 Running {len(dates)} days with {workers} worker(s)")
+
+        if workers == 1:
+            yield from self._run_inline(strategy_id, dates, session_id)
+            return
+
+        context = multiprocessing.get_context(self.start_method)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            pending: Dict[Future, DayResult] = {
+                pool.submit(self.run_day, strategy_id, test_date, session_id): DayResult(test_date, day_number)
+                for day_number, test_date in enumerate(dates, 1)
+            }
+            try:
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    # Stable order among days finishing in the same wait()
+                    for future in sorted(done, key=lambda f: pending[f].day_number):
+                        result = pending.pop(future)
+                        try:
+                            result.daily_data = future.result()
+                        except Exception as e:
+                            logger.error(f"❌ Day {result.date_str} failed: {e}")
+                            result.error = str(e)
+                        yield result
+            finally:
+                # Consumer stopped early - drop days that have not started
+                for future in pending:
+                    future.cancel()
+
+    def _run_inline(self, strategy_id: str, dates: List[date], session_id: str) -> Iterator[DayResult]:
+        """Sequential fallback (single worker)"""
+        for day_number, test_date in enumerate(dates, 1):
+            result = DayResult(test_date, day_number)
+            try:
+                result.daily_data = self.run_day(strategy_id, test_date, session_id)
+            except Exception as e:
+                logger.error(f"❌ Day {result.date_str} failed: {e}")
+                result.error = str(e)
+            yield result
+
+
+def merge_overall_summary(results: List[DayResult], total_days: int) -> Dict[str, Any]:
+    """
+    Combine per-day summaries into the overall summary.
+
+    Days are folded in date order so float totals do not depend on
+    completion order.
+    """
+    overall_summary = {
+        'total_positions': 0,
+        'total_pnl': 0,
+        'total_winning_trades': 0,
+        'total_losing_trades': 0,
+        'total_breakeven_trades': 0,
+        'largest_win': 0,
+        'largest_loss': 0,
+        'days_tested': total_days
+    }
+
+    for result in sorted(results, key=lambda r: r.date):
+        if not result.ok:
+            continue
+        summary = result.daily_data['summary']
+        overall_summary['total_positions'] += summary['total_positions']
+        overall_summary['total_pnl'] += summary['total_pnl']
+        overall_summary['total_winning_trades'] += summary['winning_trades']
+        overall_summary['total_losing_trades'] += summary['losing_trades']
+        overall_summary['total_breakeven_trades'] += summary['breakeven_trades']
+        overall_summary['largest_win'] = max(overall_summary['largest_win'], summary['largest_win'])
+        overall_summary['largest_loss'] = min(overall_summary['largest_loss'], summary['largest_loss'])
+
+    if overall_summary['total_positions'] > 0:
+        overall_summary['overall_win_rate'] = (
+            overall_summary['total_winning_trades'] / overall_summary['total_positions'] * 100
+        )
+    else:
+        overall_summary['overall_win_rate'] = 0
+
+    return overall_summary
+
@@ -0,0 +1,407 @@
+"""
+Signal Pre-screen
+=================
+
+Whole-day, vectorized pre-pass for entry/exit signal conditions.
+
+A condition such as `EMA(9)[-1] > EMA(21)[-1]` on 1m candles only reads
+completed candles, so its result can only change when a candle closes -
+yet the signal node evaluates it every second (~22,500 times a day).
+
+In columnar replay the whole day of ticks is known before the replay
+starts. The pre-screen:
+
+1. rebuilds the day's candles per symbol:timeframe from ColumnarTicks with
+   NumPy (same bucketing as CandleBuilder), appended to the historical
+   candles DataManager seeded its indicators with;
+2. runs each registered ta_hybrid indicator's calculate_bulk() once over
+   that frame;
+3. for every candle-only comparison (ConditionAnalyzer 'candle_only'),
+   computes a full-day boolean series "may be true after candle i closed".
+
+Per second, a signal node asks may_satisfy(conditions, context): the
+current row is found from the live buffer's last completed candle and the
+series are indexed - no condition evaluation. False means the conditions
+cannot hold at this second, so the node skips evaluating them (the same
+outcome the evaluator would produce). Anything else evaluates normally.
+
+Correctness guards (each falls back to per-second evaluation):
+- Only comparisons the analyzer classifies as candle-only are screened;
+  unclassified comparisons are "maybe" (an OR containing one is never
+  screened out).
+- A comparison within SCREEN_TOLERANCE of flipping is "maybe".
+- Whenever a new candle completes, the bulk values used by the screens are
+  checked against the live candle buffer (incremental indicators) over the
+  visible window; a mismatching column is disabled for the rest of the day.
+- Unknown keys / timestamps, multi-output indicators, missing forming
+  candle or an offset beyond the visible window are "maybe".
+"""
+
+import logging
+import operator as _operator
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.backtesting.candle_ring_buffer import OHLCV_FIELDS, CandleBufferView
+from src.core.condition_analyzer import ConditionAnalyzer
+
+logger = logging.getLogger(__name__)
+
+# Relative margin within which a comparison is treated as undecided
+SCREEN_TOLERANCE = 1e-9
+
+_US_PER_MINUTE = 60_000_000
+_US_PER_DAY = 86_400_000_000
+
+_COMPARISONS: Dict[str, Callable[[Any, Any], Any]] = {
+    '<': _operator.lt,
+    '<=': _operator.le,
+    '>': _operator.gt,
+    '>=': _operator.ge,
+    '==': _operator.eq,
+    '!=': _operator.ne,
+}
+
+
+def _timestamp_us(timestamp: Any) -> int:
+    """Epoch microseconds for a candle timestamp (datetime / pd.Timestamp)."""
+    return pd.Timestamp(timestamp).value // 1000
+
+
+def build_day_candles(ticks: Any, symbol: str, builder: Any) -> pd.DataFrame:
+    """
+    Vectorized equivalent of feeding one symbol's ticks through CandleBuilder.
+
+    Args:
+        ticks: ColumnarTicks for the day
+        symbol: Symbol as it appears in ticks.symbols
+        builder: CandleBuilder whose interval / market open to replicate
+
+    Returns:
+        DataFrame (timestamp, open, high, low, close, volume), one row per
+        candle including the last (still forming at end of day)
+    """
+    columns = ['timestamp', *OHLCV_FIELDS]
+    if symbol not in ticks.symbols:
+        return pd.DataFrame(columns=columns)
+
+    mask = ticks.symbol_codes == ticks.symbols.index(symbol)
+    timestamps_us = ticks.timestamps_us[mask]
+    ltp = ticks.ltp[mask]
+    if len(ltp) == 0:
+        return pd.DataFrame(columns=columns)
+
+    # CandleBuilder._get_candle_start_time on wall-clock minutes
+    market_open = builder.market_open_hour * 60 + builder.market_open_minute
+    minute_of_day = (timestamps_us // _US_PER_MINUTE) % 1440
+    since_open = minute_of_day - market_open
+    start_minute = np.where(
+        since_open < 0,
+        market_open,
+        market_open + (since_open // builder.interval_minutes) * builder.interval_minutes
+    )
+    start_us = (timestamps_us // _US_PER_DAY) * _US_PER_DAY + start_minute * _US_PER_MINUTE
+
+    # Ticks are time-ordered, so each candle is a contiguous run
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(start_us)) + 1))
+    ends = np.concatenate((starts[1:], [len(ltp)]))
+
+    return pd.DataFrame({
+        'timestamp': start_us[starts].astype('datetime64[us]'),
+        'open': ltp[starts],
+        'high': np.maximum.reduceat(ltp, starts),
+        'low': np.minimum.reduceat(ltp, starts),
+        'close': ltp[ends - 1],
+        # Columnar tick dicts carry no 'volume' key, so CandleBuilder sums 0
+        'volume': np.zeros(len(starts)),
+    })
+
+
+def _unified_symbol(data_manager: Any, symbol: str) -> str:
+    """Unified symbol for a tick symbol (DataManager.process_tick resolution)."""
+    if ':' in symbol:
+        return symbol
+    try:
+        return data_manager.symbol_cache.to_unified(data_manager.broker_name, symbol) or symbol
+    except Exception:
+        return symbol
+
+
+class _KeyFrame:
+    """Bulk candle + indicator columns for one symbol:timeframe"""
+
+    def __init__(self, frame: pd.DataFrame):
+        self.length = len(frame)
+        self.columns: Dict[str, np.ndarray] = {
+            name: frame[name].to_numpy(dtype=np.float64) for name in OHLCV_FIELDS
+        }
+        self.rows: Dict[int, int] = {_timestamp_us(ts): row for row, ts in enumerate(frame['timestamp'])}
+        self.disabled: set = set()
+
+    def shifted(self, column: str, offset: int) -> np.ndarray:
+        """Value at `offset` (-1 = newest completed) for every row as the newest."""
+        values = self.columns[column]
+        lag = -offset - 1
+        if lag == 0:
+            return values
+        out = np.full(self.length, np.nan)
+        out[lag:] = values[:self.length - lag]
+        return out
+
+
+class _Screen:
+    """Screen tree node: maybe(prescreen, context) -> False only if definitely false"""
+
+    def maybe(self, prescreen: 'SignalPrescreen', context: Dict[str, Any]) -> bool:
+        return True
+
+
+class _Group(_Screen):
+    def __init__(self, logic: str, children: List[_Screen]):
+        self.logic = logic
+        self.children = children
+
+    def maybe(self, prescreen, context):
+        if self.logic == 'OR':
+            return any(child.maybe(prescreen, context) for child in self.children)
+        # AND (and the evaluator's default for unknown logic)
+        return all(child.maybe(prescreen, context) for child in self.children)
+
+
+class _Comparison(_Screen):
+    """Candle-only comparison with its full-day series"""
+
+    def __init__(self, key: str, columns: List[str], depth: int, series: np.ndarray):
+        self.key = key
+        self.columns = columns  # Bulk columns read (disabled -> maybe)
+        self.depth = depth      # Completed candles that must be visible
+        self.series = series
+
+    def maybe(self, prescreen, context):
+        cursor = prescreen._cursor(self.key, context)
+        if cursor is None:
+            return True
+        row, completed, key_frame = cursor
+        if completed < self.depth or any(c in key_frame.disabled for c in self.columns):
+            return True
+        return bool(self.series[row])
+
+
+class SignalPrescreen:
+    """
+    Full-day candle-only condition screens for one backtest day.
+
+    Usage:
+        prescreen = SignalPrescreen.from_columnar_ticks(ticks, data_manager)
+        data_manager.signal_prescreen = prescreen
+        ...
+        if not prescreen.may_satisfy(conditions, context):
+            return False  # cannot be satisfied at this second
+    """
+
+    def __init__(self, candle_frames: Dict[str, pd.DataFrame], data_manager: Any = None):
+        """
+        Initialize pre-screen.
+
+        Args:
+            candle_frames: {symbol:timeframe: OHLCV DataFrame} covering the
+                historical seed candles and the whole day, oldest first
+            data_manager: DataManager (registered indicators + key mappings)
+        """
+        self.data_manager = data_manager
+        self._frames: Dict[str, _KeyFrame] = {}
+        for key, frame in candle_frames.items():
+            key_frame = _KeyFrame(frame)
+            self._add_indicator_columns(key, frame, key_frame)
+            self._frames[key] = key_frame
+
+        # (id(conditions), symbol) -> (conditions, screen or None)
+        self._screens: Dict[Tuple[int, str], Tuple[Any, Optional[_Screen]]] = {}
+        # key -> (view, last completed timestamp, row)
+        self._cursors: Dict[str, Tuple[Any, Any, Optional[int]]] = {}
+
+        self.stats = {'checks': 0, 'skipped': 0, 'disabled_columns': 0}
+
+    @classmethod
+    def from_columnar_ticks(cls, ticks: Any, data_manager: Any) -> 'SignalPrescreen':
+        """Build frames for every index/future symbol x candle builder timeframe."""
+        candle_frames = {}
+        for symbol in ticks.symbols:
+            unified = _unified_symbol(data_manager, symbol)
+            if not data_manager._is_index_or_future(unified):
+                continue
+            for timeframe, builder in data_manager.candle_builders.items():
+                key = f"{unified}:{timeframe}"
+                day = build_day_candles(ticks, symbol, builder)
+                history = data_manager.historical_candles.get(key)
+                if history is not None and len(history):
+                    day = pd.concat([history, day], ignore_index=True)
+                candle_frames[key] = day
+        logger.info(f"🔎 Signal pre-screen: {len(candle_frames)} candle series prepared")
+        return cls(candle_frames, data_manager)
+
+    def _add_indicator_columns(self, key: str, frame: pd.DataFrame, key_frame: _KeyFrame):
+        """Bulk-calculate each registered single-output indicator over the frame."""
+        indicators = getattr(self.data_manager, 'indicators', {}).get(key, {})
+        for indicator_key, indicator in indicators.items():
+            try:
+                # Fresh instance: the registered one carries incremental state
+                result = type(indicator)(**getattr(indicator, 'params', {})).calculate_bulk(frame)
+            except Exception as e:
+                logger.debug(f"Pre-screen skips {indicator_key} on {key}: {e}")
+                continue
+            if isinstance(result, pd.Series) and len(result) == key_frame.length:
+                key_frame.columns[indicator_key] = pd.to_numeric(result, errors='coerce').to_numpy(dtype=np.float64)
+
+    # ========================================================================
+    # SCREENS
+    # ========================================================================
+
+    def may_satisfy(self, conditions: Any, context: Dict[str, Any]) -> bool:
+        """
+        Whether the signal conditions (a list is AND-ed, like the signal
+        nodes do) can be satisfied at the current second.
+
+        Returns:
+            False only if the candle-only screens prove the conditions false
+        """
+        symbol = context.get('strategy_config', {}).get('symbol', 'NIFTY')
+        entry = self._screens.get((id(conditions), symbol))
+        if entry is None or entry[0] is not conditions:
+            entry = (conditions, self._compile(conditions, symbol))
+            self._screens[(id(conditions), symbol)] = entry
+
+        screen = entry[1]
+        if screen is None:
+            return True
+
+        self.stats['checks'] += 1
+        if screen.maybe(self, context):
+            return True
+        self.stats['skipped'] += 1
+        return False
+
+    def _compile(self, conditions: Any, symbol: str) -> Optional[_Screen]:
+        if isinstance(conditions, list):
+            screens = [self._compile_structure(ConditionAnalyzer(c).get_evaluation_structure(), symbol)
+                       for c in conditions]
+            screen = _Group('AND', screens)
+        else:
+            screen = self._compile_structure(ConditionAnalyzer(conditions).get_evaluation_structure(), symbol)
+        return screen if self._screens_anything(screen) else None
+
+    def _screens_anything(self, screen: _Screen) -> bool:
+        if isinstance(screen, _Comparison):
+            return True
+        if isinstance(screen, _Group):
+            if screen.logic == 'OR':
+                return all(self._screens_anything(child) for child in screen.children)
+            return any(self._screens_anything(child) for child in screen.children)
+        return False
+
+    def _compile_structure(self, structure: Dict[str, Any], symbol: str) -> _Screen:
+        if structure['type'] == 'group':
+            children = [self._compile_structure(sub, symbol) for sub in structure['conditions']]
+            if not children:
+                return _Screen()
+            return _Group(structure['logic'], children)
+        if not structure.get('candle_only'):
+            return _Screen()
+        return self._compile_comparison(structure['condition'], symbol) or _Screen()
+
+    def _compile_comparison(self, condition: Dict[str, Any], symbol: str) -> Optional[_Comparison]:
+        key = None
+        columns, depth, sides = [], 0, []
+        for side in (condition['lhs'], condition['rhs']):
+            kind = ConditionAnalyzer.classify_expression(side)
+            if kind == 'constant':
+                sides.append(float(side.get('value', 0)))
+                continue
+
+            side_key = f"{symbol}:{side['timeframeId']}"
+            if key not in (None, side_key):
+                return None  # Mixed timeframes: rows are not aligned
+            key = side_key
+            key_frame = self._frames.get(key)
+            if key_frame is None:
+                return None
+
+            column = self._resolve_column(key, key_frame, side, kind)
+            if column is None:
+                return None
+            columns.append(column)
+            depth = max(depth, -side['offset'])
+            sides.append(key_frame.shifted(column, side['offset']))
+
+        lhs, rhs = sides
+        with np.errstate(invalid='ignore'):
+            satisfied = _COMPARISONS[condition['operator']](lhs, rhs)
+            undecided = np.abs(lhs - rhs) <= SCREEN_TOLERANCE * (1.0 + np.abs(lhs) + np.abs(rhs))
+        series = np.broadcast_to(satisfied | undecided, (self._frames[key].length,))
+        return _Comparison(key, columns, depth, series)
+
+    def _resolve_column(self, key: str, key_frame: _KeyFrame, side: Dict[str, Any], kind: str) -> Optional[str]:
+        """Bulk column an expression reads (same lookup order as ExpressionEvaluator)."""
+        if kind == 'candle':
+            return str(side.get('field') or side.get('dataField')).lower()
+
+        parameter = side.get('parameter')
+        field = f"{side['name']}_{parameter}" if parameter else side['name']
+        if field in key_frame.columns and field not in OHLCV_FIELDS:
+            return field
+        mappings = getattr(self.data_manager, 'indicator_key_mappings', {}).get(key, {})
+        mapped = mappings.get(field)
+        if mapped in key_frame.columns and mapped not in OHLCV_FIELDS:
+            return mapped
+        return None
+
+    # ========================================================================
+    # RUNTIME POSITION + VERIFICATION
+    # ========================================================================
+
+    def _cursor(self, key: str, context: Dict[str, Any]) -> Optional[Tuple[int, int, _KeyFrame]]:
+        """
+        (row, visible completed candles, frame) for the live buffer of `key`.
+
+        Offsets are only aligned while a forming candle is present
+        (offset -1 = candles[-2]).
+        """
+        key_frame = self._frames.get(key)
+        view = (context.get('candle_df_dict') or {}).get(key)
+        if key_frame is None or not isinstance(view, CandleBufferView) or not view.has_forming:
+            return None
+
+        last_ts = view.last_completed_timestamp
+        cached = self._cursors.get(key)
+        if cached is not None and cached[0] is view and cached[1] == last_ts:
+            row = cached[2]
+        else:
+            row = None if last_ts is None else key_frame.rows.get(_timestamp_us(last_ts))
+            if row is not None:
+                self._verify(key, key_frame, view, row)
+            self._cursors[key] = (view, last_ts, row)
+
+        if row is None:
+            return None
+        return row, min(view.completed_count, row + 1), key_frame
+
+    def _verify(self, key: str, key_frame: _KeyFrame, view: CandleBufferView, row: int):
+        """Compare bulk columns with the live buffer over the visible window."""
+        count = min(view.completed_count, row + 1)
+        for column, values in key_frame.columns.items():
+            if column in key_frame.disabled:
+                continue
+            live = view.column(column)
+            if live is None:
+                continue
+            live = live[len(live) - count:]
+            bulk = values[row + 1 - count:row + 1]
+            if not np.allclose(bulk, live, rtol=SCREEN_TOLERANCE, atol=SCREEN_TOLERANCE, equal_nan=True):
+                key_frame.disabled.add(column)
+                self.stats['disabled_columns'] += 1
+                logger.warning(
+                    f"⚠️  Signal pre-screen disabled {key} {column}: bulk values differ from the "
+                    f"live candle buffer (conditions on it are evaluated every second)"
+                )
@@ -14,6 +14,8 @@ from datetime import datetime, date
 from typing import Dict, List, Any, Optional, AsyncGenerator
 import logging
 
+from src.utils.node_event_store import NodeEventStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,6 +49,19 @@ def build_flow_chain(events_history: dict, exec_id: str, max_depth: int = 10) ->
     return list(reversed(chain))
 
 
+def events_since(events_history: Any, cursor: int) -> tuple:
+    """
+    Events recorded after `cursor` and the cursor for the next call.
+    
+    NodeEventStore renders only the new events; a plain dict (insertion
+    ordered, never evicted) uses its length as the cursor.
+    """
+    if isinstance(events_history, NodeEventStore):
+        return events_history.export_since(cursor)
+    items = list(events_history.items())
+    return dict(items[cursor:]), len(items)
+
+
 def extract_flow_ids_from_events(events_history: dict, node_id: str, timestamp: str) -> list:
     """
     Extract execution_ids (flow_ids) for a specific node execution.
@@ -55,6 +70,10 @@ def extract_flow_ids_from_events(events_history: dict, node_id: str, timestamp:
     if not events_history or not node_id:
         return []
     
+    # Metadata-only view: no payload / condition text rendered per lookup
+    if isinstance(events_history, NodeEventStore):
+        events_history = events_history.headers
+    
     for exec_id, event in events_history.items():
         if event.get('node_id') == node_id:
             # Check if timestamp matches (compare HH:MM:SS)
@@ -101,7 +120,11 @@ async def run_streaming_backtest(
         emit_interval: Emit SSE event every N simulated seconds
     
     Yields:
-        Dict with 'type' and 'data' keys for SSE events
+        Dict with 'type' and 'data' keys for SSE events. The events_history
+        of a 'tick' message holds only the events recorded since the previous
+        tick message, that of a 'node_event' message the events recorded in
+        its simulated second (clients merge them by execution_id); the
+        'complete' message carries the full history.
     """
     from src.backtesting.backtest_config import BacktestConfig
     from src.backtesting.centralized_backtest_engine import CentralizedBacktestEngine
@@ -253,12 +276,14 @@ async def run_streaming_backtest(
     positions_emitted = set()
     
     # Track node events for diagnostics streaming
-    last_event_counts = {}  # {strategy_id: last_event_count} to detect new events
     emitted_events = set()  # Track emitted event execution_ids
     
-    # Store events_history per strategy (persists after strategies terminate)
+    # Keep each strategy's events_history (persists after strategies terminate)
+    # and how far tick / node_event messages have sent it
     # Use queue_id (strat_id) as key - unique per broker account
-    stored_events_history = {}  # {queue_id: events_history}
+    event_stores = {}  # {queue_id: events_history}
+    tick_event_cursors = {}  # {queue_id: cursor}
+    node_event_cursors = {}  # {queue_id: cursor}
     
     # Track trades for trades_daily streaming
     trades_list = {}  # {strategy_id: [trades]} built incrementally
@@ -547,8 +572,9 @@ async def run_streaming_backtest(
                 winning_trades = sum(1 for t in strat_trades if float(t.get('pnl', 0) or 0) > 0 and t.get('status') == 'CLOSED')
                 losing_trades = sum(1 for t in strat_trades if float(t.get('pnl', 0) or 0) <= 0 and t.get('status') == 'CLOSED')
                 
-                # Get events_history for this strategy (send with trades)
-                strat_events_history = stored_events_history.get(strat_id, {})
+                # Events recorded since the previous tick message (send with trades)
+                strat_events_history, tick_event_cursors[strat_id] = events_since(
+                    event_stores.get(strat_id, {}), tick_event_cursors.get(strat_id, 0))
                 
                 # Use queue_id (strat_id) as key - unique per broker account
                 strategy_data[strat_id] = {
@@ -620,18 +646,19 @@ async def run_streaming_backtest(
             # Get node_events_history from strategy context
             events_history = strategy_state.get('node_events_history', {})
             
-            # Store a copy of events_history (so it persists after strategy terminates)
+            # Keep the store (so it persists after strategy terminates)
             # Use queue_id (strat_id) as key - unique per broker account
-            if events_history:
-                stored_events_history[strat_id] = dict(events_history)
+            event_stores[strat_id] = events_history
             
-            # Check for new events
+            # Check for new events (only those recorded since the last pass are rendered)
+            events_history, node_event_cursors[strat_id] = events_since(
+                events_history, node_event_cursors.get(strat_id, 0))
             for exec_id, event_data in events_history.items():
                 if exec_id not in emitted_events:
                     emitted_events.add(exec_id)
                     
                     # Emit node event for action nodes (entry, exit, square-off)
-                    # Include trades and full events_history with node_event
+                    # Include trades and this second's new events with node_event
                     node_type = event_data.get('node_type', '')
                     if node_type in ['EntryNode', 'ExitNode', 'SquareOffNode']:
                         # Get current trades for this strategy
@@ -776,9 +803,9 @@ async def run_streaming_backtest(
     for strat_id, meta in strategy_metadata.items():
         actual_strat_id = meta.get('actual_strategy_id') or strat_id
         
-        # Get final diagnostics from stored_events_history (persisted during tick loop)
+        # Get final diagnostics from event_stores (kept during tick loop)
         # Use queue_id (strat_id) as key since that's how it was stored
-        events_history = stored_events_history.get(strat_id, {})
+        events_history, _ = events_since(event_stores.get(strat_id, {}), 0)
         
         # Get final trades - use queue_id (strat_id) as key
         strat_trades = list(trades_list.get(strat_id, {}).values())
@@ -0,0 +1,193 @@
+"""
+Streaming Tick Cursor
+=====================
+
+Per-second tick batches streamed from ClickHouse block by block.
+
+The list loaders in DataManager (load_ticks, load_ticks_aggregated,
+load_option_ticks_aggregated) walk `result.result_rows`, so the whole day
+is in memory before the first tick is processed. TickBatchStream instead
+consumes `query_row_block_stream` blocks:
+
+1. A background thread pulls row blocks from ClickHouse into a bounded
+   queue (prefetch), so the next block downloads while the current one
+   is being processed.
+2. Rows are converted to tick dicts one block at a time.
+3. Ticks are regrouped into per-second batches; a second that straddles
+   a block boundary is carried over until the next block arrives.
+
+Memory is bounded by (prefetch_blocks + 1) blocks regardless of day size.
+Rows must arrive ordered by timestamp (all loader queries ORDER BY it).
+"""
+
+import logging
+import queue
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Sentinel marking the end of the block stream
+_END_OF_STREAM = object()
+
+
+class TickBatchStream:
+    """
+    Iterable of (second_timestamp, tick_batch) built from streamed row blocks.
+
+    Usage:
+        stream = data_manager.stream_ticks(date, ['NIFTY'])
+        for second_timestamp, batch in stream:
+            ...
+        stream.close()  # Optional - also closed when iteration ends
+    """
+
+    def __init__(
+        self,
+        block_source: Callable[[], Iterable[Sequence[Sequence[Any]]]],
+        row_to_tick: Callable[[Sequence[Any]], Dict[str, Any]],
+        prefetch_blocks: int = 2,
+        description: str = 'ticks'
+    ):
+        """
+        Initialize tick batch stream.
+
+        Args:
+            block_source: Zero-arg callable returning an iterable of row blocks.
+                May be a context manager (clickhouse_connect StreamContext).
+            row_to_tick: Converts one result row to a tick dict
+            prefetch_blocks: Blocks buffered ahead of the consumer (0 = no
+                background thread, fetch inline)
+            description: Label used in log messages
+        """
+        self._block_source = block_source
+        self._row_to_tick = row_to_tick
+        self._prefetch_blocks = max(0, int(prefetch_blocks))
+        self._description = description
+
+        self._stop_event = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self._started = False
+
+        # Statistics (grow as the stream is consumed)
+        self.ticks_loaded = 0
+        self.seconds_loaded = 0
+        self.blocks_loaded = 0
+
+    def __len__(self) -> int:
+        """Ticks streamed so far (the full count is known only at the end)."""
+        return self.ticks_loaded
+
+    def __iter__(self) -> Iterator[Tuple[datetime, List[Dict[str, Any]]]]:
+        if self._started:
+            raise RuntimeError(f"TickBatchStream({self._description}) can only be iterated once")
+        self._started = True
+        return self._iter_second_batches()
+
+    def close(self):
+        """Stop the prefetch thread and release the ClickHouse stream."""
+        self._stop_event.set()
+        if self._worker is not None:
+            self._worker.join(timeout=5)
+            self._worker = None
+
+    # ========================================================================
+    # BLOCK FETCHING
+    # ========================================================================
+
+    def _iter_source_blocks(self) -> Iterator[Sequence[Sequence[Any]]]:
+        """Iterate raw row blocks, entering the stream context if needed."""
+        source = self._block_source()
+        if hasattr(source, '__enter__'):
+            with source as blocks:
+                for block in blocks:
+                    if self._stop_event.is_set():
+                        return
+                    yield block
+        else:
+            for block in source:
+                if self._stop_event.is_set():
+                    return
+                yield block
+
+    def _iter_prefetched_blocks(self) -> Iterator[Sequence[Sequence[Any]]]:
+        """Iterate row blocks fetched ahead by a background thread."""
+        if self._prefetch_blocks == 0:
+            yield from self._iter_source_blocks()
+            return
+
+        block_queue: queue.Queue = queue.Queue(maxsize=self._prefetch_blocks)
+
+        def _put(item: Any) -> bool:
+            # Bounded put that gives up when the consumer has gone away
+            while not self._stop_event.is_set():
+                try:
+                    block_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def _producer():
+            try:
+                for block in self._iter_source_blocks():
+                    if not _put(block):
+                        return
+                _put(_END_OF_STREAM)
+            except Exception as e:
+                logger.error(f"❌ Streaming {self._description} failed: {e}")
+                _put(e)
+
+        self._worker = threading.Thread(
+            target=_producer,
+            name=f"tick-stream-{self._description}",
+            daemon=True
+        )
+        self._worker.start()
+
+        while True:
+            item = block_queue.get()
+            if item is _END_OF_STREAM:
+                return
+            if isinstance(item, Exception):
+                raise RuntimeError(f"Streaming {self._description} failed: {item}") from item
+            yield item
+
+    # ========================================================================
+    # SECOND BATCHING
+    # ========================================================================
+
+    def _iter_second_batches(self) -> Iterator[Tuple[datetime, List[Dict[str, Any]]]]:
+        """Regroup streamed ticks into per-second batches."""
+        current_second: Optional[datetime] = None
+        current_batch: List[Dict[str, Any]] = []
+        row_to_tick = self._row_to_tick
+
+        try:
+            for block in self._iter_prefetched_blocks():
+                self.blocks_loaded += 1
+                for row in block:
+                    tick = row_to_tick(row)
+                    second = tick['timestamp'].replace(microsecond=0)
+                    self.ticks_loaded += 1
+
+                    if second != current_second:
+                        if current_batch:
+                            self.seconds_loaded += 1
+                            yield current_second, current_batch
+                        current_second = second
+                        current_batch = []
+                    current_batch.append(tick)
+
+            # Flush the final (possibly block-straddling) second
+            if current_batch:
+                self.seconds_loaded += 1
+                yield current_second, current_batch
+
+            logger.info(
+                f"✅ Streamed {self.ticks_loaded:,} {self._description} in "
+                f"{self.seconds_loaded:,} seconds ({self.blocks_loaded:,} blocks)"
+            )
+        finally:
+            self.close()
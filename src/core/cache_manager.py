@@ -176,7 +176,7 @@ class CacheManager:
             indicator: Indicator key (e.g., 'RSI_14')
             data: Subscription data containing:
                 - calculator: IndicatorCalculator instance
-                - used_by_strategies: List of strategy instance IDs
+                - series_key: IndicatorSeriesRegistry key (the registry tracks its users)
                 - subscribed_at: Timestamp
         """
         key = (symbol, timeframe, indicator)
@@ -206,29 +206,19 @@ class CacheManager:
         else:
             log_warning(f"⚠️ Cache: Indicator subscription {symbol}:{timeframe}:{indicator} not found")
     
-    def add_strategy_to_indicator(
-        self, 
-        symbol: str, 
-        timeframe: str, 
-        indicator: str, 
-        strategy_instance_id: str
-    ):
+    def remove_indicator_subscription(self, symbol: str, timeframe: str, indicator: str):
         """
-        Add strategy to indicator's used_by_strategies list.
+        Remove indicator subscription (no strategy uses it anymore).
         
         Args:
             symbol: Symbol
             timeframe: Timeframe
             indicator: Indicator key
-            strategy_instance_id: Strategy instance ID
         """
         key = (symbol, timeframe, indicator)
         if key in self.cache['indicator_subscriptions']:
-            used_by = self.cache['indicator_subscriptions'][key].get('used_by_strategies', [])
-            if strategy_instance_id not in used_by:
-                used_by.append(strategy_instance_id)
-                self.cache['indicator_subscriptions'][key]['used_by_strategies'] = used_by
-                log_debug(f"✅ Cache: Added strategy {strategy_instance_id} to indicator {symbol}:{timeframe}:{indicator}")
+            del self.cache['indicator_subscriptions'][key]
+            log_debug(f"✅ Cache: Removed indicator subscription {symbol}:{timeframe}:{indicator}")
     
     # ========================================================================
     # OPTION SUBSCRIPTIONS
@@ -18,6 +18,7 @@ from datetime import datetime
 from src.utils.logger import log_info, log_warning, log_debug, log_error
 from src.core.cache_manager import CacheManager
 from src.core.indicator_subscription_manager import IndicatorSubscriptionManager
+from src.core.node_scheduler import ActiveNodeScheduler, node_scheduler_enabled
 from src.core.option_subscription_manager import OptionSubscriptionManager
 from src.core.strategy_subscription_manager import StrategySubscriptionManager
 from src.core.unified_ltp_store import UnifiedLTPStore
@@ -45,7 +46,8 @@ class CentralizedTickProcessor:
         subscription_manager: Optional[Any] = None,
         thread_safe: bool = True,
         data_manager: Optional[Any] = None,
-        shared_gps: Optional[Any] = None
+        shared_gps: Optional[Any] = None,
+        ltp_store: Optional[UnifiedLTPStore] = None
     ):
         """
         Initialize centralized tick processor.
@@ -55,12 +57,18 @@ class CentralizedTickProcessor:
             subscription_manager: WebSocket subscription manager (optional for backtesting)
             thread_safe: Whether to use thread-safe operations (False for backtesting)
             data_manager: DataManager instance (for backtesting) to access candle_df_dict
+            ltp_store: LTP store fed by the DataManager (defaults to data_manager.ltp_slots);
+                       without one the processor keeps and updates its own
         """
         log_info("🚀 Initializing Centralized Tick Processor")
         
         # Centralized components
         self.cache = cache_manager
-        self.ltp_store = UnifiedLTPStore(thread_safe=thread_safe)
+        if ltp_store is None:
+            ltp_store = getattr(data_manager, 'ltp_slots', None)
+        # DataManager.process_tick already wrote this tick into a shared store
+        self._owns_ltp_store = ltp_store is None
+        self.ltp_store = UnifiedLTPStore(thread_safe=thread_safe) if self._owns_ltp_store else ltp_store
         self.subscription_manager = subscription_manager
         self.data_manager = data_manager  # For accessing candle_df_dict in backtesting
         
@@ -82,6 +90,9 @@ class CentralizedTickProcessor:
         self.last_sync_time = {}  # Track last sync per strategy
         self.tick_count = 0
         
+        # Execute only Active/Pending nodes per tick (NODE_SCHEDULER=full: whole tree)
+        self.use_node_scheduler = node_scheduler_enabled()
+        
         # Sync strategies from cache on initialization
         self.sync_all_strategies()
         
@@ -114,7 +125,7 @@ class CentralizedTickProcessor:
         # ================================================================
         # 1. UPDATE CENTRALIZED LTP STORE
         # ================================================================
-        if symbol and ltp:
+        if self._owns_ltp_store and symbol and ltp:
             self.ltp_store.update(symbol, ltp, timestamp)
         
         # ================================================================
@@ -152,6 +163,10 @@ class CentralizedTickProcessor:
                     log_error(traceback.format_exc())
                     # Re-raise - strategy execution errors are critical
                     raise RuntimeError(f"Strategy execution failed for {instance_id}") from e
+        
+        # All strategies have seen this state - reset per-tick dirty keys
+        if self.data_manager is not None and hasattr(self.data_manager, 'market_data'):
+            self.data_manager.market_data.clear_dirty()
     
     def _process_strategy(self, strategy_state: Dict[str, Any], tick_data: Dict[str, Any]):
         """
@@ -159,8 +174,8 @@ class CentralizedTickProcessor:
         
         Flow:
         1. Update context with tick-specific data
-        2. Reset visited flags (prepare for new traversal)
-        3. Execute start node (traverses entire node tree)
+        2. Prepare traversal (active-node scheduler, or reset visited flags)
+        3. Execute start node (runs the Active nodes of the node tree)
         4. Check termination conditions
         
         Args:
@@ -176,7 +191,13 @@ class CentralizedTickProcessor:
         
         # Step 2: Update context with tick-specific data and shared data
         # Get shared data from DataManager (candle_df_dict, ltp_store, clickhouse_client, mode)
-        if self.data_manager:
+        market_data = getattr(self.data_manager, 'market_data', None) if self.data_manager else None
+        if market_data is not None and context.get('market_data') is market_data:
+            # Context already references the shared snapshot (updated in place) -
+            # only the service handles can have been swapped since last tick
+            context['clickhouse_client'] = self.data_manager.clickhouse_client
+            context['pattern_resolver'] = self.data_manager.pattern_resolver
+        elif self.data_manager:
             data_context = self.data_manager.get_context()
             context['candle_df_dict'] = data_context.get('candle_df_dict', {})
             context['ltp_store'] = data_context.get('ltp_store', {})
@@ -184,6 +205,7 @@ class CentralizedTickProcessor:
             context['mode'] = data_context.get('mode', 'backtesting')
             context['data_manager'] = data_context.get('data_manager')  # For load_option_contract()
             context['pattern_resolver'] = data_context.get('pattern_resolver')  # For F&O resolution
+            context['market_data'] = data_context.get('market_data')  # Version + dirty keys
         else:
             # Fallback for live trading (would come from cache or other source)
             context['candle_df_dict'] = {}
@@ -201,12 +223,21 @@ class CentralizedTickProcessor:
         context['strategy_id'] = context_strategy_id
         # print(f"[DEBUG] Context strategy_id set to: {context_strategy_id} for instance: {instance_id}")
         
-        # Step 2: Reset visited flags (prepare for new node tree traversal)
-        for node_id in strategy_state['node_states']:
-            strategy_state['node_states'][node_id]['visited'] = False
-        
-        # Step 3: Execute strategy (start node traverses entire tree)
         start_node = strategy_state.get('start_node')
+        
+        # Step 2: Prepare node traversal
+        scheduler = self._get_node_scheduler(strategy_state) if start_node else None
+        if scheduler is not None:
+            # Active-set scheduling: only the start node's visited flag is per tick
+            context['node_scheduler'] = scheduler
+            scheduler.begin_tick(strategy_state['node_states'])
+        else:
+            # Reset visited flags (prepare for new node tree traversal)
+            context.pop('node_scheduler', None)
+            for node_id in strategy_state['node_states']:
+                strategy_state['node_states'][node_id]['visited'] = False
+        
+        # Step 3: Execute strategy (start node runs the scheduled / full node tree)
         if not start_node:
             log_warning(f"⚠️ No start_node found for strategy {instance_id}")
             return
@@ -225,6 +256,29 @@ class CentralizedTickProcessor:
             log_error(traceback.format_exc())
             # Don't mark inactive - might be transient error
     
+    def _get_node_scheduler(self, strategy_state: Dict[str, Any]) -> Optional[ActiveNodeScheduler]:
+        """
+        Get (or build on first tick) the strategy's active-node scheduler.
+        
+        Args:
+            strategy_state: Strategy state with start_node, node_instances, node_states
+        
+        Returns:
+            ActiveNodeScheduler, or None when the full traversal is configured
+        """
+        if not self.use_node_scheduler:
+            return None
+        
+        scheduler = strategy_state.get('node_scheduler')
+        if scheduler is None or scheduler.start_node is not strategy_state['start_node']:
+            scheduler = ActiveNodeScheduler(
+                strategy_state['start_node'],
+                strategy_state['node_instances'],
+                strategy_state['node_states']
+            )
+            strategy_state['node_scheduler'] = scheduler
+        return scheduler
+    
     def _is_spot_instrument(self, symbol: str) -> bool:
         """
         Check if symbol is a spot instrument.
@@ -186,6 +186,27 @@ class ClickHouseTickSource(TickDataSource):
             logger.error(traceback.format_exc())
             return []
     
+    def _stream_index_ticks(self):
+        """
+        Stream AGGREGATED index ticks from ClickHouse as per-second batches.
+        
+        Same rows as _load_index_ticks(), but consumed block by block so the
+        day never sits fully in memory and the next block downloads while the
+        current second is processed.
+        
+        Returns:
+            TickBatchStream yielding (second_timestamp, tick_batch)
+        """
+        from src.backtesting.data_manager import DataManager
+        
+        temp_dm = DataManager(cache=None, broker_name='clickhouse')
+        temp_dm.clickhouse_client = self.clickhouse_client
+        
+        return temp_dm.stream_ticks_aggregated(
+            date=self.backtest_date,
+            symbols=self.symbols
+        )
+    
     def _process_ticks_dynamically(self):
         """
         Process ticks batch-by-batch with dynamic option subscription.
@@ -197,23 +218,16 @@ class ClickHouseTickSource(TickDataSource):
         """
         print(f"\n🚀 DEBUG: Starting _process_ticks_dynamically() for date {self.backtest_date}")
         
-        # Load index ticks (ALREADY aggregated per second from ClickHouse)
-        index_ticks = self._load_index_ticks()
-        if not index_ticks:
+        # Stream index ticks (ALREADY aggregated per second from ClickHouse)
+        # Batches arrive in timestamp order; multiple symbols can share a second
+        index_stream = self._stream_index_ticks()
+        index_batches = iter(index_stream)
+        pending_batch = next(index_batches, None)
+        if pending_batch is None:
             logger.warning("⚠️ No index ticks loaded")
             return
         
-        # Group ticks by timestamp using defaultdict (faster than groupby)
-        # Ticks are already sorted by timestamp from ClickHouse query
-        # Multiple symbols can share same timestamp, so group into lists
-        from collections import defaultdict
-        index_batches: Dict[datetime, List[Dict]] = defaultdict(list)
-        for tick in index_ticks:
-            ts = tick.get('timestamp')
-            if ts:
-                index_batches[ts].append(tick)
-        
-        logger.info(f"📦 Organized {len(index_ticks):,} index ticks into {len(index_batches):,} second-batches")
+        logger.info(f"📦 Streaming index ticks in second-batches from {pending_batch[0]}")
         
         # Setup for option resolution
         from src.backtesting.data_manager import DataManager
@@ -296,8 +310,12 @@ class ClickHouseTickSource(TickDataSource):
                 break
             
             batch_count += 1
-            # Get index batch for this second (may be empty)
-            index_batch = index_batches.get(second_key, [])
+            # Get index batch for this second (may be empty) - advance the stream cursor
+            index_batch = []
+            while pending_batch is not None and pending_batch[0] <= second_key:
+                if pending_batch[0] == second_key:
+                    index_batch = pending_batch[1]
+                pending_batch = next(index_batches, None)
             
             # Check for NEW index symbols OR strike changes in this batch
             for tick in index_batch:
@@ -390,6 +408,9 @@ class ClickHouseTickSource(TickDataSource):
             # Progress reporting
             if batch_count % 1000 == 0:
                 logger.info(f"Progress: {batch_count}/{len(all_seconds)} seconds processed")
+        
+        # Release the ClickHouse stream (stop() may have ended the loop early)
+        index_stream.close()
     
     def _subscribe_options_for_index(self, symbol: str, spot_ltp: float, from_timestamp: datetime, patterns: Dict, calc, temp_dm):
         """
@@ -6,6 +6,9 @@ class ConditionAnalyzer:
     Provides modular functions for different analysis tasks.
     """
 
+    COMPARISON_OPERATORS = ('<', '<=', '>', '>=', '==', '!=')
+    CANDLE_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
     def __init__(self, condition):
         self.condition = condition
         self.analysis = self._analyze_condition_structure()
@@ -52,7 +55,8 @@ class ConditionAnalyzer:
         return {
             'type': 'condition',
             'condition': condition,
-            'requires_ticks': self._is_live_data_condition(condition)
+            'requires_ticks': self._is_live_data_condition(condition),
+            'candle_only': self._is_candle_only_condition(condition)
         }
 
     def _extract_group_logic(self, condition):
@@ -88,6 +92,45 @@ class ConditionAnalyzer:
                         return True
         return False
 
+    def _is_candle_only_condition(self, condition):
+        """
+        True if the comparison only reads completed candles / indicators and
+        constants - its result can only change when a candle completes.
+        """
+        if not isinstance(condition, dict) or condition.get('operator') not in self.COMPARISON_OPERATORS:
+            return False
+        kinds = [self.classify_expression(condition.get('lhs')), self.classify_expression(condition.get('rhs'))]
+        return None not in kinds and kinds != ['constant', 'constant']
+
+    @classmethod
+    def classify_expression(cls, expression):
+        """
+        Classify one side of a comparison by what its value depends on.
+
+        Returns:
+            'constant', 'candle' (OHLCV of a completed candle), 'indicator'
+            (indicator on a completed candle), or None for anything else
+            (live data, time, forming candle, node variables, positions,
+            arithmetic, ...)
+        """
+        if not isinstance(expression, dict) or 'operation' in expression:
+            return None
+
+        value_type = expression.get('type')
+        if value_type == 'constant':
+            return 'constant' if isinstance(expression.get('value', 0), (int, float)) else None
+
+        offset = expression.get('offset')
+        if not isinstance(offset, int) or offset > -1 or not expression.get('timeframeId'):
+            return None
+
+        if value_type in ('market_data', 'candle_data'):
+            field = expression.get('field') or expression.get('dataField')
+            return 'candle' if str(field).lower() in cls.CANDLE_FIELDS else None
+        if value_type == 'indicator' and expression.get('name'):
+            return 'indicator'
+        return None
+
     def get_analysis_summary(self):
         return {
             'has_live_data': self.analysis['has_live_data'],
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 
 from .condition_analyzer import ConditionAnalyzer
+from .condition_plan import compile_condition, compiled_plans_enabled
 from .expression_evaluator import ExpressionEvaluator
+from src.backtesting.candle_ring_buffer import CandleBufferView
 from src.utils.logger import log_info, log_error, log_warning
 
 
@@ -15,7 +17,7 @@ class ConditionEvaluator:
     Provides modular functions for different evaluation tasks.
     """
 
-    def __init__(self, context=None, condition=None, expression_evaluator=None, mode='backtesting'):
+    def __init__(self, context=None, condition=None, expression_evaluator=None, mode='backtesting', compiled=None):
         """
         Initialize ConditionEvaluatorV2.
         
@@ -24,8 +26,14 @@ class ConditionEvaluator:
             condition: Optional initial condition to evaluate
             expression_evaluator: Optional ExpressionEvaluator instance
             mode: Evaluation mode ('backtesting' or 'live_trading')
+            compiled: Evaluate via compiled condition plans (True) or the
+                reference dict interpreter (False); None = CONDITION_EVAL_MODE
         """
         self.mode = mode
+        self.compiled = compiled_plans_enabled() if compiled is None else compiled
+        
+        # Compiled plans keyed by id(condition) -> (condition, plan)
+        self._plans = {}
         self.context = context or {}
         self.condition = condition
         
@@ -58,8 +66,24 @@ class ConditionEvaluator:
         """
         self.condition = condition  # Store condition for later use
         self.condition_analyzer = ConditionAnalyzer(condition)
+        if self.compiled:
+            self._plans.pop(id(condition), None)
+            self._get_plan(condition)
         return self
 
+    def _get_plan(self, condition):
+        """
+        Get (compiling on first use) the plan for a condition object.
+
+        Nodes pass the same condition dicts every tick, so each condition
+        is compiled once per evaluator.
+        """
+        entry = self._plans.get(id(condition))
+        if entry is None or entry[0] is not condition:
+            entry = (condition, compile_condition(condition))
+            self._plans[id(condition)] = entry
+        return entry[1]
+
     def set_context(self, candle=None, current_timestamp=None, tick_data=None, current_tick=None, previous_candle=None,
                     current_candle_index=None, candles_df=None, context=None):
         """
@@ -145,7 +169,7 @@ class ConditionEvaluator:
                 if symbol not in symbols_to_include:
                     continue
                 
-                if isinstance(candles, list):
+                if isinstance(candles, (list, CandleBufferView)):
                     # List format (backtesting)
                     self.diagnostic_data['candle_data'][symbol] = {
                         'current': candles[-1] if candles else {},
@@ -248,7 +272,10 @@ class ConditionEvaluator:
         self._extract_symbols_from_condition(condition)
 
         # Store the evaluation result for access by nodes
-        result = self._evaluate_recursive(condition)
+        if self.compiled:
+            result = self._get_plan(condition)(self)
+        else:
+            result = self._evaluate_recursive(condition)
         self.last_evaluation_result = result
 
         # Handle both boolean and dict results
@@ -461,47 +488,9 @@ class ConditionEvaluator:
             rhs_value = self._evaluate_value(condition['rhs'], current_timestamp)
             operator = condition['operator']
             
-            # Capture candle data BEFORE building text (so indicator signatures are available)
-            self._capture_candle_data()
-            
-            # DIAGNOSTIC: Capture expression values for detailed analysis
-            # Build human-readable text
-            lhs_text = self._expression_to_text(condition.get('lhs'))
-            rhs_text = self._expression_to_text(condition.get('rhs'))
-            
             # Apply operator and return result
             result = self._apply_operator(lhs_value, operator, rhs_value)
-            
-            # Format values for display (with time-aware formatting)
-            lhs_display = self._format_value_for_display(lhs_value, condition.get('lhs'))
-            rhs_display = self._format_value_for_display(rhs_value, condition.get('rhs'))
-            result_icon = '✓' if result else '✗'
-            
-            # Build separate keys for UI (simple format)
-            raw = f"{lhs_text} {operator} {rhs_text}"
-            evaluated = f"{lhs_display} {operator} {rhs_display}"
-            
-            # Build full condition text (backward compatible)
-            condition_text = f"{raw}  [{evaluated}] {result_icon}"
-            
-            condition_diagnostic = {
-                'lhs_expression': condition.get('lhs'),
-                'rhs_expression': condition.get('rhs'),
-                'lhs_value': lhs_value,
-                'rhs_value': rhs_value,
-                'operator': operator,
-                'timestamp': str(current_timestamp),
-                'tick_count': self.context.get('tick_count', 0),
-                'result': result,
-                'result_icon': result_icon,
-                'condition_type': 'live',
-                'raw': raw,  # UI: Expression only
-                'evaluated': evaluated,  # UI: Values only
-                'condition_text': condition_text  # Backward compatible: Full text
-            }
-            
-            # Store in diagnostic data
-            self.diagnostic_data['conditions_evaluated'].append(condition_diagnostic)
+            self._record_condition(condition, lhs_value, rhs_value, result, current_timestamp, 'live')
             
             return result
         except Exception as e:
@@ -697,7 +686,7 @@ class ConditionEvaluator:
 
         return self.condition_analyzer.get_analysis_summary()
 
-    def _evaluate_time_condition(self, condition):
+    def _evaluate_time_condition(self, condition, time_obj=None):
         """
         Evaluate a time-based condition.
         
@@ -706,6 +695,8 @@ class ConditionEvaluator:
                 Format: {'lhs': {'type': 'time', 'field': 'time'}, 
                         'operator': '>', 
                         'rhs': {'type': 'constant', 'value': '09:15:00'}}
+            time_obj: Pre-parsed RHS time (compiled plans); parsed from
+                the condition if None
             
         Returns:
             bool: Time condition evaluation result
@@ -717,24 +708,11 @@ class ConditionEvaluator:
 
             operator = condition.get('operator', '>=')
             
-            # Extract time value from RHS
-            rhs = condition.get('rhs', {})
-            if isinstance(rhs, dict):
-                time_value_str = rhs.get('value', '00:00:00')
-            else:
-                time_value_str = condition.get('value', '00:00:00')  # Fallback for old format
-
-            # Parse the time value (e.g., "09:45:00")
-            from datetime import datetime, time
+            from datetime import datetime
             import pytz
 
-            # Handle different time formats
-            if len(time_value_str.split(':')) == 2:
-                # Format: "09:45"
-                time_obj = datetime.strptime(time_value_str, '%H:%M').time()
-            else:
-                # Format: "09:45:00"
-                time_obj = datetime.strptime(time_value_str, '%H:%M:%S').time()
+            if time_obj is None:
+                time_obj = self._parse_time_value(condition)
 
             # Create target datetime for comparison
             if current_timestamp.tzinfo is None:
@@ -777,6 +755,30 @@ class ConditionEvaluator:
             # Re-raise - condition evaluation errors are critical
             raise RuntimeError(f"Time condition evaluation failed: {e}") from e
 
+    @staticmethod
+    def _parse_time_value(condition):
+        """
+        Parse the RHS time of a time condition ("09:45" or "09:45:00").
+
+        Returns:
+            datetime.time: Parsed time
+        """
+        from datetime import datetime
+
+        # Extract time value from RHS
+        rhs = condition.get('rhs', {})
+        if isinstance(rhs, dict):
+            time_value_str = rhs.get('value', '00:00:00')
+        else:
+            time_value_str = condition.get('value', '00:00:00')  # Fallback for old format
+
+        # Handle different time formats
+        if len(time_value_str.split(':')) == 2:
+            # Format: "09:45"
+            return datetime.strptime(time_value_str, '%H:%M').time()
+        # Format: "09:45:00"
+        return datetime.strptime(time_value_str, '%H:%M:%S').time()
+
     def _evaluate_non_live_condition(self, condition):
         """
         Evaluate a non-live_data condition using ExpressionEvaluator.
@@ -808,46 +810,9 @@ class ConditionEvaluator:
             except Exception as log_err:
                 log_warning(f"ConditionEvaluator debug logging failed: {log_err}")
 
-            # Capture candle data BEFORE building text (so indicator signatures are available)
-            self._capture_candle_data()
-
-            # DIAGNOSTIC: Capture expression values for detailed analysis (non-live conditions)
-            # Build human-readable text
-            lhs_text = self._expression_to_text(condition.get('lhs'))
-            rhs_text = self._expression_to_text(condition.get('rhs'))
-            
             # Apply operator and return result
             result = self._apply_operator(lhs_value, operator, rhs_value)
-            
-            # Format values for display (with time-aware formatting)
-            lhs_display = self._format_value_for_display(lhs_value, condition.get('lhs'))
-            rhs_display = self._format_value_for_display(rhs_value, condition.get('rhs'))
-            result_icon = '✓' if result else '✗'
-            
-            # Build separate keys for UI (simple format)
-            raw = f"{lhs_text} {operator} {rhs_text}"
-            evaluated = f"{lhs_display} {operator} {rhs_display}"
-            
-            # Build full condition text (backward compatible)
-            condition_text = f"{raw}  [{evaluated}] {result_icon}"
-            
-            condition_diagnostic = {
-                'lhs_expression': condition.get('lhs'),
-                'rhs_expression': condition.get('rhs'),
-                'lhs_value': lhs_value,
-                'rhs_value': rhs_value,
-                'operator': operator,
-                'timestamp': str(current_timestamp) if current_timestamp else None,
-                'condition_type': 'non_live',
-                'result': result,
-                'result_icon': result_icon,
-                'raw': raw,  # UI: Expression only
-                'evaluated': evaluated,  # UI: Values only
-                'condition_text': condition_text  # Backward compatible: Full text
-            }
-            
-            # Store in diagnostic data
-            self.diagnostic_data['conditions_evaluated'].append(condition_diagnostic)
+            self._record_condition(condition, lhs_value, rhs_value, result, current_timestamp, 'non_live')
 
             return result
         except Exception as e:
@@ -883,194 +848,299 @@ class ConditionEvaluator:
 
         # Use ExpressionEvaluator to handle all value types without data_processor
         return self.expression_evaluator.evaluate(value_config)
-    
-    def _format_value_for_display(self, value, expr_config):
+
+    def _record_condition(self, condition, lhs_value, rhs_value, result, current_timestamp, condition_type):
         """
-        Format a value for human-readable display.
-        
+        Append the diagnostic entry for an evaluated comparison.
+
+        Shared by the dict interpreter and compiled condition plans so both
+        produce identical diagnostics. Display text (raw / evaluated /
+        condition_text / result_icon) is not built here: it is rendered on
+        export by render_condition_diagnostics().
+
         Args:
-            value: The value to format (number, string, etc.)
-            expr_config: The expression configuration to determine type
-            
-        Returns:
-            str: Human-readable formatted value
+            condition: Single condition (lhs/operator/rhs)
+            lhs_value: Evaluated LHS
+            rhs_value: Evaluated RHS
+            result: Comparison result
+            current_timestamp: Evaluation timestamp
+            condition_type: 'live' or 'non_live'
         """
-        from datetime import datetime
-        
-        # Handle None
-        if value is None:
-            return "null"
-        
-        # Check if this is a time-related expression
-        if isinstance(expr_config, dict):
-            expr_type = expr_config.get('type', '')
-            
-            # For current_time or time_function, format as time
-            if expr_type in ['current_time', 'time_function']:
-                if isinstance(value, (int, float)):
-                    # Assume it's a Unix timestamp
-                    try:
-                        dt = datetime.fromtimestamp(value)
-                        return dt.strftime('%H:%M:%S')
-                    except (ValueError, OSError):
-                        # If conversion fails, return as-is
-                        pass
-        
-        # For regular numbers
-        if isinstance(value, float):
-            return f"{value:.2f}"
-        elif isinstance(value, int):
-            return str(value)
-        
-        # For other types
-        return str(value)
-    
+        level = getattr(self.context.get('diagnostics'), 'level', 'full')
+        if level == 'off':
+            return
+
+        # Candle data (indicator signatures for the rendered text) only at full level
+        if level == 'full':
+            self._capture_candle_data()
+
+        if condition_type == 'live':
+            condition_diagnostic = {
+                'lhs_expression': condition.get('lhs'),
+                'rhs_expression': condition.get('rhs'),
+                'lhs_value': lhs_value,
+                'rhs_value': rhs_value,
+                'operator': condition['operator'],
+                'timestamp': str(current_timestamp),
+                'tick_count': self.context.get('tick_count', 0),
+                'result': result,
+                'condition_type': 'live'
+            }
+        else:
+            condition_diagnostic = {
+                'lhs_expression': condition.get('lhs'),
+                'rhs_expression': condition.get('rhs'),
+                'lhs_value': lhs_value,
+                'rhs_value': rhs_value,
+                'operator': condition['operator'],
+                'timestamp': str(current_timestamp) if current_timestamp else None,
+                'condition_type': 'non_live',
+                'result': result
+            }
+
+        # Store in diagnostic data
+        self.diagnostic_data['conditions_evaluated'].append(condition_diagnostic)
+
+    def _format_value_for_display(self, value, expr_config):
+        return format_value_for_display(value, expr_config)
+
     def _expression_to_text(self, expr):
-        """
-        Convert expression JSON to human-readable text matching UI preview format.
-        
-        Args:
-            expr: Expression configuration (dict, number, or string)
-            
-        Returns:
-            str: Human-readable expression text
-        """
-        if expr is None:
-            return "null"
-        
-        # Handle simple values
-        if isinstance(expr, (int, float)):
-            return str(expr)
-        if isinstance(expr, str):
-            return expr
-        if not isinstance(expr, dict):
-            return str(expr)
-        
-        expr_type = expr.get('type', '')
-        
-        # Current Time
-        if expr_type == 'current_time':
-            return "Current Time"
-        
-        # Time Function (time comparison value like "09:17")
-        elif expr_type == 'time_function':
-            time_value = expr.get('timeValue', '')
-            return time_value
-        
-        # Candle Data (e.g., Previous[TI.1m.Close] or TI.1m.Close)
-        elif expr_type == 'candle_data':
-            field = expr.get('field', 'Close')
-            offset = expr.get('offset', 0)
-            timeframe_id = expr.get('timeframeId', '1m')
-            instrument_type = expr.get('instrumentType', 'TI')
-            
-            # Build base text
-            base_text = f"{instrument_type}.{timeframe_id}.{field}"
-            
-            # Add Previous[] wrapper if offset is -1
-            if offset == -1:
-                return f"Previous[{base_text}]"
-            elif offset < -1:
-                return f"Previous[{base_text}, {abs(offset)}]"
-            else:
-                return base_text
-        
-        # Live Data (e.g., TI.underlying_ltp or SI.underlying_ltp)
-        elif expr_type == 'live_data':
-            field = expr.get('field', 'ltp')
-            instrument_type = expr.get('instrumentType', 'TI')
-            return f"{instrument_type}.{field}"
-        
-        # Indicator (e.g., Previous[TI.1m.rsi(14,close)])
-        elif expr_type == 'indicator':
-            # Get indicator name (e.g., rsi_1764509210372)
-            name = expr.get('name', 'INDICATOR')
-            offset = expr.get('offset', 0)
-            timeframe_id = expr.get('timeframeId', '1m')
-            instrument_type = expr.get('instrumentType', 'TI')
-            parameter = expr.get('parameter', None)
-            
-            # Try to get the full indicator signature from captured candle data
-            # The indicator signature is stored in the candle data as the key
-            full_signature = None
-            
-            # Check captured candle data in diagnostic_data
-            candle_data = self.diagnostic_data.get('candle_data', {})
-            for symbol, data in candle_data.items():
-                # Check previous candle (where indicators are stored)
-                prev_candle = data.get('previous', {})
-                indicators = prev_candle.get('indicators', {})
-                
-                # Extract the base indicator name (e.g., "rsi" from "rsi_1764509210372")
-                base_name = name.split('_')[0] if '_' in name else name
-                
-                # Look for an indicator key that starts with the base name
-                # e.g., "rsi(14,close)" starts with "rsi"
-                for ind_key in indicators.keys():
-                    if ind_key.startswith(base_name + '('):
-                        full_signature = ind_key
-                        break
-                
-                if full_signature:
+        return expression_to_text(expr, self.diagnostic_data.get('candle_data'))
+
+
+# ============================================================================
+# DIAGNOSTIC TEXT (rendered on export, not per evaluation)
+# ============================================================================
+
+def render_condition_diagnostics(diagnostic_data):
+    """
+    Fill in the display text of recorded condition diagnostics.
+
+    Adds 'result_icon', 'raw' (expression only), 'evaluated' (values only)
+    and 'condition_text' (both, backward compatible) to each entry of
+    diagnostic_data['conditions_evaluated'] that does not have them yet.
+    Indicator signatures are resolved from diagnostic_data['candle_data']
+    when it was captured (full diagnostics level).
+
+    Args:
+        diagnostic_data: Dict with 'conditions_evaluated' (and optionally
+            'candle_data'), e.g. ConditionEvaluator.get_diagnostic_data()
+
+    Returns:
+        The same dict (entries updated in place)
+    """
+    conditions = diagnostic_data.get('conditions_evaluated')
+    if not isinstance(conditions, list):
+        return diagnostic_data
+
+    candle_data = diagnostic_data.get('candle_data')
+    for entry in conditions:
+        if not isinstance(entry, dict) or 'condition_text' in entry:
+            continue
+        lhs_expression = entry.get('lhs_expression')
+        rhs_expression = entry.get('rhs_expression')
+        operator = entry.get('operator')
+
+        raw = f"{expression_to_text(lhs_expression, candle_data)} {operator} {expression_to_text(rhs_expression, candle_data)}"
+        evaluated = (f"{format_value_for_display(entry.get('lhs_value'), lhs_expression)} {operator} "
+                     f"{format_value_for_display(entry.get('rhs_value'), rhs_expression)}")
+        result_icon = '✓' if entry.get('result') else '✗'
+
+        entry['result_icon'] = result_icon
+        entry['raw'] = raw  # UI: Expression only
+        entry['evaluated'] = evaluated  # UI: Values only
+        entry['condition_text'] = f"{raw}  [{evaluated}] {result_icon}"  # Backward compatible: Full text
+    return diagnostic_data
+
+
+def format_value_for_display(value, expr_config):
+    """
+    Format a value for human-readable display.
+
+    Args:
+        value: The value to format (number, string, etc.)
+        expr_config: The expression configuration to determine type
+
+    Returns:
+        str: Human-readable formatted value
+    """
+    from datetime import datetime
+
+    # Handle None
+    if value is None:
+        return "null"
+
+    # Check if this is a time-related expression
+    if isinstance(expr_config, dict):
+        expr_type = expr_config.get('type', '')
+
+        # For current_time or time_function, format as time
+        if expr_type in ['current_time', 'time_function']:
+            if isinstance(value, (int, float)):
+                # Assume it's a Unix timestamp
+                try:
+                    dt = datetime.fromtimestamp(value)
+                    return dt.strftime('%H:%M:%S')
+                except (ValueError, OSError):
+                    # If conversion fails, return as-is
+                    pass
+
+    # For regular numbers
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    elif isinstance(value, int):
+        return str(value)
+
+    # For other types
+    return str(value)
+
+def expression_to_text(expr, candle_data=None):
+    """
+    Convert expression JSON to human-readable text matching UI preview format.
+
+    Args:
+        expr: Expression configuration (dict, number, or string)
+        candle_data: Captured candle data (diagnostic_data['candle_data'])
+            used to resolve full indicator signatures
+
+    Returns:
+        str: Human-readable expression text
+    """
+    if expr is None:
+        return "null"
+
+    # Handle simple values
+    if isinstance(expr, (int, float)):
+        return str(expr)
+    if isinstance(expr, str):
+        return expr
+    if not isinstance(expr, dict):
+        return str(expr)
+
+    expr_type = expr.get('type', '')
+
+    # Current Time
+    if expr_type == 'current_time':
+        return "Current Time"
+
+    # Time Function (time comparison value like "09:17")
+    elif expr_type == 'time_function':
+        time_value = expr.get('timeValue', '')
+        return time_value
+
+    # Candle Data (e.g., Previous[TI.1m.Close] or TI.1m.Close)
+    elif expr_type == 'candle_data':
+        field = expr.get('field', 'Close')
+        offset = expr.get('offset', 0)
+        timeframe_id = expr.get('timeframeId', '1m')
+        instrument_type = expr.get('instrumentType', 'TI')
+
+        # Build base text
+        base_text = f"{instrument_type}.{timeframe_id}.{field}"
+
+        # Add Previous[] wrapper if offset is -1
+        if offset == -1:
+            return f"Previous[{base_text}]"
+        elif offset < -1:
+            return f"Previous[{base_text}, {abs(offset)}]"
+        else:
+            return base_text
+
+    # Live Data (e.g., TI.underlying_ltp or SI.underlying_ltp)
+    elif expr_type == 'live_data':
+        field = expr.get('field', 'ltp')
+        instrument_type = expr.get('instrumentType', 'TI')
+        return f"{instrument_type}.{field}"
+
+    # Indicator (e.g., Previous[TI.1m.rsi(14,close)])
+    elif expr_type == 'indicator':
+        # Get indicator name (e.g., rsi_1764509210372)
+        name = expr.get('name', 'INDICATOR')
+        offset = expr.get('offset', 0)
+        timeframe_id = expr.get('timeframeId', '1m')
+        instrument_type = expr.get('instrumentType', 'TI')
+        parameter = expr.get('parameter', None)
+
+        # Try to get the full indicator signature from captured candle data
+        # The indicator signature is stored in the candle data as the key
+        full_signature = None
+
+        # Check captured candle data in diagnostic_data
+        for symbol, data in (candle_data or {}).items():
+            # Check previous candle (where indicators are stored)
+            prev_candle = data.get('previous', {})
+            indicators = prev_candle.get('indicators', {})
+
+            # Extract the base indicator name (e.g., "rsi" from "rsi_1764509210372")
+            base_name = name.split('_')[0] if '_' in name else name
+
+            # Look for an indicator key that starts with the base name
+            # e.g., "rsi(14,close)" starts with "rsi"
+            for ind_key in indicators.keys():
+                if ind_key.startswith(base_name + '('):
+                    full_signature = ind_key
                     break
-            
-            # Build indicator text
+
             if full_signature:
-                # Use the full signature from candle data
-                indicator_text = f"{instrument_type}.{timeframe_id}.{full_signature}"
-            elif parameter:
-                # Use provided parameter
-                actual_name = name.split('_')[0] if '_' in name else name
-                indicator_text = f"{instrument_type}.{timeframe_id}.{actual_name}({parameter})"
-            else:
-                # Fallback: just use the base name
-                actual_name = name.split('_')[0] if '_' in name else name
-                indicator_text = f"{instrument_type}.{timeframe_id}.{actual_name}()"
-            
-            # Add Previous[] wrapper if offset is -1
-            if offset == -1:
-                return f"Previous[{indicator_text}]"
-            elif offset < -1:
-                return f"Previous[{indicator_text}, {abs(offset)}]"
-            else:
-                return indicator_text
-        
-        # Node variable (e.g., entry_condition_1.SignalLow)
-        elif expr_type == 'node_variable':
-            node_id = expr.get('nodeId', 'NODE')
-            var_name = expr.get('variableName', 'VAR')
-            return f"{node_id}.{var_name}"
-        
-        # Expression (nested arithmetic)
-        elif expr_type == 'expression':
-            left = self._expression_to_text(expr.get('left'))
-            right = self._expression_to_text(expr.get('right'))
-            op = expr.get('operator', '+')
-            return f"({left} {op} {right})"
-        
-        # Constant/number
-        elif expr_type == 'number' or expr_type == 'constant':
-            # Prioritize 'value' field, fall back to 'numberValue' only if 'value' doesn't exist
-            if 'value' in expr:
-                value = expr.get('value')
-            elif 'numberValue' in expr:
-                value = expr.get('numberValue')
-            else:
-                value = 0
-            return str(value)
-        
-        # Time field
-        elif expr_type == 'time':
-            field = expr.get('field', 'time')
-            return f"TIME.{field}"
-        
-        # Candle (legacy)
-        elif expr_type == 'candle':
-            field = expr.get('field', 'close')
-            symbol = expr.get('symbol', '')
-            offset = expr.get('offset', 0)
-            offset_text = f"[{offset}]" if offset != 0 else ""
-            return f"{symbol}.{field}{offset_text}"
-        
-        # Fallback - return JSON string representation
-        return str(expr)
+                break
+
+        # Build indicator text
+        if full_signature:
+            # Use the full signature from candle data
+            indicator_text = f"{instrument_type}.{timeframe_id}.{full_signature}"
+        elif parameter:
+            # Use provided parameter
+            actual_name = name.split('_')[0] if '_' in name else name
+            indicator_text = f"{instrument_type}.{timeframe_id}.{actual_name}({parameter})"
+        else:
+            # Fallback: just use the base name
+            actual_name = name.split('_')[0] if '_' in name else name
+            indicator_text = f"{instrument_type}.{timeframe_id}.{actual_name}()"
+
+        # Add Previous[] wrapper if offset is -1
+        if offset == -1:
+            return f"Previous[{indicator_text}]"
+        elif offset < -1:
+            return f"Previous[{indicator_text}, {abs(offset)}]"
+        else:
+            return indicator_text
+
+    # Node variable (e.g., entry_condition_1.SignalLow)
+    elif expr_type == 'node_variable':
+        node_id = expr.get('nodeId', 'NODE')
+        var_name = expr.get('variableName', 'VAR')
+        return f"{node_id}.{var_name}"
+
+    # Expression (nested arithmetic)
+    elif expr_type == 'expression':
+        left = expression_to_text(expr.get('left'), candle_data)
+        right = expression_to_text(expr.get('right'), candle_data)
+        op = expr.get('operator', '+')
+        return f"({left} {op} {right})"
+
+    # Constant/number
+    elif expr_type == 'number' or expr_type == 'constant':
+        # Prioritize 'value' field, fall back to 'numberValue' only if 'value' doesn't exist
+        if 'value' in expr:
+            value = expr.get('value')
+        elif 'numberValue' in expr:
+            value = expr.get('numberValue')
+        else:
+            value = 0
+        return str(value)
+
+    # Time field
+    elif expr_type == 'time':
+        field = expr.get('field', 'time')
+        return f"TIME.{field}"
+
+    # Candle (legacy)
+    elif expr_type == 'candle':
+        field = expr.get('field', 'close')
+        symbol = expr.get('symbol', '')
+        offset = expr.get('offset', 0)
+        offset_text = f"[{offset}]" if offset != 0 else ""
+        return f"{symbol}.{field}{offset_text}"
+
+    # Fallback - return JSON string representation
+    return str(expr)
@@ -0,0 +1,325 @@
+"""
+Compiled Condition Plans
+========================
+
+Compile step for ConditionEvaluator / ExpressionEvaluator.
+
+The dict interpreter re-dispatches on the raw condition JSON every time it
+evaluates: `groupLogic` / `type` string checks, `'operation' in expression`,
+live-data tree scans, `f"{symbol}:{timeframe_id}"` key building, field
+name resolution and operator string matching - once per condition per
+second. compile_condition() walks the condition tree once and returns a
+chain of closures with all of that resolved up front:
+
+- groups       -> short-circuit loop over compiled children
+- comparisons  -> operator function picked once; live/non-live decided once
+- constants    -> folded to their float value
+- candle OHLCV -> (timeframe, lower-cased field, array index) pre-resolved;
+                  reads CandleBufferView columns directly
+- indicators   -> (timeframe, output field, array index) pre-resolved
+- time rules   -> RHS time parsed once
+
+Anything the plan does not specialise (node variables, live data,
+position / pnl data, scalar expressions, DataFrame-backed candles,
+malformed configs) is delegated to the interpreter for that node only, so
+results, diagnostics and errors match the interpreter exactly. The
+interpreter remains the reference implementation
+(ConditionEvaluator(compiled=False) or CONDITION_EVAL_MODE=interpreted).
+
+Plans are keyed on the condition dict object: a condition mutated after it
+was compiled must be recompiled (ConditionEvaluator.set_condition does).
+"""
+
+import operator as _operator
+import os
+import traceback
+from typing import Any, Callable, Dict, Optional
+
+from src.backtesting.candle_ring_buffer import OHLCV_FIELDS, CandleBufferView
+from src.utils.logger import log_error
+
+# Same operators as ConditionEvaluator._apply_operator
+_COMPARISONS: Dict[str, Callable[[Any, Any], Any]] = {
+    '<': _operator.lt,
+    '<=': _operator.le,
+    '>': _operator.gt,
+    '>=': _operator.ge,
+    '==': _operator.eq,
+    '!=': _operator.ne,
+}
+
+# plan(evaluator) -> result; value(evaluator) -> value
+ConditionPlan = Callable[[Any], Any]
+ValuePlan = Callable[[Any], Any]
+
+
+def compiled_plans_enabled() -> bool:
+    """CONDITION_EVAL_MODE=interpreted selects the reference dict interpreter."""
+    return os.getenv('CONDITION_EVAL_MODE', 'compiled').lower() != 'interpreted'
+
+
+# ============================================================================
+# CONDITIONS
+# ============================================================================
+
+def compile_condition(condition: Any) -> ConditionPlan:
+    """
+    Compile a condition tree into a plan.
+
+    Args:
+        condition: Condition dict (group or single comparison)
+
+    Returns:
+        Callable taking the ConditionEvaluator (for its context and
+        diagnostics) and returning the same value as _evaluate_recursive
+    """
+    if isinstance(condition, dict) and 'groupLogic' in condition:
+        return _compile_group(condition)
+    return _compile_single(condition)
+
+
+def _compile_group(condition: Dict[str, Any]) -> ConditionPlan:
+    group_logic = condition.get('groupLogic', 'AND')
+    children = tuple(compile_condition(sub) for sub in condition.get('conditions', []))
+
+    if not children:
+        return lambda evaluator: True
+
+    if group_logic == 'AND':
+        def evaluate_and(evaluator):
+            for child in children:
+                if not child(evaluator):
+                    return False
+            return True
+        return evaluate_and
+
+    if group_logic == 'OR':
+        def evaluate_or(evaluator):
+            for child in children:
+                if child(evaluator):
+                    return True
+            return False
+        return evaluate_or
+
+    # Unknown logic: interpreter evaluates every child, then defaults to AND
+    def evaluate_default(evaluator):
+        return all([child(evaluator) for child in children])
+    return evaluate_default
+
+
+def _interpret_condition(condition: Any) -> ConditionPlan:
+    return lambda evaluator: evaluator._evaluate_recursive(condition)
+
+
+def _compile_single(condition: Any) -> ConditionPlan:
+    if not isinstance(condition, dict) or not all(k in condition for k in ('lhs', 'rhs', 'operator')):
+        return _interpret_condition(condition)
+
+    lhs, rhs = condition['lhs'], condition['rhs']
+
+    if _side_type(lhs) == 'time' or _side_type(rhs) == 'time':
+        return _compile_time_condition(condition)
+
+    is_live = _contains_type(lhs, 'live_data') or _contains_type(rhs, 'live_data')
+    condition_type = 'live' if is_live else 'non_live'
+
+    lhs_value = compile_expression(lhs)
+    rhs_value = compile_expression(rhs)
+    compare = _COMPARISONS.get(condition['operator'])
+
+    def evaluate_comparison(evaluator):
+        try:
+            current_timestamp = evaluator.context.get('current_timestamp')
+            if is_live and current_timestamp is None:
+                return False
+
+            left = lhs_value(evaluator)
+            right = rhs_value(evaluator)
+
+            if left is None or right is None or compare is None:
+                result = False
+            else:
+                result = compare(left, right)
+
+            evaluator._record_condition(condition, left, right, result, current_timestamp, condition_type)
+            return result
+        except Exception as e:
+            label = 'live data' if is_live else 'non-live'
+            log_error(f"❌ CRITICAL: Error evaluating {label} condition: {e}")
+            log_error(f"   LHS: {lhs}, RHS: {rhs}, Operator: {condition.get('operator')}")
+            log_error(f"   Full traceback:\n{traceback.format_exc()}")
+            # Re-raise - condition evaluation errors are critical
+            raise RuntimeError(f"Condition evaluation failed: {e}") from e
+
+    return evaluate_comparison
+
+
+def _compile_time_condition(condition: Dict[str, Any]) -> ConditionPlan:
+    from src.core.condition_evaluator_v2 import ConditionEvaluator
+
+    try:
+        time_obj = ConditionEvaluator._parse_time_value(condition)
+    except Exception:
+        # Malformed time: let the interpreter raise at evaluation time
+        return _interpret_condition(condition)
+
+    return lambda evaluator: evaluator._evaluate_time_condition(condition, time_obj)
+
+
+def _side_type(expression: Any) -> Optional[str]:
+    return expression.get('type') if isinstance(expression, dict) else None
+
+
+def _contains_type(expression: Any, value_type: str) -> bool:
+    """True if `value_type` appears anywhere in the expression tree."""
+    if not isinstance(expression, dict):
+        return False
+    if expression.get('type') == value_type:
+        return True
+    for value in expression.values():
+        if isinstance(value, dict):
+            if _contains_type(value, value_type):
+                return True
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, dict) and _contains_type(item, value_type):
+                    return True
+    return False
+
+
+# ============================================================================
+# EXPRESSIONS
+# ============================================================================
+
+def compile_expression(expression: Any) -> ValuePlan:
+    """
+    Compile one side of a comparison.
+
+    Args:
+        expression: ExpressionEvaluator expression config
+
+    Returns:
+        Callable taking the ConditionEvaluator and returning the same value
+        as ExpressionEvaluator.evaluate under that evaluator's context
+    """
+    if not isinstance(expression, dict):
+        return lambda evaluator: None
+
+    value_type = expression.get('type')
+
+    if value_type == 'constant':
+        try:
+            value = float(expression.get('value', 0))
+        except (TypeError, ValueError):
+            value = None
+        return lambda evaluator: value
+
+    if 'operation' in expression:
+        return _interpret_expression(expression)
+
+    if value_type == 'indicator' and 'name' in expression and 'offset' in expression:
+        return _compile_indicator(expression)
+
+    if value_type in ('market_data', 'candle_data'):
+        field = expression.get('field') or expression.get('dataField')
+        if field and 'offset' in expression and str(field).lower() in OHLCV_FIELDS:
+            return _compile_candle_field(expression, str(field).lower())
+
+    return _interpret_expression(expression)
+
+
+def _interpret_expression(expression: Dict[str, Any]) -> ValuePlan:
+    def interpret(evaluator):
+        return evaluator._evaluate_value(expression, evaluator.context.get('current_timestamp'))
+    return interpret
+
+
+def _strategy_symbol(context: Dict[str, Any]) -> str:
+    return context.get('strategy_config', {}).get('symbol', 'NIFTY')
+
+
+def _compile_candle_field(expression: Dict[str, Any], field: str) -> ValuePlan:
+    """OHLCV at an offset: candles[offset - 1][field]"""
+    timeframe_id = expression.get('timeframeId')
+    target_index = expression['offset'] - 1
+    interpret = _interpret_expression(expression)
+
+    if not timeframe_id:
+        return lambda evaluator: None
+
+    keys: Dict[str, str] = {}
+
+    def candle_field(evaluator):
+        context = evaluator.context
+        symbol = _strategy_symbol(context)
+        key = keys.get(symbol)
+        if key is None:
+            key = keys[symbol] = f"{symbol}:{timeframe_id}"
+
+        candles = (context.get('candle_df_dict') or {}).get(key)
+        if isinstance(candles, CandleBufferView) and candles:
+            if abs(target_index) > len(candles):
+                return None
+            return candles.value(field, target_index)
+        if isinstance(candles, list) and candles:
+            if abs(target_index) > len(candles):
+                return None
+            value = candles[target_index].get(field)
+            return float(value) if value is not None else None
+
+        # Missing candles (debug logging) or DataFrame-backed (live trading)
+        return interpret(evaluator)
+
+    return candle_field
+
+
+def _compile_indicator(expression: Dict[str, Any]) -> ValuePlan:
+    """Indicator output at an offset: candles[offset - 1]['indicators'][field]"""
+    timeframe_id = expression.get('timeframeId')
+    target_index = expression['offset'] - 1
+    parameter = expression.get('parameter')
+    name = expression['name']
+    field = f"{name}_{parameter}" if parameter else name
+    interpret = _interpret_expression(expression)
+
+    if not timeframe_id:
+        return lambda evaluator: None
+
+    keys: Dict[str, str] = {}
+
+    def indicator(evaluator):
+        context = evaluator.context
+        symbol = _strategy_symbol(context)
+        key = keys.get(symbol)
+        if key is None:
+            key = keys[symbol] = f"{symbol}:{timeframe_id}"
+
+        candles = (context.get('candle_df_dict') or {}).get(key)
+        if not candles:
+            return None
+        if not isinstance(candles, (list, CandleBufferView)):
+            # DataFrame format (live trading)
+            return interpret(evaluator)
+
+        if abs(target_index) > len(candles):
+            return None
+
+        if isinstance(candles, CandleBufferView):
+            value = candles.value(field, target_index)
+            if value is not None:
+                return value
+
+        indicators = candles[target_index].get('indicators', {})
+        value = indicators.get(field) if indicators else None
+
+        # Database key -> generated key mapping
+        if value is None and indicators:
+            data_manager = context.get('data_manager')
+            if data_manager and hasattr(data_manager, 'indicator_key_mappings'):
+                mapped_key = data_manager.indicator_key_mappings.get(key, {}).get(field)
+                if mapped_key:
+                    value = indicators.get(mapped_key)
+
+        return float(value) if value is not None else None
+
+    return indicator
@@ -23,6 +23,7 @@ if live_trading_engine_path not in sys.path:
 # Commented out - talib not used in backtesting, causes 1-2s import delay
 # from src.utils.indicator_functions import TechnicalIndicators, calculate_ema, calculate_macd
 from src.utils.indicator_utils import execute_indicators
+from src.backtesting.candle_ring_buffer import CandleBufferView
 import inspect
 
 
@@ -742,11 +743,11 @@ class ExpressionEvaluator:
             if df_or_builder is None:
                 return None
                 
-            # Support both list and DataFrame (backtesting uses list)
-            if isinstance(df_or_builder, list):
+            # Support both list and DataFrame (backtesting uses list / candle buffer view)
+            if isinstance(df_or_builder, (list, CandleBufferView)):
                 # Convert list to DataFrame for evaluation
                 import pandas as pd
-                return pd.DataFrame(df_or_builder) if df_or_builder else None
+                return pd.DataFrame(list(df_or_builder)) if df_or_builder else None
             if hasattr(df_or_builder, 'get_dataframe'):
                 return df_or_builder.get_dataframe()
             if isinstance(df_or_builder, pd.DataFrame):
@@ -964,8 +965,8 @@ class ExpressionEvaluator:
         else:
             field = indicator_name  # Single-output indicator
         
-        # For backtesting, candles is a list of dicts
-        if isinstance(candles, list):
+        # For backtesting, candles is a list of dicts (or a candle buffer view)
+        if isinstance(candles, (list, CandleBufferView)):
             try:
                 # Get candle at offset position from end
                 # offset -1 = previous completed candle (candles[-2])
@@ -976,6 +977,12 @@ class ExpressionEvaluator:
                 if abs(target_index) > len(candles):
                     return None
                 
+                # Fast path: read the buffer column directly (no candle dict)
+                if isinstance(candles, CandleBufferView):
+                    value = candles.value(field, target_index)
+                    if value is not None:
+                        return value
+                
                 candle = candles[target_index]
                 
                 # DEBUG (disabled)
@@ -1072,9 +1079,9 @@ class ExpressionEvaluator:
         
         # DEBUG (disabled)
         
-        # For backtesting, candles is a list of dicts
+        # For backtesting, candles is a list of dicts (or a candle buffer view)
         # Last element is the forming candle, rest are completed candles
-        if isinstance(candles, list):
+        if isinstance(candles, (list, CandleBufferView)):
             # offset=0 means current forming candle (last in list)
             # offset=-1 means previous completed candle (second to last)
             # offset=-2 means 2 candles back, etc.
@@ -1088,6 +1095,10 @@ class ExpressionEvaluator:
                 if abs(target_index) > len(candles):
                     return None
                 
+                # Fast path: OHLCV straight from the buffer columns (no candle dict)
+                if isinstance(candles, CandleBufferView) and field in ('open', 'high', 'low', 'close', 'volume'):
+                    return candles.value(field, target_index)
+                
                 candle = candles[target_index]
                 
                 # Safeguard: Warn if accessing indicator on forming candle (offset 0)
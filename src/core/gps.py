@@ -309,13 +309,8 @@ class GlobalPositionStore:
             side = position.get("side", "buy").lower()
             instrument = position.get("instrument", "")
             
-            # Get current LTP - try to match by instrument
-            current_ltp = None
-            for ltp_key, ltp_data in current_ltp_store.items():
-                if isinstance(ltp_data, dict):
-                    if ltp_data.get("symbol") == instrument or ltp_key == "ltp_TI":
-                        current_ltp = ltp_data.get("ltp") or ltp_data.get("price")
-                        break
+            # Get current LTP - O(1) lookup by instrument
+            current_ltp = self._lookup_ltp(current_ltp_store, instrument)
             
             # Update current_price (MANDATORY: every tick)
             if current_ltp:
@@ -332,6 +327,23 @@ class GlobalPositionStore:
                     realized = position.get("realized_pnl") or 0.0
                     position["pnl"] = realized + position["unrealized_pnl"]
 
+    @staticmethod
+    def _lookup_ltp(current_ltp_store: Dict[str, Any], instrument: str) -> Optional[float]:
+        """
+        Current LTP of an instrument from a symbol-keyed store.
+
+        Falls back to the legacy role-keyed 'ltp_TI' entry. Both are direct
+        lookups, so repricing costs O(1) per position.
+        """
+        ltp_data = current_ltp_store.get(instrument) if instrument else None
+        if ltp_data is None:
+            ltp_data = current_ltp_store.get("ltp_TI")
+        if isinstance(ltp_data, dict):
+            return ltp_data.get("ltp") or ltp_data.get("price")
+        if isinstance(ltp_data, (int, float)):
+            return ltp_data
+        return None
+
     def _update_overall_pnl(self, current_ltp_store: Optional[Dict[str, Any]] = None):
         """Update overall PNL by summing all positions."""
         pnl_data = self.get_total_pnl(current_ltp_store)
@@ -421,11 +433,7 @@ class GlobalPositionStore:
                 current_ltp = None
                 
                 # Try to find matching LTP from store
-                for ltp_key, ltp_data in current_ltp_store.items():
-                    if isinstance(ltp_data, dict):
-                        if ltp_data.get("symbol") == instrument or ltp_key == "ltp_TI":
-                            current_ltp = ltp_data.get("ltp") or ltp_data.get("price")
-                            break
+                current_ltp = self._lookup_ltp(current_ltp_store, instrument)
                 
                 # Calculate unrealized P&L if we have all required data
                 if entry_price and current_ltp and quantity:
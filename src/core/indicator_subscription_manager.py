@@ -3,7 +3,7 @@ Indicator Subscription Manager - Deduplicate and manage indicator subscriptions.
 
 This module manages indicator subscriptions with deduplication:
 1. Reuse existing indicators if already subscribed
-2. Track which strategies use which indicators
+2. Track which strategies use which indicators (IndicatorSeriesRegistry references)
 3. Handle indicator lifecycle (subscribe/unsubscribe)
 
 Key Principle: If multiple strategies use the same indicator (e.g., RSI_14 on NIFTY:1m),
@@ -15,7 +15,8 @@ Created: 2024-11-12
 
 from typing import Dict, List, Set, Tuple, Any, Optional
 from datetime import datetime
-from src.utils.logger import log_info, log_warning, log_debug
+from src.backtesting.indicator_series_registry import IndicatorSeriesRegistry
+from src.utils.logger import log_info, log_debug
 
 
 class IndicatorSubscriptionManager:
@@ -29,16 +30,20 @@ class IndicatorSubscriptionManager:
     
     Note: For now, indicators are stored in candle_df_dict as columns.
     This manager tracks which indicators are needed and ensures they're calculated.
+    Which strategies use an indicator is kept only in the registry (its
+    references); the cache holds one entry per subscribed indicator.
     """
     
-    def __init__(self, cache_manager):
+    def __init__(self, cache_manager, registry: Optional[IndicatorSeriesRegistry] = None):
         """
         Initialize indicator subscription manager.
         
         Args:
             cache_manager: CacheManager instance
+            registry: IndicatorSeriesRegistry holding the references (new one if None)
         """
         self.cache = cache_manager
+        self.registry = registry if registry is not None else IndicatorSeriesRegistry()
         log_info("📊 Initializing Indicator Subscription Manager")
     
     def subscribe_indicator(
@@ -60,27 +65,25 @@ class IndicatorSubscriptionManager:
         Returns:
             True if newly subscribed, False if already existed
         """
-        # Check if already subscribed
-        existing = self.cache.get_indicator_subscription(symbol, timeframe, indicator)
+        # Indicator keys carry their params, so the key itself names the series
+        series, created = self.registry.acquire(symbol, timeframe, indicator, None, strategy_instance_id, indicator)
         
-        if existing:
-            # Already subscribed - add strategy to users list
-            self.cache.add_strategy_to_indicator(symbol, timeframe, indicator, strategy_instance_id)
+        if not created:
             log_debug(f"♻️ Reusing indicator: {symbol}:{timeframe}:{indicator} (used by {strategy_instance_id})")
             return False
-        else:
-            # New subscription - create entry
-            subscription_data = {
-                'symbol': symbol,
-                'timeframe': timeframe,
-                'indicator': indicator,
-                'used_by_strategies': [strategy_instance_id],
-                'subscribed_at': datetime.now().isoformat()
-            }
-            
-            self.cache.set_indicator_subscription(symbol, timeframe, indicator, subscription_data)
-            log_info(f"✅ Subscribed indicator: {symbol}:{timeframe}:{indicator} (used by {strategy_instance_id})")
-            return True
+        
+        # New subscription - create entry
+        subscription_data = {
+            'symbol': symbol,
+            'timeframe': timeframe,
+            'indicator': indicator,
+            'series_key': series.series_key,
+            'subscribed_at': datetime.now().isoformat()
+        }
+        
+        self.cache.set_indicator_subscription(symbol, timeframe, indicator, subscription_data)
+        log_info(f"✅ Subscribed indicator: {symbol}:{timeframe}:{indicator} (used by {strategy_instance_id})")
+        return True
     
     def subscribe_indicators_for_strategy(
         self, 
@@ -116,37 +119,20 @@ class IndicatorSubscriptionManager:
         """
         Unsubscribe indicators for a strategy.
         
-        Removes strategy from indicator's used_by_strategies list.
-        If no strategies use the indicator anymore, it can be removed.
+        Releases the strategy's registry references. Indicators no other
+        strategy uses are removed from the cache.
         
         Args:
             strategy_instance_id: Strategy instance ID
         """
-        all_indicators = self.cache.get_indicator_subscriptions()
+        orphaned = self.registry.release(strategy_instance_id)
         
-        removed_count = 0
-        for (symbol, timeframe, indicator), data in all_indicators.items():
-            used_by = data.get('used_by_strategies', [])
-            
-            if strategy_instance_id in used_by:
-                # Remove strategy from users list
-                used_by.remove(strategy_instance_id)
-                
-                if len(used_by) == 0:
-                    # No strategies use this indicator anymore - can remove
-                    # For now, we'll keep it (no harm in having extra indicators)
-                    # In production, you might want to remove it to save memory
-                    log_debug(f"ℹ️ Indicator {symbol}:{timeframe}:{indicator} no longer used by any strategy")
-                    removed_count += 1
-                else:
-                    # Update cache with new users list
-                    self.cache.update_indicator_subscription(
-                        symbol, timeframe, indicator, 
-                        {'used_by_strategies': used_by}
-                    )
+        for series in orphaned:
+            self.cache.remove_indicator_subscription(series.symbol, series.timeframe, series.name)
+            log_debug(f"ℹ️ Indicator {series.symbol}:{series.timeframe}:{series.name} no longer used by any strategy")
         
-        if removed_count > 0:
-            log_info(f"📊 Unsubscribed {removed_count} indicators for {strategy_instance_id}")
+        if orphaned:
+            log_info(f"📊 Unsubscribed {len(orphaned)} indicators for {strategy_instance_id}")
     
     def get_indicator_users(self, symbol: str, timeframe: str, indicator: str) -> List[str]:
         """
@@ -160,10 +146,10 @@ class IndicatorSubscriptionManager:
         Returns:
             List of strategy instance IDs
         """
-        subscription = self.cache.get_indicator_subscription(symbol, timeframe, indicator)
-        if subscription:
-            return subscription.get('used_by_strategies', [])
-        return []
+        series = self.registry.get(symbol, timeframe, indicator, None)
+        if series is None:
+            return []
+        return sorted({strategy_id for strategy_id, _ in series.refs})
     
     def get_all_required_indicators(self) -> Dict[Tuple[str, str], Set[str]]:
         """
@@ -215,7 +201,7 @@ class IndicatorSubscriptionManager:
                 by_symbol_tf[key] = []
             by_symbol_tf[key].append({
                 'indicator': indicator,
-                'users': len(data.get('used_by_strategies', []))
+                'users': len(self.get_indicator_users(symbol, timeframe, indicator))
             })
         
         log_info("📊 Indicator Subscription Summary:")
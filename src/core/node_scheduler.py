@@ -0,0 +1,271 @@
+"""
+Active Node Scheduler - Event-driven node execution per tick.
+
+The legacy traversal executes the start node, which recurses into every
+child "regardless of active status", so every node of every strategy is
+touched each tick even when one node is Active.
+
+That traversal only runs logic for nodes that are Active when reached, and
+its visiting order does not depend on node status: it is a DFS preorder of
+the (static) node graph in which the visited flags stop each node from
+being reached twice. The scheduler precomputes that preorder once and, per
+tick, visits only the Active/Pending positions in preorder. Children
+activated during the tick are scheduled into the same pass when they come
+later in the preorder - exactly when the recursive traversal would still
+reach them - and otherwise wait for the next tick (already visited).
+
+The one thing that breaks the static order is a node resetting the visited
+flag of an already-visited child (ReEntrySignalNode / ExitNode re-entry
+loops). On such a tick the scheduler rebuilds the recursion stack at that
+node and finishes the tick with an exact emulation of the recursive
+traversal.
+
+Node status changes reach the scheduler through BaseNode._set_node_state
+(context['node_scheduler']). Code writing node_states directly must call
+resync(). NODE_SCHEDULER=full restores the legacy full traversal.
+
+Author: UniTrader Team
+"""
+
+import heapq
+import os
+import sys
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# Statuses kept in the scheduled set (Pending nodes are re-checked each tick)
+LIVE_STATUSES = ('Active', 'Pending')
+
+
+def node_scheduler_enabled() -> bool:
+    """NODE_SCHEDULER=full selects the legacy full-tree traversal."""
+    return os.getenv('NODE_SCHEDULER', 'active').lower() != 'full'
+
+
+class ActiveNodeScheduler:
+    """
+    Per-strategy scheduler for the nodes below the start node.
+
+    Usage (CentralizedTickProcessor._process_strategy):
+        context['node_scheduler'] = scheduler
+        scheduler.begin_tick(node_states)
+        start_node.execute(context)  # BaseNode._execute_children delegates here
+    """
+
+    def __init__(self, start_node: Any, node_instances: Dict[str, Any], node_states: Dict[str, Dict[str, Any]]):
+        """
+        Initialize scheduler.
+
+        Args:
+            start_node: Root node (its own execute() stays with the caller)
+            node_instances: {node_id: node} (edges must already be wired)
+            node_states: {node_id: state} shared with the strategy context
+        """
+        self.start_node = start_node
+        self.root_id = start_node.id
+        self.node_instances = node_instances
+
+        # Children as the traversal sees them (missing instances are skipped)
+        self._children: Dict[str, Tuple[str, ...]] = {
+            node_id: tuple(c for c in node.children if c in node_instances)
+            for node_id, node in node_instances.items()
+        }
+
+        # Static DFS preorder + DFS tree (parent, index in parent's children)
+        self._order: List[str] = []
+        self._position: Dict[str, int] = {}
+        self._tree_parent: Dict[str, Tuple[str, int]] = {}
+        self.max_depth = self._build_order()
+
+        # Children already visited by the time a node is reached in preorder
+        self._visited_children: Dict[str, Tuple[str, ...]] = {
+            node_id: tuple(c for c in self._children[node_id] if self._position[c] <= pos)
+            for node_id, pos in self._position.items()
+        }
+
+        self._node_states: Dict[str, Dict[str, Any]] = {}
+        self._live: Set[int] = set()
+        self._heap: Optional[List[int]] = None
+        self._cursor = 0
+        self._running = False
+        self.resync(node_states)
+
+    def _build_order(self) -> int:
+        """Preorder of the recursive traversal; returns its deepest child call."""
+        self._position[self.root_id] = 0
+        self._order.append(self.root_id)
+        stack = [(self.root_id, 0, 1)]  # (node_id, next child index, depth)
+        max_depth = 1
+
+        while stack:
+            node_id, index, depth = stack[-1]
+            children = self._children.get(node_id, ())
+            if index >= len(children):
+                stack.pop()
+                continue
+            stack[-1] = (node_id, index + 1, depth)
+
+            child_id = children[index]
+            if child_id in self._position:
+                continue
+            self._position[child_id] = len(self._order)
+            self._order.append(child_id)
+            self._tree_parent[child_id] = (node_id, index)
+            stack.append((child_id, 0, depth + 1))
+            max_depth = max(max_depth, depth + 1)
+
+        return max_depth
+
+    # ========================================================================
+    # ACTIVE SET
+    # ========================================================================
+
+    def resync(self, node_states: Dict[str, Dict[str, Any]]):
+        """Rebuild the scheduled set from node_states (full scan)."""
+        self._node_states = node_states
+        self._live = {
+            pos for node_id, pos in self._position.items()
+            if node_states.get(node_id, {}).get('status') in LIVE_STATUSES
+        }
+
+    def on_status(self, node_id: str, status: str):
+        """Status change notification (BaseNode._set_node_state)."""
+        pos = self._position.get(node_id)
+        if pos is None:
+            return
+        if status not in LIVE_STATUSES:
+            self._live.discard(pos)
+            return
+        self._live.add(pos)
+        # Not yet reached this tick -> runs in this pass
+        if status == 'Active' and self._heap is not None and pos > self._cursor:
+            heapq.heappush(self._heap, pos)
+
+    @property
+    def scheduled_count(self) -> int:
+        """Nodes currently in the scheduled (Active/Pending) set."""
+        return len(self._live)
+
+    # ========================================================================
+    # TICK
+    # ========================================================================
+
+    def begin_tick(self, node_states: Dict[str, Dict[str, Any]]):
+        """
+        Prepare a tick: pick up a replaced node_states dict and clear the
+        start node's visited flag (the other flags are set per executed node).
+        """
+        if node_states is not self._node_states:
+            self.resync(node_states)
+        self._state(self.root_id)['visited'] = False
+
+    def execute_children(self, node: Any, context: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """
+        BaseNode._execute_children hook.
+
+        Returns:
+            Results of the nodes executed below the start node; [] for nodes
+            executed by the scheduler itself; None if the caller should
+            recurse itself (node outside a scheduled tick)
+        """
+        if self._running:
+            return []
+        if node.id != self.root_id:
+            return None
+
+        self._running = True
+        results: List[Dict[str, Any]] = []
+        try:
+            self._run(context, results)
+        finally:
+            self._running = False
+            self._heap = None
+
+        if self.max_depth > context.get('_max_exec_depth', 0):
+            context['_max_exec_depth'] = self.max_depth
+        return results
+
+    def _run(self, context: Dict[str, Any], results: List[Dict[str, Any]]):
+        """Visit Active positions in preorder (visited set = preorder prefix)."""
+        self._cursor = 0
+        self._heap = sorted(pos for pos in self._live if pos > 0)
+
+        while self._heap:
+            pos = heapq.heappop(self._heap)
+            if pos <= self._cursor:
+                continue
+            self._cursor = pos
+
+            node_id = self._order[pos]
+            status = self._state(node_id).get('status')
+            if status != 'Active':
+                if status not in LIVE_STATUSES:
+                    self._live.discard(pos)
+                continue
+
+            reset = self._execute(node_id, self._visited_children[node_id], context, results)
+            if reset:
+                # Re-entry: an already visited child will be traversed again
+                self._heap = None
+                visited = set(self._order[:pos + 1]) - reset
+                self._run_exact(node_id, visited, context, results)
+                return
+
+    def _run_exact(self, node_id: str, visited: Set[str], context: Dict[str, Any], results: List[Dict[str, Any]]):
+        """Finish the tick as the recursive traversal would, from inside node_id."""
+        # Recursion stack at node_id: each DFS-tree ancestor resumes after its branch
+        frames = [[node_id, 0]]
+        child_id = node_id
+        while child_id != self.root_id:
+            parent_id, index = self._tree_parent[child_id]
+            frames.append([parent_id, index + 1])
+            child_id = parent_id
+        frames.reverse()
+
+        while frames:
+            frame = frames[-1]
+            children = self._children[frame[0]]
+            if frame[1] >= len(children):
+                frames.pop()
+                continue
+            child_id = children[frame[1]]
+            frame[1] += 1
+
+            if child_id in visited:
+                continue
+            visited.add(child_id)
+
+            if self._state(child_id).get('status') == 'Active':
+                seen = tuple(c for c in self._children[child_id] if c in visited)
+                visited -= self._execute(child_id, seen, context, results)
+            frames.append([child_id, 0])
+            if len(frames) > sys.getrecursionlimit():
+                # Nodes resetting each other forever - the recursive traversal fails the same way
+                raise RecursionError(f"Node traversal exceeded {len(frames)} levels at {child_id}")
+
+    def _execute(
+        self,
+        node_id: str,
+        visited_children: Tuple[str, ...],
+        context: Dict[str, Any],
+        results: List[Dict[str, Any]]
+    ) -> Set[str]:
+        """
+        Execute one node with the visited flags the traversal would have.
+
+        Returns:
+            Visited children whose visited flag the node reset
+        """
+        for child_id in visited_children:
+            self._state(child_id)['visited'] = True
+        self._state(node_id)['visited'] = False
+
+        results.append(self.node_instances[node_id].execute(context))
+
+        return {c for c in visited_children if not self._state(c).get('visited', False)}
+
+    def _state(self, node_id: str) -> Dict[str, Any]:
+        state = self._node_states.get(node_id)
+        if state is None:
+            # Same default as BaseNode._get_node_state
+            state = self._node_states[node_id] = {'status': 'Inactive', 'visited': False, 'reEntryNum': 0}
+        return state
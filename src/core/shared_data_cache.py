@@ -23,6 +23,8 @@ from typing import Dict, Any, Optional, Callable, Tuple
 from datetime import datetime
 import pandas as pd
 
+from src.core.unified_ltp_store import UnifiedLTPStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -50,9 +52,9 @@ class SharedDataCache:
         # indicator_key format: "ema(21,close)" or "rsi(14,close)"
         self._indicator_cache: Dict[str, Dict[str, Dict[str, Any]]] = {}
         
-        # LTP store: {symbol: (price, timestamp)}
-        # Stores latest traded price with timestamp
-        self._ltp_store: Dict[str, Tuple[float, datetime]] = {}
+        # LTP store: one slot per symbol (price, timestamp, volume, oi).
+        # DataManager writes ticks straight into it (see DataManager.ltp_slots)
+        self.ltp_slots = UnifiedLTPStore()
         
         # Statistics for monitoring
         self._stats = {
@@ -328,7 +330,7 @@ class SharedDataCache:
         if timestamp is None:
             timestamp = datetime.now()
         
-        self._ltp_store[symbol] = (price, timestamp)
+        self.ltp_slots.set(symbol, price, timestamp)
         self._stats['ltp_updates'] += 1
         
         logger.debug(f"💰 LTP updated: {symbol} = {price}")
@@ -343,9 +345,7 @@ class SharedDataCache:
         Returns:
             Latest price if available, None otherwise
         """
-        if symbol in self._ltp_store:
-            return self._ltp_store[symbol][0]  # Return price only
-        return None
+        return self.ltp_slots.get_ltp(symbol)
     
     def get_ltp_with_timestamp(self, symbol: str) -> Optional[Tuple[float, datetime]]:
         """
@@ -357,7 +357,11 @@ class SharedDataCache:
         Returns:
             Tuple of (price, timestamp) if available, None otherwise
         """
-        return self._ltp_store.get(symbol)
+        slot = self.ltp_slots.slot(symbol)
+        if slot is None:
+            return None
+        record = self.ltp_slots.record_at(slot)
+        return record['ltp'], record['timestamp']
     
     def get_all_ltp(self) -> Dict[str, float]:
         """
@@ -366,7 +370,7 @@ class SharedDataCache:
         Returns:
             Dict mapping symbol to price
         """
-        return {symbol: price for symbol, (price, ts) in self._ltp_store.items()}
+        return dict(self.ltp_slots.prices)
     
     # ========================================================================
     # UTILITY METHODS
@@ -376,7 +380,7 @@ class SharedDataCache:
         """Clear all cached data. Use with caution."""
         self._candle_cache.clear()
         self._indicator_cache.clear()
-        self._ltp_store.clear()
+        self.ltp_slots.clear()
         logger.info("🗑️ Cache cleared")
     
     def get_stats(self) -> Dict[str, Any]:
@@ -413,7 +417,7 @@ class SharedDataCache:
             sum(len(inds) for inds in tfs.values())
             for tfs in self._indicator_cache.values()
         )
-        stats['ltp_entries'] = len(self._ltp_store)
+        stats['ltp_entries'] = len(self.ltp_slots)
         
         return stats
     
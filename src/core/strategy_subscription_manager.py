@@ -414,7 +414,7 @@ class StrategySubscriptionManager:
         # Initialize diagnostics for this strategy
         from src.utils.node_diagnostics import NodeDiagnostics
         diagnostics = NodeDiagnostics(max_events_per_node=100)
-        node_events_history = {}
+        node_events_history = diagnostics.events
         node_current_state = {}
         
         # Get scale from subscription (default to 1)
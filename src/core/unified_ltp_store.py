@@ -7,60 +7,198 @@ This module provides a centralized LTP store that:
 3. Clean interface (methods instead of direct dict access)
 4. Backward compatible (dict-like access)
 
+Storage is one slot per symbol in preallocated, typed NumPy arrays
+(ltp, ts_epoch, volume, oi). It is the single authoritative LTP store:
+DataManager, SharedDataCache and CentralizedTickProcessor share one
+instance, and the dict-shaped APIs existing node code uses
+(DataManager.ltp, DataManager.ltp_store) are views over the slots
+(see LTPPriceView / LTPRecordView) instead of separate copies.
+
 Author: UniTrader Team
 Created: 2024-11-12
 """
 
 import threading
-from typing import Dict, Any, Optional
-from datetime import datetime
+from collections.abc import Mapping
+from datetime import datetime, timedelta
+from typing import Dict, Any, Iterator, List, Optional
+
+import numpy as np
+
 from src.utils.logger import log_debug
 
+DEFAULT_CAPACITY = 1024
+
+# ts_epoch holds naive wall-clock microseconds since 1970-01-01
+NO_TIMESTAMP = np.iinfo(np.int64).min
+_EPOCH = datetime(1970, 1, 1)
+_ONE_US = timedelta(microseconds=1)
+_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S.%f'
+
+
+def to_epoch_us(timestamp: Any) -> int:
+    """
+    Tick timestamp as wall-clock epoch microseconds.
+
+    Accepts datetime (tz-aware values keep their wall clock), epoch
+    seconds (int/float, local time like datetime.fromtimestamp) and
+    ISO strings. Anything else maps to NO_TIMESTAMP.
+    """
+    if isinstance(timestamp, datetime):
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.replace(tzinfo=None)
+        return (timestamp - _EPOCH) // _ONE_US
+    if isinstance(timestamp, (int, float)):
+        return (datetime.fromtimestamp(timestamp) - _EPOCH) // _ONE_US
+    if isinstance(timestamp, str):
+        try:
+            return to_epoch_us(datetime.fromisoformat(timestamp))
+        except ValueError:
+            return NO_TIMESTAMP
+    return NO_TIMESTAMP
+
+
+def from_epoch_us(value: int) -> Optional[datetime]:
+    """Inverse of to_epoch_us (None for NO_TIMESTAMP)."""
+    if value == NO_TIMESTAMP:
+        return None
+    return _EPOCH + timedelta(microseconds=int(value))
+
 
 class UnifiedLTPStore:
     """
     Unified LTP store for centralized tick processor.
-    
+
     Features:
     - Symbol-based storage (no role-based, that's per-strategy)
+    - Typed slots: one index per symbol into ltp / ts_epoch / volume / oi arrays
     - Thread-safe (optional, for live trading)
     - Clean interface (get_ltp, update, etc.)
     - Backward compatible (dict-like access: store['NIFTY'])
-    
+
     Usage:
         # Backtesting (no thread safety needed)
         store = UnifiedLTPStore(thread_safe=False)
-        
+
         # Live trading (thread-safe)
         store = UnifiedLTPStore(thread_safe=True)
-        
+
         # Update
         store.update('NIFTY', 25850.50, timestamp)
-        
+
         # Access
         ltp = store.get_ltp('NIFTY')
         tick_data = store.get_tick_data('NIFTY')
         tick_data = store['NIFTY']  # Dict-like
+
+        # Dict-shaped views for existing code
+        ltp_dict = store.prices                               # {symbol: ltp}
+        ltp_store = store.records(timestamp_format='string')  # {symbol: {'ltp', ...}}
     """
-    
-    def __init__(self, thread_safe: bool = False):
+
+    def __init__(self, thread_safe: bool = False, capacity: int = DEFAULT_CAPACITY):
         """
         Initialize unified LTP store.
-        
+
         Args:
-            thread_safe: Enable thread safety (use Lock). 
+            thread_safe: Enable thread safety (use Lock).
                         Set to True for live trading, False for backtesting.
+            capacity: Initial number of symbol slots (grows by doubling)
         """
-        self._store: Dict[str, Dict[str, Any]] = {}
+        self._slots: Dict[str, int] = {}  # symbol -> slot
+        self._symbols: List[str] = []     # slot -> symbol
+        self._extra: Dict[int, Dict[str, Any]] = {}  # slot -> additional update() fields
+        self._allocate(max(int(capacity), 1))
+
         self._lock = threading.Lock() if thread_safe else None
         self._thread_safe = thread_safe
-        
+
+        self.prices = LTPPriceView(self)
+
         log_debug(f"📊 UnifiedLTPStore initialized (thread_safe={thread_safe})")
-    
+
+    def _allocate(self, capacity: int):
+        """(Re)create empty slot arrays."""
+        self.ltp = np.full(capacity, np.nan, dtype=np.float64)
+        self.ts_epoch = np.full(capacity, NO_TIMESTAMP, dtype=np.int64)
+        self.volume = np.zeros(capacity, dtype=np.int64)
+        self.oi = np.zeros(capacity, dtype=np.int64)
+
+    def _grow(self):
+        """Double slot capacity, keeping existing values."""
+        old = (self.ltp, self.ts_epoch, self.volume, self.oi)
+        self._allocate(len(self.ltp) * 2)
+        for new_column, old_column in zip((self.ltp, self.ts_epoch, self.volume, self.oi), old):
+            new_column[:len(old_column)] = old_column
+
+    def _slot_for_write(self, symbol: str) -> int:
+        slot = self._slots.get(symbol)
+        if slot is None:
+            slot = len(self._symbols)
+            if slot == len(self.ltp):
+                self._grow()
+            self._slots[symbol] = slot
+            self._symbols.append(symbol)
+        return slot
+
+    # ========================================================================
+    # WRITES
+    # ========================================================================
+
+    def set(
+        self,
+        symbol: str,
+        ltp: Optional[float],
+        timestamp: Any = None,
+        volume: Any = 0,
+        oi: Any = 0
+    ) -> bool:
+        """
+        Write a tick into the symbol's slot (hot path, no validation).
+
+        Args:
+            symbol: Symbol name (universal format)
+            ltp: Last traded price (None stored as missing)
+            timestamp: Tick timestamp (see to_epoch_us)
+            volume: Volume
+            oi: Open interest
+
+        Returns:
+            True if the price changed (or the symbol is new)
+        """
+        price = np.nan if ltp is None else ltp
+        ts_epoch = to_epoch_us(timestamp)
+        if self._lock:
+            with self._lock:
+                return self._set(symbol, price, ts_epoch, volume, oi)
+        return self._set(symbol, price, ts_epoch, volume, oi)
+
+    def _set(self, symbol: str, price: float, ts_epoch: int, volume: Any, oi: Any) -> bool:
+        slot = self._slots.get(symbol)
+        if slot is None:
+            slot = self._slot_for_write(symbol)
+            changed = True
+        else:
+            changed = self.ltp[slot] != price
+        self.ltp[slot] = price
+        self.ts_epoch[slot] = ts_epoch
+        self.volume[slot] = volume or 0
+        self.oi[slot] = oi or 0
+        return bool(changed)
+
+    def set_price(self, symbol: str, ltp: Optional[float]):
+        """Write only the price of a slot (other fields unchanged)."""
+        price = np.nan if ltp is None else ltp
+        if self._lock:
+            with self._lock:
+                self.ltp[self._slot_for_write(symbol)] = price
+        else:
+            self.ltp[self._slot_for_write(symbol)] = price
+
     def update(
-        self, 
-        symbol: str, 
-        ltp: float, 
+        self,
+        symbol: str,
+        ltp: float,
         timestamp: Any = None,
         volume: int = 0,
         oi: int = 0,
@@ -68,7 +206,7 @@ class UnifiedLTPStore:
     ):
         """
         Update LTP for a symbol.
-        
+
         Args:
             symbol: Symbol name (e.g., 'NIFTY', 'NIFTY:2024-10-28:OPT:25850:CE')
             ltp: Last traded price
@@ -76,255 +214,314 @@ class UnifiedLTPStore:
             volume: Volume (optional)
             oi: Open interest (optional)
             **kwargs: Additional fields to store
-        
+
         Example:
             store.update('NIFTY', 25850.50, timestamp, volume=1000, oi=5000)
         """
         if not symbol:
             raise ValueError("Symbol is required")
-        
+
         if ltp is None or ltp < 0:
             raise ValueError(f"Invalid LTP: {ltp}")
-        
-        # Prepare data
-        data = {
-            'ltp': float(ltp),
-            'timestamp': timestamp or datetime.now(),
-            'volume': int(volume),
-            'oi': int(oi)
+
+        self.set(symbol, float(ltp), timestamp or datetime.now(), int(volume), int(oi))
+
+        # Additional fields are rare - kept per slot outside the arrays
+        if kwargs:
+            self._extra[self._slots[symbol]] = dict(kwargs)
+        elif self._extra:
+            self._extra.pop(self._slots[symbol], None)
+
+    def __setitem__(self, symbol: str, data: Dict[str, Any]):
+        """
+        Dict-like assignment: store['NIFTY'] = {...}
+
+        Args:
+            symbol: Symbol name
+            data: Tick data dict
+
+        Example:
+            store['NIFTY'] = {'ltp': 25850.50, 'timestamp': ...}
+        """
+        if not isinstance(data, dict):
+            raise ValueError("Data must be a dictionary")
+
+        self.set(symbol, data.get('ltp'), data.get('timestamp'), data.get('volume', 0), data.get('oi', 0))
+        extra = {k: v for k, v in data.items() if k not in ('ltp', 'timestamp', 'volume', 'oi')}
+        if extra:
+            self._extra[self._slots[symbol]] = extra
+        elif self._extra:
+            self._extra.pop(self._slots[symbol], None)
+
+    # ========================================================================
+    # READS
+    # ========================================================================
+
+    def slot(self, symbol: str) -> Optional[int]:
+        """Slot index of a symbol (None if never written)."""
+        return self._slots.get(symbol)
+
+    def price_at(self, slot: int) -> Optional[float]:
+        """Price in a slot as a Python float (None if missing)."""
+        price = self.ltp[slot]
+        return None if price != price else float(price)
+
+    def record_at(self, slot: int, timestamp_format: str = 'datetime') -> Dict[str, Any]:
+        """
+        Tick data dict for a slot.
+
+        Args:
+            slot: Slot index
+            timestamp_format: 'datetime' or 'string' ('YYYY-MM-DD HH:MM:SS.ffffff')
+        """
+        timestamp = from_epoch_us(self.ts_epoch[slot])
+        if timestamp is not None and timestamp_format == 'string':
+            timestamp = timestamp.strftime(_TIMESTAMP_FORMAT)
+        record = {
+            'ltp': self.price_at(slot),
+            'timestamp': timestamp,
+            'volume': int(self.volume[slot]),
+            'oi': int(self.oi[slot])
         }
-        
-        # Add any additional fields
-        data.update(kwargs)
-        
-        # Store with thread safety if enabled
-        if self._lock:
-            with self._lock:
-                self._store[symbol] = data
-        else:
-            self._store[symbol] = data
-    
+        extra = self._extra.get(slot)
+        if extra:
+            record.update(extra)
+        return record
+
+    def records(self, timestamp_format: str = 'datetime') -> 'LTPRecordView':
+        """Dict-shaped {symbol: tick data} view over the slots."""
+        return LTPRecordView(self, timestamp_format)
+
     def get_ltp(self, symbol: str) -> Optional[float]:
         """
         Get LTP for a symbol.
-        
+
         Args:
             symbol: Symbol name
-        
+
         Returns:
             LTP value or None if symbol not found
-        
+
         Example:
             ltp = store.get_ltp('NIFTY')  # Returns 25850.50 or None
         """
-        if self._lock:
-            with self._lock:
-                data = self._store.get(symbol)
-        else:
-            data = self._store.get(symbol)
-        
-        return data.get('ltp') if data else None
-    
+        slot = self._slots.get(symbol)
+        return self.price_at(slot) if slot is not None else None
+
     def get_tick_data(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
         Get full tick data for a symbol.
-        
+
         Args:
             symbol: Symbol name
-        
+
         Returns:
             Dict with ltp, timestamp, volume, oi or None if not found
-        
+
         Example:
             data = store.get_tick_data('NIFTY')
             # Returns: {'ltp': 25850.50, 'timestamp': ..., 'volume': 1000, 'oi': 5000}
         """
-        if self._lock:
-            with self._lock:
-                return self._store.get(symbol)
-        else:
-            return self._store.get(symbol)
-    
+        slot = self._slots.get(symbol)
+        return self.record_at(slot) if slot is not None else None
+
     def get(self, symbol: str, default=None) -> Optional[Dict[str, Any]]:
         """
         Dict-like get method for backward compatibility.
-        
+
         Args:
             symbol: Symbol name
             default: Default value if symbol not found
-        
+
         Returns:
             Tick data dict or default
-        
+
         Example:
             data = store.get('NIFTY', {})
         """
-        if self._lock:
-            with self._lock:
-                return self._store.get(symbol, default)
-        else:
-            return self._store.get(symbol, default)
-    
+        slot = self._slots.get(symbol)
+        return self.record_at(slot) if slot is not None else default
+
     def __getitem__(self, symbol: str) -> Dict[str, Any]:
         """
         Dict-like access: store['NIFTY']
-        
+
         Args:
             symbol: Symbol name
-        
+
         Returns:
             Tick data dict
-        
+
         Raises:
             KeyError: If symbol not found
-        
+
         Example:
             data = store['NIFTY']
             ltp = store['NIFTY']['ltp']
         """
-        if self._lock:
-            with self._lock:
-                return self._store[symbol]
-        else:
-            return self._store[symbol]
-    
-    def __setitem__(self, symbol: str, data: Dict[str, Any]):
-        """
-        Dict-like assignment: store['NIFTY'] = {...}
-        
-        Args:
-            symbol: Symbol name
-            data: Tick data dict
-        
-        Example:
-            store['NIFTY'] = {'ltp': 25850.50, 'timestamp': ...}
-        """
-        if not isinstance(data, dict):
-            raise ValueError("Data must be a dictionary")
-        
-        if self._lock:
-            with self._lock:
-                self._store[symbol] = data
-        else:
-            self._store[symbol] = data
-    
+        return self.record_at(self._slots[symbol])
+
     def __contains__(self, symbol: str) -> bool:
         """
         Check if symbol exists: 'NIFTY' in store
-        
+
         Args:
             symbol: Symbol name
-        
+
         Returns:
             True if symbol exists, False otherwise
-        
+
         Example:
             if 'NIFTY' in store:
                 print("NIFTY exists")
         """
-        if self._lock:
-            with self._lock:
-                return symbol in self._store
-        else:
-            return symbol in self._store
-    
+        return symbol in self._slots
+
     def keys(self):
         """
         Get all symbols (dict-like).
-        
+
         Returns:
-            Dict keys view of all symbols
-        
+            List of all symbols
+
         Example:
             for symbol in store.keys():
                 print(symbol)
         """
-        if self._lock:
-            with self._lock:
-                return list(self._store.keys())
-        else:
-            return list(self._store.keys())
-    
+        return list(self._symbols)
+
     def values(self):
         """
         Get all tick data (dict-like).
-        
+
         Returns:
             List of all tick data dicts
-        
+
         Example:
             for data in store.values():
                 print(data['ltp'])
         """
-        if self._lock:
-            with self._lock:
-                return list(self._store.values())
-        else:
-            return list(self._store.values())
-    
+        return [self.record_at(slot) for slot in range(len(self._symbols))]
+
     def items(self):
         """
         Get all (symbol, data) pairs (dict-like).
-        
+
         Returns:
             List of (symbol, data) tuples
-        
+
         Example:
             for symbol, data in store.items():
                 print(f"{symbol}: {data['ltp']}")
         """
-        if self._lock:
-            with self._lock:
-                return list(self._store.items())
-        else:
-            return list(self._store.items())
-    
+        return [(symbol, self.record_at(slot)) for slot, symbol in enumerate(list(self._symbols))]
+
     def to_dict(self) -> Dict[str, Dict[str, Any]]:
         """
         Export as plain dict for context (backward compatibility).
-        
+
         Returns:
-            Copy of internal store as dict
-        
+            Copy of the store as {symbol: tick data}
+
         Example:
             context['ltp_store'] = store.to_dict()
         """
-        if self._lock:
-            with self._lock:
-                return self._store.copy()
-        else:
-            return self._store.copy()
-    
+        return dict(self.items())
+
     def clear(self):
         """
         Clear all data.
-        
+
         Example:
             store.clear()
         """
         if self._lock:
             with self._lock:
-                self._store.clear()
+                self._clear()
         else:
-            self._store.clear()
-    
+            self._clear()
+
+    def _clear(self):
+        self._slots.clear()
+        self._symbols.clear()
+        self._extra.clear()
+        self.ltp.fill(np.nan)
+        self.ts_epoch.fill(NO_TIMESTAMP)
+        self.volume.fill(0)
+        self.oi.fill(0)
+
     def __len__(self) -> int:
         """
         Get number of symbols: len(store)
-        
+
         Returns:
             Number of symbols in store
-        
+
         Example:
             print(f"Store has {len(store)} symbols")
         """
-        if self._lock:
-            with self._lock:
-                return len(self._store)
-        else:
-            return len(self._store)
-    
+        return len(self._symbols)
+
     def __repr__(self) -> str:
         """String representation."""
         thread_safe_str = "thread-safe" if self._thread_safe else "not thread-safe"
         return f"UnifiedLTPStore({len(self)} symbols, {thread_safe_str})"
+
+
+class LTPPriceView(Mapping):
+    """{symbol: ltp} view over a UnifiedLTPStore (was DataManager.ltp)"""
+
+    def __init__(self, store: UnifiedLTPStore):
+        self._store = store
+
+    def __getitem__(self, symbol: str) -> Optional[float]:
+        return self._store.price_at(self._store._slots[symbol])
+
+    def get(self, symbol: str, default: Any = None) -> Any:
+        slot = self._store._slots.get(symbol)
+        return self._store.price_at(slot) if slot is not None else default
+
+    def __setitem__(self, symbol: str, ltp: Optional[float]):
+        self._store.set_price(symbol, ltp)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._store._slots
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._store._symbols))
+
+    def __len__(self) -> int:
+        return len(self._store._symbols)
+
+    def __repr__(self) -> str:
+        return f"LTPPriceView({dict(self)})"
+
+
+class LTPRecordView(Mapping):
+    """{symbol: {'ltp', 'timestamp', 'volume', 'oi'}} view over a UnifiedLTPStore (was DataManager.ltp_store)"""
+
+    def __init__(self, store: UnifiedLTPStore, timestamp_format: str = 'datetime'):
+        self._store = store
+        self.timestamp_format = timestamp_format
+
+    def __getitem__(self, symbol: str) -> Dict[str, Any]:
+        return self._store.record_at(self._store._slots[symbol], self.timestamp_format)
+
+    def get(self, symbol: str, default: Any = None) -> Any:
+        slot = self._store._slots.get(symbol)
+        return self._store.record_at(slot, self.timestamp_format) if slot is not None else default
+
+    def __setitem__(self, symbol: str, data: Dict[str, Any]):
+        self._store[symbol] = data
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._store._slots
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._store._symbols))
+
+    def __len__(self) -> int:
+        return len(self._store._symbols)
+
+    def __repr__(self) -> str:
+        return f"LTPRecordView({len(self)} symbols)"
@@ -207,9 +207,8 @@ class UnifiedTradingEngine:
             # Per symbol:timeframe details using cold-subscription helpers
             # Build set of all symbol:timeframe keys known to DataManager
             keys = set(self.data_manager.indicators.keys())
-            # Also include any keys that have candles in the cache (for completeness)
-            if hasattr(self.data_manager.cache, "candles"):
-                keys.update(self.data_manager.cache.candles.keys())
+            # Also include any keys that have candle buffers (for completeness)
+            keys.update(getattr(self.data_manager, "candle_buffers", {}).keys())
 
             if keys:
                 print("\n   Symbol:Timeframe Details")
@@ -452,7 +451,8 @@ class UnifiedTradingEngine:
         self.centralized_processor = CentralizedTickProcessor(
             cache_manager=self.cache_manager,
             subscription_manager=None,  # TODO: Add for live trading
-            thread_safe=thread_safe
+            thread_safe=thread_safe,
+            ltp_store=self.data_manager.ltp_slots  # Written by DataManager.process_tick
         )
         
         print("   ✅ Components initialized")
@@ -618,6 +618,7 @@ class UnifiedTradingEngine:
             # Update with shared data from DataManager (single source of truth)
             strategy_state['context']['candle_df_dict'] = dm_context.get('candle_df_dict', {})
             strategy_state['context']['ltp_store'] = dm_context.get('ltp_store')  # Use DataManager's ltp_store
+            strategy_state['context']['market_data'] = dm_context.get('market_data')  # Version + dirty keys
             strategy_state['context']['mode'] = self.mode
             
             # Backtesting-specific context
@@ -13,73 +13,156 @@ Total Indicators: 136
 - New (Nov 2025): 10 indicators (Pivots, Elder Ray, AVWAP, Chart Types, Ichimoku, S/R)
 """
 
+import importlib
+
 from .base import HybridIndicator
-from .moving_averages import (
-    SMAIndicator, EMAIndicator, WMAIndicator, DEMAIndicator,
-    TEMAIndicator, HMAIndicator, ZLEMAIndicator, VWMAIndicator, KAMAIndicator
-)
-from .momentum import (
-    RSIIndicator, MACDIndicator, STOCHIndicator, STOCHRSIIndicator,
-    CCIIndicator, CMOIndicator, ROCIndicator, MOMIndicator,
-    WILLRIndicator, PPOIndicator, TRIXIndicator, UOIndicator,
-    AOIndicator, BOPIndicator, FISHERIndicator, KSTIndicator
-)
-from .volatility import (
-    ATRIndicator, NATRIndicator, BBANDSIndicator, KCIndicator,
-    DONCHIANIndicator, STDEVIndicator, VARIANCEIndicator
-)
-from .trend import (
-    ADXIndicator, DMIndicator, SUPERTRENDIndicator, AROONIndicator,
-    PSARIndicator, SLOPEIndicator, VORTEXIndicator
-)
-from .volume import (
-    OBVIndicator, ADIndicator, ADOSCIndicator, CMFIndicator, MFIIndicator,
-    PVTIndicator, VWAPIndicator, PVOIndicator, EFIIndicator, NVIIndicator, PVIIndicator
-)
-from .overlap import (
-    ALMAIndicator, FWMAIndicator, JMAIndicator, LINREGIndicator, MIDPOINTIndicator,
-    MIDPRICEIndicator, T3Indicator, TRIMAIndicator, SINWMAIndicator, PWMAIndicator,
-    RMAIndicator, SWMAIndicator, VIDYAIndicator, ZLMAIndicator, HWMAIndicator
-)
-from .statistics import (
-    ENTROPYIndicator, KURTOSISIndicator, MADIndicator, MEDIANIndicator,
-    QUANTILEIndicator, SKEWIndicator, ZSCOREIndicator
-)
-from .performance import (
-    LOGRETURNIndicator, PERCENTRETURNIndicator, DRAWDOWNIndicator
-)
-from .advanced_momentum import (
-    APOIndicator, BIASIndicator, BRARIndicator, CFOIndicator, CGIndicator,
-    COPPOCKIndicator, ERIndicator, INERTIAIndicator, KDJIndicator, PGOIndicator,
-    PSLIndicator, QQEIndicator, RSXIndicator, RVGIIndicator, SMIIndicator,
-    SQUEEZEIndicator, STCIndicator, TSIIndicator, CTIIndicator
-)
-from .advanced_trend import (
-    ALLIGATORIndicator, AMATIndicator, CHOPIndicator, CKSPIndicator, DECAYIndicator,
-    DPOIndicator, HTTRENDLINEIndicator, QSTICKIndicator, TTMTRENDIndicator, VHFIndicator,
-    ZIGZAGIndicator
-)
-from .advanced_volatility import (
-    ABERRATIONIndicator, ACCBANDSIndicator, ATRTSIndicator, CHANDELIEREXITIndicator, HWCIndicator,
-    MASSIIndicator, RVIIndicator, THERMOIndicator, TRUERANGEIndicator, UIIndicator
-)
-from .advanced_volume import (
-    AOBVIndicator, EOMIndicator, KVOIndicator, PVOLIndicator, PVRIndicator, TSVIndicator, VPIndicator
-)
-from .candles import (
-    HAIndicator, CDLDOJIIndicator, CDLINSIDEIndicator, CDLPATTERNIndicator
-)
-from .pivots import (
-    PIVOTIndicator, CPRIndicator, CAMARILLAIndicator, FIBONACCIPIVOTIndicator
-)
-from .elder_ray import ElderRayIndicator
-from .anchored_vwap import AnchoredVWAPIndicator
-from .chart_types import RenkoIndicator, HeikinAshiIndicator
-from .ichimoku import IchimokuIndicator
-from .support_resistance import SupportResistanceIndicator
+from .bank import IndicatorBank
+
+# Indicator classes are imported from their module on first access
+# (PEP 562 module __getattr__), so importing this package does not load
+# every indicator module - or pandas_ta - up front.
+_CLASS_MODULES = {
+    'SMAIndicator': 'moving_averages',
+    'EMAIndicator': 'moving_averages',
+    'WMAIndicator': 'moving_averages',
+    'DEMAIndicator': 'moving_averages',
+    'TEMAIndicator': 'moving_averages',
+    'HMAIndicator': 'moving_averages',
+    'ZLEMAIndicator': 'moving_averages',
+    'VWMAIndicator': 'moving_averages',
+    'KAMAIndicator': 'moving_averages',
+    'RSIIndicator': 'momentum',
+    'MACDIndicator': 'momentum',
+    'STOCHIndicator': 'momentum',
+    'STOCHRSIIndicator': 'momentum',
+    'CCIIndicator': 'momentum',
+    'CMOIndicator': 'momentum',
+    'ROCIndicator': 'momentum',
+    'MOMIndicator': 'momentum',
+    'WILLRIndicator': 'momentum',
+    'PPOIndicator': 'momentum',
+    'TRIXIndicator': 'momentum',
+    'UOIndicator': 'momentum',
+    'AOIndicator': 'momentum',
+    'BOPIndicator': 'momentum',
+    'FISHERIndicator': 'momentum',
+    'KSTIndicator': 'momentum',
+    'ATRIndicator': 'volatility',
+    'NATRIndicator': 'volatility',
+    'BBANDSIndicator': 'volatility',
+    'KCIndicator': 'volatility',
+    'DONCHIANIndicator': 'volatility',
+    'STDEVIndicator': 'volatility',
+    'VARIANCEIndicator': 'volatility',
+    'ADXIndicator': 'trend',
+    'DMIndicator': 'trend',
+    'SUPERTRENDIndicator': 'trend',
+    'AROONIndicator': 'trend',
+    'PSARIndicator': 'trend',
+    'SLOPEIndicator': 'trend',
+    'VORTEXIndicator': 'trend',
+    'OBVIndicator': 'volume',
+    'ADIndicator': 'volume',
+    'ADOSCIndicator': 'volume',
+    'CMFIndicator': 'volume',
+    'MFIIndicator': 'volume',
+    'PVTIndicator': 'volume',
+    'VWAPIndicator': 'volume',
+    'PVOIndicator': 'volume',
+    'EFIIndicator': 'volume',
+    'NVIIndicator': 'volume',
+    'PVIIndicator': 'volume',
+    'ALMAIndicator': 'overlap',
+    'FWMAIndicator': 'overlap',
+    'JMAIndicator': 'overlap',
+    'LINREGIndicator': 'overlap',
+    'MIDPOINTIndicator': 'overlap',
+    'MIDPRICEIndicator': 'overlap',
+    'T3Indicator': 'overlap',
+    'TRIMAIndicator': 'overlap',
+    'SINWMAIndicator': 'overlap',
+    'PWMAIndicator': 'overlap',
+    'RMAIndicator': 'overlap',
+    'SWMAIndicator': 'overlap',
+    'VIDYAIndicator': 'overlap',
+    'ZLMAIndicator': 'overlap',
+    'HWMAIndicator': 'overlap',
+    'ENTROPYIndicator': 'statistics',
+    'KURTOSISIndicator': 'statistics',
+    'MADIndicator': 'statistics',
+    'MEDIANIndicator': 'statistics',
+    'QUANTILEIndicator': 'statistics',
+    'SKEWIndicator': 'statistics',
+    'ZSCOREIndicator': 'statistics',
+    'LOGRETURNIndicator': 'performance',
+    'PERCENTRETURNIndicator': 'performance',
+    'DRAWDOWNIndicator': 'performance',
+    'APOIndicator': 'advanced_momentum',
+    'BIASIndicator': 'advanced_momentum',
+    'BRARIndicator': 'advanced_momentum',
+    'CFOIndicator': 'advanced_momentum',
+    'CGIndicator': 'advanced_momentum',
+    'COPPOCKIndicator': 'advanced_momentum',
+    'ERIndicator': 'advanced_momentum',
+    'INERTIAIndicator': 'advanced_momentum',
+    'KDJIndicator': 'advanced_momentum',
+    'PGOIndicator': 'advanced_momentum',
+    'PSLIndicator': 'advanced_momentum',
+    'QQEIndicator': 'advanced_momentum',
+    'RSXIndicator': 'advanced_momentum',
+    'RVGIIndicator': 'advanced_momentum',
+    'SMIIndicator': 'advanced_momentum',
+    'SQUEEZEIndicator': 'advanced_momentum',
+    'STCIndicator': 'advanced_momentum',
+    'TSIIndicator': 'advanced_momentum',
+    'CTIIndicator': 'advanced_momentum',
+    'ALLIGATORIndicator': 'advanced_trend',
+    'AMATIndicator': 'advanced_trend',
+    'CHOPIndicator': 'advanced_trend',
+    'CKSPIndicator': 'advanced_trend',
+    'DECAYIndicator': 'advanced_trend',
+    'DPOIndicator': 'advanced_trend',
+    'HTTRENDLINEIndicator': 'advanced_trend',
+    'QSTICKIndicator': 'advanced_trend',
+    'TTMTRENDIndicator': 'advanced_trend',
+    'VHFIndicator': 'advanced_trend',
+    'ZIGZAGIndicator': 'advanced_trend',
+    'ABERRATIONIndicator': 'advanced_volatility',
+    'ACCBANDSIndicator': 'advanced_volatility',
+    'ATRTSIndicator': 'advanced_volatility',
+    'CHANDELIEREXITIndicator': 'advanced_volatility',
+    'HWCIndicator': 'advanced_volatility',
+    'MASSIIndicator': 'advanced_volatility',
+    'RVIIndicator': 'advanced_volatility',
+    'THERMOIndicator': 'advanced_volatility',
+    'TRUERANGEIndicator': 'advanced_volatility',
+    'UIIndicator': 'advanced_volatility',
+    'AOBVIndicator': 'advanced_volume',
+    'EOMIndicator': 'advanced_volume',
+    'KVOIndicator': 'advanced_volume',
+    'PVOLIndicator': 'advanced_volume',
+    'PVRIndicator': 'advanced_volume',
+    'TSVIndicator': 'advanced_volume',
+    'VPIndicator': 'advanced_volume',
+    'HAIndicator': 'candles',
+    'CDLDOJIIndicator': 'candles',
+    'CDLINSIDEIndicator': 'candles',
+    'CDLPATTERNIndicator': 'candles',
+    'PIVOTIndicator': 'pivots',
+    'CPRIndicator': 'pivots',
+    'CAMARILLAIndicator': 'pivots',
+    'FIBONACCIPIVOTIndicator': 'pivots',
+    'ElderRayIndicator': 'elder_ray',
+    'AnchoredVWAPIndicator': 'anchored_vwap',
+    'RenkoIndicator': 'chart_types',
+    'HeikinAshiIndicator': 'chart_types',
+    'IchimokuIndicator': 'ichimoku',
+    'SupportResistanceIndicator': 'support_resistance',
+}
 
 __all__ = [
     'HybridIndicator',
+    'IndicatorBank',
     # Moving Averages (9)
     'SMAIndicator', 'EMAIndicator', 'WMAIndicator', 'DEMAIndicator',
     'TEMAIndicator', 'HMAIndicator', 'ZLEMAIndicator', 'VWMAIndicator', 'KAMAIndicator',
@@ -135,3 +218,18 @@ __all__ = [
     # Support & Resistance (1)
     'SupportResistanceIndicator',
 ]
+
+
+def __getattr__(name):
+    """Import an indicator class from its module on first access"""
+    module_name = _CLASS_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include the not-yet-imported indicator classes"""
+    return sorted(set(globals()) | set(_CLASS_MODULES))
@@ -8,10 +8,11 @@ Advanced momentum indicators with bulk + incremental support.
 from typing import Any, Dict
 import pandas as pd
 import numpy as np
-import pandas_ta as ta
 from collections import deque
 
 from .base import HybridIndicator
+from .lazy_import import pandas_ta as ta
+from .rolling import RollingMax, RollingMin, RollingRegression
 
 
 class CTIIndicator(HybridIndicator):
@@ -20,7 +21,7 @@ class CTIIndicator(HybridIndicator):
     def __init__(self, **params):
         super().__init__('cti', **params)
         self.length = params.get('length', 12)
-        self._price_window = deque(maxlen=self.length)
+        self._regression = RollingRegression(self.length)
     
     def calculate_bulk(self, df: pd.DataFrame) -> pd.Series:
         price = self._get_price_series(df)
@@ -28,28 +29,22 @@ class CTIIndicator(HybridIndicator):
     
     def update(self, candle: Dict[str, Any]) -> float:
         price = self._get_price_value(candle)
-        self._price_window.append(price)
+        self._regression.append(price)
         
-        if len(self._price_window) < self.length:
+        if not self._regression.full:
             self._value = None
             return self._value
         
-        # Simplified correlation calculation
-        prices = np.array(self._price_window)
-        x = np.arange(len(prices))
-        
-        if len(prices) > 1:
-            corr = np.corrcoef(x, prices)[0, 1]
-            self._value = corr * 100 if not np.isnan(corr) else 0
-        else:
-            self._value = 0
+        # Correlation of price with time (None for a flat window)
+        corr = self._regression.correlation()
+        self._value = corr * 100 if corr is not None else 0
         
         self.is_initialized = True
         return self._value
     
     def _initialize_state_from_dataframe(self, df: pd.DataFrame, result: pd.Series):
         price = self._get_price_series(df)
-        self._price_window = deque(price.tail(self.length).values, maxlen=self.length)
+        self._regression = RollingRegression(self.length, price.tail(self.length).values)
 
 
 class APOIndicator(HybridIndicator):
@@ -175,7 +170,7 @@ class CFOIndicator(HybridIndicator):
     def __init__(self, **params):
         super().__init__('cfo', **params)
         self.length = params.get('length', 9)
-        self._price_window = deque(maxlen=self.length)
+        self._regression = RollingRegression(self.length)
     
     def calculate_bulk(self, df: pd.DataFrame) -> pd.Series:
         price = self._get_price_series(df)
@@ -183,37 +178,22 @@ class CFOIndicator(HybridIndicator):
     
     def update(self, candle: Dict[str, Any]) -> float:
         price = self._get_price_value(candle)
-        self._price_window.append(price)
+        self._regression.append(price)
         
-        if len(self._price_window) < self.length:
+        if not self._regression.full:
             self._value = None
             return self._value
         
         # Linear regression forecast
-        n = len(self._price_window)
-        x = np.arange(n)
-        y = np.array(self._price_window)
-        
-        sum_x = x.sum()
-        sum_y = y.sum()
-        sum_xy = (x * y).sum()
-        sum_x2 = (x * x).sum()
-        
-        denominator = n * sum_x2 - sum_x * sum_x
-        if denominator != 0:
-            b = (n * sum_xy - sum_x * sum_y) / denominator
-            a = (sum_y - b * sum_x) / n
-            forecast = a + b * n
-            self._value = ((price - forecast) / price) * 100.0 if price != 0 else 0
-        else:
-            self._value = 0
+        forecast = self._regression.value_at(self.length)
+        self._value = ((price - forecast) / price) * 100.0 if price != 0 else 0
         
         self.is_initialized = True
         return self._value
     
     def _initialize_state_from_dataframe(self, df: pd.DataFrame, result: pd.Series):
         price = self._get_price_series(df)
-        self._price_window = deque(price.tail(self.length).values, maxlen=self.length)
+        self._regression = RollingRegression(self.length, price.tail(self.length).values)
 
 
 class CGIndicator(HybridIndicator):
@@ -341,7 +321,7 @@ class INERTIAIndicator(HybridIndicator):
         super().__init__('inertia', **params)
         self.length = params.get('length', 20)
         self.rvi_length = params.get('rvi_length', 14)
-        self._price_window = deque(maxlen=self.length)
+        self._regression = RollingRegression(self.length)
         self._rvi_window = deque(maxlen=self.rvi_length)
     
     def calculate_bulk(self, df: pd.DataFrame) -> pd.Series:
@@ -350,36 +330,21 @@ class INERTIAIndicator(HybridIndicator):
     
     def update(self, candle: Dict[str, Any]) -> float:
         price = self._get_price_value(candle)
-        self._price_window.append(price)
+        self._regression.append(price)
         
-        if len(self._price_window) < self.length:
+        if not self._regression.full:
             self._value = None
             return self._value
         
         # Simplified: Linear regression of price
-        n = len(self._price_window)
-        x = np.arange(n)
-        y = np.array(self._price_window)
-        
-        sum_x = x.sum()
-        sum_y = y.sum()
-        sum_xy = (x * y).sum()
-        sum_x2 = (x * x).sum()
-        
-        denominator = n * sum_x2 - sum_x * sum_x
-        if denominator != 0:
-            b = (n * sum_xy - sum_x * sum_y) / denominator
-            a = (sum_y - b * sum_x) / n
-            self._value = a + b * (n - 1)
-        else:
-            self._value = y[-1]
+        self._value = self._regression.value_at(self.length - 1)
         
         self.is_initialized = True
         return self._value
     
     def _initialize_state_from_dataframe(self, df: pd.DataFrame, result: pd.Series):
         price = self._get_price_series(df)
-        self._price_window = deque(price.tail(self.length).values, maxlen=self.length)
+        self._regression = RollingRegression(self.length, price.tail(self.length).values)
 
 
 class KDJIndicator(HybridIndicator):
@@ -390,8 +355,8 @@ class KDJIndicator(HybridIndicator):
         self.length = params.get('length', 9)
         self.signal = params.get('signal', 3)
         self.alpha = 2.0 / (self.signal + 1)
-        self._high_window = deque(maxlen=self.length)
-        self._low_window = deque(maxlen=self.length)
+        self._highest = RollingMax(self.length)
+        self._lowest = RollingMin(self.length)
         self._k = 50.0
         self._d = 50.0
     
@@ -399,16 +364,16 @@ class KDJIndicator(HybridIndicator):
         return ta.kdj(df['high'], df['low'], df['close'], length=self.length, signal=self.signal)
     
     def update(self, candle: Dict[str, Any]) -> Dict[str, float]:
-        self._high_window.append(candle['high'])
-        self._low_window.append(candle['low'])
+        self._highest.append(candle['high'])
+        self._lowest.append(candle['low'])
         close = candle['close']
         
-        if len(self._high_window) < self.length:
+        if not self._highest.full:
             self._value = {'K': None, 'D': None, 'J': None}
             return self._value
         
-        highest = max(self._high_window)
-        lowest = min(self._low_window)
+        highest = self._highest.value
+        lowest = self._lowest.value
         
         if highest != lowest:
             rsv = ((close - lowest) / (highest - lowest)) * 100.0
@@ -424,8 +389,8 @@ class KDJIndicator(HybridIndicator):
         return self._value
     
     def _initialize_state_from_dataframe(self, df: pd.DataFrame, result: pd.DataFrame):
-        self._high_window = deque(df['high'].tail(self.length).values, maxlen=self.length)
-        self._low_window = deque(df['low'].tail(self.length).values, maxlen=self.length)
+        self._highest = RollingMax(self.length, df['high'].tail(self.length).values)
+        self._lowest = RollingMin(self.length, df['low'].tail(self.length).values)
         if result is not None and isinstance(result, pd.DataFrame) and len(result) > 0:
             k_col = f'K_{self.length}_{self.signal}'
             d_col = f'D_{self.length}_{self.signal}'
@@ -613,8 +578,8 @@ class SMIIndicator(HybridIndicator):
         self.slow = params.get('slow', 20)
         self.signal = params.get('signal', 5)
         self.signal_alpha = 2.0 / (self.signal + 1)
-        self._high_window = deque(maxlen=self.slow)
-        self._low_window = deque(maxlen=self.slow)
+        self._highest = RollingMax(self.slow)
+        self._lowest = RollingMin(self.slow)
         self._smi = 0
         self._signal_line = 0
     
@@ -622,16 +587,16 @@ class SMIIndicator(HybridIndicator):
         return ta.smi(df['high'], df['low'], df['close'], fast=self.fast, slow=self.slow, signal=self.signal)
     
     def update(self, candle: Dict[str, Any]) -> Dict[str, float]:
-        self._high_window.append(candle['high'])
-        self._low_window.append(candle['low'])
+        self._highest.append(candle['high'])
+        self._lowest.append(candle['low'])
         close = candle['close']
         
-        if len(self._high_window) < self.slow:
+        if not self._highest.full:
             self._value = {'SMI': None, 'SMIs': None}
             return self._value
         
-        highest = max(self._high_window)
-        lowest = min(self._low_window)
+        highest = self._highest.value
+        lowest = self._lowest.value
         hl_mid = (highest + lowest) / 2
         
         if highest != lowest:
@@ -646,8 +611,8 @@ class SMIIndicator(HybridIndicator):
         return self._value
     
     def _initialize_state_from_dataframe(self, df: pd.DataFrame, result: pd.DataFrame):
-        self._high_window = deque(df['high'].tail(self.slow).values, maxlen=self.slow)
-        self._low_window = deque(df['low'].tail(self.slow).values, maxlen=self.slow)
+        self._highest = RollingMax(self.slow, df['high'].tail(self.slow).values)
+        self._lowest = RollingMin(self.slow, df['low'].tail(self.slow).values)
 
 
 class SQUEEZEIndicator(HybridIndicator):
@@ -8,10 +8,10 @@ Advanced trend indicators with bulk + incremental support.
 from typing import Any, Dict
 import pandas as pd
 import numpy as np
-import pandas_ta as ta
 from collections import deque
 
 from .base import HybridIndicator
+from .lazy_import import pandas_ta as ta
 
 
 class ZIGZAGIndicator(HybridIndicator):
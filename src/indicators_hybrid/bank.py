@@ -0,0 +1,253 @@
+"""
+Indicator Bank - Batched incremental updates per symbol:timeframe
+=================================================================
+
+DataManager used to call update() on every registered indicator of a
+symbol:timeframe for each completed candle. Strategies often register
+several members of the same family with different lengths (EMA 9/21/50/200,
+RSI 7/14), and each family's recurrence is identical across members.
+
+IndicatorBank groups those members into NumPy state vectors so one kernel
+step advances all of them. A class opts in with `bank_family`; members of
+other classes keep their own update() call. Kernels repeat the scalar
+arithmetic operation for operation, so values are identical to the
+per-instance path.
+
+While a bank is live it owns the batched members' state; sync() writes it
+back to the instances (DataManager does so before rebuilding a bank).
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class _Kernel:
+    """Vectorized state of one indicator family (exact classes only)."""
+
+    family = None
+
+    def __init__(self, members: List[Any]):
+        self.members = members
+
+        # Price of each member = unique candle fields gathered once per update
+        fields = [m.params.get('price_field', 'close') for m in members]
+        self.fields = list(dict.fromkeys(fields))
+        self.field_index = np.array([self.fields.index(f) for f in fields], dtype=np.intp)
+
+        # Last returned values and their readiness (None for members still warming up)
+        self.values = np.full(len(members), np.nan)
+        self.ready = np.zeros(len(members), dtype=bool)
+        self.dirty = False
+
+    def prices(self, candle: Dict[str, Any]) -> np.ndarray:
+        return np.array([candle[f] for f in self.fields], dtype=np.float64)[self.field_index]
+
+    def update(self, candle: Dict[str, Any]) -> Tuple[List[float], List[bool]]:
+        """Advance all members; returns (values, ready) per member."""
+        self.values = self.step(self.prices(candle))
+        self.dirty = True
+        return self.values.tolist(), self.ready.tolist()
+
+    def step(self, prices: np.ndarray) -> np.ndarray:
+        raise NotImplementedError
+
+    def sync(self):
+        """Write the vector state back to the member instances."""
+        raise NotImplementedError
+
+    @staticmethod
+    def _vector(values: List[Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """(float64 values, present mask) for optional scalar state."""
+        present = np.array([v is not None for v in values], dtype=bool)
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float64), present
+
+
+class _SmoothingKernel(_Kernel):
+    """
+    Exponential smoothing: s = alpha * price + (1 - alpha) * s.
+
+    EMAIndicator (alpha = 2 / (length + 1), state `_ema`) and RMAIndicator
+    (alpha = 1 / length, state `_rma`). The first price seeds the state.
+    """
+
+    family = 'smoothing'
+
+    def __init__(self, members: List[Any]):
+        super().__init__(members)
+        self.state_attrs = [f"_{m.name}" for m in members]
+        self.alpha = np.array([m.alpha for m in members], dtype=np.float64)
+        self.decay = 1 - self.alpha
+        self.smoothed, self.seeded = self._vector([getattr(m, a) for m, a in zip(members, self.state_attrs)])
+
+    def step(self, prices: np.ndarray) -> np.ndarray:
+        self.ready = self.seeded.copy()
+        self.smoothed = np.where(self.seeded, self.alpha * prices + self.decay * self.smoothed, prices)
+        self.seeded[:] = True
+        return self.smoothed
+
+    def sync(self):
+        if not self.dirty:
+            return
+        for i, member in enumerate(self.members):
+            value = float(self.smoothed[i])
+            setattr(member, self.state_attrs[i], value)
+            member._value = value if self.ready[i] else None
+            member.is_initialized = member.is_initialized or bool(self.ready[i])
+
+
+class _RSIKernel(_Kernel):
+    """Wilder-smoothed RSI (RSIIndicator state `_prev_price`, `_avg_gain`, `_avg_loss`)."""
+
+    family = 'rsi'
+
+    def __init__(self, members: List[Any]):
+        super().__init__(members)
+        self.length = np.array([m.length for m in members], dtype=np.float64)
+        self.prev_price, self.has_prev = self._vector([m._prev_price for m in members])
+        self.avg_gain, self.has_avg = self._vector([m._avg_gain for m in members])
+        self.avg_loss, _ = self._vector([m._avg_loss for m in members])
+
+    def step(self, prices: np.ndarray) -> np.ndarray:
+        change = prices - self.prev_price
+        gain = np.maximum(change, 0.0)
+        loss = np.maximum(-change, 0.0)
+
+        # Wilder's smoothing: avg = (prev_avg * (n-1) + current) / n
+        smoothed_gain = ((self.avg_gain * (self.length - 1)) + gain) / self.length
+        smoothed_loss = ((self.avg_loss * (self.length - 1)) + loss) / self.length
+
+        # Members without a previous price only record it; the first change seeds the averages
+        self.avg_gain = np.where(self.has_prev, np.where(self.has_avg, smoothed_gain, gain), self.avg_gain)
+        self.avg_loss = np.where(self.has_prev, np.where(self.has_avg, smoothed_loss, loss), self.avg_loss)
+        self.ready = self.has_prev & self.has_avg
+        self.has_avg = self.has_avg | self.has_prev
+        self.has_prev[:] = True
+        self.prev_price = prices
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = 100.0 - (100.0 / (1.0 + self.avg_gain / self.avg_loss))
+        return np.where(self.avg_loss == 0, 100.0, rsi)
+
+    def sync(self):
+        if not self.dirty:
+            return
+        for i, member in enumerate(self.members):
+            member._prev_price = float(self.prev_price[i])
+            if self.has_avg[i]:
+                member._avg_gain = float(self.avg_gain[i])
+                member._avg_loss = float(self.avg_loss[i])
+            member._value = float(self.values[i]) if self.ready[i] else None
+            member.is_initialized = member.is_initialized or bool(self.ready[i])
+
+
+_KERNELS = {kernel.family: kernel for kernel in (_SmoothingKernel, _RSIKernel)}
+
+
+class IndicatorBank:
+    """
+    All indicators of one symbol:timeframe, updated together per candle.
+
+    Usage:
+        bank = IndicatorBank(data_manager.indicators['NIFTY:1m'])
+        indicator_values = bank.update(candle)  # {indicator_key[_col]: value}
+    """
+
+    def __init__(self, indicators: Dict[str, Any]):
+        """
+        Initialize bank (after the indicators are initialized from history).
+
+        Args:
+            indicators: {indicator_key: indicator} in registration order
+        """
+        families: Dict[str, List[Tuple[str, Any]]] = {}
+        for indicator_key, indicator in indicators.items():
+            # Declared on the class itself: subclasses with their own update() stay scalar
+            family = type(indicator).__dict__.get('bank_family')
+            if family in _KERNELS:
+                families.setdefault(family, []).append((indicator_key, indicator))
+
+        # A family of one gains nothing from a kernel
+        batched = {family: members for family, members in families.items() if len(members) > 1}
+        self.kernels: List[_Kernel] = []
+        self._kernel_keys: List[List[str]] = []
+        position: Dict[str, Tuple[int, int]] = {}
+        for family, members in batched.items():
+            for member_index, (indicator_key, _) in enumerate(members):
+                position[indicator_key] = (len(self.kernels), member_index)
+            self.kernels.append(_KERNELS[family]([indicator for _, indicator in members]))
+            self._kernel_keys.append([indicator_key for indicator_key, _ in members])
+
+        # Output slots in registration order: (key, kernel, member) or (key, None, indicator)
+        self._slots: List[Tuple[str, Optional[int], Any]] = [
+            (indicator_key,) + position[indicator_key] if indicator_key in position
+            else (indicator_key, None, indicator)
+            for indicator_key, indicator in indicators.items()
+        ]
+
+        # Multi-output column names: {indicator_key: {col: "indicator_key_col"}}
+        self._column_names: Dict[str, Dict[str, str]] = {key: {} for key in indicators}
+
+        self._source = indicators
+        self._source_size = len(indicators)
+
+    def covers(self, indicators: Optional[Dict[str, Any]]) -> bool:
+        """True if the bank was built from this (unchanged) indicator dict."""
+        return indicators is self._source and len(indicators) == self._source_size
+
+    @property
+    def batched_count(self) -> int:
+        """Indicators advanced by vectorized kernels."""
+        return sum(len(kernel.members) for kernel in self.kernels)
+
+    def update(self, candle: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Advance every indicator with a completed candle.
+
+        Returns:
+            {indicator_key: value} plus {indicator_key_col: value} for
+            multi-output indicators - the same dict the per-instance
+            update() loop builds (warming-up members are omitted)
+
+        Raises:
+            RuntimeError: If an indicator update fails
+        """
+        kernel_results = []
+        for kernel, keys in zip(self.kernels, self._kernel_keys):
+            try:
+                kernel_results.append(kernel.update(candle))
+            except Exception as e:
+                raise RuntimeError(f"Incremental update failed for {', '.join(keys)}: {e}") from e
+
+        indicator_values = {}
+        for indicator_key, kernel_index, member in self._slots:
+            if kernel_index is not None:
+                values, ready = kernel_results[kernel_index]
+                if ready[member]:
+                    indicator_values[indicator_key] = values[member]
+                continue
+
+            try:
+                new_value = member.update(candle)
+            except Exception as e:
+                raise RuntimeError(f"Incremental update failed for {indicator_key}: {e}") from e
+
+            if new_value is None:
+                continue
+            if isinstance(new_value, dict):
+                # Multi-column result (e.g., MACD)
+                names = self._column_names[indicator_key]
+                for col, val in new_value.items():
+                    name = names.get(col)
+                    if name is None:
+                        name = names[col] = f"{indicator_key}_{col}"
+                    indicator_values[name] = val
+            else:
+                indicator_values[indicator_key] = new_value
+
+        return indicator_values
+
+    def sync(self):
+        """Write batched state back to the indicator instances."""
+        for kernel in self.kernels:
+            kernel.sync()
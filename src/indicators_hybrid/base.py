@@ -10,9 +10,11 @@ Design Principles:
 - Initialize with historical data using pandas_ta (fast vectorized)
 - Update incrementally with new candles (O(1) complexity)
 - Maintain internal state for rolling calculations
+- Snapshot/restore that state (get_state/set_state) to skip warm-up
 - Align with JSON configuration format
 """
 
+import copy
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional, Union
 import pandas as pd
@@ -31,8 +33,12 @@ class HybridIndicator(ABC):
         name: Indicator name (lowercase, e.g., 'ema', 'rsi')
         params: Parameters dict matching JSON config format
         is_initialized: Whether indicator has enough data
+        bank_family: IndicatorBank kernel that can batch this class (set on
+            the class itself; subclasses are not batched unless they set it)
     """
     
+    bank_family: Optional[str] = None
+    
     def __init__(self, name: str, **params):
         """
         Initialize hybrid indicator.
@@ -148,6 +154,39 @@ class HybridIndicator(ABC):
         """
         return self._value if self.is_initialized else None
     
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Snapshot of everything update() continues from (picklable).
+        
+        Covers all instance attributes, so subclass state kept outside
+        `_state` (EMA values, rolling windows, deques) is included.
+        
+        Returns:
+            Dict with indicator class, params and a deep copy of the attributes
+        """
+        attributes = {k: v for k, v in self.__dict__.items() if k not in ('name', 'params')}
+        return {
+            'indicator': type(self).__name__,
+            'params': dict(self.params),
+            'attributes': copy.deepcopy(attributes),
+        }
+    
+    def set_state(self, state: Dict[str, Any]):
+        """
+        Restore a snapshot taken with get_state() (replaces initialize_from_dataframe).
+        
+        Args:
+            state: Snapshot from an instance of the same class and params
+        
+        Raises:
+            ValueError: If the snapshot belongs to another class or params
+        """
+        if state.get('indicator') != type(self).__name__ or state.get('params') != self.params:
+            raise ValueError(
+                f"State of {state.get('indicator')}({state.get('params')}) does not match {self!r}"
+            )
+        self.__dict__.update(copy.deepcopy(state['attributes']))
+    
     def reset(self):
         """Reset indicator state."""
         self.is_initialized = False
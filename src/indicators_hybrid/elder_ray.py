@@ -20,10 +20,10 @@ The indicator shows:
 from typing import Any, Dict
 import pandas as pd
 import numpy as np
-import pandas_ta as ta
 from collections import deque
 
 from .base import HybridIndicator
+from .lazy_import import pandas_ta as ta
 
 
 class ElderRayIndicator(HybridIndicator):
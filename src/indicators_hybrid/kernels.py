@@ -0,0 +1,109 @@
+"""
+Bulk Kernels
+============
+
+Array kernels shared by calculate_bulk() implementations that used to walk
+DataFrames row by row with .iloc/.loc.
+
+Kernels that must stay sequential (state carried from row to row) are
+written against NumPy arrays only and decorated with `jit`: Numba compiles
+them when installed, otherwise they run as plain Python over the arrays
+(still far cheaper than per-cell pandas indexing).
+"""
+
+from typing import Any, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:  # Optional - kernels run uncompiled
+    numba = None
+    NUMBA_AVAILABLE = False
+
+
+def jit(func):
+    """numba.njit(cache=True) when Numba is installed, identity otherwise."""
+    if numba is None:
+        return func
+    return numba.njit(cache=True)(func)
+
+
+def previous_period_hlc(
+    period_key: Any,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    High / low / close of the period before each row's period.
+
+    Each row takes the period that precedes the most recent period change
+    at or before it (max high, min low and last close over all rows of
+    that period). Rows before the first period change are NaN.
+
+    Args:
+        period_key: Period label per row (dates, Periods, ...)
+        high, low, close: Price arrays (same length)
+
+    Returns:
+        (high, low, close) float64 arrays, one value per row
+    """
+    n = len(high)
+    empty = np.full(n, np.nan)
+    if n == 0:
+        return empty, empty.copy(), empty.copy()
+
+    codes, _ = pd.factorize(np.asarray(period_key), use_na_sentinel=False)
+
+    # Aggregates per period (codes are 0..k-1 in order of appearance)
+    period_high = pd.Series(high, dtype=np.float64).groupby(codes).max().to_numpy()
+    period_low = pd.Series(low, dtype=np.float64).groupby(codes).min().to_numpy()
+    last_row = pd.Series(np.arange(n)).groupby(codes).max().to_numpy()
+    period_close = np.asarray(close, dtype=np.float64)[last_row]
+
+    # Rows where the period changes, and the period each row takes levels from
+    changes = np.flatnonzero(codes[1:] != codes[:-1]) + 1
+    segment = np.searchsorted(changes, np.arange(n), side='right') - 1
+    has_previous = segment >= 0
+    source = codes[changes[np.maximum(segment, 0)] - 1] if len(changes) else np.zeros(n, dtype=np.intp)
+
+    return (
+        np.where(has_previous, period_high[source], np.nan),
+        np.where(has_previous, period_low[source], np.nan),
+        np.where(has_previous, period_close[source], np.nan),
+    )
+
+
+def strict_extrema(values: np.ndarray, left: int, right: int, highs: bool) -> np.ndarray:
+    """
+    Swing points confirmed `right` bars later.
+
+    Row i (i >= left + right) is True when values[i - right] is strictly
+    above (highs) / below (lows) each of the `left` values before it and
+    the `right` values after it. NaN neighbours never disqualify a pivot.
+
+    Args:
+        values: Price array
+        left: Bars required on the left of the pivot
+        right: Bars required on the right of the pivot
+        highs: Swing highs (True) or swing lows (False)
+
+    Returns:
+        Boolean array, one flag per row
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    width = left + right + 1
+    flags = np.zeros(n, dtype=bool)
+    if n < width:
+        return flags
+
+    windows = np.lib.stride_tricks.sliding_window_view(values, width)
+    pivots = windows[:, left:left + 1]
+    beaten = windows >= pivots if highs else windows <= pivots
+    beaten[:, left] = False
+    flags[width - 1:] = ~beaten.any(axis=1)
+    return flags
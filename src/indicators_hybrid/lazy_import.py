@@ -0,0 +1,41 @@
+"""
+Lazy Imports
+============
+
+pandas_ta is only needed by calculate_bulk(); incremental updates, state
+restore and the ta_hybrid registry never touch it. Indicator modules bind
+`ta` to a LazyModule instead of importing pandas_ta directly, so the real
+import happens on the first attribute access (the first bulk calculation).
+"""
+
+import importlib
+from types import ModuleType
+from typing import Any, Optional
+
+
+class LazyModule:
+    """Module proxy that imports the target on first attribute access."""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module: Optional[ModuleType] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None
+
+    def _load(self) -> ModuleType:
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self._module is not None else 'not loaded'
+        return f"<LazyModule '{self._name}' ({state})>"
+
+
+# Shared proxy used as `ta` in every indicator module
+pandas_ta = LazyModule('pandas_ta')
@@ -12,10 +12,11 @@ Aligned with momentum.json configuration.
 from typing import Any, Dict, Union
 import pandas as pd
 import numpy as np
-import pandas_ta as ta
 from collections import deque
 
 from .base import HybridIndicator
+from .lazy_import import pandas_ta as ta
+from .rolling import RollingMax, RollingMin
 
 
 class RSIIndicator(HybridIndicator):
@@ -27,6 +28,8 @@ class RSIIndicator(HybridIndicator):
     - price_field: Price field to use (default: 'close')
     """
     
+    bank_family = 'rsi'
+    
     def __init__(self, **params):
         super().__init__('rsi', **params)
         self.length = params.get('length', 14)
@@ -602,8 +605,8 @@ class WILLRIndicator(HybridIndicator):
     def __init__(self, **params):
         super().__init__('willr', **params)
         self.length = params.get('length', 14)
-        self._high_window = deque(maxlen=self.length)
-        self._low_window = deque(maxlen=self.length)
+        self._highest = RollingMax(self.length)
+        self._lowest = RollingMin(self.length)
     
     def calculate_bulk(self, df: pd.DataFrame) -> pd.Series:
         """Calculate WILLR using pandas_ta."""
@@ -611,15 +614,15 @@ class WILLRIndicator(HybridIndicator):
     
     def update(self, candle: Dict[str, Any]) -> float:
         """Update WILLR incrementally (O(1))."""
-        self._high_window.append(candle['high'])
-        self._low_window.append(candle['low'])
+        self._highest.append(candle['high'])
+        self._lowest.append(candle['low'])
         
-        if len(self._high_window) < self.length:
+        if not self._highest.full:
             self._value = None
             return self._value
         
-        highest_high = max(self._high_window)
-        lowest_low = min(self._low_window)
+        highest_high = self._highest.value
+        lowest_low = self._lowest.value
         close = candle['close']
         
         # Williams %R = -100 * (highest_high - close) / (highest_high - lowest_low)
@@ -633,8 +636,8 @@ class WILLRIndicator(HybridIndicator):
     
     def _initialize_state_from_dataframe(self, df: pd.DataFrame, result: pd.Series):
         """Initialize WILLR state from historical data."""
-        self._high_window = deque(df['high'].tail(self.length).values, maxlen=self.length)
-        self._low_window = deque(df['low'].tail(self.length).values, maxlen=self.length)
+        self._highest = RollingMax(self.length, df['high'].tail(self.length).values)
+        self._lowest = RollingMin(self.length, df['low'].tail(self.length).values)
 
 
 class TRIXIndicator(HybridIndicator):
@@ -817,8 +820,8 @@ class FISHERIndicator(HybridIndicator):
     def __init__(self, **params):
         super().__init__('fisher', **params)
         self.length = params.get('length', 9)
-        self._high_window = deque(maxlen=self.length)
-        self._low_window = deque(maxlen=self.length)
+        self._highest = RollingMax(self.length)
+        self._lowest = RollingMin(self.length)
         self._fisher = 0
         self._prev_fisher = 0
     
@@ -826,15 +829,15 @@ class FISHERIndicator(HybridIndicator):
         return ta.fisher(df['high'], df['low'], length=self.length)
     
     def update(self, candle: Dict[str, Any]) -> Dict[str, float]:
-        self._high_window.append(candle['high'])
-        self._low_window.append(candle['low'])
+        self._highest.append(candle['high'])
+        self._lowest.append(candle['low'])
         
-        if len(self._high_window) < self.length:
+        if not self._highest.full:
             self._value = {'FISHER': None, 'FISHERs': None}
             return self._value
         
-        highest = max(self._high_window)
-        lowest = min(self._low_window)
+        highest = self._highest.value
+        lowest = self._lowest.value
         
         if highest != lowest:
             value = 2 * ((candle['close'] - lowest) / (highest - lowest)) - 1
@@ -849,8 +852,8 @@ class FISHERIndicator(HybridIndicator):
         return self._value
     
     def _initialize_state_from_dataframe(self, df: pd.DataFrame, result: pd.DataFrame):
-        self._high_window = deque(df['high'].tail(self.length).values, maxlen=self.length)
-        self._low_window = deque(df['low'].tail(self.length).values, maxlen=self.length)
+        self._highest = RollingMax(self.length, df['high'].tail(self.length).values)
+        self._lowest = RollingMin(self.length, df['low'].tail(self.length).values)
         
         # Initialize fisher values from result
         fisher_col = f'FISHER_{self.length}'
@@ -12,10 +12,10 @@ Aligned with moving_averages.json configuration.
 from typing import Any, Dict, Union
 import pandas as pd
 import numpy as np
-import pandas_ta as ta
 from collections import deque
 
 from .base import HybridIndicator
+from .lazy_import import pandas_ta as ta
 
 
 class SMAIndicator(HybridIndicator):
@@ -77,6 +77,8 @@ class EMAIndicator(HybridIndicator):
     - price_field: Price field to use (default: 'close')
     """
     
+    bank_family = 'smoothing'
+    
     def __init__(self, **params):
         super().__init__('ema', **params)
         self.length = params.get('length', 20)
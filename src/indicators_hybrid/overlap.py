@@ -9,10 +9,11 @@ Aligned with overlap.json configuration.
 from typing import Any, Dict
 import pandas as pd
 import numpy as np
-import pandas_ta as ta
 from collections import deque
 
 from .base import HybridIndicator
+from .lazy_import import pandas_ta as ta
+from .rolling import RollingMax, RollingMin, RollingRegression
 
 
 class ALMAIndicator(HybridIndicator):
@@ -128,7 +129,7 @@ class LINREGIndicator(HybridIndicator):
     def __init__(self, **params):
         super().__init__('linreg', **params)
         self.length = params.get('length', 14)
-        self._price_window = deque(maxlen=self.length)
+        self._regression = RollingRegression(self.length)
     
     def calculate_bulk(self, df: pd.DataFrame) -> pd.Series:
         price = self._get_price_series(df)
@@ -136,36 +137,21 @@ class LINREGIndicator(HybridIndicator):
     
     def update(self, candle: Dict[str, Any]) -> float:
         price = self._get_price_value(candle)
-        self._price_window.append(price)
+        self._regression.append(price)
         
-        if len(self._price_window) < self.length:
+        if not self._regression.full:
             self._value = None
             return self._value
         
         # Linear regression: y = a + bx
-        n = len(self._price_window)
-        x = np.arange(n)
-        y = np.array(self._price_window)
-        
-        sum_x = x.sum()
-        sum_y = y.sum()
-        sum_xy = (x * y).sum()
-        sum_x2 = (x * x).sum()
-        
-        denominator = n * sum_x2 - sum_x * sum_x
-        if denominator != 0:
-            b = (n * sum_xy - sum_x * sum_y) / denominator
-            a = (sum_y - b * sum_x) / n
-            self._value = a + b * (n - 1)  # Predict at last point
-        else:
-            self._value = y[-1]
+        self._value = self._regression.value_at(self.length - 1)  # Predict at last point
         
         self.is_initialized = True
         return self._value
     
     def _initialize_state_from_dataframe(self, df: pd.DataFrame, result: pd.Series):
         price = self._get_price_series(df)
-        self._price_window = deque(price.tail(self.length).values, maxlen=self.length)
+        self._regression = RollingRegression(self.length, price.tail(self.length).values)
 
 
 class MIDPOINTIndicator(HybridIndicator):
@@ -174,7 +160,8 @@ class MIDPOINTIndicator(HybridIndicator):
     def __init__(self, **params):
         super().__init__('midpoint', **params)
         self.length = params.get('length', 14)
-        self._price_window = deque(maxlen=self.length)
+        self._highest = RollingMax(self.length)
+        self._lowest = RollingMin(self.length)
     
     def calculate_bulk(self, df: pd.DataFrame) -> pd.Series:
         price = self._get_price_series(df)
@@ -182,19 +169,21 @@ class MIDPOINTIndicator(HybridIndicator):
     
     def update(self, candle: Dict[str, Any]) -> float:
         price = self._get_price_value(candle)
-        self._price_window.append(price)
+        self._highest.append(price)
+        self._lowest.append(price)
         
-        if len(self._price_window) < self.length:
+        if not self._highest.full:
             self._value = None
             return self._value
         
-        self._value = (max(self._price_window) + min(self._price_window)) / 2.0
+        self._value = (self._highest.value + self._lowest.value) / 2.0
         self.is_initialized = True
         return self._value
     
     def _initialize_state_from_dataframe(self, df: pd.DataFrame, result: pd.Series):
         price = self._get_price_series(df)
-        self._price_window = deque(price.tail(self.length).values, maxlen=self.length)
+        self._highest = RollingMax(self.length, price.tail(self.length).values)
+        self._lowest = RollingMin(self.length, price.tail(self.length).values)
 
 
 class MIDPRICEIndicator(HybridIndicator):
@@ -203,27 +192,27 @@ class MIDPRICEIndicator(HybridIndicator):
     def __init__(self, **params):
         super().__init__('midprice', **params)
         self.length = params.get('length', 14)
-        self._high_window = deque(maxlen=self.length)
-        self._low_window = deque(maxlen=self.length)
+        self._highest = RollingMax(self.length)
+        self._lowest = RollingMin(self.length)
     
     def calculate_bulk(self, df: pd.DataFrame) -> pd.Series:
         return ta.midprice(df['high'], df['low'], length=self.length)
     
     def update(self, candle: Dict[str, Any]) -> float:
-        self._high_window.append(candle['high'])
-        self._low_window.append(candle['low'])
+        self._highest.append(candle['high'])
+        self._lowest.append(candle['low'])
         
-        if len(self._high_window) < self.length:
+        if not self._highest.full:
             self._value = None
             return self._value
         
-        self._value = (max(self._high_window) + min(self._low_window)) / 2.0
+        self._value = (self._highest.value + self._lowest.value) / 2.0
         self.is_initialized = True
         return self._value
     
     def _initialize_state_from_dataframe(self, df: pd.DataFrame, result: pd.Series):
-        self._high_window = deque(df['high'].tail(self.length).values, maxlen=self.length)
-        self._low_window = deque(df['low'].tail(self.length).values, maxlen=self.length)
+        self._highest = RollingMax(self.length, df['high'].tail(self.length).values)
+        self._lowest = RollingMin(self.length, df['low'].tail(self.length).values)
 
 
 class T3Indicator(HybridIndicator):
@@ -398,6 +387,8 @@ class PWMAIndicator(HybridIndicator):
 class RMAIndicator(HybridIndicator):
     """Wilder's Moving Average (RMA)"""
     
+    bank_family = 'smoothing'
+    
     def __init__(self, **params):
         super().__init__('rma', **params)
         self.length = params.get('length', 14)
@@ -0,0 +1,237 @@
+"""
+Bulk vs Incremental Parity
+==========================
+
+Replays candles through a fresh indicator's update() and compares every
+value with calculate_bulk() on the same candles. Also times the update()
+loop, so one run reports both accuracy and incremental throughput.
+
+Multi-output indicators return a dict from update() keyed by output name
+('BBL', 'MACDh', ...) while pandas_ta names bulk columns '<output>_<params>'
+('BBL_20_2.0'). Columns are matched to keys by exact name, then by that
+output prefix (the registry manifest's output names), then by position. A
+column that is never compared is reported as unchecked, not as 0 error.
+
+DataManager only runs this at startup when replay verification is enabled
+(BacktestConfig.verify_indicator_replay); the production path pays for the
+bulk calculation alone.
+
+Usage (whole registry on synthetic candles):
+    python -m src.indicators_hybrid.parity --candles 500 --seed 7
+"""
+
+import argparse
+import math
+import time
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+OHLCV_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+
+
+def synthetic_candles(count: int = 500, seed: int = 7, start: str = '2024-10-01 09:15:00') -> pd.DataFrame:
+    """
+    Random-walk 1m OHLCV candles (positive prices and volume).
+
+    Args:
+        count: Number of candles
+        seed: RNG seed
+        start: First candle timestamp
+
+    Returns:
+        DataFrame with timestamp + OHLCV columns
+    """
+    rng = np.random.default_rng(seed)
+    close = 22000.0 + np.cumsum(rng.normal(0.0, 8.0, count))
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    spread = np.abs(rng.normal(0.0, 4.0, count))
+    return pd.DataFrame({
+        'timestamp': pd.date_range(start, periods=count, freq='min'),
+        'open': open_,
+        'high': np.maximum(open_, close) + spread,
+        'low': np.minimum(open_, close) - spread,
+        'close': close,
+        'volume': rng.integers(1_000, 50_000, count).astype(float),
+    })
+
+
+def _as_float(value: Any) -> Optional[float]:
+    """Float value, or None for missing / non-numeric values."""
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if math.isnan(value) else value
+
+
+def _output_prefix(column: str) -> str:
+    """Output name of a pandas_ta column ('MACDh_12_26_9' -> 'MACDh')."""
+    return str(column).split('_', 1)[0]
+
+
+def match_output_keys(columns: List[Any], keys: List[Any]) -> Dict[Any, Any]:
+    """
+    Map bulk result columns to update() dict keys.
+
+    Exact name first, then output prefix, then the remaining columns and keys
+    in order. Columns left without a key are missing from the mapping.
+    """
+    mapping: Dict[Any, Any] = {}
+    unused = list(keys)
+    for match in (lambda col, key: col == key,
+                  lambda col, key: _output_prefix(col) == str(key)):
+        for col in columns:
+            if col in mapping:
+                continue
+            key = next((k for k in unused if match(col, k)), None)
+            if key is not None:
+                mapping[col] = key
+                unused.remove(key)
+    for col in [c for c in columns if c not in mapping]:
+        if not unused:
+            break
+        mapping[col] = unused.pop(0)
+    return mapping
+
+
+def replay_parity(
+    indicator: Any,
+    candles: pd.DataFrame,
+    bulk: Union[pd.Series, pd.DataFrame, None] = None
+) -> Dict[str, Any]:
+    """
+    Compare incremental replay with the bulk result on the same candles.
+
+    A new instance (same class and params) is replayed, so `indicator`
+    itself is never mutated.
+
+    Args:
+        indicator: HybridIndicator whose class/params are checked
+        candles: DataFrame with timestamp + OHLCV columns
+        bulk: calculate_bulk() result if already computed
+
+    Returns:
+        Dict with:
+            - columns: {column: {'key', 'max_abs_error', 'last_abs_error', 'compared'}}
+              ('value' for single-output indicators; errors are None when
+              nothing was compared)
+            - unchecked: Columns with no compared value (no matching update()
+              output, or never both non-missing)
+            - max_abs_error: Worst error over the checked columns (None if none)
+            - last_abs_error: Worst error on the last candle
+            - updates_per_sec: update() throughput of the replay
+    """
+    if bulk is None:
+        bulk = indicator.calculate_bulk(candles)
+
+    if isinstance(bulk, pd.DataFrame):
+        reference = {col: bulk[col].tolist() for col in bulk.columns}
+    elif isinstance(bulk, pd.Series):
+        reference = {'value': bulk.tolist()}
+    else:
+        reference = {}
+
+    replay = type(indicator)(**getattr(indicator, 'params', {}))
+    records = candles[OHLCV_COLUMNS].to_dict('records')
+
+    started = time.perf_counter()
+    outputs = [replay.update(candle) for candle in records]
+    elapsed = time.perf_counter() - started
+
+    update_keys = next((list(output) for output in outputs if isinstance(output, dict)), [])
+    keys = match_output_keys(list(reference), update_keys) if update_keys else {}
+
+    columns = {}
+    for col, expected in reference.items():
+        key = keys.get(col)
+        max_error = 0.0
+        last_error = None
+        compared = 0
+        for position, (bulk_value, new_value) in enumerate(zip(expected, outputs)):
+            if isinstance(new_value, dict):
+                new_value = new_value.get(key) if key is not None else None
+            bulk_value, new_value = _as_float(bulk_value), _as_float(new_value)
+            if bulk_value is None or new_value is None:
+                continue
+            error = abs(bulk_value - new_value)
+            max_error = max(max_error, error)
+            compared += 1
+            if position == len(records) - 1:
+                last_error = error
+        columns[col] = {
+            'key': key if update_keys else None,
+            'max_abs_error': max_error if compared else None,
+            'last_abs_error': last_error,
+            'compared': compared,
+        }
+
+    checked = [c for c in columns.values() if c['compared']]
+    return {
+        'columns': columns,
+        'unchecked': [col for col, c in columns.items() if not c['compared']],
+        'max_abs_error': max((c['max_abs_error'] for c in checked), default=None),
+        'last_abs_error': max((c['last_abs_error'] for c in columns.values() if c['last_abs_error'] is not None),
+                              default=None),
+        'updates_per_sec': len(records) / elapsed if elapsed > 0 else float('inf'),
+    }
+
+
+def registry_parity(candles: Optional[pd.DataFrame] = None) -> List[Dict[str, Any]]:
+    """
+    Run replay_parity() for every class in ta_hybrid's registry (default params).
+
+    Args:
+        candles: Candles to replay (default: synthetic_candles())
+
+    Returns:
+        One report per indicator class, with 'indicator' (class name) and
+        'error' (exception text, if the indicator could not be checked)
+    """
+    import ta_hybrid
+
+    if candles is None:
+        candles = synthetic_candles()
+
+    classes = list(dict.fromkeys(ta_hybrid._INDICATOR_REGISTRY.values()))
+    reports = []
+    for indicator_class in classes:
+        try:
+            report = replay_parity(indicator_class(), candles)
+        except Exception as e:
+            report = {'error': f"{type(e).__name__}: {e}"}
+        report['indicator'] = indicator_class.__name__
+        reports.append(report)
+    return reports
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk vs incremental parity for all ta_hybrid indicators")
+    parser.add_argument('--candles', type=int, default=500, help="number of synthetic candles")
+    parser.add_argument('--seed', type=int, default=7, help="random seed")
+    args = parser.parse_args()
+
+    reports = registry_parity(synthetic_candles(args.candles, args.seed))
+
+    print(f"{'indicator':<28} {'max abs err':>14} {'last abs err':>14} {'updates/s':>12}")
+    def _order(report):
+        if 'error' in report or report['max_abs_error'] is None:
+            return -math.inf
+        return -report['max_abs_error']
+
+    for report in sorted(reports, key=_order):
+        if 'error' in report:
+            print(f"{report['indicator']:<28} ERROR {report['error']}")
+            continue
+        worst, last = report['max_abs_error'], report['last_abs_error']
+        print(f"{report['indicator']:<28} {'-' if worst is None else format(worst, '.6g'):>14} "
+              f"{'-' if last is None else format(last, '.6g'):>14} {report['updates_per_sec']:>12,.0f}")
+        if report['unchecked']:
+            print(f"{'':<28} UNCHECKED {', '.join(map(str, report['unchecked']))}")
+
+
+if __name__ == '__main__':
+    main()
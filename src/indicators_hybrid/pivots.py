@@ -16,6 +16,42 @@ from datetime import datetime, time
 from collections import deque
 
 from .base import HybridIndicator
+from .kernels import previous_period_hlc
+
+
+def _period_key(df: pd.DataFrame, timeframe: str) -> Any:
+    """Period label of each row ('D' dates, 'W'/'M' Periods)."""
+    if timeframe == 'W':
+        return df.index.to_period('W')
+    if timeframe == 'M':
+        return df.index.to_period('M')
+    return df.index.date
+
+
+def _bulk_previous_hlc(df: pd.DataFrame, timeframe: str):
+    """Previous-period (high, low, close) arrays for every row (NaN in the first period)."""
+    return previous_period_hlc(
+        _period_key(df, timeframe),
+        df['high'].to_numpy(dtype=np.float64),
+        df['low'].to_numpy(dtype=np.float64),
+        df['close'].to_numpy(dtype=np.float64)
+    )
+
+
+def _last_previous_period(df: pd.DataFrame, timeframe: str):
+    """
+    (high, low, close, last_period) of the period before the last row's period.
+    
+    Returns None when the frame covers a single period.
+    """
+    period_key = _period_key(df, timeframe)
+    codes, _ = pd.factorize(np.asarray(period_key), use_na_sentinel=False)
+    earlier = np.flatnonzero(codes != codes[-1])
+    if len(earlier) == 0:
+        return None
+    
+    prev_data = df[codes == codes[earlier[-1]]]
+    return prev_data['high'].max(), prev_data['low'].min(), prev_data['close'].iloc[-1], period_key[-1]
 
 
 class PIVOTIndicator(HybridIndicator):
@@ -55,57 +91,19 @@ class PIVOTIndicator(HybridIndicator):
         self._s3 = None
     
     def calculate_bulk(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Calculate pivot points for each period."""
-        result = pd.DataFrame(index=df.index)
-        
-        # Group by period
-        if self.timeframe == 'D':
-            period_key = df.index.date
-        elif self.timeframe == 'W':
-            period_key = df.index.to_period('W')
-        elif self.timeframe == 'M':
-            period_key = df.index.to_period('M')
-        else:
-            period_key = df.index.date
-        
-        # Calculate pivots for each period
-        for i in range(len(df)):
-            if i == 0:
-                # First row - no previous period
-                result.loc[df.index[i], ['PP', 'R1', 'R2', 'R3', 'S1', 'S2', 'S3']] = [None] * 7
-                continue
-            
-            # Check if we're in a new period
-            current_period = period_key[i]
-            prev_period = period_key[i-1]
-            
-            if current_period != prev_period:
-                # New period - calculate pivots from previous period
-                prev_data = df[period_key == prev_period]
-                high = prev_data['high'].max()
-                low = prev_data['low'].min()
-                close = prev_data['close'].iloc[-1]
-                
-                pp = (high + low + close) / 3
-                r1 = (2 * pp) - low
-                r2 = pp + (high - low)
-                r3 = high + 2 * (pp - low)
-                s1 = (2 * pp) - high
-                s2 = pp - (high - low)
-                s3 = low - 2 * (high - pp)
-                
-                result.loc[df.index[i], 'PP'] = pp
-                result.loc[df.index[i], 'R1'] = r1
-                result.loc[df.index[i], 'R2'] = r2
-                result.loc[df.index[i], 'R3'] = r3
-                result.loc[df.index[i], 'S1'] = s1
-                result.loc[df.index[i], 'S2'] = s2
-                result.loc[df.index[i], 'S3'] = s3
-            else:
-                # Same period - forward fill
-                result.loc[df.index[i]] = result.iloc[i-1]
-        
-        return result
+        """Calculate pivot points for each period (vectorized)."""
+        high, low, close = _bulk_previous_hlc(df, self.timeframe)
+        
+        pp = (high + low + close) / 3
+        return pd.DataFrame({
+            'PP': pp,
+            'R1': (2 * pp) - low,
+            'R2': pp + (high - low),
+            'R3': high + 2 * (pp - low),
+            'S1': (2 * pp) - high,
+            'S2': pp - (high - low),
+            'S3': low - 2 * (high - pp),
+        }, index=df.index)
     
     def update(self, candle: Dict[str, Any]) -> Dict[str, float]:
         """Update pivot points incrementally."""
@@ -163,27 +161,9 @@ class PIVOTIndicator(HybridIndicator):
         if len(df) == 0:
             return
         
-        # Get the last period's HLC
-        if self.timeframe == 'D':
-            period_key = df.index.date
-        elif self.timeframe == 'W':
-            period_key = df.index.to_period('W')
-        elif self.timeframe == 'M':
-            period_key = df.index.to_period('M')
-        else:
-            period_key = df.index.date
-        
-        last_period = period_key[-1]
-        prev_periods = [p for p in period_key if p != last_period]
-        
-        if prev_periods:
-            prev_period = prev_periods[-1]
-            prev_data = df[period_key == prev_period]
-            
-            self._prev_high = prev_data['high'].max()
-            self._prev_low = prev_data['low'].min()
-            self._prev_close = prev_data['close'].iloc[-1]
-            self._current_period = last_period
+        previous = _last_previous_period(df, self.timeframe)
+        if previous is not None:
+            self._prev_high, self._prev_low, self._prev_close, self._current_period = previous
             
             # Calculate current pivots
             pp = (self._prev_high + self._prev_low + self._prev_close) / 3
@@ -223,46 +203,16 @@ class CPRIndicator(HybridIndicator):
         self._bc = None
     
     def calculate_bulk(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Calculate CPR for each period."""
-        result = pd.DataFrame(index=df.index)
-        
-        # Group by period
-        if self.timeframe == 'D':
-            period_key = df.index.date
-        elif self.timeframe == 'W':
-            period_key = df.index.to_period('W')
-        elif self.timeframe == 'M':
-            period_key = df.index.to_period('M')
-        else:
-            period_key = df.index.date
-        
-        for i in range(len(df)):
-            if i == 0:
-                result.loc[df.index[i], ['TC', 'PIVOT', 'BC']] = [None] * 3
-                continue
-            
-            current_period = period_key[i]
-            prev_period = period_key[i-1]
-            
-            if current_period != prev_period:
-                # New period - calculate CPR from previous period
-                prev_data = df[period_key == prev_period]
-                high = prev_data['high'].max()
-                low = prev_data['low'].min()
-                close = prev_data['close'].iloc[-1]
-                
-                pivot = (high + low + close) / 3
-                bc = (high + low) / 2
-                tc = (pivot - bc) + pivot
-                
-                result.loc[df.index[i], 'TC'] = tc
-                result.loc[df.index[i], 'PIVOT'] = pivot
-                result.loc[df.index[i], 'BC'] = bc
-            else:
-                # Same period - forward fill
-                result.loc[df.index[i]] = result.iloc[i-1]
-        
-        return result
+        """Calculate CPR for each period (vectorized)."""
+        high, low, close = _bulk_previous_hlc(df, self.timeframe)
+        
+        pivot = (high + low + close) / 3
+        bc = (high + low) / 2
+        return pd.DataFrame({
+            'TC': (pivot - bc) + pivot,
+            'PIVOT': pivot,
+            'BC': bc,
+        }, index=df.index)
     
     def update(self, candle: Dict[str, Any]) -> Dict[str, float]:
         """Update CPR incrementally."""
@@ -310,26 +260,9 @@ class CPRIndicator(HybridIndicator):
         if len(df) == 0:
             return
         
-        if self.timeframe == 'D':
-            period_key = df.index.date
-        elif self.timeframe == 'W':
-            period_key = df.index.to_period('W')
-        elif self.timeframe == 'M':
-            period_key = df.index.to_period('M')
-        else:
-            period_key = df.index.date
-        
-        last_period = period_key[-1]
-        prev_periods = [p for p in period_key if p != last_period]
-        
-        if prev_periods:
-            prev_period = prev_periods[-1]
-            prev_data = df[period_key == prev_period]
-            
-            self._prev_high = prev_data['high'].max()
-            self._prev_low = prev_data['low'].min()
-            self._prev_close = prev_data['close'].iloc[-1]
-            self._current_period = last_period
+        previous = _last_previous_period(df, self.timeframe)
+        if previous is not None:
+            self._prev_high, self._prev_low, self._prev_close, self._current_period = previous
             
             pivot = (self._prev_high + self._prev_low + self._prev_close) / 3
             bc = (self._prev_high + self._prev_low) / 2
@@ -377,55 +310,20 @@ class CAMARILLAIndicator(HybridIndicator):
         self._l4 = None
     
     def calculate_bulk(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Calculate Camarilla pivots for each period."""
-        result = pd.DataFrame(index=df.index)
-        
-        if self.timeframe == 'D':
-            period_key = df.index.date
-        elif self.timeframe == 'W':
-            period_key = df.index.to_period('W')
-        elif self.timeframe == 'M':
-            period_key = df.index.to_period('M')
-        else:
-            period_key = df.index.date
-        
-        for i in range(len(df)):
-            if i == 0:
-                result.loc[df.index[i], ['H4', 'H3', 'H2', 'H1', 'L1', 'L2', 'L3', 'L4']] = [None] * 8
-                continue
-            
-            current_period = period_key[i]
-            prev_period = period_key[i-1]
-            
-            if current_period != prev_period:
-                prev_data = df[period_key == prev_period]
-                high = prev_data['high'].max()
-                low = prev_data['low'].min()
-                close = prev_data['close'].iloc[-1]
-                
-                range_val = high - low
-                
-                h4 = close + (range_val * 1.1 / 2)
-                h3 = close + (range_val * 1.1 / 4)
-                h2 = close + (range_val * 1.1 / 6)
-                h1 = close + (range_val * 1.1 / 12)
-                l1 = close - (range_val * 1.1 / 12)
-                l2 = close - (range_val * 1.1 / 6)
-                l3 = close - (range_val * 1.1 / 4)
-                l4 = close - (range_val * 1.1 / 2)
-                
-                result.loc[df.index[i], 'H4'] = h4
-                result.loc[df.index[i], 'H3'] = h3
-                result.loc[df.index[i], 'H2'] = h2
-                result.loc[df.index[i], 'H1'] = h1
-                result.loc[df.index[i], 'L1'] = l1
-                result.loc[df.index[i], 'L2'] = l2
-                result.loc[df.index[i], 'L3'] = l3
-                result.loc[df.index[i], 'L4'] = l4
-            else:
-                result.loc[df.index[i]] = result.iloc[i-1]
-        
-        return result
+        """Calculate Camarilla pivots for each period (vectorized)."""
+        high, low, close = _bulk_previous_hlc(df, self.timeframe)
+        
+        range_val = high - low
+        return pd.DataFrame({
+            'H4': close + (range_val * 1.1 / 2),
+            'H3': close + (range_val * 1.1 / 4),
+            'H2': close + (range_val * 1.1 / 6),
+            'H1': close + (range_val * 1.1 / 12),
+            'L1': close - (range_val * 1.1 / 12),
+            'L2': close - (range_val * 1.1 / 6),
+            'L3': close - (range_val * 1.1 / 4),
+            'L4': close - (range_val * 1.1 / 2),
+        }, index=df.index)
     
     def update(self, candle: Dict[str, Any]) -> Dict[str, float]:
         """Update Camarilla pivots incrementally."""
@@ -475,26 +373,9 @@ class CAMARILLAIndicator(HybridIndicator):
         if len(df) == 0:
             return
         
-        if self.timeframe == 'D':
-            period_key = df.index.date
-        elif self.timeframe == 'W':
-            period_key = df.index.to_period('W')
-        elif self.timeframe == 'M':
-            period_key = df.index.to_period('M')
-        else:
-            period_key = df.index.date
-        
-        last_period = period_key[-1]
-        prev_periods = [p for p in period_key if p != last_period]
-        
-        if prev_periods:
-            prev_period = prev_periods[-1]
-            prev_data = df[period_key == prev_period]
-            
-            self._prev_high = prev_data['high'].max()
-            self._prev_low = prev_data['low'].min()
-            self._prev_close = prev_data['close'].iloc[-1]
-            self._current_period = last_period
+        previous = _last_previous_period(df, self.timeframe)
+        if previous is not None:
+            self._prev_high, self._prev_low, self._prev_close, self._current_period = previous
             
             range_val = self._prev_high - self._prev_low
             
@@ -543,53 +424,20 @@ class FIBONACCIPIVOTIndicator(HybridIndicator):
         self._s3 = None
     
     def calculate_bulk(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Calculate Fibonacci pivots for each period."""
-        result = pd.DataFrame(index=df.index)
-        
-        if self.timeframe == 'D':
-            period_key = df.index.date
-        elif self.timeframe == 'W':
-            period_key = df.index.to_period('W')
-        elif self.timeframe == 'M':
-            period_key = df.index.to_period('M')
-        else:
-            period_key = df.index.date
-        
-        for i in range(len(df)):
-            if i == 0:
-                result.loc[df.index[i], ['PP', 'R1', 'R2', 'R3', 'S1', 'S2', 'S3']] = [None] * 7
-                continue
-            
-            current_period = period_key[i]
-            prev_period = period_key[i-1]
-            
-            if current_period != prev_period:
-                prev_data = df[period_key == prev_period]
-                high = prev_data['high'].max()
-                low = prev_data['low'].min()
-                close = prev_data['close'].iloc[-1]
-                
-                pp = (high + low + close) / 3
-                range_val = high - low
-                
-                r1 = pp + 0.382 * range_val
-                r2 = pp + 0.618 * range_val
-                r3 = pp + 1.000 * range_val
-                s1 = pp - 0.382 * range_val
-                s2 = pp - 0.618 * range_val
-                s3 = pp - 1.000 * range_val
-                
-                result.loc[df.index[i], 'PP'] = pp
-                result.loc[df.index[i], 'R1'] = r1
-                result.loc[df.index[i], 'R2'] = r2
-                result.loc[df.index[i], 'R3'] = r3
-                result.loc[df.index[i], 'S1'] = s1
-                result.loc[df.index[i], 'S2'] = s2
-                result.loc[df.index[i], 'S3'] = s3
-            else:
-                result.loc[df.index[i]] = result.iloc[i-1]
-        
-        return result
+        """Calculate Fibonacci pivots for each period (vectorized)."""
+        high, low, close = _bulk_previous_hlc(df, self.timeframe)
+        
+        pp = (high + low + close) / 3
+        range_val = high - low
+        return pd.DataFrame({
+            'PP': pp,
+            'R1': pp + 0.382 * range_val,
+            'R2': pp + 0.618 * range_val,
+            'R3': pp + 1.000 * range_val,
+            'S1': pp - 0.382 * range_val,
+            'S2': pp - 0.618 * range_val,
+            'S3': pp - 1.000 * range_val,
+        }, index=df.index)
     
     def update(self, candle: Dict[str, Any]) -> Dict[str, float]:
         """Update Fibonacci pivots incrementally."""
@@ -640,26 +488,9 @@ class FIBONACCIPIVOTIndicator(HybridIndicator):
         if len(df) == 0:
             return
         
-        if self.timeframe == 'D':
-            period_key = df.index.date
-        elif self.timeframe == 'W':
-            period_key = df.index.to_period('W')
-        elif self.timeframe == 'M':
-            period_key = df.index.to_period('M')
-        else:
-            period_key = df.index.date
-        
-        last_period = period_key[-1]
-        prev_periods = [p for p in period_key if p != last_period]
-        
-        if prev_periods:
-            prev_period = prev_periods[-1]
-            prev_data = df[period_key == prev_period]
-            
-            self._prev_high = prev_data['high'].max()
-            self._prev_low = prev_data['low'].min()
-            self._prev_close = prev_data['close'].iloc[-1]
-            self._current_period = last_period
+        previous = _last_previous_period(df, self.timeframe)
+        if previous is not None:
+            self._prev_high, self._prev_low, self._prev_close, self._current_period = previous
             
             pp = (self._prev_high + self._prev_low + self._prev_close) / 3
             range_val = self._prev_high - self._prev_low
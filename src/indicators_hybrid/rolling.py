@@ -0,0 +1,318 @@
+"""
+Rolling Window Primitives - Streaming state for windowed indicators
+===================================================================
+
+Windowed indicators used to keep a deque of the last `length` prices and
+rebuild an array from it on every candle (sum(), max(), np.corrcoef,
+np.histogram, ...), so each update cost O(length). These primitives keep
+the statistic itself up to date as values enter and leave the window:
+
+- RollingMoments: mean / variance / std from compensated shifted sums
+- RollingMax, RollingMin: monotonic deque of extremum candidates
+- RollingOrderStatistics: sorted window for median, quantile and histogram
+- RollingRegression: least-squares line of the window against x = 0..n-1
+
+All of them take the initial window as `values` (indicator state
+initialization from history) and advance with append().
+"""
+
+import math
+import operator
+from bisect import bisect_left, insort
+from collections import deque
+from typing import Iterable, Optional
+
+import numpy as np
+
+
+def _neumaier(total: float, compensation: float, value: float):
+    """Add value to a compensated (Neumaier) sum; returns (total, compensation)."""
+    result = total + value
+    if abs(total) >= abs(value):
+        compensation += (total - result) + value
+    else:
+        compensation += (value - result) + total
+    return result, compensation
+
+
+class RollingMoments:
+    """
+    Mean and population variance of the last `length` values.
+
+    Sums are kept relative to a shift close to the window mean (limits
+    cancellation in S2 - S1^2) with Neumaier compensation, and are rebuilt
+    exactly from the window every `length` updates (amortized O(1)).
+    """
+
+    __slots__ = ('length', 'window', '_shift', '_s1', '_c1', '_s2', '_c2', '_since_rebase')
+
+    def __init__(self, length: int, values: Iterable[float] = ()):
+        self.length = length
+        self.window = deque(maxlen=length)
+        self._shift = 0.0
+        self._s1 = self._c1 = self._s2 = self._c2 = 0.0
+        self._since_rebase = 0
+        for value in values:
+            self.append(value)
+
+    def __len__(self) -> int:
+        return len(self.window)
+
+    @property
+    def full(self) -> bool:
+        return len(self.window) == self.length
+
+    def append(self, value: float):
+        """Add value; the oldest value leaves once the window is full."""
+        value = float(value)
+        window = self.window
+        if not window:
+            self._shift = value
+        elif len(window) == self.length:
+            old = window[0] - self._shift
+            self._s1, self._c1 = _neumaier(self._s1, self._c1, -old)
+            self._s2, self._c2 = _neumaier(self._s2, self._c2, -old * old)
+
+        window.append(value)
+        deviation = value - self._shift
+        self._s1, self._c1 = _neumaier(self._s1, self._c1, deviation)
+        self._s2, self._c2 = _neumaier(self._s2, self._c2, deviation * deviation)
+
+        self._since_rebase += 1
+        if self._since_rebase >= self.length:
+            self._rebase()
+
+    def _rebase(self):
+        """Recompute the sums exactly around the current mean."""
+        window = self.window
+        self._shift = math.fsum(window) / len(window)
+        deviations = [value - self._shift for value in window]
+        self._s1, self._c1 = math.fsum(deviations), 0.0
+        self._s2, self._c2 = math.fsum(d * d for d in deviations), 0.0
+        self._since_rebase = 0
+
+    @property
+    def mean(self) -> float:
+        return self._shift + (self._s1 + self._c1) / len(self.window)
+
+    @property
+    def variance(self) -> float:
+        """Population variance (ddof=0), 0.0 within cancellation noise."""
+        n = len(self.window)
+        mean_deviation = (self._s1 + self._c1) / n
+        mean_square = (self._s2 + self._c2) / n
+        variance = mean_square - mean_deviation * mean_deviation
+        return variance if variance > mean_square * 1e-12 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class RollingMax:
+    """
+    Maximum of the last `length` values (monotonic deque, amortized O(1)).
+
+    Candidates are kept in arrival order with decreasing values; a value
+    that can never be the maximum again (an equal-or-larger one arrived
+    after it) is dropped on arrival.
+    """
+
+    __slots__ = ('length', 'count', '_candidates')
+
+    # Candidate at the back is obsolete once the new value dominates it
+    _dominated = staticmethod(operator.le)
+
+    def __init__(self, length: int, values: Iterable[float] = ()):
+        self.length = length
+        self.count = 0
+        self._candidates = deque()
+        for value in values:
+            self.append(value)
+
+    def __len__(self) -> int:
+        return min(self.count, self.length)
+
+    @property
+    def full(self) -> bool:
+        return self.count >= self.length
+
+    def append(self, value: float):
+        candidates = self._candidates
+        dominated = self._dominated
+        while candidates and dominated(candidates[-1][1], value):
+            candidates.pop()
+        candidates.append((self.count, value))
+        self.count += 1
+        if candidates[0][0] < self.count - self.length:
+            candidates.popleft()
+
+    @property
+    def value(self) -> float:
+        return self._candidates[0][1]
+
+
+class RollingMin(RollingMax):
+    """Minimum of the last `length` values (monotonic deque, amortized O(1))."""
+
+    __slots__ = ()
+
+    _dominated = staticmethod(operator.ge)
+
+
+class RollingOrderStatistics:
+    """
+    Last `length` values kept sorted (bisect insert/remove).
+
+    Lookups are O(1) (median, quantile) or O(bins * log length)
+    (histogram); insert and remove are a binary search plus one C-level
+    memmove of the list, instead of sorting a fresh copy of the window.
+    Results match np.median / np.quantile (linear) / np.histogram on the
+    same window exactly.
+    """
+
+    __slots__ = ('length', 'window', 'sorted')
+
+    def __init__(self, length: int, values: Iterable[float] = ()):
+        self.length = length
+        self.window = deque(maxlen=length)
+        self.sorted = []
+        for value in values:
+            self.append(value)
+
+    def __len__(self) -> int:
+        return len(self.window)
+
+    @property
+    def full(self) -> bool:
+        return len(self.window) == self.length
+
+    def append(self, value: float):
+        value = float(value)
+        if len(self.window) == self.length:
+            del self.sorted[bisect_left(self.sorted, self.window[0])]
+        self.window.append(value)
+        insort(self.sorted, value)
+
+    def median(self) -> float:
+        ordered = self.sorted
+        middle = len(ordered) // 2
+        if len(ordered) % 2:
+            return ordered[middle]
+        return (ordered[middle - 1] + ordered[middle]) / 2
+
+    def quantile(self, q: float) -> float:
+        """Linear interpolation between closest ranks (np.quantile default)."""
+        ordered = self.sorted
+        index = (len(ordered) - 1) * q
+        below = math.floor(index)
+        weight = index - below
+        low = ordered[below]
+        high = ordered[min(below + 1, len(ordered) - 1)]
+        difference = high - low
+        # Same two-sided lerp as numpy (exact at both ends)
+        if weight >= 0.5:
+            return high - difference * (1 - weight)
+        return low + difference * weight
+
+    def histogram(self, bins: int) -> np.ndarray:
+        """Counts per equal-width bin over [min, max] (np.histogram semantics)."""
+        ordered = self.sorted
+        first, last = ordered[0], ordered[-1]
+        if first == last:
+            first, last = first - 0.5, last + 0.5
+        edges = np.linspace(first, last, bins + 1)
+
+        # Bin i holds edges[i] <= v < edges[i + 1]; the last bin includes max
+        positions = [0] + [bisect_left(ordered, edge) for edge in edges[1:-1].tolist()] + [len(ordered)]
+        return np.diff(np.array(positions, dtype=np.int64))
+
+
+class RollingRegression:
+    """
+    Least-squares line y = a + b*x over the last `length` values, x = 0..n-1.
+
+    Sliding the window renumbers x, which updates the sums in O(1):
+        Sxy' = Sxy - (Sy - y_out) + (n - 1) * y_in
+    Sx and Sxx depend only on n. y is shifted like RollingMoments and the
+    sums are rebuilt from the window every `length` updates.
+    """
+
+    __slots__ = ('length', 'window', '_shift', '_sy', '_syy', '_sxy', '_since_rebase')
+
+    def __init__(self, length: int, values: Iterable[float] = ()):
+        self.length = length
+        self.window = deque(maxlen=length)
+        self._shift = 0.0
+        self._sy = self._syy = self._sxy = 0.0
+        self._since_rebase = 0
+        for value in values:
+            self.append(value)
+
+    def __len__(self) -> int:
+        return len(self.window)
+
+    @property
+    def full(self) -> bool:
+        return len(self.window) == self.length
+
+    def append(self, value: float):
+        value = float(value)
+        window = self.window
+        if not window:
+            self._shift = value
+        deviation = value - self._shift
+
+        n = len(window)
+        if n == self.length:
+            old = window[0] - self._shift
+            self._sxy += (n - 1) * deviation - (self._sy - old)
+            self._sy += deviation - old
+            self._syy += deviation * deviation - old * old
+        else:
+            self._sxy += n * deviation
+            self._sy += deviation
+            self._syy += deviation * deviation
+        window.append(value)
+
+        self._since_rebase += 1
+        if self._since_rebase >= self.length:
+            self._rebase()
+
+    def _rebase(self):
+        window = self.window
+        self._shift = math.fsum(window) / len(window)
+        deviations = [value - self._shift for value in window]
+        self._sy = math.fsum(deviations)
+        self._syy = math.fsum(d * d for d in deviations)
+        self._sxy = math.fsum(x * d for x, d in enumerate(deviations))
+        self._since_rebase = 0
+
+    def _x_sums(self):
+        n = len(self.window)
+        return n, n * (n - 1) / 2, (n - 1) * n * (2 * n - 1) / 6
+
+    def slope(self) -> float:
+        """b, or 0.0 for a single-point window."""
+        n, sx, sxx = self._x_sums()
+        denominator = n * sxx - sx * sx
+        if denominator == 0:
+            return 0.0
+        return (n * self._sxy - sx * self._sy) / denominator
+
+    def value_at(self, x: float) -> float:
+        """a + b*x (x = n - 1 is the fitted value of the newest point)."""
+        n, sx, _ = self._x_sums()
+        slope = self.slope()
+        intercept = (self._sy - slope * sx) / n
+        return self._shift + intercept + slope * x
+
+    def correlation(self) -> Optional[float]:
+        """Pearson r of (x, y); None if y is constant (np.corrcoef gives NaN)."""
+        n, sx, sxx = self._x_sums()
+        x_spread = n * sxx - sx * sx
+        y_spread = n * self._syy - self._sy * self._sy
+        if x_spread <= 0 or y_spread <= n * self._syy * 1e-12:
+            return None
+        r = (n * self._sxy - sx * self._sy) / math.sqrt(x_spread * y_spread)
+        return max(-1.0, min(1.0, r))
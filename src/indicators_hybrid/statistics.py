@@ -8,11 +8,12 @@ Statistical indicators with bulk + incremental support.
 from typing import Any, Dict
 import pandas as pd
 import numpy as np
-import pandas_ta as ta
 from collections import deque
 from scipy import stats
 
 from .base import HybridIndicator
+from .lazy_import import pandas_ta as ta
+from .rolling import RollingMoments, RollingOrderStatistics
 
 
 class ENTROPYIndicator(HybridIndicator):
@@ -21,7 +22,7 @@ class ENTROPYIndicator(HybridIndicator):
     def __init__(self, **params):
         super().__init__('entropy', **params)
         self.length = params.get('length', 10)
-        self._price_window = deque(maxlen=self.length)
+        self._window = RollingOrderStatistics(self.length)
     
     def calculate_bulk(self, df: pd.DataFrame) -> pd.Series:
         price = self._get_price_series(df)
@@ -29,15 +30,14 @@ class ENTROPYIndicator(HybridIndicator):
     
     def update(self, candle: Dict[str, Any]) -> float:
         price = self._get_price_value(candle)
-        self._price_window.append(price)
+        self._window.append(price)
         
-        if len(self._price_window) < self.length:
+        if not self._window.full:
             self._value = None
             return self._value
         
-        # Calculate entropy
-        values = np.array(self._price_window)
-        hist, _ = np.histogram(values, bins=min(10, self.length))
+        # Calculate entropy (bin counts from the sorted window)
+        hist = self._window.histogram(min(10, self.length))
         hist = hist[hist > 0]
         probs = hist / hist.sum()
         self._value = -np.sum(probs * np.log2(probs))
@@ -46,7 +46,7 @@ class ENTROPYIndicator(HybridIndicator):
     
     def _initialize_state_from_dataframe(self, df: pd.DataFrame, result: pd.Series):
         price = self._get_price_series(df)
-        self._price_window = deque(price.tail(self.length).values, maxlen=self.length)
+        self._window = RollingOrderStatistics(self.length, price.tail(self.length).values)
 
 
 class KURTOSISIndicator(HybridIndicator):
@@ -84,7 +84,7 @@ class MADIndicator(HybridIndicator):
     def __init__(self, **params):
         super().__init__('mad', **params)
         self.length = params.get('length', 30)
-        self._price_window = deque(maxlen=self.length)
+        self._moments = RollingMoments(self.length)
     
     def calculate_bulk(self, df: pd.DataFrame) -> pd.Series:
         price = self._get_price_series(df)
@@ -92,20 +92,22 @@ class MADIndicator(HybridIndicator):
     
     def update(self, candle: Dict[str, Any]) -> float:
         price = self._get_price_value(candle)
-        self._price_window.append(price)
+        self._moments.append(price)
         
-        if len(self._price_window) < self.length:
+        if not self._moments.full:
             self._value = None
             return self._value
         
-        values = np.array(self._price_window)
-        self._value = np.mean(np.abs(values - np.mean(values)))
+        # Absolute deviations change for every member when the mean moves,
+        # so this stays one pass over the window (the mean is streamed)
+        values = np.fromiter(self._moments.window, dtype=np.float64, count=self.length)
+        self._value = np.mean(np.abs(values - self._moments.mean))
         self.is_initialized = True
         return self._value
     
     def _initialize_state_from_dataframe(self, df: pd.DataFrame, result: pd.Series):
         price = self._get_price_series(df)
-        self._price_window = deque(price.tail(self.length).values, maxlen=self.length)
+        self._moments = RollingMoments(self.length, price.tail(self.length).values)
 
 
 class MEDIANIndicator(HybridIndicator):
@@ -114,7 +116,7 @@ class MEDIANIndicator(HybridIndicator):
     def __init__(self, **params):
         super().__init__('median', **params)
         self.length = params.get('length', 30)
-        self._price_window = deque(maxlen=self.length)
+        self._window = RollingOrderStatistics(self.length)
     
     def calculate_bulk(self, df: pd.DataFrame) -> pd.Series:
         price = self._get_price_series(df)
@@ -122,19 +124,19 @@ class MEDIANIndicator(HybridIndicator):
     
     def update(self, candle: Dict[str, Any]) -> float:
         price = self._get_price_value(candle)
-        self._price_window.append(price)
+        self._window.append(price)
         
-        if len(self._price_window) < self.length:
+        if not self._window.full:
             self._value = None
             return self._value
         
-        self._value = np.median(list(self._price_window))
+        self._value = self._window.median()
         self.is_initialized = True
         return self._value
     
     def _initialize_state_from_dataframe(self, df: pd.DataFrame, result: pd.Series):
         price = self._get_price_series(df)
-        self._price_window = deque(price.tail(self.length).values, maxlen=self.length)
+        self._window = RollingOrderStatistics(self.length, price.tail(self.length).values)
 
 
 class QUANTILEIndicator(HybridIndicator):
@@ -144,7 +146,7 @@ class QUANTILEIndicator(HybridIndicator):
         super().__init__('quantile', **params)
         self.length = params.get('length', 30)
         self.q = params.get('q', 0.5)
-        self._price_window = deque(maxlen=self.length)
+        self._window = RollingOrderStatistics(self.length)
     
     def calculate_bulk(self, df: pd.DataFrame) -> pd.Series:
         price = self._get_price_series(df)
@@ -152,19 +154,19 @@ class QUANTILEIndicator(HybridIndicator):
     
     def update(self, candle: Dict[str, Any]) -> float:
         price = self._get_price_value(candle)
-        self._price_window.append(price)
+        self._window.append(price)
         
-        if len(self._price_window) < self.length:
+        if not self._window.full:
             self._value = None
             return self._value
         
-        self._value = np.quantile(list(self._price_window), self.q)
+        self._value = self._window.quantile(self.q)
         self.is_initialized = True
         return self._value
     
     def _initialize_state_from_dataframe(self, df: pd.DataFrame, result: pd.Series):
         price = self._get_price_series(df)
-        self._price_window = deque(price.tail(self.length).values, maxlen=self.length)
+        self._window = RollingOrderStatistics(self.length, price.tail(self.length).values)
 
 
 class SKEWIndicator(HybridIndicator):
@@ -202,7 +204,7 @@ class ZSCOREIndicator(HybridIndicator):
     def __init__(self, **params):
         super().__init__('zscore', **params)
         self.length = params.get('length', 30)
-        self._price_window = deque(maxlen=self.length)
+        self._moments = RollingMoments(self.length)
     
     def calculate_bulk(self, df: pd.DataFrame) -> pd.Series:
         price = self._get_price_series(df)
@@ -210,19 +212,18 @@ class ZSCOREIndicator(HybridIndicator):
     
     def update(self, candle: Dict[str, Any]) -> float:
         price = self._get_price_value(candle)
-        self._price_window.append(price)
+        self._moments.append(price)
         
-        if len(self._price_window) < self.length:
+        if not self._moments.full:
             self._value = None
             return self._value
         
-        values = np.array(self._price_window)
-        mean = np.mean(values)
-        std = np.std(values)
+        mean = self._moments.mean
+        std = self._moments.std
         self._value = (price - mean) / std if std > 0 else 0
         self.is_initialized = True
         return self._value
     
     def _initialize_state_from_dataframe(self, df: pd.DataFrame, result: pd.Series):
         price = self._get_price_series(df)
-        self._price_window = deque(price.tail(self.length).values, maxlen=self.length)
+        self._moments = RollingMoments(self.length, price.tail(self.length).values)
@@ -19,6 +19,7 @@ Pine Script Logic (TradingView):
 This is a simplified but accurate implementation of the core logic.
 """
 
+import warnings
 from typing import Any, Dict, List, Tuple, Optional
 import pandas as pd
 import numpy as np
@@ -26,6 +27,81 @@ from collections import deque
 from datetime import datetime
 
 from .base import HybridIndicator
+from .kernels import jit, strict_extrema
+
+
+@jit
+def _track_levels(high, low, close, pivot_high, pivot_low, swing_high, swing_low,
+                  weight, start, max_levels, min_strength, out):
+    """
+    Sequential level bookkeeping of calculate_bulk (Numba-compiled when available).
+    
+    Levels live in fixed arrays (kind 1 = resistance, 0 = support); sorts are
+    stable so ties keep list order. Writes top 3 support prices (highest
+    first) to out[:, 0:3] and top 3 resistance prices (lowest first) to
+    out[:, 3:6]; other cells are left untouched (NaN).
+    """
+    capacity = max(max_levels, 0) + 2
+    price = np.empty(capacity)
+    kind = np.empty(capacity, dtype=np.int8)
+    strength = np.empty(capacity)
+    count = 0
+    
+    for i in range(start, len(high)):
+        if swing_high[i]:
+            price[count] = pivot_high[i]
+            kind[count] = 1
+            strength[count] = weight[i]
+            count += 1
+        if swing_low[i]:
+            price[count] = pivot_low[i]
+            kind[count] = 0
+            strength[count] = weight[i]
+            count += 1
+        
+        # Touches strengthen a level; broken levels are dropped (order kept)
+        tolerance = (high[i] - low[i]) * 0.02
+        kept = 0
+        for j in range(count):
+            if abs(close[i] - price[j]) <= tolerance:
+                strength[j] += 0.5
+            if kind[j] == 1:
+                broken = high[i] > price[j] * 1.01
+            else:
+                broken = low[i] < price[j] * 0.99
+            if not broken:
+                price[kept] = price[j]
+                kind[kept] = kind[j]
+                strength[kept] = strength[j]
+                kept += 1
+        
+        # Keep only the strongest levels
+        order = np.argsort(-strength[:kept], kind='mergesort')
+        count = min(kept, max(max_levels, 0))
+        order = order[:count]
+        price[:count] = price[order]
+        kind[:count] = kind[order]
+        strength[:count] = strength[order]
+        
+        supports = np.empty(count)
+        resistances = np.empty(count)
+        n_support = 0
+        n_resistance = 0
+        for j in range(count):
+            if strength[j] >= min_strength:
+                if kind[j] == 0:
+                    supports[n_support] = price[j]
+                    n_support += 1
+                else:
+                    resistances[n_resistance] = price[j]
+                    n_resistance += 1
+        
+        support_order = np.argsort(-supports[:n_support], kind='mergesort')
+        for k in range(min(n_support, 3)):
+            out[i, k] = supports[support_order[k]]
+        resistance_order = np.argsort(resistances[:n_resistance], kind='mergesort')
+        for k in range(min(n_resistance, 3)):
+            out[i, 3 + k] = resistances[resistance_order[k]]
 
 
 class SupportResistanceIndicator(HybridIndicator):
@@ -72,135 +148,47 @@ class SupportResistanceIndicator(HybridIndicator):
         """
         Calculate Support and Resistance levels.
         
+        Swing detection and volume weights are vectorized; the level
+        bookkeeping (which carries state row to row) runs in _track_levels.
+        
         Returns DataFrame with support and resistance levels.
         """
-        result = pd.DataFrame(index=df.index)
-        
-        # Initialize columns
-        result['support_1'] = np.nan
-        result['support_2'] = np.nan
-        result['support_3'] = np.nan
-        result['resistance_1'] = np.nan
-        result['resistance_2'] = np.nan
-        result['resistance_3'] = np.nan
-        
-        levels = []
-        
-        for i in range(len(df)):
-            # Need enough data for pivot detection
-            if i < self.left_bars + self.right_bars:
-                continue
-            
-            # Check for swing high (resistance)
-            is_swing_high = True
-            pivot_high = df['high'].iloc[i - self.right_bars]
-            
-            for j in range(self.left_bars):
-                if df['high'].iloc[i - self.right_bars - self.left_bars + j] >= pivot_high:
-                    is_swing_high = False
-                    break
-            
-            if is_swing_high:
-                for j in range(self.right_bars):
-                    if df['high'].iloc[i - self.right_bars + j + 1] >= pivot_high:
-                        is_swing_high = False
-                        break
-            
-            if is_swing_high:
-                # Calculate strength
-                volume_weight = 1.0
-                if self.use_volume:
-                    avg_volume = df['volume'].iloc[i - self.right_bars - self.left_bars:i].mean()
-                    pivot_volume = df['volume'].iloc[i - self.right_bars]
-                    volume_weight = pivot_volume / avg_volume if avg_volume > 0 else 1.0
-                
-                strength = 1 * volume_weight
-                
-                # Add resistance level
-                levels.append({
-                    'price': pivot_high,
-                    'type': 'resistance',
-                    'strength': strength,
-                    'touches': 1,
-                    'index': i
-                })
-            
-            # Check for swing low (support)
-            is_swing_low = True
-            pivot_low = df['low'].iloc[i - self.right_bars]
-            
-            for j in range(self.left_bars):
-                if df['low'].iloc[i - self.right_bars - self.left_bars + j] <= pivot_low:
-                    is_swing_low = False
-                    break
-            
-            if is_swing_low:
-                for j in range(self.right_bars):
-                    if df['low'].iloc[i - self.right_bars + j + 1] <= pivot_low:
-                        is_swing_low = False
-                        break
-            
-            if is_swing_low:
-                # Calculate strength
-                volume_weight = 1.0
-                if self.use_volume:
-                    avg_volume = df['volume'].iloc[i - self.right_bars - self.left_bars:i].mean()
-                    pivot_volume = df['volume'].iloc[i - self.right_bars]
-                    volume_weight = pivot_volume / avg_volume if avg_volume > 0 else 1.0
-                
-                strength = 1 * volume_weight
-                
-                # Add support level
-                levels.append({
-                    'price': pivot_low,
-                    'type': 'support',
-                    'strength': strength,
-                    'touches': 1,
-                    'index': i
-                })
-            
-            # Update touches for existing levels
-            current_price = df['close'].iloc[i]
-            current_high = df['high'].iloc[i]
-            current_low = df['low'].iloc[i]
-            
-            for level in levels:
-                # Check if price touched the level
-                tolerance = (df['high'].iloc[i] - df['low'].iloc[i]) * 0.02  # 2% tolerance
-                
-                if abs(current_price - level['price']) <= tolerance:
-                    level['touches'] += 1
-                    level['strength'] += 0.5
-                
-                # Remove broken levels
-                if level['type'] == 'resistance' and current_high > level['price'] * 1.01:
-                    level['broken'] = True
-                elif level['type'] == 'support' and current_low < level['price'] * 0.99:
-                    level['broken'] = True
-            
-            # Remove broken levels
-            levels = [l for l in levels if not l.get('broken', False)]
-            
-            # Keep only strongest levels
-            levels = sorted(levels, key=lambda x: x['strength'], reverse=True)[:self.max_levels]
-            
-            # Assign to result
-            support_levels = [l for l in levels if l['type'] == 'support' and l['strength'] >= self.min_strength]
-            resistance_levels = [l for l in levels if l['type'] == 'resistance' and l['strength'] >= self.min_strength]
-            
-            support_levels = sorted(support_levels, key=lambda x: x['price'], reverse=True)[:3]
-            resistance_levels = sorted(resistance_levels, key=lambda x: x['price'])[:3]
-            
-            for idx, level in enumerate(support_levels):
-                result.loc[df.index[i], f'support_{idx+1}'] = level['price']
-            
-            for idx, level in enumerate(resistance_levels):
-                result.loc[df.index[i], f'resistance_{idx+1}'] = level['price']
+        high = df['high'].to_numpy(dtype=np.float64)
+        low = df['low'].to_numpy(dtype=np.float64)
+        close = df['close'].to_numpy(dtype=np.float64)
+        n = len(df)
+        span = self.left_bars + self.right_bars
+        
+        # Swing points are confirmed right_bars later: row i sees the pivot at i - right_bars
+        swing_high = strict_extrema(high, self.left_bars, self.right_bars, highs=True)
+        swing_low = strict_extrema(low, self.left_bars, self.right_bars, highs=False)
+        pivot_high = np.full(n, np.nan)
+        pivot_low = np.full(n, np.nan)
+        if n > self.right_bars:
+            pivot_high[self.right_bars:] = high[:n - self.right_bars]
+            pivot_low[self.right_bars:] = low[:n - self.right_bars]
+        
+        # Volume weight: pivot volume / mean volume of the span bars before row i
+        weight = np.ones(n)
+        if self.use_volume and span > 0 and n > span:
+            volume = df['volume'].to_numpy(dtype=np.float64)
+            with warnings.catch_warnings(), np.errstate(divide='ignore', invalid='ignore'):
+                warnings.simplefilter('ignore', RuntimeWarning)
+                avg_volume = np.nanmean(np.lib.stride_tricks.sliding_window_view(volume, span)[:n - span], axis=1)
+                pivot_volume = volume[self.left_bars:n - self.right_bars]
+                weight[span:] = np.where(avg_volume > 0, pivot_volume / avg_volume, 1.0)
+        
+        out = np.full((n, 6), np.nan)
+        _track_levels(high, low, close, pivot_high, pivot_low, swing_high, swing_low,
+                      weight, span, int(self.max_levels), float(self.min_strength), out)
+        
+        result = pd.DataFrame(out, index=df.index, columns=[
+            'support_1', 'support_2', 'support_3',
+            'resistance_1', 'resistance_2', 'resistance_3'
+        ])
         
         # Forward fill levels
-        result = result.fillna(method='ffill')
-        
-        return result
+        return result.ffill()
     
     def update(self, candle: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -12,10 +12,11 @@ Aligned with trend.json configuration.
 from typing import Any, Dict, Union
 import pandas as pd
 import numpy as np
-import pandas_ta as ta
 from collections import deque
 
 from .base import HybridIndicator
+from .lazy_import import pandas_ta as ta
+from .rolling import RollingRegression
 from .volatility import ATRIndicator
 
 
@@ -471,7 +472,7 @@ class SLOPEIndicator(HybridIndicator):
     def __init__(self, **params):
         super().__init__('slope', **params)
         self.length = params.get('length', 14)
-        self._price_window = deque(maxlen=self.length)
+        self._regression = RollingRegression(self.length)
     
     def calculate_bulk(self, df: pd.DataFrame) -> pd.Series:
         """Calculate SLOPE using pandas_ta."""
@@ -481,28 +482,14 @@ class SLOPEIndicator(HybridIndicator):
     def update(self, candle: Dict[str, Any]) -> float:
         """Update SLOPE incrementally (O(1))."""
         price = self._get_price_value(candle)
-        self._price_window.append(price)
+        self._regression.append(price)
         
-        if len(self._price_window) < self.length:
+        if not self._regression.full:
             self._value = None
             return self._value
         
-        # Calculate linear regression slope
-        n = len(self._price_window)
-        x = np.arange(n)
-        y = np.array(self._price_window)
-        
-        # Slope = (n*sum(xy) - sum(x)*sum(y)) / (n*sum(x^2) - sum(x)^2)
-        sum_x = x.sum()
-        sum_y = y.sum()
-        sum_xy = (x * y).sum()
-        sum_x2 = (x * x).sum()
-        
-        denominator = n * sum_x2 - sum_x * sum_x
-        if denominator != 0:
-            self._value = (n * sum_xy - sum_x * sum_y) / denominator
-        else:
-            self._value = 0.0
+        # Linear regression slope of the window (0.0 for a single point)
+        self._value = self._regression.slope()
         
         self.is_initialized = True
         return self._value
@@ -510,7 +497,7 @@ class SLOPEIndicator(HybridIndicator):
     def _initialize_state_from_dataframe(self, df: pd.DataFrame, result: pd.Series):
         """Initialize SLOPE state from historical data."""
         price = self._get_price_series(df)
-        self._price_window = deque(price.tail(self.length).values, maxlen=self.length)
+        self._regression = RollingRegression(self.length, price.tail(self.length).values)
 
 
 class VORTEXIndicator(HybridIndicator):
@@ -12,10 +12,10 @@ Aligned with volatility.json configuration.
 from typing import Any, Dict, Union
 import pandas as pd
 import numpy as np
-import pandas_ta as ta
-from collections import deque
 
 from .base import HybridIndicator
+from .lazy_import import pandas_ta as ta
+from .rolling import RollingMax, RollingMin, RollingMoments
 
 
 class ATRIndicator(HybridIndicator):
@@ -129,7 +129,7 @@ class BBANDSIndicator(HybridIndicator):
         super().__init__('bbands', **params)
         self.length = params.get('length', 20)
         self.std = params.get('std', 2)
-        self._price_window = deque(maxlen=self.length)
+        self._moments = RollingMoments(self.length)
     
     def calculate_bulk(self, df: pd.DataFrame) -> pd.DataFrame:
         """Calculate BBANDS using pandas_ta."""
@@ -139,18 +139,15 @@ class BBANDSIndicator(HybridIndicator):
     def update(self, candle: Dict[str, Any]) -> Dict[str, float]:
         """Update BBANDS incrementally (O(1))."""
         price = self._get_price_value(candle)
-        self._price_window.append(price)
+        self._moments.append(price)
         
-        if len(self._price_window) < self.length:
+        if not self._moments.full:
             self._value = None
             return self._value
         
-        # Calculate SMA (middle band)
-        sma = sum(self._price_window) / self.length
-        
-        # Calculate standard deviation
-        variance = sum((p - sma) ** 2 for p in self._price_window) / self.length
-        std_dev = variance ** 0.5
+        # SMA (middle band) and standard deviation of the window
+        sma = self._moments.mean
+        std_dev = self._moments.std
         
         # Calculate bands
         upper = sma + (self.std * std_dev)
@@ -171,7 +168,7 @@ class BBANDSIndicator(HybridIndicator):
     def _initialize_state_from_dataframe(self, df: pd.DataFrame, result: pd.DataFrame):
         """Initialize BBANDS state from historical data."""
         price = self._get_price_series(df)
-        self._price_window = deque(price.tail(self.length).values, maxlen=self.length)
+        self._moments = RollingMoments(self.length, price.tail(self.length).values)
 
 
 class KCIndicator(HybridIndicator):
@@ -251,8 +248,8 @@ class DONCHIANIndicator(HybridIndicator):
         self.lower_length = params.get('lower_length', 20)
         self.upper_length = params.get('upper_length', 20)
         
-        self._high_window = deque(maxlen=self.upper_length)
-        self._low_window = deque(maxlen=self.lower_length)
+        self._highest = RollingMax(self.upper_length)
+        self._lowest = RollingMin(self.lower_length)
     
     def calculate_bulk(self, df: pd.DataFrame) -> pd.DataFrame:
         """Calculate DONCHIAN using pandas_ta."""
@@ -262,16 +259,16 @@ class DONCHIANIndicator(HybridIndicator):
     
     def update(self, candle: Dict[str, Any]) -> Dict[str, float]:
         """Update DONCHIAN incrementally (O(1))."""
-        self._high_window.append(candle['high'])
-        self._low_window.append(candle['low'])
+        self._highest.append(candle['high'])
+        self._lowest.append(candle['low'])
         
-        if len(self._high_window) < self.upper_length or len(self._low_window) < self.lower_length:
+        if not (self._highest.full and self._lowest.full):
             self._value = None
             return self._value
         
         # Calculate channels
-        upper = max(self._high_window)
-        lower = min(self._low_window)
+        upper = self._highest.value
+        lower = self._lowest.value
         middle = (upper + lower) / 2.0
         
         self._value = {
@@ -284,9 +281,8 @@ class DONCHIANIndicator(HybridIndicator):
     
     def _initialize_state_from_dataframe(self, df: pd.DataFrame, result: pd.DataFrame):
         """Initialize DONCHIAN state from historical data."""
-        max_length = max(self.upper_length, self.lower_length)
-        self._high_window = deque(df['high'].tail(max_length).values, maxlen=self.upper_length)
-        self._low_window = deque(df['low'].tail(max_length).values, maxlen=self.lower_length)
+        self._highest = RollingMax(self.upper_length, df['high'].tail(self.upper_length).values)
+        self._lowest = RollingMin(self.lower_length, df['low'].tail(self.lower_length).values)
 
 
 class STDEVIndicator(HybridIndicator):
@@ -301,7 +297,7 @@ class STDEVIndicator(HybridIndicator):
     def __init__(self, **params):
         super().__init__('stdev', **params)
         self.length = params.get('length', 20)
-        self._price_window = deque(maxlen=self.length)
+        self._moments = RollingMoments(self.length)
     
     def calculate_bulk(self, df: pd.DataFrame) -> pd.Series:
         """Calculate STDEV using pandas_ta."""
@@ -311,18 +307,13 @@ class STDEVIndicator(HybridIndicator):
     def update(self, candle: Dict[str, Any]) -> float:
         """Update STDEV incrementally (O(1))."""
         price = self._get_price_value(candle)
-        self._price_window.append(price)
+        self._moments.append(price)
         
-        if len(self._price_window) < self.length:
+        if not self._moments.full:
             self._value = None
             return self._value
         
-        # Calculate mean
-        mean = sum(self._price_window) / self.length
-        
-        # Calculate standard deviation
-        variance = sum((p - mean) ** 2 for p in self._price_window) / self.length
-        self._value = variance ** 0.5
+        self._value = self._moments.std
         
         self.is_initialized = True
         return self._value
@@ -330,7 +321,7 @@ class STDEVIndicator(HybridIndicator):
     def _initialize_state_from_dataframe(self, df: pd.DataFrame, result: pd.Series):
         """Initialize STDEV state from historical data."""
         price = self._get_price_series(df)
-        self._price_window = deque(price.tail(self.length).values, maxlen=self.length)
+        self._moments = RollingMoments(self.length, price.tail(self.length).values)
 
 
 class VARIANCEIndicator(HybridIndicator):
@@ -345,7 +336,7 @@ class VARIANCEIndicator(HybridIndicator):
     def __init__(self, **params):
         super().__init__('variance', **params)
         self.length = params.get('length', 20)
-        self._price_window = deque(maxlen=self.length)
+        self._moments = RollingMoments(self.length)
     
     def calculate_bulk(self, df: pd.DataFrame) -> pd.Series:
         """Calculate VARIANCE using pandas_ta."""
@@ -355,17 +346,13 @@ class VARIANCEIndicator(HybridIndicator):
     def update(self, candle: Dict[str, Any]) -> float:
         """Update VARIANCE incrementally (O(1))."""
         price = self._get_price_value(candle)
-        self._price_window.append(price)
+        self._moments.append(price)
         
-        if len(self._price_window) < self.length:
+        if not self._moments.full:
             self._value = None
             return self._value
         
-        # Calculate mean
-        mean = sum(self._price_window) / self.length
-        
-        # Calculate variance
-        self._value = sum((p - mean) ** 2 for p in self._price_window) / self.length
+        self._value = self._moments.variance
         
         self.is_initialized = True
         return self._value
@@ -373,4 +360,4 @@ class VARIANCEIndicator(HybridIndicator):
     def _initialize_state_from_dataframe(self, df: pd.DataFrame, result: pd.Series):
         """Initialize VARIANCE state from historical data."""
         price = self._get_price_series(df)
-        self._price_window = deque(price.tail(self.length).values, maxlen=self.length)
+        self._moments = RollingMoments(self.length, price.tail(self.length).values)
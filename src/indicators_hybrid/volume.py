@@ -12,10 +12,10 @@ Aligned with volume.json configuration.
 from typing import Any, Dict, Union
 import pandas as pd
 import numpy as np
-import pandas_ta as ta
 from collections import deque
 
 from .base import HybridIndicator
+from .lazy_import import pandas_ta as ta
 
 
 class OBVIndicator(HybridIndicator):
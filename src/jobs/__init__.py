@@ -1,4 +1,8 @@
 """Jobs module for backtest execution"""
 from .job_manager import JobManager, BacktestJob, get_job_manager
+from .job_executor import JobExecutor, ExecutionJob, JobRejectedError, TaskResult, get_job_executor
 
-__all__ = ['JobManager', 'BacktestJob', 'get_job_manager']
+__all__ = [
+    'JobManager', 'BacktestJob', 'get_job_manager',
+    'JobExecutor', 'ExecutionJob', 'JobRejectedError', 'TaskResult', 'get_job_executor'
+]
@@ -0,0 +1,356 @@
+"""
+Job Executor
+Runs CPU-bound backtest work in one bounded process pool, off the event loop
+
+The API handlers used to call run_dashboard_backtest /
+run_multi_strategy_backtest directly inside `async def` endpoints, so a
+single request held the uvicorn event loop (health checks, every other SSE
+stream) for the whole run. The executor runs that work in a process pool
+shared by all requests and hands each finished task back to the event
+loop through an asyncio queue:
+
+    session_id = new_session_id()  # days of one job share a BacktestSession per worker
+    job = get_job_executor().submit(run_dashboard_day, [(strategy_id, d, session_id) for d in dates],
+                                    user_id=user_id, strategy_id=strategy_id)
+    async for task in job:            # completion order
+        ...
+    async for task in job.ordered():  # submission order
+        ...
+
+Each job keeps at most `max_in_flight` tasks in the pool and feeds the
+next one as a task finishes, so a long date range does not queue ahead of
+every other user's work.
+
+Admission control (submit raises JobRejectedError):
+    - a user may have max_active_per_user active jobs (JobManager)
+    - no new job while max_queued tasks are already waiting for a worker
+
+Bookkeeping (counters, job status) happens on the event loop thread; pool
+callbacks only schedule it there.
+
+A worker that dies (e.g. OOM-killed on a large day) breaks the whole
+process pool: its in-flight tasks fail with BrokenProcessPool, and the
+next submit replaces the pool. A task that still cannot be scheduled fails
+together with the job's remaining tasks, so every job reaches a terminal
+status.
+
+Configuration (environment):
+    BACKTEST_JOB_WORKERS       - pool processes (default: CPU count)
+    BACKTEST_JOB_MAX_QUEUED    - waiting tasks before new jobs are rejected (default: 256)
+    BACKTEST_JOB_MAX_PER_USER  - active jobs per user (default: 1)
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from .job_manager import BacktestJob, JobManager, get_job_manager
+
+logger = logging.getLogger(__name__)
+
+
+class JobRejectedError(Exception):
+    """Job not admitted (reason: 'user_limit' or 'queue_full')"""
+
+    def __init__(self, message: str, reason: str):
+        super().__init__(message)
+        self.reason = reason
+
+
+@dataclass
+class TaskResult:
+    """Outcome of one task of a job"""
+    index: int
+    args: Tuple[Any, ...]
+    result: Any = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def run_multi_strategy_day(strategy_ids: List[str], backtest_date, scales: Optional[Dict[str, float]] = None,
+                           queue_entries: Optional[Dict[str, Any]] = None,
+                           session_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Worker entry point: run a multi-strategy day via show_dashboard_data.
+
+    Imported lazily so the module is loaded inside the worker process.
+    """
+    from show_dashboard_data import run_multi_strategy_backtest
+    return run_multi_strategy_backtest(strategy_ids=strategy_ids, backtest_date=backtest_date, scales=scales,
+                                       queue_entries=queue_entries, session_id=session_id)
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+class ExecutionJob:
+    """Handle of a submitted job: async iteration over its task results"""
+
+    def __init__(self, executor: 'JobExecutor', job: BacktestJob, fn: Callable[..., Any],
+                 calls: Sequence[Tuple[Any, ...]], max_in_flight: int):
+        self.executor = executor
+        self.job = job
+        self.fn = fn
+        self.total = len(calls)
+        self.max_in_flight = max(1, max_in_flight)
+        self.failed = 0
+
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._held: Deque[Tuple[int, Tuple[Any, ...]]] = deque(enumerate(tuple(args) for args in calls))
+        self._futures: Dict[int, Future] = {}
+        self._results: Dict[int, TaskResult] = {}
+        self._consumed = False
+
+    @property
+    def job_id(self) -> str:
+        return self.job.job_id
+
+    @property
+    def done(self) -> bool:
+        return len(self._results) == self.total
+
+    # ------------------------------------------------------------------
+    # Scheduling (event loop thread)
+    # ------------------------------------------------------------------
+
+    def _fill(self) -> None:
+        while self._held and len(self._futures) < self.max_in_flight:
+            index, args = self._held.popleft()
+            try:
+                future = self.executor._submit(self.fn, args)
+            except Exception as e:
+                logger.error(f"❌ Job {self.job_id} task {index} could not be scheduled: {e}")
+                self._held.appendleft((index, args))
+                self._fail_held(f"not scheduled: {e}")
+                return
+            self._futures[index] = future
+            self.executor._in_pool_tasks += 1
+            future.add_done_callback(lambda f, i=index, a=args: self._schedule_done(i, a, f))
+
+    def _schedule_done(self, index: int, args: Tuple[Any, ...], future: Future) -> None:
+        """Pool thread: hand the finished task to the event loop"""
+        try:
+            self._loop.call_soon_threadsafe(self._task_done, index, args, future)
+        except RuntimeError:
+            pass  # Event loop already closed
+
+    def _task_done(self, index: int, args: Tuple[Any, ...], future: Future) -> None:
+        self._futures.pop(index, None)
+        self.executor._in_pool_tasks -= 1
+        task = TaskResult(index, args)
+        try:
+            task.result = future.result()
+        except CancelledError:
+            task.error = 'cancelled'
+        except Exception as e:
+            logger.error(f"❌ Job {self.job_id} task {index} failed: {e}")
+            task.error = str(e)
+        self._finish(task)
+        self._fill()
+
+    def _finish(self, task: TaskResult) -> None:
+        self._results[task.index] = task
+        self.failed += not task.ok
+        self.executor._task_finished(task)
+        self._queue.put_nowait(task)
+
+        progress = {'completed': len(self._results), 'failed': self.failed, 'total': self.total}
+        if self.done:
+            error = f"{self.failed}/{self.total} tasks failed" if self.failed else None
+            self.executor.job_manager.update_job_status(self.job_id, 'failed' if error else 'completed',
+                                                        error=error, progress=progress)
+        else:
+            self.executor.job_manager.update_job_status(self.job_id, 'running', progress=progress)
+
+    def _fail_held(self, error: str) -> None:
+        while self._held:
+            index, args = self._held.popleft()
+            self._finish(TaskResult(index, args, error=error))
+
+    def cancel(self) -> None:
+        """Drop tasks that have not started (consumer went away)"""
+        self._fail_held('cancelled')
+        for future in list(self._futures.values()):
+            future.cancel()
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    def __aiter__(self) -> AsyncIterator[TaskResult]:
+        return self._completed()
+
+    async def _completed(self) -> AsyncIterator[TaskResult]:
+        if self._consumed:
+            raise RuntimeError(f"Job {self.job_id} results were already consumed")
+        self._consumed = True
+        for _ in range(self.total):
+            yield await self._queue.get()
+
+    async def ordered(self) -> AsyncIterator[TaskResult]:
+        """Task results in submission order"""
+        next_index = 0
+        async for _ in self:
+            while next_index in self._results:
+                yield self._results[next_index]
+                next_index += 1
+
+    async def results(self) -> List[TaskResult]:
+        """Wait for every task; results in submission order"""
+        return [task async for task in self.ordered()]
+
+
+class JobExecutor:
+    """
+    Shared process pool with admission control for backtest jobs.
+
+    Usage:
+        executor = get_job_executor()
+        job = executor.submit(run_dashboard_day, [(strategy_id, test_date)], user_id=user_id)
+        daily_data = (await job.results())[0].result
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_queued: Optional[int] = None,
+        max_active_per_user: Optional[int] = None,
+        job_manager: Optional[JobManager] = None,
+        start_method: str = 'spawn'
+    ):
+        """
+        Initialize executor.
+
+        Args:
+            max_workers: Pool processes (None = BACKTEST_JOB_WORKERS / CPU count)
+            max_queued: Waiting tasks before new jobs are rejected (None = BACKTEST_JOB_MAX_QUEUED)
+            max_active_per_user: Active jobs per user (None = BACKTEST_JOB_MAX_PER_USER)
+            job_manager: Job records (default: a private JobManager)
+            start_method: multiprocessing start method. 'spawn' avoids forking
+                the API server's threads and open ClickHouse connections.
+        """
+        self.max_workers = max(1, max_workers or _env_int('BACKTEST_JOB_WORKERS', os.cpu_count() or 1))
+        self.max_queued = max_queued if max_queued is not None else _env_int('BACKTEST_JOB_MAX_QUEUED', 256)
+        self.job_manager = job_manager or JobManager()
+        self.job_manager.max_active_per_user = (
+            max_active_per_user if max_active_per_user is not None else _env_int('BACKTEST_JOB_MAX_PER_USER', 1)
+        )
+        self.start_method = start_method
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._unfinished_tasks = 0
+        self._in_pool_tasks = 0
+        self.stats = {'submitted_jobs': 0, 'rejected_jobs': 0, 'completed_tasks': 0, 'failed_tasks': 0,
+                      'pool_restarts': 0}
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            context = multiprocessing.get_context(self.start_method)
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+            logger.info(f"🚀 Job executor started with {self.max_workers} worker(s)")
+        return self._executor
+
+    def _submit(self, fn: Callable[..., Any], args: Tuple[Any, ...]) -> Future:
+        """Submit one task, replacing the pool once if a worker died."""
+        try:
+            return self._pool().submit(fn, *args)
+        except BrokenProcessPool:
+            logger.warning("⚠️  Job executor pool is broken (a worker died), starting a new one")
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self.stats['pool_restarts'] += 1
+            return self._pool().submit(fn, *args)
+
+    @property
+    def queued_tasks(self) -> int:
+        """Tasks of active jobs not yet running on a worker"""
+        return self._unfinished_tasks - min(self._in_pool_tasks, self.max_workers)
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        calls: Sequence[Tuple[Any, ...]],
+        user_id: str,
+        strategy_id: str = '',
+        start_date: str = '',
+        end_date: str = '',
+        max_in_flight: Optional[int] = None
+    ) -> ExecutionJob:
+        """
+        Admit a job and start its tasks (call from the event loop).
+
+        Args:
+            fn: Picklable module-level callable run once per call
+            calls: Positional arguments of each task
+            user_id: Owner for the per-user limit
+            strategy_id, start_date, end_date: Job record details
+            max_in_flight: Tasks of this job in the pool at once (None = max_workers)
+
+        Raises:
+            JobRejectedError: User limit reached or pool backlog full
+        """
+        # User limit first (JobManager raises ValueError), then the pool backlog
+        user_at_limit = self.job_manager.count_active_jobs(user_id) >= self.job_manager.max_active_per_user
+        if not user_at_limit and self.queued_tasks >= self.max_queued:
+            self.stats['rejected_jobs'] += 1
+            raise JobRejectedError(f"Backtest queue is full ({self.queued_tasks} tasks waiting)", 'queue_full')
+        try:
+            job = self.job_manager.create_job(user_id, strategy_id, start_date, end_date)
+        except ValueError as e:
+            self.stats['rejected_jobs'] += 1
+            raise JobRejectedError(str(e), 'user_limit') from e
+
+        execution = ExecutionJob(self, job, fn, calls, min(max_in_flight or self.max_workers, self.max_workers))
+        self.stats['submitted_jobs'] += 1
+        self._unfinished_tasks += execution.total
+
+        if execution.total == 0:
+            self.job_manager.update_job_status(job.job_id, 'completed', progress={'completed': 0, 'total': 0})
+            return execution
+
+        self.job_manager.update_job_status(job.job_id, 'running')
+        execution._fill()
+        return execution
+
+    def _task_finished(self, task: TaskResult) -> None:
+        self._unfinished_tasks -= 1
+        self.stats['completed_tasks' if task.ok else 'failed_tasks'] += 1
+
+    def metrics(self) -> Dict[str, Any]:
+        """Pool size, queue depth and job counters"""
+        return {
+            'workers': self.max_workers,
+            'max_queued': self.max_queued,
+            'max_active_per_user': self.job_manager.max_active_per_user,
+            'active_jobs': self.job_manager.count_active_jobs(),
+            'running_tasks': self._unfinished_tasks - self.queued_tasks,
+            'queued_tasks': self.queued_tasks,
+            **self.stats
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+
+# Singleton instance
+_job_executor = None
+
+def get_job_executor() -> JobExecutor:
+    """Get singleton job executor (job records in the shared JobManager)"""
+    global _job_executor
+    if _job_executor is None:
+        _job_executor = JobExecutor(job_manager=get_job_manager())
+    return _job_executor
@@ -1,10 +1,10 @@
 """
 Job Manager for Backtest Execution
-Manages job queue and prevents concurrent backtests per user
+Manages job queue and limits concurrent backtests per user
 """
 import uuid
 from datetime import datetime
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 
 
@@ -31,9 +31,10 @@ class BacktestJob:
 class JobManager:
     """Manages backtest jobs"""
     
-    def __init__(self):
+    def __init__(self, max_active_per_user: int = 1):
         self.jobs: Dict[str, BacktestJob] = {}
-        self.active_user_jobs: Dict[str, str] = {}  # user_id -> job_id
+        self.active_user_jobs: Dict[str, List[str]] = {}  # user_id -> job_ids (oldest first)
+        self.max_active_per_user = max_active_per_user
     
     def create_job(
         self,
@@ -55,14 +56,15 @@ class JobManager:
             BacktestJob instance
         
         Raises:
-            ValueError: If user already has an active job
+            ValueError: If user already has max_active_per_user active jobs
         """
-        # Check if user has active job
-        if user_id in self.active_user_jobs:
-            existing_job_id = self.active_user_jobs[user_id]
-            existing_job = self.jobs.get(existing_job_id)
-            if existing_job and existing_job.status in ['queued', 'running']:
-                raise ValueError(f"User already has an active job: {existing_job_id}")
+        # Check the user's active jobs
+        active_job_ids = [
+            job_id for job_id in self.active_user_jobs.get(user_id, [])
+            if job_id in self.jobs and self.jobs[job_id].status in ['queued', 'running']
+        ]
+        if len(active_job_ids) >= self.max_active_per_user:
+            raise ValueError(f"User already has an active job: {', '.join(active_job_ids)}")
         
         # Generate job ID
         job_id = f"bt_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
@@ -80,7 +82,7 @@ class JobManager:
         
         # Store job
         self.jobs[job_id] = job
-        self.active_user_jobs[user_id] = job_id
+        self.active_user_jobs[user_id] = active_job_ids + [job_id]
         
         return job
     
@@ -108,8 +110,11 @@ class JobManager:
         if status in ['completed', 'failed']:
             job.completed_at = datetime.now().isoformat()
             # Remove from active jobs
-            if job.user_id in self.active_user_jobs:
-                del self.active_user_jobs[job.user_id]
+            active_job_ids = self.active_user_jobs.get(job.user_id, [])
+            if job_id in active_job_ids:
+                active_job_ids.remove(job_id)
+            if not active_job_ids:
+                self.active_user_jobs.pop(job.user_id, None)
         
         if error:
             job.error = error
@@ -118,12 +123,18 @@ class JobManager:
             job.progress = progress
     
     def get_active_job_for_user(self, user_id: str) -> Optional[BacktestJob]:
-        """Get active job for user"""
-        job_id = self.active_user_jobs.get(user_id)
-        if job_id:
-            return self.jobs.get(job_id)
+        """Get active job for user (oldest if several)"""
+        job_ids = self.active_user_jobs.get(user_id)
+        if job_ids:
+            return self.jobs.get(job_ids[0])
         return None
     
+    def count_active_jobs(self, user_id: Optional[str] = None) -> int:
+        """Active (queued / running) jobs of one user, or of all users"""
+        if user_id is not None:
+            return len(self.active_user_jobs.get(user_id, []))
+        return sum(len(job_ids) for job_ids in self.active_user_jobs.values())
+    
     def cleanup_old_jobs(self, max_age_hours: int = 24) -> int:
         """
         Clean up old completed/failed jobs
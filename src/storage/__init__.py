@@ -1,4 +1,10 @@
 """Storage module for backtest data"""
 from .backtest_storage import BacktestStorage, get_storage
+from .local_tick_store import LocalTickStore, get_local_tick_store
+from .indicator_state_store import IndicatorStateStore, get_indicator_state_store
+from .results_catalog import ResultsCatalog, get_results_catalog
 
-__all__ = ['BacktestStorage', 'get_storage']
+__all__ = [
+    'BacktestStorage', 'get_storage', 'LocalTickStore', 'get_local_tick_store',
+    'IndicatorStateStore', 'get_indicator_state_store', 'ResultsCatalog', 'get_results_catalog'
+]
@@ -1,6 +1,10 @@
 """
 Backtest Storage Module
 Handles file-based storage of backtest results with compression
+
+Stored strategies and days are indexed in a ResultsCatalog
+(<base_path>/catalog.sqlite3), so listing and TTL cleanup answer from the
+catalog instead of scanning folders and reading every metadata.json.
 """
 import gzip
 import json
@@ -10,6 +14,8 @@ from pathlib import Path
 from datetime import datetime, timedelta, date, time
 from typing import Dict, Any, List, Optional
 
+from .results_catalog import ResultsCatalog
+
 class DateTimeEncoder(json.JSONEncoder):
     """Custom JSON encoder that handles datetime objects"""
     def default(self, obj):
@@ -28,6 +34,36 @@ class BacktestStorage:
     def __init__(self, base_path: str = "backtest_data"):
         self.base_path = Path(base_path)
         self.base_path.mkdir(exist_ok=True)
+
+        catalog_path = self.base_path / "catalog.sqlite3"
+        is_new_catalog = not catalog_path.exists()
+        self.catalog = ResultsCatalog(str(catalog_path))
+        if is_new_catalog:
+            self._import_existing()
+
+    def _import_existing(self) -> None:
+        """Catalog strategies and days stored before the catalog existed (one scan)."""
+        for metadata_file in self.base_path.glob("*/*/metadata.json"):
+            strategy_folder = metadata_file.parent
+            user_id, strategy_id = strategy_folder.parent.name, strategy_folder.name
+            try:
+                with open(metadata_file, 'r') as f:
+                    metadata = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                continue
+            self._record_metadata(user_id, strategy_id, metadata)
+            for day_file in strategy_folder.glob("*.json.gz"):
+                self.catalog.record_day(strategy_id, day_file.name[:-len(".json.gz")], path=str(day_file),
+                                        size_bytes=day_file.stat().st_size, owner=user_id)
+
+    def _record_metadata(self, user_id: str, strategy_id: str, metadata: Dict[str, Any]) -> None:
+        created_at = metadata.get('created_at')
+        if isinstance(created_at, str):
+            created_at = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+        if isinstance(created_at, datetime):
+            created_at = created_at.timestamp()
+        self.catalog.record_backtest(strategy_id, created_at=created_at, backtest_id=metadata.get('backtest_id'),
+                                     owner=user_id)
     
     def get_user_folder(self, user_id: str) -> Path:
         """Get user folder path"""
@@ -46,14 +82,11 @@ class BacktestStorage:
         strategy_folder = self.get_strategy_folder(user_id, strategy_id)
         
         # Count files and calculate size
-        file_count = 0
-        total_size = 0
+        deleted = self.catalog.delete_strategy(strategy_id, owner=user_id)
+        file_count = deleted['days']
+        total_size = deleted['bytes']
         
         if strategy_folder.exists():
-            for file in strategy_folder.glob("*.json.gz"):
-                total_size += file.stat().st_size
-                file_count += 1
-            
             # Also count metadata
             metadata_file = strategy_folder / "metadata.json"
             if metadata_file.exists():
@@ -77,6 +110,8 @@ class BacktestStorage:
         
         with open(metadata_file, 'w', encoding='utf-8') as f:
             json.dump(metadata, f, indent=2, cls=DateTimeEncoder)
+
+        self._record_metadata(user_id, strategy_id, metadata)
     
     def load_metadata(self, user_id: str, strategy_id: str) -> Optional[Dict[str, Any]]:
         """Load backtest metadata"""
@@ -105,6 +140,9 @@ class BacktestStorage:
         # Write compressed JSON with custom encoder
         with gzip.open(day_file, 'wt', encoding='utf-8') as f:
             json.dump(day_data, f, cls=DateTimeEncoder, indent=2)
+
+        self.catalog.record_day(strategy_id, date, summary=day_data.get('summary'), path=str(day_file),
+                                size_bytes=day_file.stat().st_size, owner=user_id)
     
     def load_day_data(self, user_id: str, strategy_id: str, date: str) -> Optional[Dict[str, Any]]:
         """
@@ -147,20 +185,14 @@ class BacktestStorage:
     
     def list_dates(self, user_id: str, strategy_id: str) -> List[Dict[str, Any]]:
         """List all available dates with file sizes"""
-        strategy_folder = self.get_strategy_folder(user_id, strategy_id)
-        
-        dates = []
-        for file in sorted(strategy_folder.glob("*.json.gz")):
-            date_str = file.stem  # Remove .json.gz
-            file_size = file.stat().st_size
-            
-            dates.append({
-                "date": date_str,
-                "file_size_kb": round(file_size / 1024, 2),
-                "file_path": str(file)
-            })
-        
-        return dates
+        return [
+            {
+                "date": day['date'],
+                "file_size_kb": round(day['bytes'] / 1024, 2),
+                "file_path": day['path']
+            }
+            for day in self.catalog.list_days(strategy_id, owner=user_id)
+        ]
     
     def cleanup_expired(self, ttl_hours: int = 12) -> Dict[str, Any]:
         """
@@ -177,45 +209,22 @@ class BacktestStorage:
         deleted_strategies = 0
         freed_space = 0
         
-        # Scan all user folders
-        for user_folder in self.base_path.iterdir():
-            if not user_folder.is_dir():
-                continue
+        for user_id, strategy_id in self.catalog.expired_backtests(cutoff_time.timestamp()):
+            strategy_folder = self.base_path / user_id / strategy_id
             
-            # Scan strategy folders
-            for strategy_folder in user_folder.iterdir():
-                if not strategy_folder.is_dir():
-                    continue
-                
-                metadata_file = strategy_folder / "metadata.json"
-                
-                if not metadata_file.exists():
-                    continue
+            if strategy_folder.exists():
+                # Calculate size
+                freed_space += sum(
+                    f.stat().st_size 
+                    for f in strategy_folder.glob("**/*") 
+                    if f.is_file()
+                )
                 
-                # Check creation time
-                with open(metadata_file, 'r') as f:
-                    metadata = json.load(f)
-                
-                created_at_str = metadata.get('created_at')
-                if not created_at_str:
-                    continue
-                
-                created_at = datetime.fromisoformat(created_at_str.replace('Z', '+00:00'))
-                
-                # If expired, delete
-                if created_at < cutoff_time:
-                    # Calculate size
-                    folder_size = sum(
-                        f.stat().st_size 
-                        for f in strategy_folder.glob("**/*") 
-                        if f.is_file()
-                    )
-                    
-                    # Delete folder
-                    shutil.rmtree(strategy_folder)
-                    
-                    deleted_strategies += 1
-                    freed_space += folder_size
+                # Delete folder
+                shutil.rmtree(strategy_folder)
+            
+            self.catalog.delete_strategy(strategy_id, owner=user_id)
+            deleted_strategies += 1
         
         return {
             "deleted_strategies": deleted_strategies,
@@ -8,6 +8,27 @@ from typing import Optional
 
 _client_instance: Optional[clickhouse_connect.driver.Client] = None
 
+def create_clickhouse_client():
+    """
+    Create a new ClickHouse client from environment variables.
+    
+    Clients run one query per session at a time, so background threads
+    that query while the shared client is busy need their own.
+    """
+    host = os.getenv('CLICKHOUSE_HOST', 'localhost')
+    port = int(os.getenv('CLICKHOUSE_PORT', '8123'))
+    user = os.getenv('CLICKHOUSE_USER', 'tradelayout')
+    password = os.getenv('CLICKHOUSE_PASSWORD', 'Unificater123*')
+    database = os.getenv('CLICKHOUSE_DATABASE', 'tradelayout')
+    
+    return clickhouse_connect.get_client(
+        host=host,
+        port=port,
+        username=user,
+        password=password,
+        database=database
+    )
+
 def get_clickhouse_client():
     """
     Get or create ClickHouse client instance
@@ -18,18 +39,10 @@ def get_clickhouse_client():
     if _client_instance is None:
         host = os.getenv('CLICKHOUSE_HOST', 'localhost')
         port = int(os.getenv('CLICKHOUSE_PORT', '8123'))
-        user = os.getenv('CLICKHOUSE_USER', 'tradelayout')
-        password = os.getenv('CLICKHOUSE_PASSWORD', 'Unificater123*')
         database = os.getenv('CLICKHOUSE_DATABASE', 'tradelayout')
         
         try:
-            _client_instance = clickhouse_connect.get_client(
-                host=host,
-                port=port,
-                username=user,
-                password=password,
-                database=database
-            )
+            _client_instance = create_clickhouse_client()
             print(f"✅ ClickHouse client connected: {host}:{port}/{database}")
         except Exception as e:
             print(f"❌ Failed to connect to ClickHouse: {e}")
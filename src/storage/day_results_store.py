@@ -0,0 +1,345 @@
+"""
+Day Results Store
+Per-day backtest results (trades, positions, node events) as Arrow IPC files
+
+save_daily_files used to write trades_daily.json.gz and
+diagnostics_export.json.gz with json.dump(indent=2) through gzip text mode,
+and every read (trades / diagnostics endpoints, day download) parsed or
+re-compressed the whole document. This store writes each day as
+zstd-compressed Arrow IPC files that are read back memory-mapped, so
+readers can select columns, rows and single nodes without decoding the
+rest of the day.
+
+Layout (inside the day directory):
+    <day_dir>/trades.arrow     one row per trade; schema metadata: date, summary
+    <day_dir>/positions.arrow  one row per raw dashboard position
+    <day_dir>/events.arrow     one row per node event: header columns
+                               (execution_id, node_id, event_type, ...) plus
+                               the rest of the event as a JSON 'payload' column
+
+Column encoding: a column whose values are all one scalar type (str, int,
+float, bool; None allowed) is stored natively. Anything else (nested
+dicts / lists, mixed types, keys missing from some rows) is stored as JSON
+text and tagged encoding=json in the field metadata, so records read back
+as they were written. Values JSON cannot hold come back in their JSON form
+(datetimes as ISO strings, NumPy scalars as Python numbers). Event header
+columns follow the same rules; an event's execution_id is always its
+events_history key.
+
+Reads only decompress what they need: the fields being returned or
+filtered on (IpcReadOptions.included_fields), and record batches up to the
+end of the requested offset / limit.
+
+Legacy JSON documents (trades_daily.json / diagnostics_export.json shape)
+are produced on request by streaming one record batch at a time
+(iter_trades_json / iter_diagnostics_json). The file is opened and read
+when the iterator is created, so a corrupt file raises before any output.
+
+Configuration (environment):
+    RESULTS_FORMAT  - 'arrow' (default when pyarrow is installed) / 'json'
+"""
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.ipc as pa_ipc
+except ImportError:
+    pa = None
+    pc = None
+    pa_ipc = None
+
+logger = logging.getLogger(__name__)
+
+TRADES_FILE = 'trades.arrow'
+POSITIONS_FILE = 'positions.arrow'
+EVENTS_FILE = 'events.arrow'
+
+BATCH_ROWS = 1000
+EVENT_HEADER = ('execution_id', 'parent_execution_id', 'timestamp', 'event_type', 'node_id', 'node_name',
+                'node_type')
+
+_JSON = b'json'
+_MISSING = object()
+
+
+def results_format() -> str:
+    """RESULTS_FORMAT=json selects the legacy gzipped JSON day files."""
+    if pa is None:
+        return 'json'
+    return 'json' if os.getenv('RESULTS_FORMAT', 'arrow').lower() == 'json' else 'arrow'
+
+
+def has_day_results(day_dir: str) -> bool:
+    """True if the day was saved in the Arrow format."""
+    return pa is not None and (Path(day_dir) / TRADES_FILE).exists()
+
+
+# ----------------------------------------------------------------------
+# Encoding
+# ----------------------------------------------------------------------
+
+def _json_default(obj: Any) -> Any:
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    if hasattr(obj, 'item'):  # NumPy scalars
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, default=_json_default, separators=(',', ':'))
+
+
+_NATIVE_TYPES = {str: pa.string(), int: pa.int64(), float: pa.float64(), bool: pa.bool_()} if pa else {}
+
+
+def _column(name: str, values: List[Any]) -> Tuple['pa.Field', 'pa.Array']:
+    """(field, array) for one column, native when it has a single scalar type."""
+    kinds = {type(value) for value in values if value is not None and value is not _MISSING}
+    if _MISSING not in values and len(kinds) <= 1:
+        arrow_type = _NATIVE_TYPES.get(next(iter(kinds))) if kinds else pa.string()
+        if arrow_type is not None:
+            try:
+                return pa.field(name, arrow_type), pa.array(values, type=arrow_type)
+            except (pa.ArrowInvalid, OverflowError):
+                pass
+
+    # JSON text: Arrow null = key missing from the record, 'null' = None
+    encoded = [None if value is _MISSING else _dumps(value) for value in values]
+    return pa.field(name, pa.string(), metadata={b'encoding': _JSON}), pa.array(encoded, type=pa.string())
+
+
+def _records_table(records: Sequence[Dict[str, Any]], metadata: Optional[Dict[str, Any]] = None) -> 'pa.Table':
+    names: Dict[str, None] = {}
+    for record in records:
+        names.update(dict.fromkeys(record))
+
+    fields, arrays = [], []
+    for name in names:
+        field, array = _column(name, [record.get(name, _MISSING) for record in records])
+        fields.append(field)
+        arrays.append(array)
+
+    schema_metadata = {key.encode(): _dumps(value).encode() for key, value in (metadata or {}).items()}
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields, metadata=schema_metadata or None))
+
+
+def _events_table(events_history: Dict[str, Dict[str, Any]]) -> 'pa.Table':
+    fields, arrays = [], []
+    for key in EVENT_HEADER:
+        if key == 'execution_id':
+            values = list(events_history)
+        else:
+            values = [event.get(key, _MISSING) for event in events_history.values()]
+        field, array = _column(key, values)
+        fields.append(field)
+        arrays.append(array)
+
+    payloads = [_dumps({key: value for key, value in event.items() if key not in EVENT_HEADER})
+                for event in events_history.values()]
+    fields.append(pa.field('payload', pa.string(), metadata={b'encoding': b'payload'}))
+    arrays.append(pa.array(payloads, type=pa.string()))
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+
+def _write(path: Path, table: 'pa.Table') -> None:
+    """Write a table (zstd record batches) atomically."""
+    tmp_path = path.with_suffix(f".tmp.{os.getpid()}")
+    options = pa_ipc.IpcWriteOptions(compression='zstd' if pa.Codec.is_available('zstd') else None)
+    try:
+        with pa.OSFile(str(tmp_path), 'wb') as sink:
+            with pa_ipc.new_file(sink, table.schema, options=options) as writer:
+                writer.write_table(table, max_chunksize=BATCH_ROWS)
+        os.replace(tmp_path, path)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_day_results(day_dir: str, trades_data: Dict[str, Any], positions: Sequence[Dict[str, Any]],
+                      events_history: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Save one day's results.
+
+    Args:
+        day_dir: Day directory (created if missing)
+        trades_data: {'date', 'summary', 'trades': [...]} (trades_daily shape)
+        positions: Raw dashboard positions
+        events_history: {execution_id: event} (diagnostics_export shape)
+    """
+    path = Path(day_dir)
+    path.mkdir(parents=True, exist_ok=True)
+
+    trades_metadata = {'date': trades_data.get('date'), 'summary': trades_data.get('summary', {})}
+    _write(path / TRADES_FILE, _records_table(trades_data.get('trades', []), trades_metadata))
+    _write(path / POSITIONS_FILE, _records_table(positions))
+    _write(path / EVENTS_FILE, _events_table(events_history))
+
+
+# ----------------------------------------------------------------------
+# Reading
+# ----------------------------------------------------------------------
+
+def read_metadata(day_dir: str) -> Dict[str, Any]:
+    """Schema metadata of trades.arrow ({'date', 'summary'})."""
+    with pa.memory_map(str(Path(day_dir) / TRADES_FILE), 'r') as source:
+        metadata = pa_ipc.open_file(source).schema.metadata or {}
+    return {key.decode(): json.loads(value) for key, value in metadata.items()}
+
+
+def read_table(day_dir: str, name: str, columns: Optional[Sequence[str]] = None,
+               filters: Optional[Dict[str, Any]] = None, offset: int = 0,
+               limit: Optional[int] = None) -> 'pa.Table':
+    """
+    Read a day table with column / row selection.
+
+    Only the returned and filtered fields are decompressed, and record
+    batches after the last requested row are not read.
+
+    Args:
+        day_dir: Day directory
+        name: TRADES_FILE, POSITIONS_FILE or EVENTS_FILE
+        columns: Columns to keep (None = all; unknown names are ignored)
+        filters: {column: value} equality filters
+        offset: First row (after filtering)
+        limit: Maximum rows (None = all)
+    """
+    path = str(Path(day_dir) / name)
+    with pa.memory_map(path, 'r') as source:
+        schema = pa_ipc.open_file(source).schema
+
+    filters = {column: value for column, value in (filters or {}).items() if column in schema.names}
+    if columns is None:
+        keep = list(schema.names)
+    else:
+        keep = [column for column in schema.names if column in columns]
+        if name == EVENTS_FILE:
+            keep = list(dict.fromkeys(['execution_id', *keep]))
+
+    # An empty included_fields list means "all fields": read one for the row count
+    read_names = [column for column in schema.names if column in keep or column in filters] or schema.names[:1]
+    options = pa_ipc.IpcReadOptions(included_fields=[schema.get_field_index(column) for column in read_names])
+
+    batches = []
+    skip, remaining = offset, limit
+    with pa.memory_map(path, 'r') as source:
+        reader = pa_ipc.open_file(source, options=options)
+        for index in range(reader.num_record_batches):
+            if remaining is not None and remaining <= 0:
+                break
+            batch = reader.get_batch(index)
+            for column, value in filters.items():
+                batch = batch.filter(pc.equal(batch.column(column), _filter_value(schema.field(column), value)))
+            if skip:
+                if batch.num_rows <= skip:
+                    skip -= batch.num_rows
+                    continue
+                batch = batch.slice(skip)
+                skip = 0
+            if remaining is not None:
+                batch = batch.slice(0, remaining)
+                remaining -= batch.num_rows
+            batches.append(batch)
+        table = pa.Table.from_batches(batches, schema=reader.schema)
+
+    return table.select(keep)
+
+
+def _filter_value(field: 'pa.Field', value: Any) -> Any:
+    """Filter value as stored in the column (JSON text for JSON-encoded columns)."""
+    return _dumps(value) if (field.metadata or {}).get(b'encoding') == _JSON else value
+
+
+def table_records(table: 'pa.Table', payload_keys: Optional[Sequence[str]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Records of a table, JSON columns decoded.
+
+    Event payloads are merged back into the record (payload_keys limits
+    which payload keys are kept).
+    """
+    encodings = {field.name: (field.metadata or {}).get(b'encoding') for field in table.schema}
+    for batch in table.to_batches():
+        for row in batch.to_pylist():
+            record = {}
+            for key, value in row.items():
+                encoding = encodings[key]
+                if encoding is None:
+                    record[key] = value
+                elif encoding == _JSON:
+                    if value is not None:
+                        record[key] = json.loads(value)
+                elif value is not None:
+                    payload = json.loads(value)
+                    if payload_keys is not None:
+                        payload = {k: v for k, v in payload.items() if k in payload_keys}
+                    record.update(payload)
+            yield record
+
+
+def read_trades(day_dir: str, **selection: Any) -> Dict[str, Any]:
+    """trades_daily document ({'date', 'summary', 'trades'}) with optional selection."""
+    return {**read_metadata(day_dir), 'trades': list(table_records(read_table(day_dir, TRADES_FILE, **selection)))}
+
+
+def read_positions(day_dir: str, **selection: Any) -> List[Dict[str, Any]]:
+    return list(table_records(read_table(day_dir, POSITIONS_FILE, **selection)))
+
+
+def read_events(day_dir: str, columns: Optional[Sequence[str]] = None, **selection: Any) -> Dict[str, Dict[str, Any]]:
+    """{execution_id: event} with optional selection (columns may name payload keys)."""
+    table = read_table(day_dir, EVENTS_FILE, columns=_event_columns(columns), **selection)
+    return {event['execution_id']: event for event in table_records(table, columns)}
+
+
+def _event_columns(columns: Optional[Sequence[str]]) -> Optional[List[str]]:
+    if columns is None:
+        return None
+    selected = [column for column in columns if column in EVENT_HEADER]
+    if any(column not in EVENT_HEADER for column in columns):
+        selected.append('payload')
+    return selected
+
+
+# ----------------------------------------------------------------------
+# Streaming legacy JSON
+# ----------------------------------------------------------------------
+
+def iter_trades_json(day_dir: str, **selection: Any) -> Iterator[bytes]:
+    """
+    trades_daily.json document, one chunk per record batch.
+
+    Reads the file before returning; the iterator only encodes.
+    """
+    metadata = read_metadata(day_dir)
+    table = read_table(day_dir, TRADES_FILE, **selection)
+    head = (f'{{"date":{_dumps(metadata.get("date"))},"summary":{_dumps(metadata.get("summary", {}))},'
+            f'"trades":[').encode()
+    return _iter_json_document(head, table, _dumps, b']}')
+
+
+def iter_diagnostics_json(day_dir: str, columns: Optional[Sequence[str]] = None, **selection: Any) -> Iterator[bytes]:
+    """
+    diagnostics_export.json document, one chunk per record batch.
+
+    Reads the file before returning; the iterator only encodes.
+    """
+    table = read_table(day_dir, EVENTS_FILE, columns=_event_columns(columns), **selection)
+    return _iter_json_document(b'{"events_history":{', table,
+                               lambda event: f'{_dumps(event["execution_id"])}:{_dumps(event)}', b'}}', columns)
+
+
+def _iter_json_document(head: bytes, table: 'pa.Table', encode: Any, tail: bytes,
+                        payload_keys: Optional[Sequence[str]] = None) -> Iterator[bytes]:
+    yield head
+    separator = ''
+    for batch in table.to_batches():
+        chunk = ','.join(encode(record) for record in table_records(pa.Table.from_batches([batch]), payload_keys))
+        if chunk:
+            yield (separator + chunk).encode()
+            separator = ','
+    yield tail
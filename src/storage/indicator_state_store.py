@@ -0,0 +1,265 @@
+"""
+Indicator State Store
+On-disk snapshots of warmed-up indicator state (pickle files)
+
+Every backtest day loads 500 historical candles per symbol:timeframe and
+warms each indicator up with calculate_bulk() + initialize_from_dataframe().
+This store keeps the indicator state (HybridIndicator.get_state()) together
+with the indicator values of the last candles, so the next run whose
+history ends on the same candles restores the state instead.
+
+Two kinds of snapshot are kept under separate keys:
+- 'warmup': state right after warm-up on the historical candles. Restoring
+  it gives exactly the warm-up result, so backtests do not depend on which
+  days ran before (the default).
+- 'eod': state at the end of a replayed day (as of its last completed
+  candle). The next day's history ends there, so it can continue from the
+  previous day instead of a fresh warm-up. This changes indicator values
+  (longer effective history) and makes a day depend on whether the day
+  before was replayed first, so it is opt-in (indicator_state_carry_over).
+
+Each snapshot carries a checksum of the candles it was built from
+(timestamp + OHLCV). A warm-up snapshot covers the whole history frame, so
+a backfill or correction anywhere in the history, or a different lookback,
+never matches. An end-of-day snapshot covers the candle buffer it was
+taken from, which the next day's history ends on. Otherwise the indicator
+warms up as before.
+
+Snapshots not used for INDICATOR_STATE_STORE_MAX_AGE_DAYS are deleted by
+prune(), which runs when the process-wide store is created (a restore
+refreshes the file's modification time).
+
+Layout:
+    <root>/<symbol>/<timeframe>/as_of=<YYYY-MM-DD>/<indicator_key>.<params hash>.<kind>.pkl
+
+Configuration (environment):
+    INDICATOR_STATE_STORE_ENABLED - 'true' (default) / 'false'
+    INDICATOR_STATE_STORE_DIR     - root directory (default: data/indicator_state)
+    INDICATOR_STATE_STORE_MAX_AGE_DAYS - days an unused snapshot is kept (default: 30, 0 keeps all)
+"""
+import hashlib
+import json
+import logging
+import os
+import pickle
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+STATE_VERSION = 1
+
+CHECKSUM_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+# Snapshot kinds (separate files, never overwrite each other)
+WARMUP = 'warmup'
+END_OF_DAY = 'eod'
+SNAPSHOT_KINDS = (WARMUP, END_OF_DAY)
+
+
+def candle_checksum(candles: List[Dict[str, Any]]) -> str:
+    """
+    Checksum of the candles a snapshot ends on.
+
+    Args:
+        candles: Candle dicts (oldest first) with timestamp and OHLCV
+
+    Returns:
+        Hex digest (timestamps to the second, prices rounded to 1e-6)
+    """
+    digest = hashlib.sha256()
+    for candle in candles:
+        timestamp = pd.Timestamp(candle['timestamp']).strftime('%Y-%m-%dT%H:%M:%S')
+        values = ','.join(repr(round(float(candle[f]), 6)) for f in CHECKSUM_FIELDS)
+        digest.update(f"{timestamp}|{values};".encode())
+    return digest.hexdigest()
+
+
+class IndicatorStateStore:
+    """Indicator snapshots keyed by (symbol, timeframe, indicator key, params, as-of date, kind)"""
+
+    def __init__(self, root: str = "data/indicator_state", enabled: bool = True, max_age_days: float = 30):
+        self.root = Path(root)
+        self.enabled = bool(enabled)
+        self.max_age_days = max_age_days
+
+        # Statistics
+        self.stats = {'restored': 0, 'missing': 0, 'mismatched': 0, 'writes': 0, 'pruned': 0}
+
+        if self.enabled:
+            self.root.mkdir(parents=True, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # Keys and paths
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _day_str(as_of: Any) -> str:
+        return pd.Timestamp(as_of).strftime('%Y-%m-%d')
+
+    @staticmethod
+    def _safe(part: str) -> str:
+        return re.sub(r'[^A-Za-z0-9_.=-]', '_', str(part))
+
+    @staticmethod
+    def _params_hash(params: Dict[str, Any]) -> str:
+        encoded = json.dumps(params, sort_keys=True, default=str)
+        return hashlib.sha1(encoded.encode()).hexdigest()[:12]
+
+    def _state_path(self, symbol: str, timeframe: str, indicator_key: str,
+                    params: Dict[str, Any], as_of: Any, kind: str) -> Path:
+        if kind not in SNAPSHOT_KINDS:
+            raise ValueError(f"Unknown snapshot kind {kind!r} (expected one of {SNAPSHOT_KINDS})")
+        return (
+            self.root / self._safe(symbol) / self._safe(timeframe)
+            / f"as_of={self._day_str(as_of)}"
+            / f"{self._safe(indicator_key)}.{self._params_hash(params)}.{kind}.pkl"
+        )
+
+    # ------------------------------------------------------------------
+    # Snapshot read / write
+    # ------------------------------------------------------------------
+
+    def load(
+        self,
+        symbol: str,
+        timeframe: str,
+        indicator_key: str,
+        params: Dict[str, Any],
+        as_of: Any,
+        checksum: str,
+        kind: str = WARMUP
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Read a snapshot of `kind` whose candles match `checksum`.
+
+        Returns:
+            {'state': get_state() dict, 'tail': [value per tail candle] or None},
+            or None on miss / checksum mismatch (caller warms up)
+        """
+        if not self.enabled:
+            return None
+
+        path = self._state_path(symbol, timeframe, indicator_key, params, as_of, kind)
+        if not path.exists():
+            self.stats['missing'] += 1
+            return None
+
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"⚠️  Corrupt indicator state {path}, warming up: {e}")
+            path.unlink(missing_ok=True)
+            self.stats['missing'] += 1
+            return None
+
+        if entry.get('version') != STATE_VERSION or entry.get('checksum') != checksum:
+            self.stats['mismatched'] += 1
+            return None
+
+        try:
+            os.utime(path)  # last use, for prune()
+        except OSError:
+            pass
+        self.stats['restored'] += 1
+        return entry
+
+    def save(
+        self,
+        symbol: str,
+        timeframe: str,
+        indicator_key: str,
+        params: Dict[str, Any],
+        as_of: Any,
+        checksum: str,
+        state: Dict[str, Any],
+        tail: Optional[List[Any]] = None,
+        kind: str = WARMUP
+    ) -> bool:
+        """Write a snapshot of `kind` (atomically); False if the state cannot be pickled"""
+        if not self.enabled:
+            return False
+
+        path = self._state_path(symbol, timeframe, indicator_key, params, as_of, kind)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".tmp.{os.getpid()}")
+
+        entry = {
+            'version': STATE_VERSION,
+            'checksum': checksum,
+            'kind': kind,
+            'state': state,
+            'tail': tail,
+        }
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"⚠️  Failed to write indicator state {path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return False
+
+        self.stats['writes'] += 1
+        return True
+
+    def prune(self) -> int:
+        """
+        Delete snapshots not written or restored for max_age_days.
+
+        Returns:
+            Number of snapshot files deleted
+        """
+        if not self.enabled or not self.max_age_days or self.max_age_days <= 0:
+            return 0
+
+        cutoff = time.time() - self.max_age_days * 86400
+        pruned = 0
+        for path in self.root.glob('*/*/as_of=*/*.pkl'):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    pruned += 1
+            except OSError:
+                continue
+
+        # Drop day / timeframe / symbol directories left empty
+        for directory in sorted(self.root.glob('*/*/as_of=*'), reverse=True) + \
+                sorted(self.root.glob('*/*'), reverse=True) + sorted(self.root.glob('*'), reverse=True):
+            try:
+                directory.rmdir()
+            except OSError:
+                pass
+
+        if pruned:
+            logger.info(f"🧹 Pruned {pruned} indicator state snapshots unused for {self.max_age_days} days")
+        self.stats['pruned'] += pruned
+        return pruned
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Store summary for diagnostics"""
+        if not self.enabled:
+            return {'enabled': False}
+        return {'enabled': True, 'root': str(self.root), **self.stats}
+
+
+# Global store instance
+_state_store_instance: Optional[IndicatorStateStore] = None
+
+
+def get_indicator_state_store() -> IndicatorStateStore:
+    """Get or create the process-wide indicator state store"""
+    global _state_store_instance
+    if _state_store_instance is None:
+        _state_store_instance = IndicatorStateStore(
+            root=os.getenv('INDICATOR_STATE_STORE_DIR', 'data/indicator_state'),
+            enabled=os.getenv('INDICATOR_STATE_STORE_ENABLED', 'true').lower() != 'false',
+            max_age_days=float(os.getenv('INDICATOR_STATE_STORE_MAX_AGE_DAYS', '30'))
+        )
+        _state_store_instance.prune()
+    return _state_store_instance
@@ -0,0 +1,564 @@
+"""
+Local Tick Store
+Local on-disk cache of ClickHouse tick and candle slices (Arrow IPC files)
+
+Every backtest day re-queries nse_ticks_indices, nse_ticks_options and
+nse_ohlcv_indices even when the same days are replayed many times. This
+store keeps each (table, trading_day, variant, symbol) slice as an Arrow IPC
+file the first time it is fetched and reads it back memory-mapped afterwards.
+ClickHouse is only queried on a miss.
+
+Layout:
+    <root>/manifest.json
+    <root>/<table>/trading_day=<YYYY-MM-DD>/variant=<variant>/<symbol>.arrow
+
+`variant` distinguishes different query shapes over the same table
+(e.g. raw ticks vs OHLC-per-second aggregates).
+
+The manifest tracks size and last access per slice; when the total size
+exceeds the limit, least-recently-used slices are evicted. Last-access times
+of hits are kept in memory and written with the next slice write (or every
+ACCESS_FLUSH_SECONDS), so a hit does not take the manifest lock. Slices for
+the current (or a future) trading day are never persisted, since that data
+may still be incomplete.
+
+Streaming loaders read the store only when it already holds every slice
+(get_cached); on a miss they stream from ClickHouse and write the streamed
+blocks into per-symbol slices as they go (slice_writer), so the day is
+neither held in memory nor queried twice.
+
+Configuration (environment):
+    LOCAL_TICK_STORE_ENABLED  - 'true' (default) / 'false'
+    LOCAL_TICK_STORE_DIR      - root directory (default: data/tick_store)
+    LOCAL_TICK_STORE_MAX_GB   - size limit before eviction (default: 50)
+"""
+import atexit
+import json
+import logging
+import os
+import re
+import threading
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Collection, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+except ImportError:
+    pa = None
+    pa_ipc = None
+
+try:
+    import fcntl
+except ImportError:  # Windows - manifest updates are then process-local only
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+# Seconds between manifest writes of buffered last-access times
+ACCESS_FLUSH_SECONDS = 60
+
+
+class LocalTickStore:
+    """Arrow IPC slice cache with a JSON manifest and LRU size-based eviction"""
+
+    def __init__(self, root: str = "data/tick_store", max_bytes: int = 50 * 1024 ** 3, enabled: bool = True):
+        self.root = Path(root)
+        self.max_bytes = int(max_bytes)
+        self.enabled = bool(enabled) and pa is not None
+        self._lock = threading.Lock()
+
+        # Last-access times of hits not yet written to the manifest: key -> (path, time)
+        self._pending_access: Dict[str, Tuple[str, float]] = {}
+        self._last_access_flush = time.monotonic()
+
+        # Statistics
+        self.stats = {'hits': 0, 'misses': 0, 'writes': 0, 'evictions': 0}
+
+        if enabled and pa is None:
+            logger.warning("⚠️  pyarrow not installed - local tick store disabled (ClickHouse only)")
+
+        if self.enabled:
+            self.root.mkdir(parents=True, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # Keys and paths
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _day_str(trading_day: Any) -> str:
+        if hasattr(trading_day, 'strftime'):
+            return trading_day.strftime('%Y-%m-%d')
+        return str(trading_day)[:10]
+
+    @staticmethod
+    def _safe(part: str) -> str:
+        return re.sub(r'[^A-Za-z0-9_.=-]', '_', str(part))
+
+    def _entry_key(self, table: str, trading_day: Any, variant: str, symbol: str) -> str:
+        return f"{table}/{self._day_str(trading_day)}/{variant}/{symbol}"
+
+    def _slice_path(self, table: str, trading_day: Any, variant: str, symbol: str) -> Path:
+        return (
+            self.root / self._safe(table)
+            / f"trading_day={self._day_str(trading_day)}"
+            / f"variant={self._safe(variant)}"
+            / f"{self._safe(symbol)}.arrow"
+        )
+
+    def _is_cacheable_day(self, trading_day: Any) -> bool:
+        """Only completed past trading days are persisted."""
+        try:
+            day = datetime.strptime(self._day_str(trading_day), '%Y-%m-%d').date()
+        except ValueError:
+            return False
+        return day < date.today()
+
+    # ------------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------------
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.root / "manifest.json"
+
+    def _read_manifest(self) -> Dict[str, Any]:
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('version') == MANIFEST_VERSION:
+                return manifest
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+        return {'version': MANIFEST_VERSION, 'entries': {}}
+
+    def _write_manifest(self, manifest: Dict[str, Any]) -> None:
+        tmp_path = self.manifest_path.with_suffix(f".tmp.{os.getpid()}")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _update_manifest(self, mutate: Callable[[Dict[str, Any]], None]) -> None:
+        """Read-modify-write the manifest under a thread + file lock."""
+        with self._lock:
+            lock_file = open(self.root / ".manifest.lock", 'a')
+            try:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                manifest = self._read_manifest()
+                mutate(manifest)
+                self._write_manifest(manifest)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+                lock_file.close()
+
+    # ------------------------------------------------------------------
+    # Slice read / write
+    # ------------------------------------------------------------------
+
+    def get(self, table: str, trading_day: Any, variant: str, symbol: str) -> Optional[pd.DataFrame]:
+        """Read a cached slice (memory-mapped), or None on miss"""
+        if not self.enabled:
+            return None
+
+        path = self._slice_path(table, trading_day, variant, symbol)
+        if not path.exists():
+            return None
+
+        try:
+            with pa.memory_map(str(path), 'r') as source:
+                df = pa_ipc.open_file(source).read_all().to_pandas()
+        except Exception as e:
+            logger.warning(f"⚠️  Corrupt tick store slice {path}, refetching: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        key = self._entry_key(table, trading_day, variant, symbol)
+        with self._lock:
+            self._pending_access[key] = (str(path), time.time())
+        if time.monotonic() - self._last_access_flush >= ACCESS_FLUSH_SECONDS:
+            self.flush_access()
+        return df
+
+    def _apply_access(self, manifest: Dict[str, Any]) -> None:
+        """Merge buffered last-access times into the manifest (caller holds the lock)"""
+        pending, self._pending_access = self._pending_access, {}
+        self._last_access_flush = time.monotonic()
+        for key, (path, accessed) in pending.items():
+            entry = manifest['entries'].get(key)
+            if entry is None:
+                if not os.path.exists(path):
+                    continue
+                entry = manifest['entries'][key] = {'path': path, 'bytes': os.path.getsize(path)}
+            entry['last_access'] = max(entry.get('last_access', 0), accessed)
+
+    def flush_access(self) -> None:
+        """Write buffered last-access times to the manifest"""
+        if self.enabled and self._pending_access:
+            self._update_manifest(self._apply_access)
+
+    def put(self, table: str, trading_day: Any, variant: str, symbol: str, df: pd.DataFrame) -> bool:
+        """Write a slice (atomically) and evict if over the size limit"""
+        if not self.enabled or not self._is_cacheable_day(trading_day):
+            return False
+
+        path = self._slice_path(table, trading_day, variant, symbol)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".tmp.{os.getpid()}")
+
+        try:
+            arrow_table = pa.Table.from_pandas(df.reset_index(drop=True), preserve_index=False)
+            with pa.OSFile(str(tmp_path), 'wb') as sink:
+                with pa_ipc.new_file(sink, arrow_table.schema) as writer:
+                    writer.write_table(arrow_table)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"⚠️  Failed to write tick store slice {path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return False
+
+        self._register_slices({self._entry_key(table, trading_day, variant, symbol): (path, len(df))})
+        return True
+
+    def _register_slices(self, slices: Dict[str, Tuple[Path, int]]) -> None:
+        """Add written slices (key -> (path, rows)) to the manifest and evict if needed"""
+        now = time.time()
+        sizes = {key: path.stat().st_size for key, (path, _) in slices.items()}
+
+        def _add(manifest: Dict[str, Any]) -> None:
+            self._apply_access(manifest)
+            for key, (path, rows) in slices.items():
+                manifest['entries'][key] = {
+                    'path': str(path),
+                    'bytes': sizes[key],
+                    'rows': rows,
+                    'created_at': now,
+                    'last_access': now,
+                }
+            self._evict(manifest, keep=slices)
+
+        self._update_manifest(_add)
+        self.stats['writes'] += len(slices)
+
+    def _evict(self, manifest: Dict[str, Any], keep: Collection[str] = ()) -> None:
+        """Drop least-recently-used slices (other than `keep`) until under max_bytes"""
+        entries = manifest['entries']
+        total = sum(e.get('bytes', 0) for e in entries.values())
+        if total <= self.max_bytes:
+            return
+
+        for key in sorted(entries, key=lambda k: entries[k].get('last_access', 0)):
+            if total <= self.max_bytes:
+                break
+            if key in keep:
+                continue
+            entry = entries.pop(key)
+            Path(entry['path']).unlink(missing_ok=True)
+            total -= entry.get('bytes', 0)
+            self.stats['evictions'] += 1
+
+    # ------------------------------------------------------------------
+    # Read-through helper
+    # ------------------------------------------------------------------
+
+    def get_or_fetch(
+        self,
+        table: str,
+        trading_day: Any,
+        variant: str,
+        symbols: List[str],
+        fetch: Callable[[List[str]], pd.DataFrame],
+        symbol_column: str = 'symbol',
+        normalize_symbol: Optional[Callable[[str], str]] = None,
+        sort_column: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Return rows for all symbols, fetching only the missing slices.
+
+        Args:
+            table: Source table name (used in the cache key only)
+            trading_day: Trading day of the slice
+            variant: Query-shape label (e.g. 'raw', 'ohlc_1s')
+            symbols: Symbols (slice keys) to return
+            fetch: Callable(missing_symbols) -> DataFrame from ClickHouse
+            symbol_column: Column holding the symbol in fetched rows
+            normalize_symbol: Maps a fetched row symbol to its slice key
+                (e.g. strip '.NFO'); identity by default
+            sort_column: Stable-sort the combined frame by this column
+
+        Returns:
+            Combined DataFrame (cached + fetched slices)
+        """
+        if not self.enabled:
+            return fetch(list(symbols))
+
+        frames: List[pd.DataFrame] = []
+        missing: List[str] = []
+
+        for symbol in symbols:
+            cached = self.get(table, trading_day, variant, symbol)
+            if cached is None:
+                missing.append(symbol)
+            else:
+                frames.append(cached)
+
+        self.stats['hits'] += len(symbols) - len(missing)
+        self.stats['misses'] += len(missing)
+
+        if missing:
+            fetched = fetch(missing)
+            if fetched is not None and not fetched.empty:
+                frames.append(fetched)
+                row_keys = fetched[symbol_column].astype(str)
+                if normalize_symbol is not None:
+                    row_keys = row_keys.map(normalize_symbol)
+                for symbol in missing:
+                    self.put(table, trading_day, variant, symbol, fetched[row_keys == symbol])
+            elif fetched is not None:
+                # Persist empty slices too, so known-empty days skip ClickHouse
+                for symbol in missing:
+                    self.put(table, trading_day, variant, symbol, fetched)
+            logger.info(
+                f"📦 Tick store {table}/{self._day_str(trading_day)}/{variant}: "
+                f"{len(symbols) - len(missing)} hit, {len(missing)} fetched from ClickHouse"
+            )
+
+        return self._combine(frames, sort_column)
+
+    def get_cached(
+        self,
+        table: str,
+        trading_day: Any,
+        variant: str,
+        symbols: List[str],
+        sort_column: Optional[str] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Combined slices for all symbols if every one is stored, else None.
+
+        Never queries ClickHouse; a partial hit reads nothing.
+        """
+        if not self.enabled:
+            return None
+        if not all(self._slice_path(table, trading_day, variant, s).exists() for s in symbols):
+            self.stats['misses'] += len(symbols)
+            return None
+
+        frames: List[pd.DataFrame] = []
+        for symbol in symbols:
+            cached = self.get(table, trading_day, variant, symbol)
+            if cached is None:  # Corrupt slice (removed by get)
+                self.stats['misses'] += len(symbols)
+                return None
+            frames.append(cached)
+
+        self.stats['hits'] += len(symbols)
+        return self._combine(frames, sort_column)
+
+    def slice_writer(
+        self,
+        table: str,
+        trading_day: Any,
+        variant: str,
+        symbols: List[str],
+        symbol_column: str = 'symbol',
+        normalize_symbol: Optional[Callable[[str], str]] = None
+    ) -> Optional['SliceStreamWriter']:
+        """
+        Writer storing streamed row blocks as the missing slices of `symbols`.
+
+        Returns:
+            SliceStreamWriter, or None if the store is disabled, the day is
+            not cacheable or every slice is already stored
+        """
+        if not self.enabled or not self._is_cacheable_day(trading_day):
+            return None
+        missing = [s for s in symbols if not self._slice_path(table, trading_day, variant, s).exists()]
+        if not missing:
+            return None
+        return SliceStreamWriter(self, table, trading_day, variant, missing, symbol_column, normalize_symbol)
+
+    @staticmethod
+    def _combine(frames: List[pd.DataFrame], sort_column: Optional[str]) -> pd.DataFrame:
+        frames = [f for f in frames if f is not None and len(f.columns)]
+        if not frames:
+            return pd.DataFrame()
+
+        combined = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        if sort_column and sort_column in combined.columns and len(frames) > 1:
+            combined = combined.sort_values(sort_column, kind='stable', ignore_index=True)
+        return combined
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Manifest summary for diagnostics"""
+        if not self.enabled:
+            return {'enabled': False}
+        manifest = self._read_manifest()
+        total = sum(e.get('bytes', 0) for e in manifest['entries'].values())
+        return {
+            'enabled': True,
+            'root': str(self.root),
+            'slices': len(manifest['entries']),
+            'total_mb': round(total / (1024 * 1024), 2),
+            'max_mb': round(self.max_bytes / (1024 * 1024), 2),
+            **self.stats,
+        }
+
+
+class SliceStreamWriter:
+    """
+    Writes row blocks of a streamed query into per-symbol slices.
+
+    Every symbol gets an Arrow IPC writer on a temp file, fed block by block,
+    so at most one block is in memory. commit() publishes the slices once the
+    stream was fully consumed (symbols without rows get an empty slice);
+    abort() drops everything written so far.
+    """
+
+    def __init__(
+        self,
+        store: LocalTickStore,
+        table: str,
+        trading_day: Any,
+        variant: str,
+        symbols: List[str],
+        symbol_column: str = 'symbol',
+        normalize_symbol: Optional[Callable[[str], str]] = None
+    ):
+        self.store = store
+        self.table = table
+        self.trading_day = trading_day
+        self.variant = variant
+        self.symbols = set(symbols)
+        self.symbol_column = symbol_column
+        self.normalize_symbol = normalize_symbol
+
+        self.schema = None
+        # symbol -> (path, tmp_path, sink, writer, rows)
+        self._writers: Dict[str, list] = {}
+        self.closed = False
+
+    def _open(self, symbol: str, schema: Any) -> list:
+        path = self.store._slice_path(self.table, self.trading_day, self.variant, symbol)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".tmp.{os.getpid()}.{threading.get_ident()}")
+        sink = pa.OSFile(str(tmp_path), 'wb')
+        entry = self._writers[symbol] = [path, tmp_path, sink, pa_ipc.new_file(sink, schema), 0]
+        return entry
+
+    def write_block(self, column_names: Sequence[str], rows: Sequence[tuple]) -> bool:
+        """
+        Append one block of row tuples (columns in `column_names` order).
+
+        Returns:
+            False if the block could not be written (the writer is aborted)
+        """
+        if self.closed:
+            return False
+        if not rows:
+            return True
+
+        try:
+            symbol_index = list(column_names).index(self.symbol_column)
+            by_symbol: Dict[str, List[tuple]] = {}
+            for row in rows:
+                symbol = str(row[symbol_index])
+                if self.normalize_symbol is not None:
+                    symbol = self.normalize_symbol(symbol)
+                if symbol in self.symbols:
+                    by_symbol.setdefault(symbol, []).append(row)
+
+            for symbol, symbol_rows in by_symbol.items():
+                columns = list(zip(*symbol_rows))
+                if self.schema is None:
+                    batch = pa.record_batch([pa.array(column) for column in columns], names=list(column_names))
+                    self.schema = batch.schema
+                else:
+                    batch = pa.record_batch(
+                        [pa.array(column, type=field.type) for column, field in zip(columns, self.schema)],
+                        schema=self.schema
+                    )
+                entry = self._writers.get(symbol) or self._open(symbol, self.schema)
+                entry[3].write_batch(batch)
+                entry[4] += len(symbol_rows)
+        except Exception as e:
+            logger.warning(f"⚠️  Tick store {self.table}/{self.store._day_str(self.trading_day)}/{self.variant}: "
+                           f"streamed slices not stored: {e}")
+            self.abort()
+            return False
+        return True
+
+    def commit(self, column_names: Sequence[str] = ()) -> int:
+        """
+        Publish the slices (after the stream was fully consumed).
+
+        Args:
+            column_names: Result columns, used for the empty slices when no
+                row arrived at all
+
+        Returns:
+            Number of slices written
+        """
+        if self.closed:
+            return 0
+
+        try:
+            schema = self.schema or pa.schema([(name, pa.null()) for name in column_names])
+            for symbol in self.symbols - set(self._writers):
+                self._open(symbol, schema)
+            for _, _, sink, writer, _ in self._writers.values():
+                writer.close()
+                sink.close()
+            for path, tmp_path, _, _, _ in self._writers.values():
+                os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"⚠️  Tick store {self.table}/{self.store._day_str(self.trading_day)}/{self.variant}: "
+                           f"streamed slices not stored: {e}")
+            self.abort()
+            return 0
+
+        self.closed = True
+        self.store._register_slices({
+            self.store._entry_key(self.table, self.trading_day, self.variant, symbol): (path, rows)
+            for symbol, (path, _, _, _, rows) in self._writers.items()
+        })
+        logger.info(f"📦 Tick store {self.table}/{self.store._day_str(self.trading_day)}/{self.variant}: "
+                    f"stored {len(self._writers)} streamed slice(s)")
+        return len(self._writers)
+
+    def abort(self) -> None:
+        """Drop the temp files (no-op once committed or aborted)."""
+        if self.closed:
+            return
+        self.closed = True
+        for _, tmp_path, sink, writer, _ in self._writers.values():
+            try:
+                writer.close()
+            except Exception:
+                pass
+            sink.close()
+            tmp_path.unlink(missing_ok=True)
+
+
+# Global store instance
+_tick_store_instance: Optional[LocalTickStore] = None
+
+
+def get_local_tick_store() -> LocalTickStore:
+    """Get or create the process-wide local tick store"""
+    global _tick_store_instance
+    if _tick_store_instance is None:
+        _tick_store_instance = LocalTickStore(
+            root=os.getenv('LOCAL_TICK_STORE_DIR', 'data/tick_store'),
+            max_bytes=int(float(os.getenv('LOCAL_TICK_STORE_MAX_GB', '50')) * 1024 ** 3),
+            enabled=os.getenv('LOCAL_TICK_STORE_ENABLED', 'true').lower() != 'false'
+        )
+        atexit.register(_tick_store_instance.flush_access)
+    return _tick_store_instance
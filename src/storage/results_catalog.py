@@ -0,0 +1,236 @@
+"""
+Results Catalog
+Embedded SQLite index of stored backtest results
+
+Completed days used to be discovered by walking result directories
+(backtest_results/<strategy>/<date>, backtest_data/<user>/<strategy>) and
+by reading summary.jsonl, which every finished day appended to. Each
+status poll was a filesystem scan, and parallel writers could interleave
+lines.
+
+The catalog records every stored day (and, for BacktestStorage, every
+stored strategy with its creation time) in one SQLite database in WAL
+mode, so readers never block the writer. A completed day is upserted in
+a single transaction (last write wins per date), and listing, status and
+cleanup queries use the primary keys and indexes:
+
+    days      (owner, strategy_id, date)  PK     list / status by strategy
+              (backtest_id, date)         index  list by backtest
+    backtests (owner, strategy_id)        PK
+              (created_at)                index  TTL cleanup
+
+`owner` is the user id for BacktestStorage and '' for backtest_results.
+
+Results written before the catalog existed are picked up once per
+strategy from summary.jsonl (import_summary_jsonl).
+
+Configuration (environment):
+    RESULTS_CATALOG_PATH  - database for backtest_results
+                            (default: backtest_results/catalog.sqlite3)
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS days (
+    owner        TEXT NOT NULL DEFAULT '',
+    strategy_id  TEXT NOT NULL,
+    date         TEXT NOT NULL,
+    backtest_id  TEXT,
+    summary      TEXT NOT NULL DEFAULT '{}',
+    path         TEXT,
+    bytes        INTEGER NOT NULL DEFAULT 0,
+    completed_at REAL NOT NULL,
+    PRIMARY KEY (owner, strategy_id, date)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_days_backtest ON days (backtest_id, date);
+
+CREATE TABLE IF NOT EXISTS backtests (
+    owner        TEXT NOT NULL DEFAULT '',
+    strategy_id  TEXT NOT NULL,
+    backtest_id  TEXT,
+    created_at   REAL NOT NULL,
+    metadata     TEXT NOT NULL DEFAULT '{}',
+    PRIMARY KEY (owner, strategy_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_backtests_created ON backtests (created_at);
+"""
+
+
+class ResultsCatalog:
+    """SQLite (WAL) catalog of stored backtest days and strategies"""
+
+    def __init__(self, db_path: str = "backtest_results/catalog.sqlite3"):
+        self.db_path = str(db_path)
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+
+        with self._connection() as conn:
+            conn.executescript(SCHEMA)
+
+    # ------------------------------------------------------------------
+    # Connections
+    # ------------------------------------------------------------------
+
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread (sqlite3 connections are not shared)."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ------------------------------------------------------------------
+    # Days
+    # ------------------------------------------------------------------
+
+    def record_day(self, strategy_id: str, date: str, summary: Optional[Dict[str, Any]] = None,
+                   path: Optional[str] = None, size_bytes: int = 0, backtest_id: Optional[str] = None,
+                   owner: str = '') -> None:
+        """Upsert a completed day (one transaction)."""
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO days "
+                "(owner, strategy_id, date, backtest_id, summary, path, bytes, completed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (owner, strategy_id, date, backtest_id, json.dumps(summary or {}), path, int(size_bytes),
+                 time.time())
+            )
+
+    def list_days(self, strategy_id: str, owner: str = '', start: Optional[str] = None,
+                  end: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Days of a strategy in date order (optionally within [start, end])."""
+        query = "SELECT * FROM days WHERE owner = ? AND strategy_id = ?"
+        params: List[Any] = [owner, strategy_id]
+        if start is not None:
+            query += " AND date >= ?"
+            params.append(start)
+        if end is not None:
+            query += " AND date <= ?"
+            params.append(end)
+        rows = self._connection().execute(query + " ORDER BY date", params).fetchall()
+        return [self._day(row) for row in rows]
+
+    def list_backtest_days(self, backtest_id: str) -> List[Dict[str, Any]]:
+        """Days recorded for one backtest run, in date order."""
+        rows = self._connection().execute(
+            "SELECT * FROM days WHERE backtest_id = ? ORDER BY date", (backtest_id,)
+        ).fetchall()
+        return [self._day(row) for row in rows]
+
+    def has_days(self, strategy_id: str, owner: str = '') -> bool:
+        row = self._connection().execute(
+            "SELECT 1 FROM days WHERE owner = ? AND strategy_id = ? LIMIT 1", (owner, strategy_id)
+        ).fetchone()
+        return row is not None
+
+    @staticmethod
+    def _day(row: sqlite3.Row) -> Dict[str, Any]:
+        day = dict(row)
+        day['summary'] = json.loads(day['summary'])
+        return day
+
+    # ------------------------------------------------------------------
+    # Strategies
+    # ------------------------------------------------------------------
+
+    def record_backtest(self, strategy_id: str, created_at: Optional[float] = None,
+                        backtest_id: Optional[str] = None, owner: str = '',
+                        metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Upsert a stored strategy (created_at: epoch seconds, default now)."""
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO backtests (owner, strategy_id, backtest_id, created_at, metadata) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (owner, strategy_id, backtest_id, time.time() if created_at is None else created_at,
+                 json.dumps(metadata or {}, default=str))
+            )
+
+    def expired_backtests(self, cutoff: float) -> List[Tuple[str, str]]:
+        """(owner, strategy_id) of strategies created before cutoff (epoch seconds)."""
+        rows = self._connection().execute(
+            "SELECT owner, strategy_id FROM backtests WHERE created_at < ? ORDER BY created_at", (cutoff,)
+        ).fetchall()
+        return [(row['owner'], row['strategy_id']) for row in rows]
+
+    def delete_strategy(self, strategy_id: str, owner: str = '') -> Dict[str, int]:
+        """Forget a strategy and all its days (one transaction)."""
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) AS days, COALESCE(SUM(bytes), 0) AS bytes FROM days "
+                "WHERE owner = ? AND strategy_id = ?", (owner, strategy_id)
+            ).fetchone()
+            conn.execute("DELETE FROM days WHERE owner = ? AND strategy_id = ?", (owner, strategy_id))
+            conn.execute("DELETE FROM backtests WHERE owner = ? AND strategy_id = ?", (owner, strategy_id))
+        return {'days': row['days'], 'bytes': row['bytes']}
+
+    # ------------------------------------------------------------------
+    # Legacy import
+    # ------------------------------------------------------------------
+
+    def import_summary_jsonl(self, strategy_id: str, summary_jsonl_path: str, owner: str = '') -> int:
+        """
+        Record the days of a pre-catalog summary.jsonl (last entry wins per date).
+
+        Returns the number of days imported.
+        """
+        if not os.path.exists(summary_jsonl_path):
+            return 0
+
+        entries: Dict[str, Dict[str, Any]] = {}
+        with open(summary_jsonl_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"⚠️  Skipping malformed summary.jsonl line in {summary_jsonl_path}")
+                    continue
+                entries[entry['date']] = entry
+
+        now = time.time()
+        day_root = os.path.dirname(summary_jsonl_path)
+        with self._connection() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO days (owner, strategy_id, date, summary, path, completed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(owner, strategy_id, date_str, json.dumps(entry.get('summary', {})),
+                  os.path.join(day_root, date_str), now) for date_str, entry in entries.items()]
+            )
+        return len(entries)
+
+
+# Singleton instance
+_catalog_instance = None
+_catalog_lock = threading.Lock()
+
+
+def get_results_catalog() -> ResultsCatalog:
+    """Get singleton catalog for backtest_results (RESULTS_CATALOG_PATH)"""
+    global _catalog_instance
+    if _catalog_instance is None:
+        with _catalog_lock:
+            if _catalog_instance is None:
+                _catalog_instance = ResultsCatalog(
+                    os.getenv('RESULTS_CATALOG_PATH', 'backtest_results/catalog.sqlite3')
+                )
+    return _catalog_instance
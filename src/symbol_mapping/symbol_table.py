@@ -0,0 +1,139 @@
+"""
+Interned Symbol Table
+=====================
+
+Raw tick symbol -> small integer id -> universal symbol, resolved once per
+distinct ticker.
+
+DataManager.process_tick used to normalize the symbol of every tick: a
+':' check, a function-local import, the ClickHouse ticker regex plus a
+date object and f-string per option tick, or a scrip-master DataFrame
+.loc lookup per index tick - for the same few hundred tickers all day.
+
+SymbolTable interns each raw ticker the first time it is seen:
+
+- universal format ('NIFTY:2024-10-03:OPT:25950:CE') is kept as-is;
+- ClickHouse compact tickers ('NIFTY03OCT2425950CE', optionally '.NFO')
+  go through ClickHouseTickerConverter (backtests);
+- anything else is looked up in the SymbolCacheManager scrip master for
+  the broker (index symbols, live broker tickers).
+
+Loaders attach the id to each tick ('symbol_id'), so process_tick does a
+list index instead of any string work. The table is bounded: past
+max_symbols new tickers are still normalized, just not interned.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.symbol_mapping.clickhouse_ticker_converter import get_converter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SYMBOLS = 50_000
+
+
+class SymbolTable:
+    """Bounded raw-ticker -> id -> universal-symbol table"""
+
+    def __init__(self, broker_name: str, symbol_cache: Any = None, max_symbols: int = DEFAULT_MAX_SYMBOLS):
+        """
+        Initialize symbol table.
+
+        Args:
+            broker_name: Broker the raw tickers come from ('clickhouse', 'angelone', ...)
+            symbol_cache: SymbolCacheManager for broker / index symbols (to_unified)
+            max_symbols: Maximum number of interned tickers
+        """
+        self.broker_name = broker_name
+        self.symbol_cache = symbol_cache
+        self.max_symbols = max_symbols
+
+        self.ids: Dict[str, int] = {}   # raw ticker -> id
+        self.raw: List[str] = []        # id -> raw ticker
+        self.universal: List[str] = []  # id -> universal symbol
+
+        self.stats = {'interned': 0, 'overflow': 0}
+
+    def normalize(self, raw_symbol: str) -> str:
+        """
+        Universal symbol for a raw ticker (no caching).
+
+        Raises:
+            RuntimeError: ClickHouse ticker that cannot be converted, or
+                symbol cache not loaded
+            KeyError / ValueError: Symbol unknown to the broker scrip master
+        """
+        # Already in universal format (tick source converted it)
+        if ':' in raw_symbol:
+            return raw_symbol
+
+        if self.broker_name == 'clickhouse':
+            # Backtesting: ClickHouse compact option ticker -> universal
+            # (e.g., NIFTY03OCT2425950CE -> NIFTY:2024-10-03:OPT:25950:CE)
+            converter = get_converter()
+            if converter.is_clickhouse_format(raw_symbol):
+                try:
+                    return converter.to_universal(raw_symbol)
+                except ValueError as e:
+                    logger.error(f"❌ CRITICAL: Failed to convert ClickHouse ticker: {raw_symbol}")
+                    logger.error(f"   Error: {e}")
+                    raise RuntimeError(f"ClickHouse ticker conversion failed: {e}") from e
+
+        # Index symbols (backtest) and broker tickers (live): scrip master lookup
+        return self.symbol_cache.to_unified(self.broker_name, raw_symbol)
+
+    def intern(self, raw_symbol: str) -> Optional[int]:
+        """
+        Id for a raw ticker, normalizing it on first sight.
+
+        Returns:
+            Symbol id, or None when the table is full (ticker not interned)
+        """
+        symbol_id = self.ids.get(raw_symbol)
+        if symbol_id is not None:
+            return symbol_id
+
+        universal = self.normalize(raw_symbol)
+        if len(self.raw) >= self.max_symbols:
+            self.stats['overflow'] += 1
+            return None
+
+        symbol_id = len(self.raw)
+        self.ids[raw_symbol] = symbol_id
+        self.raw.append(raw_symbol)
+        self.universal.append(universal)
+        self.stats['interned'] += 1
+        return symbol_id
+
+    def try_intern(self, raw_symbol: str) -> Optional[int]:
+        """
+        Like intern(), but None for tickers that cannot be normalized.
+
+        Used by loaders: such ticks carry no id and fail in process_tick,
+        exactly where they did before interning.
+        """
+        try:
+            return self.intern(raw_symbol)
+        except (KeyError, ValueError, RuntimeError):
+            return None
+
+    def intern_all(self, raw_symbols: Iterable[str]) -> List[Optional[int]]:
+        """Ids for a loader's distinct tickers (resolved up front)."""
+        return [self.try_intern(symbol) for symbol in raw_symbols]
+
+    def to_universal(self, raw_symbol: str) -> str:
+        """Universal symbol for a raw ticker (interned lookup when possible)."""
+        symbol_id = self.ids.get(raw_symbol)
+        if symbol_id is None:
+            symbol_id = self.intern(raw_symbol)
+            if symbol_id is None:
+                return self.normalize(raw_symbol)
+        return self.universal[symbol_id]
+
+    def get_summary(self) -> Dict[str, Any]:
+        return {
+            'symbols': len(self.raw),
+            'max_symbols': self.max_symbols,
+            **self.stats
+        }
@@ -3,22 +3,41 @@ Node Diagnostics System
 
 Provides comprehensive diagnostic tracking for all nodes during strategy execution.
 Records both real-time state and historical events for debugging and UI display.
+
+Events are kept in a bounded columnar NodeEventStore (see node_event_store);
+condition display text is rendered when events are read / exported.
+NODE_DIAGNOSTICS=off|summary|full selects how much is recorded.
 """
 
 from typing import Dict, List, Any, Optional
-from datetime import datetime
-from collections import deque
 import logging
+import os
+
+from src.backtesting.candle_ring_buffer import CandleBufferView
+from src.core.condition_evaluator_v2 import render_condition_diagnostics
+from src.utils.node_event_store import (
+    DIAGNOSTICS_FULL,
+    DIAGNOSTICS_LEVELS,
+    DIAGNOSTICS_OFF,
+    NodeEventStore,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def diagnostics_level() -> str:
+    """NODE_DIAGNOSTICS=off|summary|full selects the diagnostics detail (default full)."""
+    level = os.getenv('NODE_DIAGNOSTICS', DIAGNOSTICS_FULL).lower()
+    return level if level in DIAGNOSTICS_LEVELS else DIAGNOSTICS_FULL
+
+
 class NodeDiagnostics:
     """
     Manages diagnostic data for all nodes in a strategy.
     
     Maintains two key data structures:
-    1. node_events_history: Append-only timeline of significant events per node
+    1. node_events_history: Timeline of significant events (NodeEventStore,
+       bounded to max_events_per_node per node)
     2. node_current_state: Real-time snapshot of active/pending nodes
     
     Usage:
@@ -34,15 +53,18 @@ class NodeDiagnostics:
         diagnostics.update_pending_state(node, context, reason='Waiting for order fill')
     """
     
-    def __init__(self, max_events_per_node: int = 100):
+    def __init__(self, max_events_per_node: int = 100, level: Optional[str] = None):
         """
         Initialize diagnostics system.
         
         Args:
             max_events_per_node: Maximum events to store per node (circular buffer)
+            level: 'off', 'summary' or 'full'; None = NODE_DIAGNOSTICS
         """
         self.max_events_per_node = max_events_per_node
-        logger.info(f"📊 NodeDiagnostics initialized (max {max_events_per_node} events per node)")
+        self.level = diagnostics_level() if level is None else level
+        self.events = NodeEventStore(max_events_per_node=max_events_per_node, level=self.level)
+        logger.info(f"📊 NodeDiagnostics initialized (max {max_events_per_node} events per node, level {self.level})")
     
     def initialize_context(self, context: Dict[str, Any]) -> None:
         """
@@ -52,7 +74,7 @@ class NodeDiagnostics:
             context: Strategy execution context
         """
         if 'node_events_history' not in context:
-            context['node_events_history'] = {}
+            context['node_events_history'] = self.events
         
         if 'node_current_state' not in context:
             context['node_current_state'] = {}
@@ -83,13 +105,15 @@ class NodeDiagnostics:
             raise AttributeError(f"Node {node} missing 'id' attribute - cannot record diagnostic event")
         
         node_id = node.id
-        current_tick = context.get('tick_count', 0)
         current_timestamp = context.get('current_timestamp')
         
         # Validate context has required keys
         if 'node_events_history' not in context:
             raise KeyError(f"Context missing 'node_events_history' - diagnostics not initialized properly")
         
+        if self.level == DIAGNOSTICS_OFF:
+            return
+        
         # Get execution ID from additional_data (required for new chain tracking)
         execution_id = (additional_data or {}).get('execution_id')
         parent_execution_id = (additional_data or {}).get('parent_execution_id')
@@ -100,10 +124,26 @@ class NodeDiagnostics:
             ts_str = str(current_timestamp).replace(':', '').replace('-', '').replace(' ', '_')[:15] if current_timestamp else 'unknown'
             execution_id = f"exec_{node_id}_{ts_str}_{uuid.uuid4().hex[:6]}"
         
-        # Get history dict (now keyed by execution_id, not node_id)
+        # Get history (keyed by execution_id, not node_id)
         history = context['node_events_history']
         
-        # Build event record
+        if isinstance(history, NodeEventStore):
+            payload = dict(evaluation_data) if evaluation_data else {}
+            if additional_data:
+                for key, value in additional_data.items():
+                    if key not in ['execution_id', 'parent_execution_id']:
+                        payload[key] = value
+            history.record(node, context, event_type, execution_id, parent_execution_id,
+                           payload=payload, conditions=self._find_conditions(payload))
+            
+            # Push to SSE if session exists (live simulation mode)
+            if 'session_id' in context:
+                self._push_event(context, execution_id, history[execution_id])
+            
+            logger.debug(f"📝 Event recorded: {execution_id} (node: {node_id}) - {event_type}")
+            return
+        
+        # Plain dict history (contexts built without initialize_context)
         event = {
             # Execution chain tracking
             'execution_id': execution_id,
@@ -137,17 +177,7 @@ class NodeDiagnostics:
         
         # Push to SSE if session exists (live simulation mode)
         if 'session_id' in context:
-            try:
-                # Import here to avoid circular dependency
-                from live_simulation_sse import sse_manager
-                
-                session = sse_manager.get_session(context['session_id'])
-                if session:
-                    # Push event to SSE queue (session.add_node_event handles sequence increment)
-                    session.add_node_event(execution_id, event)
-                    logger.debug(f"📡 SSE push: {execution_id} (session: {context['session_id']})")
-            except Exception as e:
-                logger.warning(f"Failed to push event to SSE: {e}")
+            self._push_event(context, execution_id, event)
         
         logger.debug(f"📝 Event recorded: {execution_id} (node: {node_id}) - {event_type}")
     
@@ -182,6 +212,12 @@ class NodeDiagnostics:
         if 'node_current_state' not in context:
             raise KeyError(f"Context missing 'node_current_state' - diagnostics not initialized properly")
         
+        if self.level == DIAGNOSTICS_OFF:
+            return
+        
+        # Node name/type/children resolved once per node
+        _, node_name, node_type, children = self.events.node_info(node, context)
+        
         # Build current state
         state = {
             # Execution chain tracking (optional for current_state)
@@ -194,11 +230,11 @@ class NodeDiagnostics:
             
             # Node metadata
             'node_id': node_id,
-            'node_name': getattr(node, 'name', node_id),
-            'node_type': getattr(node, 'type', 'unknown'),
+            'node_name': node_name,
+            'node_type': node_type,
             
             # Relationships
-            'children_nodes': self._get_children_info(node, context),
+            'children_nodes': children,
         }
         
         # Add evaluation data if provided
@@ -236,6 +272,9 @@ class NodeDiagnostics:
         if 'node_current_state' not in context:
             raise KeyError(f"Context missing 'node_current_state' - diagnostics not initialized properly")
         
+        if self.level == DIAGNOSTICS_OFF:
+            return
+        
         # Get existing state (if any)
         existing_state = context['node_current_state'].get(node_id, {})
         
@@ -296,7 +335,10 @@ class NodeDiagnostics:
             List of events
         """
         history = context.get('node_events_history', {})
-        events = list(history.get(node_id, []))
+        if isinstance(history, NodeEventStore):
+            return history.events_for_node(node_id, event_type)
+        
+        events = [e for e in history.values() if e.get('node_id') == node_id]
         
         if event_type:
             events = [e for e in events if e.get('event_type') == event_type]
@@ -318,25 +360,66 @@ class NodeDiagnostics:
         Returns:
             Current state or None if inactive
         """
-        return context.get('node_current_state', {}).get(node_id)
+        state = context.get('node_current_state', {}).get(node_id)
+        return self._render_state(state) if state else state
     
     def get_all_current_states(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Get all current states."""
-        return context.get('node_current_state', {})
+        states = context.get('node_current_state', {})
+        for state in states.values():
+            self._render_state(state)
+        return states
     
     def get_all_events(self, context: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
         """
         Get all events history.
         
         Returns dict keyed by execution_id (not node_id anymore).
-        Each value is an event dict (not a list).
+        Each value is an event dict (not a list), condition text rendered.
         """
         history = context.get('node_events_history', {})
-        # History is already a dict[execution_id, event_dict], return as-is
+        if isinstance(history, NodeEventStore):
+            return history.export()
+        # Plain dict history is already a dict[execution_id, event_dict]
         return history
     
     # ==================== Private Helper Methods ====================
     
+    @staticmethod
+    def _find_conditions(payload: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """Condition diagnostics in an event payload (top level or nested diagnostic data)."""
+        conditions = payload.get('conditions_evaluated')
+        if isinstance(conditions, list):
+            return conditions
+        for key in ('diagnostic_data', 'evaluated_conditions'):
+            nested = payload.get(key)
+            if isinstance(nested, dict) and isinstance(nested.get('conditions_evaluated'), list):
+                return nested['conditions_evaluated']
+        return None
+    
+    @staticmethod
+    def _render_state(state: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill in condition display text of a current state (in place)."""
+        render_condition_diagnostics(state)
+        for value in state.values():
+            if isinstance(value, dict):
+                render_condition_diagnostics(value)
+        return state
+    
+    @staticmethod
+    def _push_event(context: Dict[str, Any], execution_id: str, event: Dict[str, Any]) -> None:
+        try:
+            # Import here to avoid circular dependency
+            from live_simulation_sse import sse_manager
+            
+            session = sse_manager.get_session(context['session_id'])
+            if session:
+                # Push event to SSE queue (session.add_node_event handles sequence increment)
+                session.add_node_event(execution_id, event)
+                logger.debug(f"📡 SSE push: {execution_id} (session: {context['session_id']})")
+        except Exception as e:
+            logger.warning(f"Failed to push event to SSE: {e}")
+    
     def _get_children_info(self, node: Any, context: Dict[str, Any]) -> List[Dict[str, str]]:
         """Get children nodes information."""
         children_ids = getattr(node, 'children', [])
@@ -406,7 +489,7 @@ class NodeDiagnostics:
         candle_df_dict = context.get('candle_df_dict', {})
         for key, candle_data in candle_df_dict.items():
             try:
-                if isinstance(candle_data, list) and len(candle_data) > 0:
+                if isinstance(candle_data, (list, CandleBufferView)) and len(candle_data) > 0:
                     # List of candle dicts - capture ALL candles (full buffer)
                     candle_snapshot[key] = []
                     for candle in candle_data:
@@ -0,0 +1,567 @@
+"""
+Node Event Store - bounded, columnar node diagnostics history.
+
+NodeDiagnostics.record_event used to build a dict per event (node
+metadata, a fresh children list, the evaluation payload and the display
+text of every condition) and keep it forever in
+context['node_events_history'], whatever max_events_per_node said.
+
+NodeEventStore keeps the same history as rows of typed, preallocated
+NumPy columns:
+
+- events: interned node code, interned event type, epoch-microsecond
+  timestamp, tick count (+ execution ids, which flow tracking needs)
+- conditions: numeric lhs/rhs values, result and interned operator of
+  each condition evaluated for an event (expression configs are kept by
+  reference, never copied or rendered)
+
+Node name/type/children are resolved once per node. Each node keeps at
+most max_events_per_node rows; recording past that recycles the node's
+oldest row.
+
+Detail is set by the diagnostics level:
+
+- 'full':    event columns + condition columns + the raw payload
+             (evaluation_data / additional_data), as before
+- 'summary': event columns + condition columns only
+- 'off':     nothing is recorded (NodeDiagnostics skips the store)
+
+The store is a read-only Mapping execution_id -> event dict, so existing
+consumers (streaming results, dashboards, JSON export) read it exactly
+like the old dict. Event dicts and all human-readable condition text are
+rendered on access / export only.
+
+Author: UniTrader Team
+Created: 2024-11-12
+"""
+
+import math
+from collections import deque
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from src.core.unified_ltp_store import NO_TIMESTAMP, from_epoch_us, to_epoch_us
+
+DIAGNOSTICS_OFF = 'off'
+DIAGNOSTICS_SUMMARY = 'summary'
+DIAGNOSTICS_FULL = 'full'
+DIAGNOSTICS_LEVELS = (DIAGNOSTICS_OFF, DIAGNOSTICS_SUMMARY, DIAGNOSTICS_FULL)
+
+DEFAULT_CAPACITY = 256
+
+# Condition value kinds (int/float kept apart: display formats differ)
+_FLOAT, _INT, _OTHER = 0, 1, 2
+_RESULTS = {1: True, 0: False}
+
+
+def _pack_value(value: Any) -> Tuple[int, float]:
+    if isinstance(value, bool) or value is None:
+        return _OTHER, math.nan
+    if isinstance(value, int):
+        return _INT, float(value)
+    if isinstance(value, float):
+        return _FLOAT, value
+    return _OTHER, math.nan
+
+
+class NodeEventStore(Mapping):
+    """
+    Columnar, per-node bounded store of node diagnostic events.
+
+    Usage:
+        store = NodeEventStore(max_events_per_node=100, level='summary')
+        store.record(node, context, 'logic_completed', execution_id, parent_id,
+                     payload=None, conditions=diagnostic_data['conditions_evaluated'])
+
+        store[execution_id]   # rendered event dict
+        store.headers         # same keys, metadata only (flow-chain lookups)
+        store.export()        # {execution_id: event dict} (JSON-ready)
+        store.export_since(c) # (events recorded after cursor c, next cursor)
+        store.to_columns()    # columnar export
+    """
+
+    def __init__(self, max_events_per_node: int = 100, level: str = DIAGNOSTICS_FULL,
+                 capacity: int = DEFAULT_CAPACITY):
+        """
+        Initialize event store.
+
+        Args:
+            max_events_per_node: Maximum events kept per node (oldest recycled)
+            level: Diagnostics level ('full' keeps raw payloads, 'summary' does not)
+            capacity: Initial number of event rows (grows by doubling)
+        """
+        if level not in DIAGNOSTICS_LEVELS:
+            raise ValueError(f"Unknown diagnostics level '{level}' (expected one of {DIAGNOSTICS_LEVELS})")
+
+        self.max_events_per_node = max_events_per_node
+        self.level = level
+        self._tzinfo = None  # Wall-clock timestamps are re-attached to this on export
+
+        # Interned nodes: code -> (node_id, name, type, children info)
+        self._node_codes: Dict[str, int] = {}
+        self._nodes: List[Tuple[str, Any, Any, List[Dict[str, str]]]] = []
+        self._node_rows: List[Deque[int]] = []
+
+        # Interned event types / operators / condition types
+        self._event_type_codes: Dict[str, int] = {}
+        self._event_types: List[str] = []
+        self._operator_codes: Dict[str, int] = {}
+        self._operators: List[str] = []
+
+        # Event columns (one row per event)
+        capacity = max(1, capacity)
+        self._node = np.zeros(capacity, dtype=np.int32)
+        self._event_type = np.zeros(capacity, dtype=np.int16)
+        self._ts_epoch = np.full(capacity, NO_TIMESTAMP, dtype=np.int64)
+        self._tick = np.zeros(capacity, dtype=np.int64)
+        self._seq = np.zeros(capacity, dtype=np.int64)  # stats['recorded'] when the row was last written
+        self._cond_start = np.zeros(capacity, dtype=np.int64)
+        self._cond_count = np.zeros(capacity, dtype=np.int32)
+        self._execution_id: List[Optional[str]] = [None] * capacity
+        self._parent_execution_id: List[Optional[str]] = [None] * capacity
+        self._payload: List[Optional[Dict[str, Any]]] = [None] * capacity
+        self._raw_timestamp: Dict[int, str] = {}  # Rows whose timestamp has no epoch form
+
+        self._rows: Dict[str, int] = {}  # execution_id -> row (insertion ordered)
+        self._size = 0
+
+        # Condition columns (appended; compacted when half of them are dead)
+        self._cond_lhs = np.zeros(capacity, dtype=np.float64)
+        self._cond_rhs = np.zeros(capacity, dtype=np.float64)
+        self._cond_lhs_kind = np.zeros(capacity, dtype=np.int8)
+        self._cond_rhs_kind = np.zeros(capacity, dtype=np.int8)
+        self._cond_result = np.zeros(capacity, dtype=np.int8)
+        self._cond_operator = np.zeros(capacity, dtype=np.int16)
+        self._cond_live = np.zeros(capacity, dtype=np.bool_)
+        self._cond_expressions: List[Optional[Tuple[Any, Any]]] = [None] * capacity
+        self._cond_raw: Dict[int, Tuple[Any, Any, Any]] = {}  # Non-numeric lhs/rhs/result
+        self._cond_size = 0
+        self._cond_used = 0
+
+        self.stats = {'recorded': 0, 'evicted': 0}
+
+    # ==================== Recording ====================
+
+    def record(
+        self,
+        node: Any,
+        context: Dict[str, Any],
+        event_type: str,
+        execution_id: str,
+        parent_execution_id: Optional[str] = None,
+        payload: Optional[Dict[str, Any]] = None,
+        conditions: Optional[List[Dict[str, Any]]] = None
+    ) -> None:
+        """
+        Record one event.
+
+        Args:
+            node: Node instance
+            context: Execution context (tick_count, current_timestamp, all_nodes)
+            event_type: Event type ('logic_completed', ...)
+            execution_id: Unique execution id (store key)
+            parent_execution_id: Parent's execution id
+            payload: Raw event payload (kept at 'full' level only)
+            conditions: Condition diagnostics evaluated for this event
+        """
+        node_code = self._node_code(node, context)
+
+        row = self._rows.get(execution_id)
+        if row is None:
+            row = self._allocate_row(node_code)
+            self._rows[execution_id] = row
+        else:
+            self._release_conditions(row)
+
+        self._node[row] = node_code
+        self._event_type[row] = self._intern_event_type(event_type)
+        self._tick[row] = context.get('tick_count', 0)
+        self._set_timestamp(row, context.get('current_timestamp'))
+        self._execution_id[row] = execution_id
+        self._parent_execution_id[row] = parent_execution_id
+        self._payload[row] = payload if self.level == DIAGNOSTICS_FULL else None
+        self._append_conditions(row, conditions or ())
+        self.stats['recorded'] += 1
+        self._seq[row] = self.stats['recorded']
+
+    def node_info(self, node: Any, context: Dict[str, Any]) -> Tuple[str, Any, Any, List[Dict[str, str]]]:
+        """(node_id, name, type, children info) for a node, resolved once."""
+        return self._nodes[self._node_code(node, context)]
+
+    def clear(self) -> None:
+        """Drop all events (interned nodes are kept)."""
+        self._rows.clear()
+        self._raw_timestamp.clear()
+        self._cond_raw.clear()
+        for rows in self._node_rows:
+            rows.clear()
+        self._payload = [None] * len(self._payload)
+        self._cond_expressions = [None] * len(self._cond_expressions)
+        self._size = 0
+        self._cond_size = 0
+        self._cond_used = 0
+
+    # ==================== Mapping (rendered events) ====================
+
+    def __getitem__(self, execution_id: str) -> Dict[str, Any]:
+        return self._render_event(self._rows[execution_id])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._rows))
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, execution_id: object) -> bool:
+        return execution_id in self._rows
+
+    @property
+    def headers(self) -> 'NodeEventHeaders':
+        """Mapping execution_id -> event metadata (no payload / conditions)."""
+        return NodeEventHeaders(self)
+
+    def export(self) -> Dict[str, Dict[str, Any]]:
+        """All events as {execution_id: event dict}, text rendered."""
+        return {execution_id: self._render_event(row) for execution_id, row in self._rows.items()}
+
+    def export_since(self, cursor: int = 0) -> Tuple[Dict[str, Dict[str, Any]], int]:
+        """
+        Events recorded (or re-recorded) after `cursor`, oldest first, and the next cursor.
+
+        Cursor 0 returns every event. Only the new events are rendered, so
+        polling consumers (SSE streams) pay per new event, not per stored one.
+        """
+        live = np.flatnonzero(self._seq[:self._size] > cursor)
+        rows = [row for row in live[np.argsort(self._seq[live], kind='stable')].tolist()
+                if self._rows.get(self._execution_id[row]) == row]
+        return {self._execution_id[row]: self._render_event(row) for row in rows}, self.stats['recorded']
+
+    def events_for_node(self, node_id: str, event_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Rendered events of one node, oldest first."""
+        code = self._node_codes.get(node_id)
+        if code is None:
+            return []
+        events = [self._render_event(row) for row in self._node_rows[code]]
+        if event_type:
+            events = [event for event in events if event['event_type'] == event_type]
+        return events
+
+    def to_columns(self) -> Dict[str, Any]:
+        """
+        Columnar export (events in insertion order, no text rendered).
+
+        Returns:
+            {'nodes': [...], 'event_types': [...], 'operators': [...],
+             'events': {column: array/list}, 'conditions': {column: array/list}}
+            conditions['event'] indexes the events columns.
+        """
+        rows = np.fromiter(self._rows.values(), dtype=np.int64, count=len(self._rows))
+        counts = self._cond_count[rows]
+        cond_rows = np.concatenate([
+            np.arange(start, start + count) for start, count in zip(self._cond_start[rows], counts)
+        ]) if counts.sum() else np.zeros(0, dtype=np.int64)
+
+        return {
+            'nodes': [{'id': node_id, 'name': name, 'type': node_type}
+                      for node_id, name, node_type, _ in self._nodes],
+            'event_types': list(self._event_types),
+            'operators': list(self._operators),
+            'events': {
+                'execution_id': [self._execution_id[row] for row in rows],
+                'parent_execution_id': [self._parent_execution_id[row] for row in rows],
+                'node': self._node[rows],
+                'event_type': self._event_type[rows],
+                'ts_epoch': self._ts_epoch[rows],
+                'tick': self._tick[rows],
+                'condition_count': counts,
+            },
+            'conditions': {
+                'event': np.repeat(np.arange(len(rows)), counts),
+                'lhs_value': self._cond_lhs[cond_rows],
+                'rhs_value': self._cond_rhs[cond_rows],
+                'result': self._cond_result[cond_rows],
+                'operator': self._cond_operator[cond_rows],
+                'live': self._cond_live[cond_rows],
+            },
+        }
+
+    def get_summary(self) -> Dict[str, Any]:
+        return {
+            'events': len(self._rows),
+            'nodes': len(self._nodes),
+            'conditions': self._cond_used,
+            'level': self.level,
+            'max_events_per_node': self.max_events_per_node,
+            **self.stats
+        }
+
+    # ==================== Private Helper Methods ====================
+
+    def _node_code(self, node: Any, context: Dict[str, Any]) -> int:
+        node_id = node.id
+        code = self._node_codes.get(node_id)
+        if code is None:
+            code = len(self._nodes)
+            self._node_codes[node_id] = code
+            self._nodes.append((
+                node_id,
+                getattr(node, 'name', node_id),
+                getattr(node, 'type', 'unknown'),
+                self._children_info(node, context)
+            ))
+            self._node_rows.append(deque())
+        return code
+
+    @staticmethod
+    def _children_info(node: Any, context: Dict[str, Any]) -> List[Dict[str, str]]:
+        children_ids = getattr(node, 'children', [])
+        if not children_ids:
+            return []
+
+        all_nodes = context.get('all_nodes', {})
+        children_info = []
+        for child_id in children_ids:
+            child_node = all_nodes.get(child_id)
+            if child_node:
+                children_info.append({
+                    'id': child_id,
+                    'name': getattr(child_node, 'name', child_id),
+                    'type': getattr(child_node, 'type', 'unknown')
+                })
+            else:
+                # Fallback: just return ID
+                children_info.append({'id': child_id})
+        return children_info
+
+    def _intern_event_type(self, event_type: str) -> int:
+        code = self._event_type_codes.get(event_type)
+        if code is None:
+            code = len(self._event_types)
+            self._event_type_codes[event_type] = code
+            self._event_types.append(event_type)
+        return code
+
+    def _intern_operator(self, operator: str) -> int:
+        code = self._operator_codes.get(operator)
+        if code is None:
+            code = len(self._operators)
+            self._operator_codes[operator] = code
+            self._operators.append(operator)
+        return code
+
+    def _allocate_row(self, node_code: int) -> int:
+        node_rows = self._node_rows[node_code]
+        if self.max_events_per_node and len(node_rows) >= self.max_events_per_node:
+            # Recycle this node's oldest event
+            row = node_rows.popleft()
+            del self._rows[self._execution_id[row]]
+            self._release_conditions(row)
+            self._raw_timestamp.pop(row, None)
+            self.stats['evicted'] += 1
+        else:
+            if self._size == len(self._node):
+                self._grow_events()
+            row = self._size
+            self._size += 1
+            self._cond_count[row] = 0
+        node_rows.append(row)
+        return row
+
+    def _grow_events(self) -> None:
+        extra = len(self._node)
+        self._node = np.concatenate([self._node, np.zeros(extra, dtype=np.int32)])
+        self._event_type = np.concatenate([self._event_type, np.zeros(extra, dtype=np.int16)])
+        self._ts_epoch = np.concatenate([self._ts_epoch, np.full(extra, NO_TIMESTAMP, dtype=np.int64)])
+        self._tick = np.concatenate([self._tick, np.zeros(extra, dtype=np.int64)])
+        self._seq = np.concatenate([self._seq, np.zeros(extra, dtype=np.int64)])
+        self._cond_start = np.concatenate([self._cond_start, np.zeros(extra, dtype=np.int64)])
+        self._cond_count = np.concatenate([self._cond_count, np.zeros(extra, dtype=np.int32)])
+        self._execution_id.extend([None] * extra)
+        self._parent_execution_id.extend([None] * extra)
+        self._payload.extend([None] * extra)
+
+    def _set_timestamp(self, row: int, timestamp: Any) -> None:
+        self._raw_timestamp.pop(row, None)
+        if not timestamp:
+            self._ts_epoch[row] = NO_TIMESTAMP
+            return
+        if isinstance(timestamp, datetime) and timestamp.tzinfo is not None:
+            self._tzinfo = timestamp.tzinfo
+        epoch = to_epoch_us(timestamp)
+        self._ts_epoch[row] = epoch
+        if epoch == NO_TIMESTAMP:
+            self._raw_timestamp[row] = str(timestamp)
+
+    def _timestamp_text(self, row: int) -> Optional[str]:
+        raw = self._raw_timestamp.get(row)
+        if raw is not None:
+            return raw
+        timestamp = from_epoch_us(self._ts_epoch[row])
+        if timestamp is None:
+            return None
+        if self._tzinfo is not None:
+            timestamp = timestamp.replace(tzinfo=self._tzinfo)
+        return str(timestamp)
+
+    def _append_conditions(self, row: int, conditions: Any) -> None:
+        count = len(conditions)
+        if self._cond_size + count > len(self._cond_lhs):
+            self._compact_conditions(count)
+
+        start = self._cond_size
+        for i, condition in enumerate(conditions):
+            index = start + i
+            lhs_value = condition.get('lhs_value')
+            rhs_value = condition.get('rhs_value')
+            result = condition.get('result')
+            lhs_kind, self._cond_lhs[index] = _pack_value(lhs_value)
+            rhs_kind, self._cond_rhs[index] = _pack_value(rhs_value)
+            self._cond_lhs_kind[index] = lhs_kind
+            self._cond_rhs_kind[index] = rhs_kind
+            if result is True or result is False:
+                self._cond_result[index] = result
+            else:
+                self._cond_result[index] = -1
+            if lhs_kind == _OTHER or rhs_kind == _OTHER or self._cond_result[index] == -1:
+                self._cond_raw[index] = (lhs_value, rhs_value, result)
+            self._cond_operator[index] = self._intern_operator(condition.get('operator'))
+            self._cond_live[index] = condition.get('condition_type') == 'live'
+            self._cond_expressions[index] = (condition.get('lhs_expression'), condition.get('rhs_expression'))
+
+        self._cond_start[row] = start
+        self._cond_count[row] = count
+        self._cond_size += count
+        self._cond_used += count
+
+    def _release_conditions(self, row: int) -> None:
+        start, count = int(self._cond_start[row]), int(self._cond_count[row])
+        for index in range(start, start + count):
+            self._cond_expressions[index] = None
+            self._cond_raw.pop(index, None)
+        self._cond_used -= count
+        self._cond_count[row] = 0
+
+    def _compact_conditions(self, needed: int) -> None:
+        """Drop dead condition rows; grow only if live rows fill half the columns."""
+        live_rows = sorted(self._rows.values(), key=lambda row: self._cond_start[row])
+        old = np.concatenate([
+            np.arange(self._cond_start[row], self._cond_start[row] + self._cond_count[row]) for row in live_rows
+        ]) if self._cond_used else np.zeros(0, dtype=np.int64)
+
+        capacity = len(self._cond_lhs)
+        while 2 * (len(old) + needed) > capacity:
+            capacity *= 2
+
+        def _compacted(column, fill=0):
+            compacted = np.full(capacity, fill, dtype=column.dtype)
+            compacted[:len(old)] = column[old]
+            return compacted
+
+        self._cond_lhs = _compacted(self._cond_lhs)
+        self._cond_rhs = _compacted(self._cond_rhs)
+        self._cond_lhs_kind = _compacted(self._cond_lhs_kind)
+        self._cond_rhs_kind = _compacted(self._cond_rhs_kind)
+        self._cond_result = _compacted(self._cond_result)
+        self._cond_operator = _compacted(self._cond_operator)
+        self._cond_live = _compacted(self._cond_live)
+
+        remap = {int(index): new for new, index in enumerate(old)}
+        expressions = [None] * capacity
+        for index, new in remap.items():
+            expressions[new] = self._cond_expressions[index]
+        self._cond_expressions = expressions
+        self._cond_raw = {remap[index]: raw for index, raw in self._cond_raw.items() if index in remap}
+
+        start = 0
+        for row in live_rows:
+            self._cond_start[row] = start
+            start += int(self._cond_count[row])
+        self._cond_size = start
+
+    def _render_conditions(self, row: int, timestamp: Optional[str]) -> List[Dict[str, Any]]:
+        conditions = []
+        start = int(self._cond_start[row])
+        for index in range(start, start + int(self._cond_count[row])):
+            raw = self._cond_raw.get(index)
+            lhs_value = self._unpack(self._cond_lhs_kind[index], self._cond_lhs[index], raw, 0)
+            rhs_value = self._unpack(self._cond_rhs_kind[index], self._cond_rhs[index], raw, 1)
+            result = raw[2] if raw is not None and self._cond_result[index] == -1 else _RESULTS[self._cond_result[index]]
+            lhs_expression, rhs_expression = self._cond_expressions[index]
+
+            condition = {
+                'lhs_expression': lhs_expression,
+                'rhs_expression': rhs_expression,
+                'lhs_value': lhs_value,
+                'rhs_value': rhs_value,
+                'operator': self._operators[self._cond_operator[index]],
+                'timestamp': timestamp,
+            }
+            if self._cond_live[index]:
+                condition['tick_count'] = int(self._tick[row])
+            condition['condition_type'] = 'live' if self._cond_live[index] else 'non_live'
+            condition['result'] = result
+            conditions.append(condition)
+        return conditions
+
+    @staticmethod
+    def _unpack(kind: int, value: float, raw: Optional[Tuple[Any, Any, Any]], side: int) -> Any:
+        if kind == _OTHER:
+            return raw[side]
+        if kind == _INT:
+            return int(value)
+        return float(value)
+
+    def _render_header(self, row: int) -> Dict[str, Any]:
+        node_id, name, node_type, children = self._nodes[self._node[row]]
+        return {
+            'execution_id': self._execution_id[row],
+            'parent_execution_id': self._parent_execution_id[row],
+            'timestamp': self._timestamp_text(row),
+            'event_type': self._event_types[self._event_type[row]],
+            'node_id': node_id,
+            'node_name': name,
+            'node_type': node_type,
+            'children_nodes': [dict(child) for child in children],
+        }
+
+    def _render_event(self, row: int) -> Dict[str, Any]:
+        from src.core.condition_evaluator_v2 import render_condition_diagnostics
+
+        event = self._render_header(row)
+        timestamp = event['timestamp']
+
+        payload = self._payload[row]
+        if payload is not None:
+            event.update(payload)
+            render_condition_diagnostics(event)
+            for value in payload.values():
+                if isinstance(value, dict):
+                    render_condition_diagnostics(value)
+        elif self._cond_count[row]:
+            event['conditions_evaluated'] = self._render_conditions(row, timestamp)
+            render_condition_diagnostics(event)
+        return event
+
+
+class NodeEventHeaders(Mapping):
+    """Read-only view: execution_id -> event metadata of a NodeEventStore"""
+
+    __slots__ = ('_store',)
+
+    def __init__(self, store: NodeEventStore):
+        self._store = store
+
+    def __getitem__(self, execution_id: str) -> Dict[str, Any]:
+        return self._store._render_header(self._store._rows[execution_id])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store)
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __contains__(self, execution_id: object) -> bool:
+        return execution_id in self._store
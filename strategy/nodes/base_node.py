@@ -68,6 +68,12 @@ class BaseNode:
         node_states[self.id].update(state_updates)
         context['node_states'] = node_states
 
+        # Keep the active-node scheduler's Active/Pending set current
+        if 'status' in state_updates:
+            scheduler = context.get('node_scheduler')
+            if scheduler is not None:
+                scheduler.on_status(self.id, state_updates['status'])
+
     def set_status(self, context, status: str):
         """Set the node status in context."""
         self._set_node_state(context, {'status': status})
@@ -340,12 +346,22 @@ class BaseNode:
         - Each child handles its own visited/active logic internally
         - This creates a natural flow through the entire node tree
         
+        With an ActiveNodeScheduler in the context (centralized tick
+        processor), the start node hands its subtree to the scheduler, which
+        executes only the nodes that are Active when reached.
+        
         Args:
             context: Execution context
             
         Returns:
             List of child execution results
         """
+        scheduler = context.get('node_scheduler')
+        if scheduler is not None:
+            scheduled_results = scheduler.execute_children(self, context)
+            if scheduled_results is not None:
+                return scheduled_results
+        
         # Track recursion depth for monitoring and safety
         depth = context.get('_exec_depth', 0)
         context['_exec_depth'] = depth + 1
@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import Dict, Any
 
 from src.utils.logger import log_debug, log_info, log_warning, log_error, log_critical
+from src.core.condition_evaluator_v2 import render_condition_diagnostics
 from src.utils.ltp_filter import filter_ltp_store, get_position_symbols_from_context
 
 from .base_node import BaseNode
@@ -801,6 +802,9 @@ class EntryNode(BaseNode):
             except Exception as e:
                 log_warning(f"EntryNode {self.id}: Error retrieving diagnostic data: {e}")
             
+            # Condition display text is rendered here, once per order (not per evaluation)
+            render_condition_diagnostics(diagnostic_data)
+            
             # Enhanced diagnostic snapshot
             entry_snapshot = {
                 'timestamp': current_timestamp.isoformat() if current_timestamp and hasattr(current_timestamp, 'isoformat') else str(current_timestamp),
@@ -181,6 +181,12 @@ class EntrySignalNode(BaseNode):
         if hasattr(self.condition_evaluator, 'reset_diagnostic_data'):
             self.condition_evaluator.reset_diagnostic_data()
         
+        # Whole-day candle-only screens (columnar backtests): skip seconds where
+        # the conditions provably cannot hold
+        prescreen = getattr(context.get('data_manager'), 'signal_prescreen', None)
+        if prescreen is not None and not prescreen.may_satisfy(active_conditions, context):
+            return False
+        
         # For now, let's handle simple conditions first
         # Each condition in the list should be satisfied (AND logic)
         for i, condition in enumerate(active_conditions):
@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import Dict, Any
 
 from src.utils.logger import log_debug, log_info, log_warning, log_error, log_critical
+from src.core.condition_evaluator_v2 import render_condition_diagnostics
 from src.utils.ltp_filter import filter_ltp_store, get_position_symbols_from_context
 
 from .base_node import BaseNode
@@ -812,6 +813,9 @@ class ExitNode(BaseNode):
             except Exception as e:
                 log_warning(f"ExitNode {self.id}: Error retrieving exit diagnostic data: {e}")
             
+            # Condition display text is rendered here, once per order (not per evaluation)
+            render_condition_diagnostics(diagnostic_data)
+            
             # Get node variables snapshot at exit
             context_manager = context.get('context_manager')
             node_variables_snapshot = {}
@@ -125,6 +125,12 @@ class ExitSignalNode(BaseNode):
             log_warning(f"  ⚠️  No exit conditions configured for {self.id} ({'re-entry' if in_reentry_mode else 'normal'})")
             return False
 
+        # Whole-day candle-only screens (columnar backtests): skip seconds where
+        # the conditions provably cannot hold
+        prescreen = getattr(context.get('data_manager'), 'signal_prescreen', None)
+        if prescreen is not None and not prescreen.may_satisfy(active_conditions, context):
+            return False
+
         # PERFORMANCE: Conditional logging
         # if not PERFORMANCE_MODE:
         # log_info(f"   Evaluating {len(self.conditions)} exit condition(s):")
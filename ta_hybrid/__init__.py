@@ -23,33 +23,18 @@ Usage:
     # All return pandas Series or DataFrame
 """
 
-import pandas as pd
 from typing import Any
 
-# Import all indicator classes dynamically
-import src.indicators_hybrid as indicators_module
-
 # ============================================================================
-# DYNAMIC INDICATOR REGISTRY
+# INDICATOR REGISTRY
 # ============================================================================
 
-# Build indicator registry: {function_name: IndicatorClass}
-_INDICATOR_REGISTRY = {}
+# {function_name: IndicatorClass}, read from the generated registry manifest.
+# Each indicator module is imported on first lookup (and pandas_ta on the
+# first bulk calculation), so importing ta_hybrid stays cheap.
+from .registry import LazyRegistry
 
-# Get all indicator classes from indicators_hybrid module
-import re
-for name in dir(indicators_module):
-    if name.endswith('Indicator') and not name.startswith('_'):
-        indicator_class = getattr(indicators_module, name)
-        original_name = name.replace('Indicator', '')
-        
-        # Convert to snake_case: ElderRay -> elder_ray, AnchoredVWAP -> anchored_vwap
-        snake_case = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', original_name)
-        snake_case = re.sub('([a-z0-9])([A-Z])', r'\1_\2', snake_case).lower()
-        
-        # Register both versions
-        _INDICATOR_REGISTRY[snake_case] = indicator_class
-        _INDICATOR_REGISTRY[original_name.lower()] = indicator_class  # Also without underscores
+_INDICATOR_REGISTRY = LazyRegistry()
 
 
 # ============================================================================
@@ -65,7 +50,7 @@ def __getattr__(name: str) -> Any:
     if name in _INDICATOR_REGISTRY:
         indicator_class = _INDICATOR_REGISTRY[name]
         
-        def indicator_function(df: pd.DataFrame, **kwargs):
+        def indicator_function(df, **kwargs):
             """Dynamically created indicator function"""
             indicator = indicator_class(**kwargs)
             return indicator.calculate_bulk(df)
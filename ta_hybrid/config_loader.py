@@ -16,8 +16,15 @@ class ConfigLoader:
     
     def __init__(self):
         self.config_dir = Path(__file__).parent / 'config'
-        self._configs = {}
-        self._load_all_configs()
+        self._loaded_configs = None
+    
+    @property
+    def _configs(self) -> Dict[str, List[Dict]]:
+        """Configs by category, parsed on first use (not at import)"""
+        if self._loaded_configs is None:
+            self._loaded_configs = {}
+            self._load_all_configs()
+        return self._loaded_configs
     
     def _load_all_configs(self):
         """Load all JSON config files"""
@@ -29,7 +36,7 @@ class ConfigLoader:
             try:
                 with open(json_file, 'r') as f:
                     data = json.load(f)
-                    self._configs[category] = data.get('indicators', [])
+                    self._loaded_configs[category] = data.get('indicators', [])
             except Exception as e:
                 print(f"Warning: Could not load {json_file}: {e}")
     
@@ -98,7 +105,7 @@ class ConfigLoader:
         return None
 
 
-# Global config loader instance
+# Global config loader instance (JSON files are parsed on first use)
 _config_loader = ConfigLoader()
 
 
@@ -0,0 +1,169 @@
+"""
+Indicator Registry
+==================
+
+Static manifest of every ta_hybrid indicator, with per-module lazy import.
+
+The manifest (registry_manifest.json, generated) maps each function name
+to its module path, class name, config category, output columns and
+params schema. `import ta_hybrid` reads only this file; an indicator's
+module is imported the first time its class is looked up, and pandas_ta
+the first time a bulk calculation runs.
+
+Regenerate after adding, renaming or moving an indicator class:
+    python scripts/generate_ta_registry.py            # write registry_manifest.json
+    python scripts/generate_ta_registry.py --check    # exit 1 if the file is stale
+"""
+
+import importlib
+import json
+import re
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+
+MANIFEST_PATH = Path(__file__).parent / 'registry_manifest.json'
+MANIFEST_VERSION = 1
+
+# Parameter fields kept in the manifest's params schema
+_PARAM_FIELDS = ('name', 'type', 'default', 'options')
+
+
+def function_names(class_name: str) -> List[str]:
+    """
+    Registry names for an indicator class.
+
+    ElderRayIndicator -> ['elder_ray', 'elderray'], RSIIndicator -> ['rsi']
+    """
+    original_name = class_name.replace('Indicator', '')
+
+    # Convert to snake_case: ElderRay -> elder_ray, AnchoredVWAP -> anchored_vwap
+    snake_case = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', original_name)
+    snake_case = re.sub('([a-z0-9])([A-Z])', r'\1_\2', snake_case).lower()
+
+    # Also without underscores
+    return list(dict.fromkeys([snake_case, original_name.lower()]))
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> Dict[str, Any]:
+    """Read the generated manifest."""
+    with open(path, 'r') as f:
+        manifest = json.load(f)
+    if manifest.get('version') != MANIFEST_VERSION:
+        raise ValueError(
+            f"{path} has manifest version {manifest.get('version')}, expected {MANIFEST_VERSION}; "
+            f"regenerate it with: python scripts/generate_ta_registry.py"
+        )
+    return manifest
+
+
+class LazyRegistry(Mapping):
+    """
+    Read-only {function_name: IndicatorClass} mapping backed by the manifest.
+
+    Keys, membership and entry metadata come from the manifest alone; the
+    indicator module is imported (once) when a class is first requested.
+    """
+
+    def __init__(self, path: Path = MANIFEST_PATH):
+        self._path = path
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._classes: Dict[str, type] = {}
+
+    @property
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        """Manifest entries keyed by every function name (aliases included)."""
+        if self._entries is None:
+            entries = {}
+            for entry in load_manifest(self._path)['indicators']:
+                for name in entry['names']:
+                    entries[name] = entry
+            self._entries = entries
+        return self._entries
+
+    def entry(self, name: str) -> Optional[Dict[str, Any]]:
+        """Manifest metadata for a function name, without importing anything."""
+        return self.entries.get(name)
+
+    def __getitem__(self, name: str) -> type:
+        indicator_class = self._classes.get(name)
+        if indicator_class is not None:
+            return indicator_class
+
+        entry = self.entries[name]
+        module = importlib.import_module(entry['module'])
+        indicator_class = getattr(module, entry['class'])
+        for alias in entry['names']:
+            self._classes[alias] = indicator_class
+        return indicator_class
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def loaded_modules(self) -> List[str]:
+        """Indicator modules imported so far."""
+        return sorted({cls.__module__ for cls in self._classes.values()})
+
+
+# ============================================================================
+# MANIFEST GENERATION
+# ============================================================================
+
+def _config_index(config_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """{normalized function_name: config entry (with 'category')} from ta_hybrid/config"""
+    index = {}
+    for json_file in sorted(config_dir.glob('*.json')):
+        with open(json_file, 'r') as f:
+            data = json.load(f)
+        for indicator in data.get('indicators', []):
+            key = indicator.get('function_name', indicator.get('name', ''))
+            info = dict(indicator, category=json_file.stem)
+            index[key.lower().replace('_', '')] = info
+    return index
+
+
+def build_manifest() -> Dict[str, Any]:
+    """
+    Build the manifest from the indicator classes and the JSON configs.
+
+    Imports every indicator module (pandas_ta is not needed). Output columns
+    and params schema come from the indicator's config entry; classes
+    without one get an empty category / outputs / params.
+    """
+    import src.indicators_hybrid as indicators_module
+
+    configs = _config_index(Path(__file__).parent / 'config')
+    indicators = []
+    for class_name, module_name in indicators_module._CLASS_MODULES.items():
+        module_path = f'{indicators_module.__name__}.{module_name}'
+        getattr(importlib.import_module(module_path), class_name)  # must exist
+
+        names = function_names(class_name)
+        config = next((configs[key] for key in (n.replace('_', '') for n in names) if key in configs), {})
+        indicators.append({
+            'names': names,
+            'module': module_path,
+            'class': class_name,
+            'category': config.get('category'),
+            'outputs': list(config.get('outputs', [])),
+            'params': [
+                {field: param[field] for field in _PARAM_FIELDS if field in param}
+                for param in config.get('parameters', [])
+            ],
+        })
+
+    return {'version': MANIFEST_VERSION, 'indicators': indicators}
+
+
+def write_manifest(manifest: Dict[str, Any], path: Path = MANIFEST_PATH):
+    """Write the manifest (stable formatting, so diffs stay reviewable)."""
+    with open(path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+        f.write('\n')
@@ -0,0 +1,112 @@
+"""Test suite for BacktestSession warm state reuse"""
+
+import os
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src.backtesting.backtest_session import (
+    BacktestSession,
+    clear_backtest_sessions,
+    get_backtest_session,
+    new_session_id,
+)
+from src.backtesting.centralized_backtest_engine import CentralizedBacktestEngine
+from src.core.cache_manager import CacheManager
+from src.core.centralized_tick_processor import CentralizedTickProcessor
+
+
+class _CountingStrategyManager:
+    """Stand-in for StrategyManager (no Supabase)"""
+
+    def __init__(self):
+        self.loads = []
+
+    def load_strategy(self, strategy_id, broker_connection_id=None):
+        self.loads.append(strategy_id)
+        return SimpleNamespace(strategy_id=strategy_id, user_id='u1', config={'nodes': [], 'edges': []})
+
+
+class TestBacktestSession(unittest.TestCase):
+    """Session cache, strategy loading and subscription templates"""
+
+    def setUp(self):
+        clear_backtest_sessions()
+
+    def tearDown(self):
+        clear_backtest_sessions()
+        os.environ.pop('BACKTEST_SESSION_MAX', None)
+
+    def test_sessions_are_scoped_to_a_request(self):
+        request = new_session_id()
+        session = get_backtest_session(['s1'], session_id=request)
+        self.assertIs(get_backtest_session(['s1'], session_id=request), session)
+        self.assertIsNot(get_backtest_session(['s1'], scales={'s1': 2}, session_id=request), session)
+
+        # Another request (or no request id) always loads the strategies again
+        self.assertIsNot(get_backtest_session(['s1'], session_id=new_session_id()), session)
+        self.assertIsNot(get_backtest_session(['s1']), get_backtest_session(['s1']))
+
+    def test_session_limit_drops_least_recently_used(self):
+        os.environ['BACKTEST_SESSION_MAX'] = '2'
+        first, second = new_session_id(), new_session_id()
+        session = get_backtest_session(['s1'], session_id=first)
+        get_backtest_session(['s1'], session_id=second)
+        get_backtest_session(['s1'], session_id=new_session_id())
+
+        self.assertIsNot(get_backtest_session(['s1'], session_id=first), session)
+
+    def test_engines_share_strategy_manager_and_queue_override(self):
+        session = BacktestSession(['q1'], queue_entries={'q1': {'actual_strategy_id': 's1', 'user_id': 'u2'}})
+        session.strategy_manager = _CountingStrategyManager()
+
+        engine = CentralizedBacktestEngine(session.config_for('2024-10-01'), session=session)
+        strategies = engine._load_strategies()
+
+        self.assertIs(engine.strategy_manager, session.strategy_manager)
+        self.assertEqual(session.strategy_manager.loads, ['s1'])
+        self.assertEqual((strategies[0].strategy_id, strategies[0].actual_strategy_id, strategies[0].user_id),
+                         ('q1', 's1', 'u2'))
+
+    def test_subscription_template_reused_across_days(self):
+        session = BacktestSession(['s1'])
+        session.strategy_manager = _CountingStrategyManager()
+        strategy = session.strategy_manager.load_strategy('s1')
+
+        states = []
+        for backtest_date in ('2024-10-01', '2024-10-03'):
+            engine = CentralizedBacktestEngine(session.config_for(backtest_date), session=session)
+            engine.cache_manager = CacheManager()
+            engine.centralized_processor = CentralizedTickProcessor(cache_manager=engine.cache_manager,
+                                                                    thread_safe=False)
+            engine._subscribe_strategy_to_cache(strategy)
+            states.append(list(engine.centralized_processor.strategy_manager.active_strategies.values())[0])
+
+        # Day 2 gets its own copy of the prepared config, with metadata already built
+        self.assertIs(states[0]['config'], strategy.config)
+        self.assertIsNot(states[1]['config'], strategy.config)
+        self.assertEqual(states[1]['config'], strategy.config)
+        self.assertIn('metadata', states[1]['config'])
+        self.assertIsNot(states[0]['context_manager'], states[1]['context_manager'])
+
+    def test_strategies_agg_built_once_per_session(self):
+        session = BacktestSession(['s1'])
+        session.strategy_manager = _CountingStrategyManager()
+        session.strategies = [SimpleNamespace(strategy_name='s1', user_id='u1')]
+        built = {'timeframes': ['1m']}
+
+        # Stop each day right after the metadata step
+        with patch.object(CentralizedBacktestEngine, '_build_metadata', return_value=built) as build, \
+                patch.object(CentralizedBacktestEngine, '_initialize_data_components', side_effect=StopIteration):
+            for backtest_date in ('2024-10-01', '2024-10-03'):
+                engine = CentralizedBacktestEngine(session.config_for(backtest_date), session=session)
+                with self.assertRaises(StopIteration):
+                    engine.run()
+                self.assertIs(engine.strategies_agg, built)
+
+        self.assertEqual(build.call_count, 1)
+        self.assertIs(session.strategies_agg, built)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+"""Test suite for vectorized pivot / support-resistance bulk calculations"""
+
+import unittest
+
+import numpy as np
+
+from scripts.benchmark_bulk_kernels import SESSION_MINUTES, intraday_frame, legacy_bulk
+
+try:
+    from src.indicators_hybrid import (
+        PIVOTIndicator, CPRIndicator, CAMARILLAIndicator, FIBONACCIPIVOTIndicator,
+        SupportResistanceIndicator
+    )
+    from src.indicators_hybrid.kernels import previous_period_hlc, strict_extrema
+except ImportError:  # indicators_hybrid needs pandas_ta / scipy
+    PIVOTIndicator = None
+
+
+def _assert_same(test, new, old):
+    """Same columns, NaN positions and values (bit-identical)"""
+    test.assertEqual(list(new.columns), list(old.columns))
+    np.testing.assert_array_equal(new.to_numpy(dtype=float), old.to_numpy(dtype=float))
+
+
+@unittest.skipIf(PIVOTIndicator is None, "indicators_hybrid dependencies not installed")
+class TestKernels(unittest.TestCase):
+    """Array kernels"""
+
+    def test_previous_period_hlc(self):
+        """Each row gets the preceding period's max high, min low and last close"""
+        keys = ['a', 'a', 'b', 'b', 'b', 'c']
+        high = np.array([5.0, 7.0, 6.0, 9.0, 8.0, 1.0])
+        low = np.array([1.0, 2.0, 3.0, 0.5, 4.0, 1.0])
+        close = np.array([2.0, 3.0, 4.0, 5.0, 6.0, 1.0])
+
+        prev_high, prev_low, prev_close = previous_period_hlc(keys, high, low, close)
+
+        np.testing.assert_array_equal(prev_high, [np.nan, np.nan, 7.0, 7.0, 7.0, 9.0])
+        np.testing.assert_array_equal(prev_low, [np.nan, np.nan, 1.0, 1.0, 1.0, 0.5])
+        np.testing.assert_array_equal(prev_close, [np.nan, np.nan, 3.0, 3.0, 3.0, 6.0])
+
+    def test_strict_extrema(self):
+        """Pivot must beat every neighbour strictly; flagged right bars later"""
+        values = np.array([1.0, 3.0, 2.0, 2.0, 4.0, 4.0, 1.0])
+        np.testing.assert_array_equal(
+            strict_extrema(values, 1, 1, highs=True),
+            [False, False, True, False, False, False, False]
+        )
+        np.testing.assert_array_equal(
+            strict_extrema(values, 1, 1, highs=False),
+            [False, False, False, False, False, False, False]
+        )
+
+
+@unittest.skipIf(PIVOTIndicator is None, "indicators_hybrid dependencies not installed")
+class TestBulkMatchesRowLoops(unittest.TestCase):
+    """Vectorized calculate_bulk equals the replaced row-loop implementations"""
+
+    def setUp(self):
+        # Six weeks (day, week and month changes), five candles per session
+        self.df = intraday_frame(SESSION_MINUTES * 30, seed=11).iloc[::75]
+
+    def test_pivot_family(self):
+        """Daily, weekly and monthly periods"""
+        for indicator_class in (PIVOTIndicator, CPRIndicator, CAMARILLAIndicator, FIBONACCIPIVOTIndicator):
+            for timeframe in ('D', 'W', 'M'):
+                indicator = indicator_class(timeframe=timeframe)
+                with self.subTest(indicator=indicator_class.__name__, timeframe=timeframe):
+                    _assert_same(self, indicator.calculate_bulk(self.df), legacy_bulk(indicator, self.df))
+
+    def test_pivot_state_from_dataframe(self):
+        """Warm-up state is taken from the period before the last row's period"""
+        indicator = PIVOTIndicator(timeframe='D')
+        indicator.initialize_from_dataframe(self.df)
+
+        dates = self.df.index.date
+        previous_day = self.df[dates == dates[dates != dates[-1]][-1]]
+        self.assertEqual(indicator._prev_high, previous_day['high'].max())
+        self.assertEqual(indicator._prev_close, previous_day['close'].iloc[-1])
+        self.assertEqual(indicator._current_period, self.df.index.date[-1])
+
+    def test_support_resistance(self):
+        """Default and small swing windows, with and without volume weighting"""
+        df = intraday_frame(800, seed=5)
+        for params in ({}, {'left_bars': 3, 'right_bars': 2, 'max_levels': 4, 'min_strength': 1},
+                       {'left_bars': 5, 'right_bars': 5, 'use_volume': False, 'min_strength': 1.5}):
+            indicator = SupportResistanceIndicator(**params)
+            with self.subTest(params=params):
+                _assert_same(self, indicator.calculate_bulk(df), legacy_bulk(indicator, df))
+
+    def test_support_resistance_short_frame(self):
+        """Fewer candles than the swing window: all NaN"""
+        result = SupportResistanceIndicator().calculate_bulk(self.df.iloc[:10])
+        self.assertEqual(result.shape, (10, 6))
+        self.assertTrue(result.isna().all().all())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+"""Test suite for MultiTimeframeCandleAggregator (parity with per-timeframe CandleBuilders)"""
+
+import random
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from src.backtesting.candle_aggregator import MultiTimeframeCandleAggregator, bucket_start_minute
+from src.backtesting.candle_builder import CandleBuilder
+from src.backtesting.data_manager import DataManager
+from src.symbol_mapping.symbol_table import SymbolTable
+
+
+def _ticks(seed, start=datetime(2024, 10, 1, 9, 5, 0), days=2, symbols=('NIFTY',)):
+    """Random-gap tick stream: pre-open ticks, quiet minutes, a day change"""
+    rng = random.Random(seed)
+    ticks = []
+    price = 25000.0
+    for day in range(days):
+        timestamp = start + timedelta(days=day)
+        end = timestamp.replace(hour=15, minute=30)
+        while timestamp < end:
+            timestamp += timedelta(seconds=rng.choice([1, 1, 2, 5, 30, 90, 400]))
+            price += rng.uniform(-5, 5)
+            ticks.append({'symbol': rng.choice(symbols), 'timestamp': timestamp,
+                          'ltp': round(price, 2), 'volume': rng.randint(0, 50)})
+    return ticks
+
+
+class TestBucketing(unittest.TestCase):
+    """Integer bucketing matches CandleBuilder._get_candle_start_time"""
+
+    def test_every_minute_of_day(self):
+        for exchange in ('NSE', 'MCX'):
+            for timeframe in ('1m', '3m', '5m', '15m', '1h'):
+                builder = CandleBuilder(timeframe=timeframe, exchange=exchange)
+                market_open = builder.market_open_hour * 60 + builder.market_open_minute
+                for minute in range(1440):
+                    timestamp = datetime(2024, 10, 1, minute // 60, minute % 60, 30)
+                    start = builder._get_candle_start_time(timestamp)
+                    self.assertEqual(
+                        bucket_start_minute(minute, market_open, builder.interval_minutes),
+                        start.hour * 60 + start.minute
+                    )
+
+
+class TestParityWithCandleBuilders(unittest.TestCase):
+    """Completed and forming candles equal one CandleBuilder per timeframe"""
+
+    def _assert_parity(self, timeframes, ticks, exchange='NSE', force_every=None):
+        aggregator = MultiTimeframeCandleAggregator(timeframes, exchange=exchange)
+        builders = {tf: CandleBuilder(timeframe=tf, exchange=exchange) for tf in timeframes}
+        symbols = sorted({tick['symbol'] for tick in ticks})
+
+        for i, tick in enumerate(ticks):
+            expected = {}
+            for tf, builder in builders.items():
+                candle = builder.process_tick(dict(tick))
+                if candle:
+                    expected[tf] = candle
+            got = dict(aggregator.process_tick(dict(tick)))
+            self.assertEqual(got, expected, f"tick {i}: {tick}")
+
+            for tf, builder in builders.items():
+                self.assertEqual(aggregator.views[tf].get_current_candle(tick['symbol']),
+                                 builder.get_current_candle(tick['symbol']), f"forming {tf} at tick {i}")
+
+            if force_every and i % force_every == force_every - 1:
+                tf = timeframes[(i // force_every) % len(timeframes)]
+                self.assertEqual(aggregator.views[tf].force_complete_all(), builders[tf].force_complete_all())
+
+        for tf, builder in builders.items():
+            self.assertEqual(aggregator.views[tf].current_candles,
+                             {s: builder.get_current_candle(s) for s in symbols if builder.get_current_candle(s)})
+
+    def test_minute_base(self):
+        self._assert_parity(['1m', '3m', '5m', '15m', '1h'], _ticks(1))
+
+    def test_gcd_base_not_requested(self):
+        """3m + 5m roll up from internal 1m bars"""
+        self._assert_parity(['5m', '3m'], _ticks(2))
+
+    def test_five_minute_base(self):
+        self._assert_parity(['15m', '5m', '1h'], _ticks(3))
+
+    def test_mcx_open_and_symbols(self):
+        self._assert_parity(['1m', '5m', '15m'], _ticks(4, start=datetime(2024, 10, 1, 8, 50), symbols=('CRUDEOIL', 'GOLD')),
+                            exchange='MCX')
+
+    def test_force_complete_mid_stream(self):
+        """Force-completing any timeframe restarts only that timeframe"""
+        self._assert_parity(['1m', '5m', '15m'], _ticks(5, days=1), force_every=97)
+        self._assert_parity(['3m', '5m'], _ticks(6, days=1), force_every=61)
+
+
+class TestDataManagerWiring(unittest.TestCase):
+    """DataManager builds every timeframe through one aggregator"""
+
+    def test_setup_exposes_views(self):
+        dm = DataManager(cache=None, broker_name='clickhouse')
+        dm._setup_candle_builders(['5m', '1m'])
+        dm._setup_candle_builders(['15m'])
+
+        self.assertEqual(set(dm.candle_builders), {'1m', '5m', '15m'})
+        self.assertEqual(dm.candle_aggregator.base_minutes, 1)
+        self.assertEqual(dm.candle_builders['5m'].interval_minutes, 5)
+        self.assertEqual((dm.candle_builders['5m'].market_open_hour, dm.candle_builders['5m'].market_open_minute),
+                         (9, 15))
+
+    def _data_manager(self, timeframes, aggregated):
+        dm = DataManager(cache=None, broker_name='clickhouse')
+        dm.symbol_table = SymbolTable('clickhouse', _IdentitySymbolCache())
+        if aggregated:
+            dm._setup_candle_builders(timeframes)
+        else:
+            dm.candle_builders = {tf: CandleBuilder(timeframe=tf) for tf in timeframes}
+        return dm
+
+    def test_forming_buffers_match_per_tick_refresh(self):
+        """Higher timeframes read on access equal refreshing every buffer on every tick"""
+        timeframes = ['1m', '3m', '5m', '15m']
+        lazy = self._data_manager(timeframes, aggregated=True)
+        eager = self._data_manager(timeframes, aggregated=False)
+
+        for i, tick in enumerate(_ticks(11, days=1)):
+            lazy.process_tick(dict(tick))
+            eager.process_tick(dict(tick))
+            if i % 37 == 0:
+                self.assertEqual(set(lazy.candle_buffers), set(eager.candle_buffers))
+                for key, buffer in eager.candle_buffers.items():
+                    self.assertEqual(lazy.candle_buffers[key].to_list(), buffer.to_list(), f"{key} tick {i}")
+
+    def test_tick_touches_only_base_timeframe(self):
+        """A tick inside the base bar materializes no higher-timeframe candle"""
+        dm = self._data_manager(['1m', '5m', '15m'], aggregated=True)
+        ticks = [{'symbol': 'NIFTY', 'timestamp': datetime(2024, 10, 1, 9, 16, second), 'ltp': 100.0 + second}
+                 for second in range(1, 30)]
+        dm.process_tick(dict(ticks[0]))
+
+        with patch.object(dm.candle_aggregator, 'get_current_candle',
+                          wraps=dm.candle_aggregator.get_current_candle) as reads:
+            for tick in ticks[1:]:
+                dm.process_tick(dict(tick))
+            self.assertEqual({call.args[1] for call in reads.call_args_list}, {'1m'})
+
+            self.assertEqual(dm.market_data.candle_df_dict['NIFTY:5m'][-1]['close'], 129.0)
+
+
+class _IdentitySymbolCache:
+    """Scrip master stand-in: index symbols map to themselves"""
+
+    def to_unified(self, broker_name, broker_symbol):
+        return broker_symbol
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+"""Test suite for the array-backed candle ring buffer"""
+
+import unittest
+from datetime import datetime, timedelta
+
+from src.backtesting.candle_ring_buffer import CandleBufferView, CandleRingBuffer
+from src.backtesting.data_manager import DataManager
+
+
+def _candle(i, close=None):
+    close = float(100 + i) if close is None else close
+    return {
+        'timestamp': datetime(2024, 10, 1, 9, 15) + timedelta(minutes=i),
+        'open': close - 1, 'high': close + 1, 'low': close - 2, 'close': close, 'volume': 10 * i
+    }
+
+
+class TestCandleRingBuffer(unittest.TestCase):
+    """Test CandleRingBuffer window semantics"""
+
+    def test_window_matches_legacy_list(self):
+        """Keeps the last max_candles-1 completed candles plus forming, in order"""
+        buffer = CandleRingBuffer(max_candles=5)
+        for i in range(23):  # Crosses several compactions
+            buffer.append_completed(_candle(i), {'RSI(14)': float(i)})
+        buffer.set_forming(_candle(23))
+
+        view = buffer.view()
+        self.assertEqual(len(view), 5)
+        self.assertEqual([c['close'] for c in view], [119.0, 120.0, 121.0, 122.0, 123.0])
+        self.assertEqual(view[-2]['indicators'], {'RSI(14)': 22.0})
+        self.assertNotIn('indicators', view[-1])
+        self.assertEqual(view[-3:][0]['timestamp'], _candle(21)['timestamp'])
+
+    def test_forming_flag(self):
+        """Forming candle is replaced in place and never evicts completed candles"""
+        buffer = CandleRingBuffer(max_candles=3)
+        buffer.append_completed(_candle(0))
+        self.assertFalse(buffer.has_forming)
+
+        buffer.set_forming(_candle(1, close=50.0))
+        buffer.set_forming(_candle(1, close=51.0))
+        self.assertTrue(buffer.has_forming)
+        self.assertEqual(len(buffer), 2)
+        self.assertEqual(buffer.value('close'), 51.0)
+
+        # Completed candles without indicators are not mistaken for forming
+        buffer.append_completed(_candle(1, close=51.0))
+        self.assertEqual(len(buffer), 3)
+        self.assertEqual(buffer.value('close', -3), 100.0)
+
+    def test_value_and_column(self):
+        """Direct reads avoid dicts; column is a read-only chronological view"""
+        buffer = CandleRingBuffer(max_candles=4)
+        for i in range(7):
+            buffer.append_completed(_candle(i), {'EMA(9)': i * 2.0} if i != 5 else {})
+        buffer.set_forming(_candle(7))
+
+        self.assertIsNone(buffer.value('EMA(9)', -1))  # Forming candle
+        self.assertIsNone(buffer.value('EMA(9)', -3))  # Missing value
+        self.assertEqual(buffer.value('EMA(9)', -2), 12.0)
+        self.assertIsNone(buffer.value('UNKNOWN', -2))
+
+        closes = buffer.column('close')
+        self.assertEqual(closes.tolist(), [104.0, 105.0, 106.0])
+        with self.assertRaises(ValueError):
+            closes[0] = 0.0
+
+        with self.assertRaises(IndexError):
+            buffer.value('close', -5)
+
+    def test_view_rows_are_copies(self):
+        """Mutating a returned candle does not change the buffer"""
+        buffer = CandleRingBuffer(max_candles=3)
+        buffer.append_completed(_candle(0), {'RSI(14)': 40.0})
+        row = buffer.view()[-1]
+        row['close'] = 0.0
+        row['indicators']['RSI(14)'] = 0.0
+        self.assertEqual(buffer.value('close'), 100.0)
+        self.assertEqual(buffer.value('RSI(14)'), 40.0)
+
+
+class TestDataManagerCandleBuffers(unittest.TestCase):
+    """Test DataManager writes into ring buffers"""
+
+    def test_context_exposes_buffer_views(self):
+        """Completed + forming candles reach get_context without a cache round trip"""
+        dm = DataManager(cache=None, broker_name='clickhouse')
+        dm._add_to_candle_buffer('NIFTY', '1m', _candle(0))
+        dm._update_forming_candle_in_buffer('NIFTY', '1m', _candle(1))
+        dm._add_to_candle_buffer('NIFTY', '1m', _candle(1))
+        dm._update_forming_candle_in_buffer('NIFTY', '1m', _candle(2))
+
+        candles = dm.get_context()['candle_df_dict']['NIFTY:1m']
+        self.assertIsInstance(candles, CandleBufferView)
+        self.assertEqual([c['close'] for c in candles], [100.0, 101.0, 102.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+"""Test suite for columnar tick replay"""
+
+import unittest
+from collections import defaultdict
+from datetime import datetime
+
+from src.backtesting.columnar_ticks import ColumnarTicks
+
+
+def _make_ticks():
+    """Two symbols, several ticks per second, deliberately out of order."""
+    ticks = []
+    for second in range(5):
+        for micro, (symbol, price) in enumerate([('NIFTY', 22000.0), ('BANKNIFTY', 48000.0)]):
+            ticks.append({
+                'symbol': symbol,
+                'timestamp': datetime(2024, 10, 1, 9, 15, second, micro * 250000),
+                'ltp': price + second,
+                'ltq': 10 + second,
+                'oi': 0,
+            })
+    # Shuffle one tick out of order; store must re-sort stably
+    ticks.insert(0, ticks.pop(5))
+    return ticks
+
+
+class TestColumnarTicks(unittest.TestCase):
+    """Test ColumnarTicks batching and lazy materialization"""
+
+    def test_batches_match_dict_grouping(self):
+        """Per-second batches match the legacy defaultdict grouping"""
+        ticks = _make_ticks()
+        store = ColumnarTicks.from_ticks(ticks)
+
+        expected = defaultdict(list)
+        for tick in sorted(ticks, key=lambda t: t['timestamp']):
+            expected[tick['timestamp'].replace(microsecond=0)].append(tick)
+
+        batches = list(store.iter_second_batches())
+        self.assertEqual(len(store), len(ticks))
+        self.assertEqual(store.second_count, len(expected))
+        self.assertEqual([b[0] for b in batches], sorted(expected.keys()))
+
+        for second, batch in batches:
+            self.assertEqual(batch, expected[second])
+
+    def test_materialized_values_are_python_types(self):
+        """Materialized ticks use native Python types like load_ticks()"""
+        store = ColumnarTicks.from_ticks(_make_ticks())
+        _, batch = next(store.iter_second_batches())
+        tick = batch[0]
+
+        self.assertIsInstance(tick['timestamp'], datetime)
+        self.assertIsInstance(tick['ltp'], float)
+        self.assertIsInstance(tick['ltq'], int)
+        self.assertIsInstance(tick['symbol'], str)
+
+    def test_empty_store(self):
+        """Empty input yields no batches"""
+        store = ColumnarTicks.from_ticks([])
+        self.assertEqual(len(store), 0)
+        self.assertEqual(store.second_count, 0)
+        self.assertEqual(list(store.iter_second_batches()), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+"""
+Parity Suite: compiled condition plans vs the dict interpreter
+
+Re-runs every scenario in test_condition_evaluator_comprehensive.py with a
+ConditionEvaluator that evaluates each condition twice - once through the
+reference dict interpreter and once through the compiled plan - and
+asserts identical results and diagnostics before the scenario's own
+assertion runs. Plus buffer-backed cases the comprehensive suite does not
+cover (CandleBufferView fast paths).
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+import tests.test_condition_evaluator_comprehensive as comprehensive
+from src.backtesting.candle_ring_buffer import CandleRingBuffer
+from src.core.condition_evaluator_v2 import ConditionEvaluator
+from src.core.expression_evaluator import ExpressionEvaluator
+
+
+class ParityConditionEvaluator(ConditionEvaluator):
+    """Evaluates in both modes and checks they agree."""
+
+    def evaluate_condition(self, condition=None):
+        self.compiled = False
+        expected = self._evaluate_outcome(condition)
+        self.compiled = True
+        actual = self._evaluate_outcome(condition)
+
+        assert actual == expected, f"compiled {actual} != interpreted {expected}"
+        return actual[0]
+
+    def _evaluate_outcome(self, condition):
+        try:
+            result = ConditionEvaluator.evaluate_condition(self, condition)
+        except Exception as e:
+            return ('error', type(e), str(e))
+        return (result, self.last_evaluation_result, self.get_diagnostic_data())
+
+
+def _use_parity_evaluator(test):
+    test.evaluator = ParityConditionEvaluator(
+        expression_evaluator=test.expr_evaluator,
+        mode='backtesting'
+    )
+
+
+class TestSimpleConditionsParity(comprehensive.TestSimpleConditions):
+    def setup_method(self):
+        super().setup_method()
+        _use_parity_evaluator(self)
+
+
+class TestNestedGroupsParity(comprehensive.TestNestedGroups):
+    def setup_method(self):
+        super().setup_method()
+        _use_parity_evaluator(self)
+
+
+class TestMarketDataConditionsParity(comprehensive.TestMarketDataConditions):
+    def setup_method(self):
+        super().setup_method()
+        _use_parity_evaluator(self)
+
+
+class TestTimeConditionsParity(comprehensive.TestTimeConditions):
+    def setup_method(self):
+        super().setup_method()
+        _use_parity_evaluator(self)
+
+
+class TestEdgeCasesParity(comprehensive.TestEdgeCases):
+    def setup_method(self):
+        super().setup_method()
+        _use_parity_evaluator(self)
+
+
+class TestComplexScenariosParity(comprehensive.TestComplexScenarios):
+    def setup_method(self):
+        super().setup_method()
+        _use_parity_evaluator(self)
+
+
+class TestCandleBufferParity:
+    """Compiled fast paths over a CandleBufferView"""
+
+    def setup_method(self):
+        buffer = CandleRingBuffer(max_candles=5)
+        start = datetime(2024, 11, 24, 9, 15)
+        for i in range(6):
+            close = 100.0 + i
+            buffer.append_completed(
+                {'timestamp': start + timedelta(minutes=i), 'open': close - 1, 'high': close + 2,
+                 'low': close - 2, 'close': close, 'volume': 1000 + i},
+                {'rsi(14,close)': 40.0 + i}
+            )
+        buffer.set_forming({'timestamp': start + timedelta(minutes=6), 'open': 105.0, 'high': 109.0,
+                            'low': 104.0, 'close': 108.0, 'volume': 50})
+
+        self.context = {
+            'strategy_config': {'symbol': 'NIFTY'},
+            'candle_df_dict': {'NIFTY:1m': buffer.view()},
+            'current_timestamp': start + timedelta(minutes=6, seconds=30),
+            'ltp_store': {'NIFTY': {'ltp': 107.5}},
+        }
+        self.evaluator = ParityConditionEvaluator(expression_evaluator=ExpressionEvaluator())
+        self.evaluator.set_context(context=self.context)
+
+    @pytest.mark.parametrize('lhs, operator, rhs, expected', [
+        ({'type': 'candle_data', 'field': 'Close', 'offset': 0, 'timeframeId': '1m'}, '>',
+         {'type': 'candle_data', 'field': 'High', 'offset': -1, 'timeframeId': '1m'}, True),
+        ({'type': 'market_data', 'field': 'low', 'offset': -3, 'timeframeId': '1m'}, '<',
+         {'type': 'constant', 'value': 100}, False),
+        ({'type': 'indicator', 'name': 'rsi(14,close)', 'offset': -1, 'timeframeId': '1m'}, '==',
+         {'type': 'constant', 'value': 45}, True),
+        ({'type': 'indicator', 'name': 'rsi(14,close)', 'offset': 0, 'timeframeId': '1m'}, '>',
+         {'type': 'constant', 'value': 0}, False),
+        ({'type': 'candle_data', 'field': 'close', 'offset': -10, 'timeframeId': '1m'}, '>',
+         {'type': 'constant', 'value': 0}, False),
+        ({'type': 'candle_data', 'field': 'close', 'offset': -1, 'timeframeId': '5m'}, '>',
+         {'type': 'constant', 'value': 0}, False),
+    ])
+    def test_buffer_backed_values(self, lhs, operator, rhs, expected):
+        condition = {'lhs': lhs, 'operator': operator, 'rhs': rhs}
+        assert self.evaluator.evaluate_condition(condition) == expected
+
+    def test_diagnostics_match(self):
+        """Diagnostics (incl. candle data for indicator signatures) are identical"""
+        condition = {
+            'groupLogic': 'OR',
+            'conditions': [
+                {'lhs': {'type': 'indicator', 'name': 'rsi_1764509210372', 'offset': -1, 'timeframeId': '1m'},
+                 'operator': '>', 'rhs': {'type': 'constant', 'value': 90}},
+                {'lhs': {'type': 'live_data', 'field': 'ltp', 'instrumentType': 'TI'},
+                 'operator': '<', 'rhs': {'type': 'candle_data', 'field': 'high', 'offset': 0, 'timeframeId': '1m'}},
+            ]
+        }
+        assert self.evaluator.evaluate_condition(condition) is True
+        assert len(self.evaluator.get_diagnostic_data()['conditions_evaluated']) == 2
+
+    def test_plan_compiled_once_per_condition(self):
+        """Same condition object reuses its plan; set_condition recompiles"""
+        evaluator = ConditionEvaluator(compiled=True)
+        condition = {'lhs': {'type': 'constant', 'value': 2}, 'operator': '>', 'rhs': {'type': 'constant', 'value': 1}}
+
+        evaluator.set_condition(condition)
+        plan = evaluator._get_plan(condition)
+        assert evaluator.evaluate_condition(condition) is True
+        assert evaluator._get_plan(condition) is plan
+
+        condition['operator'] = '<'
+        evaluator.set_condition(condition)
+        assert evaluator._get_plan(condition) is not plan
+        assert evaluator.evaluate_condition() is False
@@ -0,0 +1,145 @@
+"""Test suite for the Arrow day results store"""
+
+import json
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+
+from src.storage import day_results_store
+from src.storage.day_results_store import pa
+
+
+def _trades_data():
+    return {
+        'date': '2024-10-01',
+        'summary': {'total_trades': 2, 'total_pnl': '150.00', 'winning_trades': 1, 'losing_trades': 1,
+                    'win_rate': '50.00'},
+        'trades': [
+            {'trade_id': 'entry_2_pos1', 'quantity': 75, 'entry_price': '120.00', 'exit_price': None,
+             'entry_flow_ids': ['exec_start', 'exec_signal'], 'status': 'OPEN'},
+            {'trade_id': 'entry_2_pos2', 'quantity': 75, 'entry_price': '98.50', 'exit_price': '100.50',
+             'entry_flow_ids': [], 'status': 'CLOSED'},
+        ]
+    }
+
+
+def _events():
+    return {
+        f'exec_{i}': {
+            'execution_id': f'exec_{i}',
+            'parent_execution_id': f'exec_{i - 1}' if i else None,
+            'timestamp': f'2024-10-01 09:{15 + i}:00',
+            'event_type': 'logic_completed',
+            'node_id': 'entry_condition_1' if i % 2 else 'entry_2',
+            'node_name': 'Entry Condition' if i % 2 else 'Entry',
+            'node_type': 'EntrySignalNode' if i % 2 else 'EntryNode',
+            'children_nodes': [{'id': 'entry_2'}],
+            'signal_emitted': bool(i % 2),
+            'conditions_evaluated': [{'lhs_value': 25000.5 + i, 'operator': '>', 'rhs_value': 25000, 'result': True}],
+        }
+        for i in range(2500)
+    }
+
+
+@unittest.skipIf(pa is None, "pyarrow not installed")
+class TestDayResultsStore(unittest.TestCase):
+    """Round trip, selection and streamed legacy JSON"""
+
+    def setUp(self):
+        self.day_dir = tempfile.mkdtemp()
+        self.events = _events()
+        self.positions = [
+            {'position_id': 'entry_2_pos1', 'status': 'OPEN', 'entry_time': datetime(2024, 10, 1, 9, 16)},
+            {'position_id': 'entry_2_pos2', 'status': 'CLOSED', 'pnl': 150.0, 'entry_time': None},
+        ]
+        day_results_store.write_day_results(self.day_dir, _trades_data(), self.positions, self.events)
+
+    def tearDown(self):
+        shutil.rmtree(self.day_dir, ignore_errors=True)
+
+    def test_round_trip(self):
+        self.assertTrue(day_results_store.has_day_results(self.day_dir))
+        self.assertEqual(day_results_store.read_trades(self.day_dir), _trades_data())
+        self.assertEqual(day_results_store.read_events(self.day_dir), self.events)
+        self.assertEqual(day_results_store.read_positions(self.day_dir), [
+            {'position_id': 'entry_2_pos1', 'status': 'OPEN', 'entry_time': '2024-10-01T09:16:00'},
+            {'position_id': 'entry_2_pos2', 'status': 'CLOSED', 'pnl': 150.0, 'entry_time': None},
+        ])
+
+    def test_selection(self):
+        trades = day_results_store.read_trades(self.day_dir, columns=['trade_id', 'exit_price'], offset=1)
+        self.assertEqual(trades['trades'], [{'trade_id': 'entry_2_pos2', 'exit_price': '100.50'}])
+
+        events = day_results_store.read_events(self.day_dir, columns=['timestamp', 'signal_emitted'],
+                                               filters={'node_id': 'entry_condition_1'}, limit=2)
+        self.assertEqual(events, {
+            'exec_1': {'execution_id': 'exec_1', 'timestamp': '2024-10-01 09:16:00', 'signal_emitted': True},
+            'exec_3': {'execution_id': 'exec_3', 'timestamp': '2024-10-01 09:18:00', 'signal_emitted': True},
+        })
+
+    def test_streamed_json_matches_legacy_documents(self):
+        trades_json = b''.join(day_results_store.iter_trades_json(self.day_dir))
+        self.assertEqual(json.loads(trades_json), _trades_data())
+
+        chunks = list(day_results_store.iter_diagnostics_json(self.day_dir))
+        self.assertGreater(len(chunks), 3)  # One chunk per record batch
+        self.assertEqual(json.loads(b''.join(chunks)), {'events_history': self.events})
+
+        empty = b''.join(day_results_store.iter_diagnostics_json(self.day_dir, filters={'node_id': 'missing'}))
+        self.assertEqual(json.loads(empty), {'events_history': {}})
+
+    def test_reads_only_selected_fields_and_batches(self):
+        """Filter and output fields are decompressed; batches past the limit are not read"""
+        from unittest.mock import patch
+
+        readers = []
+        open_file = day_results_store.pa_ipc.open_file
+
+        class RecordingReader:
+            def __init__(self, reader, options):
+                self.reader, self.options, self.batches_read = reader, options, []
+                self.schema, self.num_record_batches = reader.schema, reader.num_record_batches
+
+            def get_batch(self, index):
+                self.batches_read.append(index)
+                return self.reader.get_batch(index)
+
+        def recording_open_file(source, **kwargs):
+            readers.append(RecordingReader(open_file(source, **kwargs), kwargs.get('options')))
+            return readers[-1]
+
+        with patch.object(day_results_store.pa_ipc, 'open_file', side_effect=recording_open_file):
+            table = day_results_store.read_table(self.day_dir, day_results_store.EVENTS_FILE,
+                                                 columns=['timestamp'], filters={'node_id': 'entry_2'},
+                                                 offset=600, limit=100)
+
+        reader = readers[-1]
+        self.assertEqual(table.column_names, ['execution_id', 'timestamp'])
+        self.assertEqual(reader.schema.names, ['execution_id', 'timestamp', 'node_id'])
+        self.assertEqual(sorted(reader.options.included_fields), [0, 2, 4])
+        self.assertEqual(reader.batches_read, [0, 1])  # Rows 1200-1398 end in batch 1 of 3
+        self.assertEqual(table['execution_id'].to_pylist(), [f'exec_{i}' for i in range(1200, 1400, 2)])
+
+    def test_event_header_fields_keep_their_types(self):
+        """Header fields are stored like any other column (not coerced to str)"""
+        events = {
+            'a': {'execution_id': 'a', 'timestamp': 1727754300, 'node_id': 'n1', 'event_type': 'x'},
+            'b': {'execution_id': 'b', 'timestamp': 1727754301, 'node_id': 'n2'},
+        }
+        day_results_store.write_day_results(self.day_dir, _trades_data(), [], events)
+
+        self.assertEqual(day_results_store.read_events(self.day_dir), events)
+        self.assertEqual(list(day_results_store.read_events(self.day_dir, filters={'event_type': 'x'})), ['a'])
+
+    def test_corrupt_file_raises_before_streaming(self):
+        """The JSON iterators read the file when created, not while streaming"""
+        with open(f'{self.day_dir}/{day_results_store.EVENTS_FILE}', 'wb') as f:
+            f.write(b'not an arrow file')
+
+        with self.assertRaises(Exception):
+            day_results_store.iter_diagnostics_json(self.day_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""Test suite for batched indicator updates (IndicatorBank)"""
+
+import random
+import unittest
+
+try:
+    from src.indicators_hybrid import EMAIndicator, IndicatorBank, RMAIndicator, RSIIndicator
+except ImportError:  # indicators_hybrid needs pandas_ta / scipy
+    IndicatorBank = None
+
+
+class PairMean:
+    """Duck-typed multi-output indicator (stays on the per-instance path)"""
+
+    name = 'pair'
+    params = {}
+
+    def __init__(self):
+        self._prev = None
+
+    def update(self, candle):
+        prev, self._prev = self._prev, candle['close']
+        if prev is None:
+            return None
+        return {'mean': (prev + candle['close']) / 2, 'gap': candle['close'] - prev}
+
+
+def _indicators():
+    ema_seeded = EMAIndicator(length=50)
+    ema_seeded._ema = 22010.25
+    rsi_seeded = RSIIndicator(length=14)
+    rsi_seeded._prev_price, rsi_seeded._avg_gain, rsi_seeded._avg_loss = 22000.0, 3.5, 0.0
+    return {
+        'EMA(9)': EMAIndicator(length=9),
+        'RSI(7)': RSIIndicator(length=7),
+        'PAIR()': PairMean(),
+        'EMA(21,high)': EMAIndicator(length=21, price_field='high'),
+        'EMA(50)': ema_seeded,
+        'RMA(14)': RMAIndicator(length=14),
+        'RSI(14)': rsi_seeded,
+        'RSI(3,low)': RSIIndicator(length=3, price_field='low'),
+    }
+
+
+def _candles(count, seed=7):
+    rng = random.Random(seed)
+    close = 22000.0
+    candles = []
+    for i in range(count):
+        # Flat stretches exercise zero gains/losses
+        close = close if i % 11 < 3 else round(close + rng.uniform(-15, 15), 2)
+        candles.append({'open': close, 'high': close + rng.uniform(0, 5), 'low': close - rng.uniform(0, 5),
+                        'close': close, 'volume': 0})
+    return candles
+
+
+def _update_individually(indicators, candle):
+    """Reference: the per-instance loop DataManager runs without a bank."""
+    values = {}
+    for indicator_key, indicator in indicators.items():
+        new_value = indicator.update(candle)
+        if isinstance(new_value, dict):
+            for col, val in new_value.items():
+                values[f"{indicator_key}_{col}"] = val
+        elif new_value is not None:
+            values[indicator_key] = new_value
+    return values
+
+
+@unittest.skipIf(IndicatorBank is None, "indicators_hybrid dependencies not installed")
+class TestIndicatorBank(unittest.TestCase):
+    """Bank output equals the per-instance update path exactly"""
+
+    def test_matches_per_instance_updates(self):
+        """Same keys, order and values on every candle"""
+        reference = _indicators()
+        bank = IndicatorBank(_indicators())
+        self.assertEqual(bank.batched_count, 7)
+
+        for candle in _candles(300):
+            expected = _update_individually(reference, candle)
+            actual = bank.update(candle)
+            self.assertEqual(list(actual), list(expected))
+            self.assertEqual(actual, expected)
+
+    def test_sync_hands_state_back(self):
+        """After sync() the instances continue exactly where the bank stopped"""
+        candles = _candles(200, seed=3)
+        reference = _indicators()
+        banked = _indicators()
+        bank = IndicatorBank(banked)
+
+        for candle in candles[:120]:
+            _update_individually(reference, candle)
+            bank.update(candle)
+        bank.sync()
+
+        for key in ('EMA(9)', 'EMA(50)', 'RMA(14)', 'RSI(7)', 'RSI(14)'):
+            self.assertEqual(banked[key].get_value(), reference[key].get_value())
+        for candle in candles[120:]:
+            self.assertEqual(_update_individually(banked, candle), _update_individually(reference, candle))
+
+    def test_single_family_member_not_batched(self):
+        """A family with one member keeps its own update() call"""
+        bank = IndicatorBank({'EMA(9)': EMAIndicator(length=9), 'RSI(14)': RSIIndicator(length=14)})
+        self.assertEqual(bank.batched_count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
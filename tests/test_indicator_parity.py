@@ -0,0 +1,123 @@
+"""Test suite for bulk vs incremental parity reports"""
+
+import unittest
+
+import pandas as pd
+
+try:
+    from src.indicators_hybrid.parity import match_output_keys, registry_parity, replay_parity, synthetic_candles
+except ImportError:  # indicators_hybrid needs pandas_ta / scipy
+    replay_parity = None
+
+
+class RunningMean:
+    """Duck-typed indicator whose update() matches calculate_bulk() (up to rounding)"""
+
+    def __init__(self, **params):
+        self.params = params
+        self.length = params.get('length', 3)
+        self._window = []
+
+    def calculate_bulk(self, df):
+        return df['close'].rolling(self.length).mean()
+
+    def update(self, candle):
+        self._window = (self._window + [candle['close']])[-self.length:]
+        if len(self._window) < self.length:
+            return None
+        return sum(self._window) / self.length
+
+
+class DriftingBands:
+    """Duck-typed multi-output indicator with a deliberate error on 'upper'"""
+
+    def __init__(self, **params):
+        self.params = params
+
+    def calculate_bulk(self, df):
+        return pd.DataFrame({'upper': df['high'], 'lower': df['low']})
+
+    def update(self, candle):
+        return {'upper': candle['high'] + 0.5, 'lower': candle['low']}
+
+
+class PandasTaBands:
+    """Multi-output indicator named like pandas_ta (bulk 'BBL_20_2.0', update() 'BBL')"""
+
+    def __init__(self, **params):
+        self.params = params
+
+    def calculate_bulk(self, df):
+        return pd.DataFrame({'BBL_20_2.0': df['low'], 'BBU_20_2.0': df['high'], 'BBB_20_2.0': df['high'] - df['low']})
+
+    def update(self, candle):
+        return {'BBU': candle['high'] + 0.25, 'BBL': candle['low']}
+
+
+@unittest.skipIf(replay_parity is None, "indicators_hybrid dependencies not installed")
+class TestReplayParity(unittest.TestCase):
+    """replay_parity compares every candle and reports throughput"""
+
+    def setUp(self):
+        self.candles = synthetic_candles(120, seed=3)
+
+    def test_matching_indicator_has_no_error(self):
+        """Warm-up candles (None / NaN) are skipped, the rest compared"""
+        report = replay_parity(RunningMean(length=5), self.candles)
+
+        self.assertLess(report['max_abs_error'], 1e-9)
+        self.assertLess(report['last_abs_error'], 1e-9)
+        self.assertEqual(report['columns']['value']['compared'], 116)
+        self.assertGreater(report['updates_per_sec'], 0)
+
+    def test_multi_output_errors_per_column(self):
+        """Each bulk column is matched with the update() dict key of the same name"""
+        report = replay_parity(DriftingBands(), self.candles)
+
+        self.assertAlmostEqual(report['columns']['upper']['max_abs_error'], 0.5)
+        self.assertEqual(report['columns']['lower']['max_abs_error'], 0.0)
+        self.assertAlmostEqual(report['last_abs_error'], 0.5)
+
+    def test_pandas_ta_columns_match_output_prefix(self):
+        """Bulk columns named '<output>_<params>' are compared with update() key '<output>'"""
+        report = replay_parity(PandasTaBands(), self.candles)
+
+        self.assertEqual(report['columns']['BBL_20_2.0']['key'], 'BBL')
+        self.assertEqual(report['columns']['BBL_20_2.0']['compared'], len(self.candles))
+        self.assertAlmostEqual(report['columns']['BBU_20_2.0']['max_abs_error'], 0.25)
+        self.assertAlmostEqual(report['max_abs_error'], 0.25)
+
+    def test_uncompared_column_is_unchecked(self):
+        """A bulk column no update() output covers is unchecked, not 0 error"""
+        report = replay_parity(PandasTaBands(), self.candles)
+
+        self.assertEqual(report['unchecked'], ['BBB_20_2.0'])
+        self.assertEqual(report['columns']['BBB_20_2.0']['compared'], 0)
+        self.assertIsNone(report['columns']['BBB_20_2.0']['max_abs_error'])
+
+    def test_unrelated_names_match_by_position(self):
+        """Columns and keys with no name in common are paired in order"""
+        self.assertEqual(match_output_keys(['first_5', 'second_5'], ['a', 'b']),
+                         {'first_5': 'a', 'second_5': 'b'})
+
+    def test_indicator_is_not_mutated(self):
+        """The replay runs on a fresh instance"""
+        indicator = RunningMean(length=5)
+        replay_parity(indicator, self.candles)
+        self.assertEqual(indicator._window, [])
+
+    def test_registry_report_covers_every_class(self):
+        """One report per registered class (failures reported, not raised)"""
+        import ta_hybrid
+
+        reports = registry_parity(synthetic_candles(60))
+        classes = {cls.__name__ for cls in ta_hybrid._INDICATOR_REGISTRY.values()}
+
+        self.assertEqual({r['indicator'] for r in reports}, classes)
+        for report in reports:
+            if 'error' not in report and report['max_abs_error'] is not None:
+                self.assertGreaterEqual(report['max_abs_error'], 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
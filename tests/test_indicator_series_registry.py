@@ -0,0 +1,170 @@
+"""Test suite for shared indicator series (IndicatorSeriesRegistry)"""
+
+import unittest
+from types import SimpleNamespace
+
+from src.backtesting.centralized_backtest_engine import CentralizedBacktestEngine
+from src.backtesting.data_manager import DataManager
+from src.backtesting.indicator_series_registry import IndicatorSeriesRegistry, series_key
+from src.backtesting.strategy_metadata import IndicatorMetadata, InstrumentConfig, StrategyMetadata
+from src.core.cache_manager import CacheManager
+from src.core.indicator_subscription_manager import IndicatorSubscriptionManager
+
+
+class CountingIndicator:
+    """Duck-typed indicator counting its update() calls"""
+
+    def __init__(self, name, **params):
+        self.name = name
+        self.params = params
+        self.calls = 0
+        self.is_initialized = True
+
+    def update(self, candle):
+        self.calls += 1
+        return candle['close']
+
+
+def _strategy(strategy_id, *indicators):
+    return StrategyMetadata(
+        strategy_id=strategy_id,
+        user_id='user',
+        strategy_name=strategy_id,
+        instrument_configs={'NIFTY:1m': InstrumentConfig('NIFTY', '1m', set(indicators))},
+    )
+
+
+class TestSeriesKey(unittest.TestCase):
+    """Canonical series identity"""
+
+    def test_param_order_case_and_integral_floats(self):
+        key = series_key('NIFTY', '1m', 'RSI', {'length': 14, 'price_field': 'close'})
+        self.assertEqual(key, series_key('NIFTY', '1m', 'rsi', {'price_field': 'close', 'length': 14.0}))
+
+    def test_different_series(self):
+        key = series_key('NIFTY', '1m', 'rsi', {'length': 14})
+        self.assertNotEqual(key, series_key('NIFTY', '1m', 'rsi', {'length': 21}))
+        self.assertNotEqual(key, series_key('NIFTY', '5m', 'rsi', {'length': 14}))
+        self.assertNotEqual(key, series_key('BANKNIFTY', '1m', 'rsi', {'length': 14}))
+
+
+class TestIndicatorSeriesRegistry(unittest.TestCase):
+    """Reference counts and compute counters"""
+
+    def test_acquire_and_release(self):
+        registry = IndicatorSeriesRegistry()
+        series, created = registry.acquire('NIFTY', '1m', 'rsi', {'length': 14}, 's1', 'rsi_1')
+        self.assertTrue(created)
+        _, created = registry.acquire('NIFTY', '1m', 'RSI', {'length': 14}, 's2', 'rsi_2')
+        self.assertFalse(created)
+        self.assertEqual(registry.ref_count(series.series_key), 2)
+
+        self.assertEqual(registry.release('s1'), [])
+        self.assertEqual(registry.ref_count(series.series_key), 1)
+        self.assertEqual([s.series_key for s in registry.release('s2')], [series.series_key])
+        self.assertEqual(registry.get_summary()['series'], 0)
+
+    def test_record_updates_splits_time_and_counts_savings(self):
+        registry = IndicatorSeriesRegistry()
+        rsi, _ = registry.acquire('NIFTY', '1m', 'rsi', {'length': 14}, 's1', 'rsi_1')
+        registry.acquire('NIFTY', '1m', 'rsi', {'length': 14}, 's2', 'rsi_2')
+        registry.acquire('NIFTY', '1m', 'rsi', {'length': 14}, 's3', 'rsi_3')
+        ema, _ = registry.acquire('NIFTY', '1m', 'ema', {'length': 21}, 's1', 'ema_1')
+
+        registry.record_updates('NIFTY:1m', 0.5)
+        registry.record_updates('NIFTY:1m', 0.5)
+        registry.record_updates('NIFTY:5m', 1.0)  # no series - ignored
+
+        self.assertEqual(rsi.updates, 2)
+        self.assertAlmostEqual(rsi.update_seconds, 0.5)
+        self.assertEqual(rsi.saved_updates, 4)
+        self.assertEqual(ema.saved_updates, 0)
+        summary = registry.get_summary()
+        self.assertEqual((summary['series'], summary['references'], summary['shared_series']), (2, 4, 1))
+        self.assertEqual(summary['per_series'][rsi.series_key]['ref_count'], 3)
+
+
+class TestDataManagerSharing(unittest.TestCase):
+    """One instance per series, every strategy's database key mapped onto it"""
+
+    def setUp(self):
+        self.dm = DataManager(cache=None, broker_name='clickhouse')
+
+    def test_same_series_is_computed_once(self):
+        first = CountingIndicator('rsi', length=14, price_field='close')
+        second = CountingIndicator('rsi', price_field='close', length=14)
+        key_1 = self.dm.register_indicator('NIFTY', '1m', first, 'rsi_1', strategy_id='s1')
+        key_2 = self.dm.register_indicator('NIFTY', '1m', second, 'rsi_2', strategy_id='s2')
+
+        self.assertEqual(key_1, key_2)
+        self.assertEqual(self.dm.indicator_key_mappings['NIFTY:1m'], {'rsi_1': key_1, 'rsi_2': key_1})
+        self.assertIs(self.dm.indicators['NIFTY:1m'][key_1], first)
+
+        self.dm._add_to_candle_buffer('NIFTY', '1m', {'timestamp': 1, 'open': 1.0, 'high': 1.0,
+                                                      'low': 1.0, 'close': 1.0, 'volume': 0})
+        self.assertEqual((first.calls, second.calls), (1, 0))
+        stats = self.dm.get_stats()['indicator_series']
+        self.assertEqual((stats['series'], stats['references'], stats['saved_updates']), (1, 2, 1))
+
+    def test_release_keeps_shared_series(self):
+        self.dm.register_indicator('NIFTY', '1m', CountingIndicator('rsi', length=14), 'rsi_1', strategy_id='s1')
+        self.dm.register_indicator('NIFTY', '1m', CountingIndicator('rsi', length=14), 'rsi_2', strategy_id='s2')
+        self.dm.register_indicator('NIFTY', '1m', CountingIndicator('ema', length=9), 'ema_2', strategy_id='s2')
+
+        self.assertEqual(self.dm.release_strategy_indicators('s2'), 1)
+        self.assertEqual(list(self.dm.indicators['NIFTY:1m']), ['rsi(14)'])
+        self.assertEqual(set(self.dm.indicator_key_mappings['NIFTY:1m']), {'rsi_1', 'rsi_2'})
+
+
+class TestBuildMetadata(unittest.TestCase):
+    """_build_metadata keeps one entry per series with every strategy's reference"""
+
+    def test_refs_per_series(self):
+        engine = CentralizedBacktestEngine.__new__(CentralizedBacktestEngine)
+        engine.config = SimpleNamespace(strategies_agg=None)
+        strategies = [
+            _strategy('s1', IndicatorMetadata('rsi', {'length': 14}, 'rsi_1')),
+            _strategy('s2', IndicatorMetadata('rsi', {'length': 14.0}, 'rsi_2'),
+                      IndicatorMetadata('ema', {'length': 9}, 'ema_2')),
+        ]
+
+        indicators = engine._build_metadata(strategies)['indicators']['NIFTY']['1m']
+
+        by_name = {ind['name']: ind for ind in indicators}
+        self.assertEqual(len(indicators), 2)
+        self.assertEqual(by_name['rsi']['refs'], [{'strategy_id': 's1', 'key': 'rsi_1'},
+                                                  {'strategy_id': 's2', 'key': 'rsi_2'}])
+        self.assertEqual(by_name['ema']['series_key'], series_key('NIFTY', '1m', 'ema', {'length': 9}))
+
+
+
+class TestIndicatorSubscriptionManager(unittest.TestCase):
+    """Live indicator subscriptions keep their users in the registry"""
+
+    def setUp(self):
+        self.cache = CacheManager()
+        self.manager = IndicatorSubscriptionManager(self.cache)
+
+    def test_users_are_registry_references(self):
+        counts = self.manager.subscribe_indicators_for_strategy({('NIFTY', '1m'): {'RSI_14', 'EMA_20'}}, 'a')
+        self.assertEqual(counts, {'new': 2, 'reused': 0})
+        counts = self.manager.subscribe_indicators_for_strategy({('NIFTY', '1m'): {'RSI_14'}}, 'b')
+        self.assertEqual(counts, {'new': 0, 'reused': 1})
+
+        self.assertEqual(self.manager.get_indicator_users('NIFTY', '1m', 'RSI_14'), ['a', 'b'])
+        self.assertEqual(self.manager.registry.ref_count(series_key('NIFTY', '1m', 'RSI_14', None)), 2)
+        subscription = self.cache.get_indicator_subscription('NIFTY', '1m', 'RSI_14')
+        self.assertNotIn('used_by_strategies', subscription)
+
+    def test_unsubscribe_drops_unused_indicators(self):
+        self.manager.subscribe_indicators_for_strategy({('NIFTY', '1m'): {'RSI_14', 'EMA_20'}}, 'a')
+        self.manager.subscribe_indicators_for_strategy({('NIFTY', '1m'): {'RSI_14'}}, 'b')
+
+        self.manager.unsubscribe_indicators_for_strategy('a')
+
+        self.assertEqual(self.manager.get_all_required_indicators(), {('NIFTY', '1m'): {'RSI_14'}})
+        self.assertEqual(self.manager.get_indicator_users('NIFTY', '1m', 'RSI_14'), ['b'])
+        self.assertEqual(self.manager.get_indicator_users('NIFTY', '1m', 'EMA_20'), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,211 @@
+"""Test suite for indicator state snapshots (IndicatorStateStore)"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from src.backtesting.data_manager import DataManager
+from src.storage.indicator_state_store import END_OF_DAY, IndicatorStateStore, candle_checksum
+
+try:
+    from src.indicators_hybrid import EMAIndicator, RSIIndicator
+    import pandas_ta  # noqa: F401 (warm-up runs calculate_bulk)
+except ImportError:  # indicators_hybrid needs pandas_ta / scipy
+    EMAIndicator = None
+
+
+def _history(count, start='2024-10-01 09:15:00'):
+    timestamps = pd.date_range(start, periods=count, freq='min')
+    closes = [22000.0 + ((i * 7) % 23) - 11 + i * 0.5 for i in range(count)]
+    return pd.DataFrame({
+        'timestamp': timestamps,
+        'open': closes,
+        'high': [c + 3 for c in closes],
+        'low': [c - 3 for c in closes],
+        'close': closes,
+        'volume': [0] * count,
+    })
+
+
+def _snapshot_files(root, day_pattern):
+    return sorted(Path(root).glob(f'*/*/{day_pattern}/*.pkl'))
+
+
+class TestIndicatorStateStore(unittest.TestCase):
+    """Test snapshot read / write and checksum validation"""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.store = IndicatorStateStore(root=self.root)
+        self.candles = _history(5).to_dict('records')
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_roundtrip(self):
+        """Saved snapshot is returned for the same key and checksum"""
+        checksum = candle_checksum(self.candles)
+        self.assertTrue(self.store.save('NIFTY', '1m', 'ema(21)', {'length': 21}, '2024-10-01',
+                                        checksum, {'indicator': 'EMAIndicator'}, [1.0, 2.0]))
+
+        entry = self.store.load('NIFTY', '1m', 'ema(21)', {'length': 21}, '2024-10-01', checksum)
+        self.assertEqual(entry['state'], {'indicator': 'EMAIndicator'})
+        self.assertEqual(entry['tail'], [1.0, 2.0])
+        self.assertEqual(self.store.stats['restored'], 1)
+
+    def test_checksum_mismatch_falls_back(self):
+        """A snapshot ending on different candles is not used"""
+        self.store.save('NIFTY', '1m', 'ema(21)', {'length': 21}, '2024-10-01',
+                        candle_checksum(self.candles), {}, None)
+        self.candles[-1]['close'] += 0.05
+
+        entry = self.store.load('NIFTY', '1m', 'ema(21)', {'length': 21}, '2024-10-01',
+                                candle_checksum(self.candles))
+        self.assertIsNone(entry)
+        self.assertEqual(self.store.stats['mismatched'], 1)
+
+    def test_params_are_part_of_key(self):
+        """Different params never share a snapshot"""
+        checksum = candle_checksum(self.candles)
+        self.store.save('NIFTY', '1m', 'ema(21)', {'length': 21}, '2024-10-01', checksum, {}, None)
+        self.assertIsNone(self.store.load('NIFTY', '1m', 'ema(21)', {'length': 22}, '2024-10-01', checksum))
+
+    def test_kinds_are_separate_keys(self):
+        """An end-of-day snapshot never replaces the warm-up one for the same candles"""
+        checksum = candle_checksum(self.candles)
+        self.store.save('NIFTY', '1m', 'ema(21)', {'length': 21}, '2024-10-01', checksum, {'warm': True}, None)
+        self.store.save('NIFTY', '1m', 'ema(21)', {'length': 21}, '2024-10-01', checksum, {'eod': True}, None,
+                        kind=END_OF_DAY)
+
+        warmup = self.store.load('NIFTY', '1m', 'ema(21)', {'length': 21}, '2024-10-01', checksum)
+        eod = self.store.load('NIFTY', '1m', 'ema(21)', {'length': 21}, '2024-10-01', checksum, kind=END_OF_DAY)
+        self.assertEqual(warmup['state'], {'warm': True})
+        self.assertEqual(eod['state'], {'eod': True})
+
+    def test_prune_drops_unused_snapshots(self):
+        """Snapshots not written or restored for max_age_days are deleted"""
+        checksum = candle_checksum(self.candles)
+        store = IndicatorStateStore(root=self.root, max_age_days=1)
+        store.save('NIFTY', '1m', 'ema(21)', {'length': 21}, '2024-10-01', checksum, {}, None)
+        store.save('NIFTY', '1m', 'ema(21)', {'length': 21}, '2024-10-02', checksum, {}, None)
+        old = time.time() - 2 * 86400
+        for path in _snapshot_files(self.root, 'as_of=2024-10-0*'):
+            os.utime(path, (old, old))
+        store.load('NIFTY', '1m', 'ema(21)', {'length': 21}, '2024-10-02', checksum)  # still in use
+
+        self.assertEqual(store.prune(), 1)
+        self.assertIsNone(store.load('NIFTY', '1m', 'ema(21)', {'length': 21}, '2024-10-01', checksum))
+        self.assertIsNotNone(store.load('NIFTY', '1m', 'ema(21)', {'length': 21}, '2024-10-02', checksum))
+        self.assertEqual(_snapshot_files(self.root, 'as_of=2024-10-01'), [])
+    def test_checksum_ignores_timestamp_type(self):
+        """Buffer timestamps (datetime) and history timestamps (Timestamp) agree"""
+        as_datetimes = [dict(c, timestamp=c['timestamp'].to_pydatetime()) for c in self.candles]
+        self.assertEqual(candle_checksum(as_datetimes), candle_checksum(self.candles))
+
+
+@unittest.skipIf(EMAIndicator is None, "indicators_hybrid dependencies not installed")
+class TestIndicatorStateResume(unittest.TestCase):
+    """DataManager restores snapshots instead of warming up"""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.store = IndicatorStateStore(root=self.root)
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _data_manager(self, carry_over=False):
+        dm = DataManager(cache=None, broker_name='clickhouse')
+        dm.indicator_state_store = self.store
+        dm.indicator_state_carry_over = carry_over
+        dm.register_indicator('NIFTY', '1m', EMAIndicator(length=21))
+        dm.register_indicator('NIFTY', '1m', RSIIndicator(length=14))
+        return dm
+
+    def test_rerun_restores_warmup_state(self):
+        """Same history: second run restores, values and buffer match warm-up"""
+        history = _history(300)
+        warmed = self._data_manager()
+        warmed.initialize_from_historical_data('NIFTY', '1m', history.copy())
+        self.assertEqual(self.store.stats['writes'], 2)
+
+        restored = self._data_manager()
+        restored.initialize_from_historical_data('NIFTY', '1m', history.copy())
+        self.assertEqual(self.store.stats['restored'], 2)
+
+        self.assertEqual(restored.candle_buffers['NIFTY:1m'].to_list(),
+                         warmed.candle_buffers['NIFTY:1m'].to_list())
+        candle = {'timestamp': pd.Timestamp('2024-10-01 14:15:00'), 'open': 22100.0,
+                  'high': 22105.0, 'low': 22095.0, 'close': 22100.0, 'volume': 0}
+        for key, indicator in warmed.indicators['NIFTY:1m'].items():
+            self.assertEqual(restored.indicators['NIFTY:1m'][key].update(dict(candle)), indicator.update(dict(candle)))
+
+    def test_corrected_history_is_not_restored(self):
+        """A correction early in the history (outside the buffer tail) forces a warm-up"""
+        history = _history(300)
+        self._data_manager().initialize_from_historical_data('NIFTY', '1m', history.copy())
+
+        corrected = history.copy()
+        corrected.loc[10, 'close'] += 5.0
+        self._data_manager().initialize_from_historical_data('NIFTY', '1m', corrected)
+        self.assertEqual(self.store.stats['restored'], 0)
+        self.assertEqual(self.store.stats['mismatched'], 2)
+
+        # A shorter lookback ending on the same candles does not match either
+        self._data_manager().initialize_from_historical_data('NIFTY', '1m', history.iloc[50:].copy())
+        self.assertEqual(self.store.stats['restored'], 0)
+
+    def _run_day(self, full, start, history=300):
+        """Warm up on `history` candles ending at `start`, replay the next 30, return last values"""
+        dm = self._data_manager()
+        dm.initialize_from_historical_data('NIFTY', '1m', full.iloc[start - history:start].copy())
+        for candle in full.iloc[start:start + 30].to_dict('records'):
+            dm._add_to_candle_buffer('NIFTY', '1m', candle)
+        dm.save_indicator_states()
+        return {key: indicator.get_value() for key, indicator in dm.indicators['NIFTY:1m'].items()}
+
+    def test_day_results_independent_of_run_order(self):
+        """Two consecutive days give the same values whichever ran first"""
+        full = _history(360)
+
+        forward = [self._run_day(full, 300), self._run_day(full, 330)]
+        shutil.rmtree(self.root)
+        self.store = IndicatorStateStore(root=self.root)
+        backward = [self._run_day(full, 330), self._run_day(full, 300)][::-1]
+
+        self.assertEqual(forward, backward)
+        # Re-running with snapshots on disk restores and still matches
+        self.assertEqual([self._run_day(full, 300), self._run_day(full, 330)], forward)
+        self.assertGreater(self.store.stats['restored'], 0)
+
+    def test_end_of_day_snapshot_requires_carry_over(self):
+        """End-of-day state is only saved with indicator_state_carry_over"""
+        day = self._data_manager()
+        day.initialize_from_historical_data('NIFTY', '1m', _history(300))
+        for candle in _history(310).iloc[300:].to_dict('records'):
+            day._add_to_candle_buffer('NIFTY', '1m', candle)
+        self.assertEqual(day.save_indicator_states(), 0)
+
+    def test_end_of_day_state_seeds_next_day(self):
+        """With carry-over, next day's history ending on the day's candles resumes from end-of-day state"""
+        full = _history(330)
+        day = self._data_manager(carry_over=True)
+        day.initialize_from_historical_data('NIFTY', '1m', full.iloc[:300].copy())
+        for candle in full.iloc[300:].to_dict('records'):
+            day._add_to_candle_buffer('NIFTY', '1m', candle)
+        self.assertEqual(day.save_indicator_states(), 2)
+
+        next_day = self._data_manager(carry_over=True)
+        next_day.initialize_from_historical_data('NIFTY', '1m', full.iloc[-300:].copy())
+        self.assertEqual(self.store.stats['restored'], 2)
+        for key, indicator in day.indicators['NIFTY:1m'].items():
+            self.assertEqual(next_day.indicators['NIFTY:1m'][key].get_value(), indicator.get_value())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+"""Test suite for the process-pool job executor"""
+
+import asyncio
+import os
+import time
+import unittest
+from unittest.mock import patch
+
+from src.jobs.job_executor import JobExecutor, JobRejectedError
+from src.jobs.job_manager import JobManager
+
+
+def _square(value, delay=0.0):
+    """Picklable task: earlier calls may be given a longer delay"""
+    if value < 0:
+        raise ValueError("negative")
+    time.sleep(delay)
+    return value * value
+
+
+def _crash_on_zero(value):
+    """Picklable task: value 0 kills the worker process (like an OOM kill)"""
+    if value == 0:
+        os._exit(1)
+    return value
+
+
+class TestJobExecutor(unittest.TestCase):
+    """Scheduling, ordering and admission control"""
+
+    def setUp(self):
+        self.executor = JobExecutor(max_workers=2, max_queued=1, max_active_per_user=1)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_results_and_event_loop_stays_free(self):
+        async def scenario():
+            job = self.executor.submit(_square, [(1, 0.5), (2,), (-1,), (3,)], user_id='u1')
+            ticks = 0
+            while not job.done:
+                ticks += 1
+                await asyncio.sleep(0.01)
+            return job, ticks, await job.results()
+
+        job, ticks, results = asyncio.run(scenario())
+        self.assertGreater(ticks, 10)
+        self.assertEqual([task.result for task in results], [1, 4, None, 9])
+        self.assertIn('negative', results[2].error)
+        self.assertEqual(job.job.status, 'failed')
+        self.assertEqual(job.job.progress, {'completed': 4, 'failed': 1, 'total': 4})
+        self.assertEqual(self.executor.metrics()['queued_tasks'], 0)
+
+    def test_completion_and_submission_order(self):
+        async def scenario():
+            completed = [task.index async for task in self.executor.submit(_square, [(1, 0.5), (2,)], 'u1')]
+            ordered = [task.index async for task in self.executor.submit(_square, [(1, 0.5), (2,)], 'u1').ordered()]
+            return completed, ordered
+
+        completed, ordered = asyncio.run(scenario())
+        self.assertEqual(completed, [1, 0])
+        self.assertEqual(ordered, [0, 1])
+
+    def test_admission_control(self):
+        async def scenario():
+            job = self.executor.submit(_square, [(1, 0.3)] * 5, user_id='u1', max_in_flight=1)
+            with self.assertRaises(JobRejectedError) as user_limit:
+                self.executor.submit(_square, [(1,)], user_id='u1')
+            with self.assertRaises(JobRejectedError) as queue_full:
+                self.executor.submit(_square, [(1,)], user_id='u2')
+            metrics = self.executor.metrics()
+            job.cancel()
+            return user_limit.exception, queue_full.exception, metrics, await job.results()
+
+        user_limit, queue_full, metrics, results = asyncio.run(scenario())
+        self.assertEqual(user_limit.reason, 'user_limit')
+        self.assertEqual(queue_full.reason, 'queue_full')
+        self.assertEqual((metrics['running_tasks'], metrics['queued_tasks'], metrics['rejected_jobs']), (1, 4, 2))
+        self.assertEqual([task.error for task in results[1:]], ['cancelled'] * 4)
+
+    def test_worker_crash_fails_task_and_pool_recovers(self):
+        executor = JobExecutor(max_workers=1, max_active_per_user=1)
+        self.addCleanup(executor.shutdown)
+
+        async def scenario():
+            job = executor.submit(_crash_on_zero, [(0,), (1,), (2,)], user_id='u1')
+            results = await asyncio.wait_for(job.results(), timeout=60)
+            # The user is free again and other jobs run on the new pool
+            retry = executor.submit(_crash_on_zero, [(5,)], user_id='u1')
+            return job, results, await asyncio.wait_for(retry.results(), timeout=60)
+
+        job, results, retry = asyncio.run(scenario())
+        self.assertIsNotNone(results[0].error)
+        self.assertEqual([task.result for task in results[1:]], [1, 2])
+        self.assertEqual(job.job.status, 'failed')
+        self.assertEqual(retry[0].result, 5)
+        self.assertEqual(executor.stats['pool_restarts'], 1)
+        self.assertEqual(executor.metrics()['queued_tasks'], 0)
+
+    def test_unschedulable_tasks_fail_the_job(self):
+        async def scenario():
+            job = self.executor.submit(_square, [(1,), (2,), (3,)], user_id='u1')
+            return job, await asyncio.wait_for(job.results(), timeout=5)
+
+        with patch.object(self.executor, '_submit', side_effect=RuntimeError("pool gone")):
+            job, results = asyncio.run(scenario())
+        self.assertTrue(all('pool gone' in task.error for task in results))
+        self.assertEqual(job.job.status, 'failed')
+        self.assertEqual(self.executor.job_manager.count_active_jobs('u1'), 0)
+
+
+class TestJobManagerLimits(unittest.TestCase):
+    """Per-user active job limit"""
+
+    def test_max_active_per_user(self):
+        manager = JobManager(max_active_per_user=2)
+        first = manager.create_job('u1', 's1', '2024-10-01', '2024-10-01')
+        manager.create_job('u1', 's2', '2024-10-01', '2024-10-01')
+        with self.assertRaises(ValueError):
+            manager.create_job('u1', 's3', '2024-10-01', '2024-10-01')
+
+        manager.update_job_status(first.job_id, 'completed')
+        manager.create_job('u1', 's3', '2024-10-01', '2024-10-01')
+        self.assertEqual(manager.count_active_jobs('u1'), 2)
+        self.assertEqual(manager.count_active_jobs(), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
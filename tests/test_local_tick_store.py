@@ -0,0 +1,146 @@
+"""Test suite for the local Arrow tick store"""
+
+import shutil
+import tempfile
+import unittest
+from datetime import date
+
+import pandas as pd
+
+from src.storage.local_tick_store import LocalTickStore, pa
+
+
+def _frame(symbols, rows_per_symbol=3):
+    rows = []
+    for symbol in symbols:
+        for i in range(rows_per_symbol):
+            rows.append({'symbol': symbol, 'timestamp': pd.Timestamp('2024-10-01 09:15:00') + pd.Timedelta(seconds=i),
+                         'ltp': 100.0 + i})
+    return pd.DataFrame(rows, columns=['symbol', 'timestamp', 'ltp'])
+
+
+@unittest.skipIf(pa is None, "pyarrow not installed")
+class TestLocalTickStore(unittest.TestCase):
+    """Test LocalTickStore read-through caching"""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.store = LocalTickStore(root=self.root)
+        self.fetched = []
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _fetch(self, missing):
+        self.fetched.append(list(missing))
+        return _frame(missing)
+
+    def _get(self, symbols, trading_day='2024-10-01'):
+        return self.store.get_or_fetch(
+            table='nse_ticks_indices', trading_day=trading_day, variant='raw',
+            symbols=symbols, fetch=self._fetch, sort_column='timestamp'
+        )
+
+    def test_miss_then_hit(self):
+        """Second read is served from disk without refetching"""
+        first = self._get(['NIFTY'])
+        second = self._get(['NIFTY'])
+
+        self.assertEqual(self.fetched, [['NIFTY']])
+        pd.testing.assert_frame_equal(first.reset_index(drop=True), second)
+        self.assertEqual(self.store.stats['hits'], 1)
+
+    def test_fetches_only_missing_symbols(self):
+        """Cached symbols are not re-queried"""
+        self._get(['NIFTY'])
+        combined = self._get(['NIFTY', 'BANKNIFTY'])
+
+        self.assertEqual(self.fetched, [['NIFTY'], ['BANKNIFTY']])
+        self.assertEqual(sorted(combined['symbol'].unique()), ['BANKNIFTY', 'NIFTY'])
+        self.assertTrue(combined['timestamp'].is_monotonic_increasing)
+
+    def test_lru_eviction(self):
+        """Least-recently-used slices are evicted over the size limit"""
+        self._get(['NIFTY'])
+        slice_bytes = sum(e['bytes'] for e in self.store._read_manifest()['entries'].values())
+        self.store.max_bytes = int(slice_bytes * 1.5)
+
+        self._get(['BANKNIFTY'])
+
+        entries = self.store._read_manifest()['entries']
+        self.assertEqual([k.rsplit('/', 1)[1] for k in entries], ['BANKNIFTY'])
+        self.assertEqual(self.store.stats['evictions'], 1)
+
+    def test_current_day_not_persisted(self):
+        """Today's (possibly incomplete) data always comes from ClickHouse"""
+        today = date.today().strftime('%Y-%m-%d')
+        self._get(['NIFTY'], trading_day=today)
+        self._get(['NIFTY'], trading_day=today)
+
+        self.assertEqual(len(self.fetched), 2)
+        self.assertEqual(self.store.get_summary()['slices'], 0)
+
+    def test_get_cached_requires_every_slice(self):
+        """A partial hit reads nothing and never fetches"""
+        self._get(['NIFTY'])
+
+        self.assertIsNone(self.store.get_cached('nse_ticks_indices', '2024-10-01', 'raw', ['NIFTY', 'BANKNIFTY']))
+        cached = self.store.get_cached('nse_ticks_indices', '2024-10-01', 'raw', ['NIFTY'])
+
+        self.assertEqual(len(cached), 3)
+        self.assertEqual(self.fetched, [['NIFTY']])
+
+    def test_slice_writer_stores_missing_symbols(self):
+        """slice_writer() splits streamed blocks into the slices that are missing"""
+        self._get(['NIFTY'])
+        writer = self.store.slice_writer('nse_ticks_indices', '2024-10-01', 'raw',
+                                         ['NIFTY', 'BANKNIFTY', 'FINNIFTY'])
+        columns = ['symbol', 'timestamp', 'ltp']
+        for block in (_frame(['NIFTY', 'BANKNIFTY'], 2), _frame(['BANKNIFTY'], 1)):
+            self.assertTrue(writer.write_block(columns, list(block.itertuples(index=False, name=None))))
+
+        self.assertIsNone(self.store.get_cached('nse_ticks_indices', '2024-10-01', 'raw', ['BANKNIFTY']))
+        self.assertEqual(writer.commit(columns), 2)
+
+        self.assertEqual(len(self.store.get_cached('nse_ticks_indices', '2024-10-01', 'raw', ['BANKNIFTY'])), 3)
+        self.assertEqual(len(self.store.get_cached('nse_ticks_indices', '2024-10-01', 'raw', ['FINNIFTY'])), 0)
+        self.assertEqual(len(self.store.get_cached('nse_ticks_indices', '2024-10-01', 'raw', ['NIFTY'])), 3)
+        self.assertEqual(self.fetched, [['NIFTY']])
+        entries = self.store._read_manifest()['entries']
+        self.assertEqual(entries['nse_ticks_indices/2024-10-01/raw/BANKNIFTY']['rows'], 3)
+
+    def test_slice_writer_abort_drops_partial_slices(self):
+        """An aborted writer leaves neither slices nor temp files"""
+        writer = self.store.slice_writer('nse_ticks_indices', '2024-10-01', 'raw', ['NIFTY'])
+        writer.write_block(['symbol', 'timestamp', 'ltp'],
+                           list(_frame(['NIFTY']).itertuples(index=False, name=None)))
+        writer.abort()
+
+        self.assertEqual(writer.commit(), 0)
+        self.assertIsNone(self.store.get_cached('nse_ticks_indices', '2024-10-01', 'raw', ['NIFTY']))
+        self.assertEqual(list(self.store.root.rglob('*.arrow*')), [])
+
+    def test_hits_buffer_last_access(self):
+        """Hits do not rewrite the manifest until the next write or flush"""
+        self._get(['NIFTY'])
+        written_at = self.store._read_manifest()['entries']['nse_ticks_indices/2024-10-01/raw/NIFTY']['last_access']
+
+        self._get(['NIFTY'])
+        entry = self.store._read_manifest()['entries']['nse_ticks_indices/2024-10-01/raw/NIFTY']
+        self.assertEqual(entry['last_access'], written_at)
+
+        self.store.flush_access()
+        entry = self.store._read_manifest()['entries']['nse_ticks_indices/2024-10-01/raw/NIFTY']
+        self.assertGreaterEqual(entry['last_access'], written_at)
+        self.assertEqual(self.store._pending_access, {})
+
+    def test_disabled_store_passes_through(self):
+        """A disabled store calls fetch directly"""
+        store = LocalTickStore(root=self.root, enabled=False)
+        df = store.get_or_fetch('t', '2024-10-01', 'raw', ['NIFTY'], self._fetch)
+        self.assertEqual(len(df), 3)
+        self.assertIsNone(store.get('t', '2024-10-01', 'raw', 'NIFTY'))
+
+
+if __name__ == '__main__':
+    unittest.main()
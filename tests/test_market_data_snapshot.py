@@ -0,0 +1,64 @@
+"""Test suite for the shared market data snapshot"""
+
+import unittest
+from datetime import datetime
+
+from src.backtesting.data_manager import DataManager
+
+
+def _candle(minute, close):
+    return {
+        'timestamp': datetime(2024, 10, 1, 9, 15 + minute),
+        'open': close, 'high': close, 'low': close, 'close': close, 'volume': 0
+    }
+
+
+class TestMarketDataSnapshot(unittest.TestCase):
+    """Test versioning and dirty tracking in DataManager.market_data"""
+
+    def setUp(self):
+        self.dm = DataManager(cache=None, broker_name='clickhouse')
+        self.snapshot = self.dm.market_data
+
+    def test_context_references_are_stable(self):
+        """get_context() hands out the same shared objects every call"""
+        self.dm._add_to_candle_buffer('NIFTY', '1m', _candle(0, 100.0))
+        first = self.dm.get_context()
+        self.dm._add_to_candle_buffer('NIFTY', '1m', _candle(1, 101.0))
+        second = self.dm.get_context()
+
+        self.assertIs(first['candle_df_dict'], second['candle_df_dict'])
+        self.assertIs(first['market_data'], self.snapshot)
+        # Earlier reference already sees the new candle
+        self.assertEqual(first['candle_df_dict']['NIFTY:1m'][-1]['close'], 101.0)
+
+    def test_dirty_tracking(self):
+        """Only real changes bump the version and mark keys dirty"""
+        self.dm._update_forming_candle_in_buffer('NIFTY', '1m', _candle(0, 100.0))
+        self.assertEqual(self.snapshot.dirty_candles, {'NIFTY:1m'})
+
+        self.snapshot.clear_dirty()
+        version = self.snapshot.version
+        self.dm._update_forming_candle_in_buffer('NIFTY', '1m', _candle(0, 100.0))
+        self.assertFalse(self.snapshot.is_dirty())
+        self.assertEqual(self.snapshot.version, version)
+
+        self.dm._update_forming_candle_in_buffer('NIFTY', '1m', _candle(0, 100.5))
+        self.assertEqual(self.snapshot.dirty_candles, {'NIFTY:1m'})
+        self.assertGreater(self.snapshot.version, version)
+
+    def test_ltp_changes(self):
+        """Unchanged LTP ticks do not mark the symbol dirty"""
+        symbol = 'NIFTY:2024-10-03:FUT'
+        tick = {'symbol': symbol, 'ltp': 25000.0, 'timestamp': datetime(2024, 10, 1, 9, 15)}
+        self.dm.process_tick(dict(tick))
+        self.assertEqual(self.snapshot.dirty_ltp, {symbol})
+
+        self.snapshot.clear_dirty()
+        self.dm.process_tick(dict(tick))
+        self.assertFalse(self.snapshot.dirty_ltp)
+        self.assertEqual(self.snapshot.ltp[symbol], 25000.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
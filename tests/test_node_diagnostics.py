@@ -0,0 +1,170 @@
+"""Test suite for NodeDiagnostics and the bounded columnar NodeEventStore"""
+
+import unittest
+from datetime import datetime
+
+from src.backtesting.streaming_backtest import events_since
+from src.core.condition_evaluator_v2 import ConditionEvaluator, render_condition_diagnostics
+from src.utils.node_diagnostics import NodeDiagnostics
+from src.utils.node_event_store import NodeEventStore
+
+
+class FakeNode:
+    def __init__(self, node_id, node_type='EntrySignalNode', children=()):
+        self.id = node_id
+        self.name = node_id.title()
+        self.type = node_type
+        self.children = list(children)
+
+
+def _condition(lhs_value, rhs_value, result, operator='>'):
+    return {
+        'lhs_expression': {'type': 'candle_data', 'field': 'Close', 'offset': -1, 'timeframeId': '1m'},
+        'rhs_expression': {'type': 'constant', 'value': 3},
+        'lhs_value': lhs_value,
+        'rhs_value': rhs_value,
+        'operator': operator,
+        'timestamp': '2024-10-01 09:15:00',
+        'condition_type': 'non_live',
+        'result': result
+    }
+
+
+class TestNodeEventStore(unittest.TestCase):
+    """Bounds, levels and export"""
+
+    def setUp(self):
+        self.node = FakeNode('entry_condition_1', children=['entry_2'])
+        self.context = {'tick_count': 7, 'current_timestamp': datetime(2024, 10, 1, 9, 15),
+                        'all_nodes': {'entry_2': FakeNode('entry_2', 'EntryNode')}}
+
+    def test_bounded_per_node(self):
+        store = NodeEventStore(max_events_per_node=3, capacity=2)
+        other = FakeNode('start')
+        for i in range(5):
+            store.record(self.node, self.context, 'logic_completed', f'exec_{i}',
+                         conditions=[_condition(float(i), 3.0, i > 3)])
+        store.record(other, self.context, 'logic_completed', 'exec_start')
+
+        self.assertEqual(list(store), ['exec_2', 'exec_3', 'exec_4', 'exec_start'])
+        self.assertEqual(store.get_summary()['evicted'], 2)
+        self.assertEqual([event['conditions_evaluated'][0]['lhs_value'] for event in
+                          store.events_for_node('entry_condition_1')], [2.0, 3.0, 4.0])
+
+        columns = store.to_columns()
+        self.assertEqual(list(columns['events']['condition_count']), [1, 1, 1, 0])
+        self.assertEqual(list(columns['conditions']['lhs_value']), [2.0, 3.0, 4.0])
+        self.assertEqual(list(columns['conditions']['event']), [0, 1, 2])
+
+    def test_event_matches_legacy_shape(self):
+        store = NodeEventStore(level='full')
+        payload = {'signal_emitted': True, 'conditions_evaluated': [_condition(5, 3.0, True)]}
+        store.record(self.node, self.context, 'logic_completed', 'exec_1', 'exec_0', payload=payload,
+                     conditions=payload['conditions_evaluated'])
+
+        event = store['exec_1']
+        self.assertEqual(event['timestamp'], '2024-10-01 09:15:00')
+        self.assertEqual(event['parent_execution_id'], 'exec_0')
+        self.assertEqual(event['children_nodes'], [{'id': 'entry_2', 'name': 'Entry_2', 'type': 'EntryNode'}])
+        self.assertTrue(event['signal_emitted'])
+        self.assertEqual(event['conditions_evaluated'][0]['condition_text'],
+                         'Previous[TI.1m.Close] > 3  [5 > 3.00] ✓')
+        self.assertNotIn('payload', store.headers['exec_1'])
+        self.assertNotIn('signal_emitted', store.headers['exec_1'])
+
+    def test_summary_level_keeps_values_not_payload(self):
+        store = NodeEventStore(level='summary')
+        conditions = [_condition(5, 3.5, True), _condition(None, 'x', False, '==')]
+        store.record(self.node, self.context, 'logic_completed', 'exec_1',
+                     payload={'ltp_store': {'NIFTY': 25000.0}}, conditions=conditions)
+
+        event = store['exec_1']
+        self.assertNotIn('ltp_store', event)
+        rendered = event['conditions_evaluated']
+        self.assertEqual([(c['lhs_value'], c['rhs_value'], c['result']) for c in rendered],
+                         [(5, 3.5, True), (None, 'x', False)])
+        self.assertIsInstance(rendered[0]['lhs_value'], int)
+        self.assertEqual(rendered[1]['evaluated'], 'null == x')
+
+    def test_conditions_compacted_under_eviction(self):
+        store = NodeEventStore(max_events_per_node=2, level='summary', capacity=4)
+        for i in range(200):
+            store.record(self.node, self.context, 'logic_completed', f'exec_{i}',
+                         conditions=[_condition(float(i), 0.0, True), _condition(float(-i), 0.0, False)])
+        self.assertLessEqual(len(store._cond_lhs), 16)
+        self.assertEqual([c['lhs_value'] for event in store.export().values()
+                          for c in event['conditions_evaluated']], [198.0, -198.0, 199.0, -199.0])
+
+    def test_export_since_returns_only_new_events(self):
+        store = NodeEventStore(max_events_per_node=3, capacity=2)
+        store.record(self.node, self.context, 'logic_completed', 'exec_0')
+        events, cursor = store.export_since(0)
+        self.assertEqual(list(events), ['exec_0'])
+
+        for i in range(1, 5):
+            store.record(self.node, self.context, 'logic_completed', f'exec_{i}')
+        store.record(self.node, self.context, 'logic_completed', 'exec_2')  # re-recorded
+        events, next_cursor = store.export_since(cursor)
+
+        # exec_1 was evicted before it was read; the re-recorded exec_2 comes last
+        self.assertEqual(list(events), ['exec_3', 'exec_4', 'exec_2'])
+        self.assertEqual(events['exec_4'], store['exec_4'])
+        self.assertEqual(store.export_since(next_cursor), ({}, next_cursor))
+
+    def test_events_since_plain_dict(self):
+        history = {'exec_0': {'node_id': 'a'}}
+        events, cursor = events_since(history, 0)
+        history['exec_1'] = {'node_id': 'b'}
+        self.assertEqual(events_since(history, cursor), ({'exec_1': {'node_id': 'b'}}, 2))
+
+class TestNodeDiagnostics(unittest.TestCase):
+    """Levels through NodeDiagnostics and ConditionEvaluator"""
+
+    def _context(self, level):
+        diagnostics = NodeDiagnostics(level=level)
+        context = {'tick_count': 1, 'current_timestamp': datetime(2024, 10, 1, 9, 15)}
+        diagnostics.initialize_context(context)
+        return diagnostics, context
+
+    def test_off_records_nothing(self):
+        diagnostics, context = self._context('off')
+        node = FakeNode('entry_condition_1')
+        diagnostics.record_event(node, context, 'logic_completed', {'conditions_evaluated': []})
+        diagnostics.update_current_state(node, context, 'active')
+
+        self.assertEqual(len(context['node_events_history']), 0)
+        self.assertEqual(context['node_current_state'], {})
+
+        evaluator = ConditionEvaluator(context=context)
+        condition = {'lhs': {'type': 'constant', 'value': 2}, 'operator': '>', 'rhs': {'type': 'constant', 'value': 1}}
+        self.assertTrue(evaluator.evaluate_condition(condition))
+        self.assertEqual(evaluator.get_diagnostic_data()['conditions_evaluated'], [])
+
+    def test_text_rendered_on_export(self):
+        diagnostics, context = self._context('full')
+        evaluator = ConditionEvaluator(context=context)
+        condition = {'lhs': {'type': 'constant', 'value': 2}, 'operator': '>', 'rhs': {'type': 'constant', 'value': 1}}
+        evaluator.evaluate_condition(condition)
+
+        diagnostic_data = evaluator.get_diagnostic_data()
+        self.assertNotIn('condition_text', diagnostic_data['conditions_evaluated'][0])
+
+        node = FakeNode('entry_condition_1')
+        diagnostics.record_event(node, context, 'logic_completed', {'diagnostic_data': diagnostic_data},
+                                 {'execution_id': 'exec_1'})
+        events = diagnostics.get_all_events(context)
+        self.assertIs(context['node_events_history'], diagnostics.events)
+        self.assertEqual(events['exec_1']['diagnostic_data']['conditions_evaluated'][0]['condition_text'],
+                         '2 > 1  [2.00 > 1.00] ✓')
+        self.assertEqual(diagnostics.get_events_for_node('entry_condition_1', context)[0]['execution_id'], 'exec_1')
+
+    def test_render_is_idempotent(self):
+        data = {'conditions_evaluated': [_condition(1.0, 3.0, False)]}
+        render_condition_diagnostics(data)
+        render_condition_diagnostics(data)
+        self.assertEqual(data['conditions_evaluated'][0]['raw'], 'Previous[TI.1m.Close] > 3')
+        self.assertEqual(data['conditions_evaluated'][0]['result_icon'], '✗')
+
+
+if __name__ == '__main__':
+    unittest.main()
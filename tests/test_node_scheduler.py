@@ -0,0 +1,147 @@
+"""Test suite for the active-node scheduler"""
+
+import random
+import unittest
+from datetime import datetime, timedelta
+
+from src.core.centralized_tick_processor import CentralizedTickProcessor
+from strategy.nodes.base_node import BaseNode
+
+
+class ScriptedNode(BaseNode):
+    """Node whose logic completes on scripted ticks"""
+
+    def __init__(self, node_id, complete_on=(), resets_children=False):
+        super().__init__(node_id, 'scriptedNode', node_id)
+        self.complete_on = complete_on
+        self.resets_children = resets_children
+        self.execute_calls = 0
+        self._completed_ticks = set()
+
+    def execute(self, context):
+        self.execute_calls += 1
+        return super().execute(context)
+
+    def _ensure_fo_resolver(self, context):
+        pass
+
+    def _execute_node_logic(self, context):
+        tick = context['tick_count']
+        context['log'].append((tick, self.id))
+        # At most once per tick (re-entry counts are bounded), so reset loops terminate
+        completed = tick not in self._completed_ticks and (self.complete_on == 'always' or tick in self.complete_on)
+        if completed:
+            self._completed_ticks.add(tick)
+        if completed and self.resets_children:
+            # ReEntrySignalNode / ExitNode: children may run again this tick
+            for child_id in self.children:
+                context['node_instances'][child_id].reset_visited(context)
+        return {'node_id': self.id, 'logic_completed': completed}
+
+
+def _build(edges, nodes):
+    for node_id, children in edges.items():
+        nodes[node_id].set_relations([], list(children))
+    states = {node_id: {'status': 'Inactive', 'visited': False} for node_id in nodes}
+    states['root']['status'] = 'Active'
+    return {
+        'instance_id': 'test',
+        'strategy_id': 'test',
+        'context': {'log': []},
+        'node_instances': nodes,
+        'node_states': states,
+        'start_node': nodes['root'],
+    }
+
+
+def _run(make_state, ticks, scheduled):
+    """Drive _process_strategy; returns (execution log, final statuses, execute calls)."""
+    processor = CentralizedTickProcessor.__new__(CentralizedTickProcessor)
+    processor.data_manager = None
+    processor.use_node_scheduler = scheduled
+    strategy_state = make_state()
+
+    for tick in range(ticks):
+        processor.tick_count = tick
+        processor._process_strategy(strategy_state, {'timestamp': datetime(2024, 10, 1, 9, 15) + timedelta(seconds=tick)})
+
+    statuses = {node_id: state['status'] for node_id, state in strategy_state['node_states'].items()}
+    calls = sum(node.execute_calls for node in strategy_state['node_instances'].values())
+    return strategy_state['context']['log'], statuses, calls
+
+
+class TestActiveNodeScheduler(unittest.TestCase):
+    """Scheduled execution matches the full tree traversal"""
+
+    def assert_parity(self, make_state, ticks):
+        expected = _run(make_state, ticks, scheduled=False)
+        actual = _run(make_state, ticks, scheduled=True)
+        self.assertEqual(actual[0], expected[0])
+        self.assertEqual(actual[1], expected[1])
+        return expected[2], actual[2]
+
+    def test_chain_activates_within_tick(self):
+        """Children activated by a completed node run in the same tick"""
+        def make_state():
+            nodes = {node_id: ScriptedNode(node_id, complete_on) for node_id, complete_on in
+                     [('root', {0}), ('a', {1}), ('b', {1}), ('c', {3}), ('hub', ())] + [(f"idle{i}", ()) for i in range(30)]}
+            edges = {'root': ['a', 'hub'], 'a': ['b'], 'b': ['c'], 'hub': [f"idle{i}" for i in range(30)]}
+            return _build(edges, nodes)
+
+        full_calls, scheduled_calls = self.assert_parity(make_state, ticks=6)
+        log, _, _ = _run(make_state, 6, scheduled=True)
+        self.assertIn((1, 'b'), log)
+        self.assertIn((1, 'c'), log)
+        self.assertLess(scheduled_calls * 10, full_calls)
+
+    def test_shared_child_waits_when_already_visited(self):
+        """A child reached earlier in the tick is only executed next tick"""
+        def make_state():
+            nodes = {node_id: ScriptedNode(node_id, complete_on) for node_id, complete_on in
+                     [('root', {0}), ('x', ()), ('y', 'always'), ('z', 'always')]}
+            return _build({'root': ['x', 'y'], 'x': ['z'], 'y': ['z']}, nodes)
+
+        self.assert_parity(make_state, ticks=4)
+        log, _, _ = _run(make_state, 4, scheduled=True)
+        self.assertEqual([entry for entry in log if entry[1] == 'z'], [(1, 'z')])
+
+    def test_reentry_reset_reruns_child(self):
+        """Visited-flag resets (re-entry loops) follow the recursive order"""
+        def make_state():
+            nodes = {
+                'root': ScriptedNode('root', {0}),
+                'entry': ScriptedNode('entry', 'always'),
+                'reentry': ScriptedNode('reentry', {2, 4}, resets_children=True),
+                'exit': ScriptedNode('exit', {3}),
+                'late': ScriptedNode('late', ()),
+            }
+            edges = {'root': ['entry', 'late'], 'entry': ['reentry', 'exit'], 'reentry': ['entry'], 'exit': ['late']}
+            return _build(edges, nodes)
+
+        self.assert_parity(make_state, ticks=6)
+        log, _, _ = _run(make_state, 6, scheduled=True)
+        self.assertEqual(log.count((2, 'entry')), 1)
+        self.assertIn((2, 'reentry'), log)
+
+    def test_random_graphs(self):
+        """Random cyclic graphs with random completions and resets"""
+        for seed in range(40):
+            rng = random.Random(seed)
+
+            def make_state():
+                rng.seed(seed)
+                ids = ['root'] + [f"n{i}" for i in range(rng.randint(3, 12))]
+                nodes = {}
+                for node_id in ids:
+                    complete_on = {0, 5} if node_id == 'root' else set(rng.sample(range(12), rng.randint(0, 6)))
+                    nodes[node_id] = ScriptedNode(node_id, complete_on, resets_children=rng.random() < 0.3)
+                edges = {node_id: rng.sample(ids[1:], rng.randint(0, 3)) for node_id in ids}
+                edges['root'] = edges['root'] or [ids[1]]
+                return _build(edges, nodes)
+
+            with self.subTest(seed=seed):
+                self.assert_parity(make_state, ticks=12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+"""Test suite for batched option contract prefetch"""
+
+import re
+import unittest
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+
+import pandas as pd
+
+from src.backtesting.columnar_ticks import ColumnarTicks
+from src.backtesting.data_manager import DataManager
+from src.backtesting.option_prefetch import OptionPrefetchPlanner, OptionTickBuffer, spot_ranges_from_ticks
+from src.storage.local_tick_store import LocalTickStore
+
+START = datetime(2024, 10, 1, 9, 15)
+
+
+class ExpiryResolver:
+    """FODynamicResolver stand-in with a fixed expiry"""
+
+    def __init__(self):
+        self.calls = []
+
+    def resolve(self, dynamic_symbol, spot_prices, reference_date=None):
+        self.calls.append(dynamic_symbol)
+        index = dynamic_symbol.split(':')[0]
+        return f"{index}:2024-10-03:OPT:0:CE"
+
+
+class RecordingClient:
+    """ClickHouse client serving nse_ticks_options rows for the queried tickers"""
+
+    def __init__(self, rows):
+        self.frame = pd.DataFrame(rows, columns=['ticker', 'timestamp', 'ltp', 'ltq', 'oi'])
+        self.queries = []
+
+    def query_df(self, query):
+        self.queries.append(query)
+        tickers = re.search(r"ticker IN \(([^)]*)\)", query).group(1)
+        wanted = [t.strip("'") for t in tickers.split(',')]
+        frame = self.frame[self.frame['ticker'].isin(wanted)]
+        since = re.search(r"timestamp >= (\d+)", query)
+        if since:
+            frame = frame[frame['timestamp'].map(lambda ts: ts.timestamp()) >= int(since.group(1))]
+        return frame.reset_index(drop=True)
+
+
+def _option_rows():
+    rows = []
+    for ticker, base in (('NIFTY03OCT2425900CE.NFO', 120.0), ('NIFTY03OCT2425950CE.NFO', 95.0)):
+        for i in range(6):
+            rows.append((ticker, START + timedelta(seconds=i), base + i, 50, 1000 + i))
+    return rows
+
+
+class TestOptionPrefetch(unittest.TestCase):
+    """Planned contracts load in one query and replay like per-contract loads"""
+
+    def setUp(self):
+        # Keep the read-through tick store off disk
+        patcher = patch('src.storage.local_tick_store._tick_store_instance', LocalTickStore(root='unused', enabled=False))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _data_manager(self, client):
+        dm = DataManager(cache=None, broker_name='clickhouse')
+        dm.clickhouse_client = client
+        return dm
+
+    def test_plan_covers_atm_band(self):
+        """Every strike the pattern resolves to within the spot range is planned"""
+        ticks = ColumnarTicks.from_ticks([
+            {'symbol': 'NIFTY', 'timestamp': START + timedelta(seconds=i), 'ltp': ltp, 'ltq': 0, 'oi': 0}
+            for i, ltp in enumerate([25880.0, 25990.0, 25930.0])
+        ])
+        resolver = ExpiryResolver()
+        patterns = [
+            {'underlying': 'NIFTY', 'expiry_code': 'W0', 'strike_code': 'ATM', 'option_type': 'CE'},
+            {'underlying': 'NIFTY', 'expiry_code': 'W0', 'strike_code': 'OTM1', 'option_type': 'PE'},
+            {'underlying': 'BANKNIFTY', 'expiry_code': 'W0', 'strike_code': 'ATM', 'option_type': 'CE'},
+        ]
+
+        keys = OptionPrefetchPlanner(resolver).plan(patterns, spot_ranges_from_ticks(ticks), date(2024, 10, 1))
+
+        self.assertEqual(spot_ranges_from_ticks(ticks), {'NIFTY': (25880.0, 25990.0)})
+        self.assertEqual(keys, [
+            'NIFTY:2024-10-03:OPT:25900:CE', 'NIFTY:2024-10-03:OPT:25950:CE', 'NIFTY:2024-10-03:OPT:26000:CE',
+            'NIFTY:2024-10-03:OPT:25850:PE', 'NIFTY:2024-10-03:OPT:25900:PE', 'NIFTY:2024-10-03:OPT:25950:PE',
+        ])
+        # One expiry resolution per pattern; no spot range -> not planned
+        self.assertEqual(len(resolver.calls), 2)
+
+    def test_prefetch_serves_contracts_without_requery(self):
+        """One IN query loads all contracts; later loads and replay use the buffers"""
+        client = RecordingClient(_option_rows())
+        dm = self._data_manager(client)
+        planned = ['NIFTY:2024-10-03:OPT:25900:CE', 'NIFTY:2024-10-03:OPT:25950:CE', 'NIFTY:2024-10-03:OPT:26000:CE']
+
+        self.assertEqual(dm.prefetch_option_contracts(planned, date(2024, 10, 1)), 2)
+        self.assertEqual(len(client.queries), 1)
+        self.assertNotIn('startsWith', client.queries[0])
+
+        ltp = dm.load_option_contract('NIFTY:2024-10-03:OPT:25900:CE', START + timedelta(seconds=2))
+        self.assertEqual(ltp, 122.0)
+        self.assertIsNone(dm.load_option_contract('NIFTY:2024-10-03:OPT:26000:CE', START))
+        self.assertEqual(len(client.queries), 1)
+
+        replayed = [dm.get_option_ticks_for_timestamp(START + timedelta(seconds=i)) for i in range(6)]
+        self.assertEqual([len(batch) for batch in replayed], [0, 0, 1, 1, 1, 1])
+        self.assertEqual(replayed[3][0], {
+            'symbol': 'NIFTY:2024-10-03:OPT:25900:CE', 'timestamp': START + timedelta(seconds=3),
+            'ltp': 123.0, 'ltq': 50, 'oi': 1003,
+        })
+
+    def test_unplanned_contract_matches_prefetched(self):
+        """On-demand loading of an unplanned contract replays the same ticks"""
+        contract = 'NIFTY:2024-10-03:OPT:25950:CE'
+        subscribed = START + timedelta(seconds=1)
+
+        prefetched = self._data_manager(RecordingClient(_option_rows()))
+        prefetched.prefetch_option_contracts([contract], date(2024, 10, 1))
+        on_demand = self._data_manager(RecordingClient(_option_rows()))
+
+        for dm in (prefetched, on_demand):
+            self.assertEqual(dm.load_option_contract(contract, subscribed), 96.0)
+        self.assertEqual(len(on_demand.clickhouse_client.queries), 1)
+
+        for i in range(6):
+            timestamp = START + timedelta(seconds=i)
+            self.assertEqual(prefetched.get_option_ticks_for_timestamp(timestamp),
+                             on_demand.get_option_ticks_for_timestamp(timestamp))
+
+    def test_buffer_drops_past_ticks(self):
+        """pop_at returns exact-second ticks and drops skipped ones"""
+        frame = pd.DataFrame({
+            'timestamp': [START, START, START + timedelta(seconds=1), START + timedelta(seconds=3)],
+            'ltp': [1.0, 2.0, 3.0, 4.0], 'ltq': [0, 0, 0, 0], 'oi': [0, 0, 0, 0],
+        })
+        buffer = OptionTickBuffer.from_frame('X', frame)
+
+        self.assertEqual([t['ltp'] for t in buffer.pop_at(START)], [1.0, 2.0])
+        self.assertEqual(buffer.pop_at(START + timedelta(seconds=2)), [])
+        self.assertEqual(len(buffer), 1)
+        self.assertEqual([t['ltp'] for t in buffer.pop_at(START + timedelta(seconds=3))], [4.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+"""Test suite for the parallel multi-day executor"""
+
+import os
+import time
+import unittest
+from datetime import date
+from unittest.mock import patch
+
+from src.backtesting.parallel_day_executor import (
+    DayResult,
+    ParallelDayExecutor,
+    merge_overall_summary,
+    resolve_worker_count,
+)
+
+
+def _fake_day(strategy_id, test_date, session_id):
+    """Picklable stand-in for run_dashboard_day: earlier days finish later"""
+    if test_date.day == 3:
+        raise ValueError("no data")
+    time.sleep(1.0 if test_date.day == 1 else 0.0)
+    pnl = float(test_date.day)
+    return {
+        'session_id': session_id,
+        'summary': {
+            'total_positions': 1,
+            'total_pnl': pnl,
+            'winning_trades': 1,
+            'losing_trades': 0,
+            'breakeven_trades': 0,
+            'largest_win': pnl,
+            'largest_loss': 0,
+            'win_rate': 100.0
+        }
+    }
+
+
+DATES = [date(2024, 10, day) for day in (1, 2, 3, 4)]
+
+
+class TestParallelDayExecutor(unittest.TestCase):
+    """Test ParallelDayExecutor scheduling and merging"""
+
+    def setUp(self):
+        env = patch.dict(os.environ, {'BACKTEST_DAY_WORKERS': '2'})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def test_parallel_matches_sequential(self):
+        """Process pool yields every day; merged summary equals the inline run"""
+        parallel = list(ParallelDayExecutor(max_workers=2, run_day=_fake_day).run('s1', DATES))
+        inline = list(ParallelDayExecutor(max_workers=1, run_day=_fake_day).run('s1', DATES))
+
+        self.assertEqual([r.date for r in inline], DATES)
+        self.assertEqual(sorted(r.date for r in parallel), DATES)
+        # The slow first day does not hold back the others
+        self.assertNotEqual(parallel[0].date, DATES[0])
+
+        self.assertEqual(
+            merge_overall_summary(parallel, len(DATES)),
+            merge_overall_summary(inline, len(DATES))
+        )
+
+    def test_failed_day_is_isolated(self):
+        """A failing day reports its error and the other days still complete"""
+        results = {r.date: r for r in ParallelDayExecutor(max_workers=2, run_day=_fake_day).run('s1', DATES)}
+
+        self.assertIn('no data', results[date(2024, 10, 3)].error)
+        self.assertEqual(sum(r.ok for r in results.values()), 3)
+
+        overall = merge_overall_summary(list(results.values()), len(DATES))
+        self.assertEqual(overall['total_positions'], 3)
+        self.assertEqual(overall['total_pnl'], 7.0)
+        self.assertEqual(overall['days_tested'], 4)
+
+    def test_days_of_a_run_share_one_session(self):
+        """Every day of a run gets the run's session_id; another run gets a new one"""
+        first = [r.daily_data['session_id'] for r in ParallelDayExecutor(max_workers=2, run_day=_fake_day).run('s1', DATES) if r.ok]
+        second = [r.daily_data['session_id'] for r in ParallelDayExecutor(max_workers=1, run_day=_fake_day).run('s1', DATES) if r.ok]
+
+        self.assertEqual(len(set(first)), 1)
+        self.assertEqual(len(set(second)), 1)
+        self.assertNotEqual(first[0], second[0])
+
+    def test_worker_count_is_capped(self):
+        """A requested worker count never exceeds BACKTEST_DAY_WORKERS or the number of days"""
+        self.assertEqual(resolve_worker_count(365, 365), 2)
+        self.assertEqual(resolve_worker_count(None, 365), 2)
+        self.assertEqual(resolve_worker_count(8, 1), 1)
+        self.assertEqual(resolve_worker_count(1, 365), 1)
+
+    def test_merge_skips_failed_days(self):
+        """Failed results do not contribute to the overall summary"""
+        overall = merge_overall_summary([DayResult(date(2024, 10, 1), 1, error='boom')], 1)
+        self.assertEqual(overall['total_positions'], 0)
+        self.assertEqual(overall['overall_win_rate'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""Test suite for the SQLite results catalog"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta
+
+from src.storage.backtest_storage import BacktestStorage
+from src.storage.results_catalog import ResultsCatalog
+
+SUMMARY = {'total_trades': 2, 'total_pnl': '150.00', 'winning_trades': 1, 'losing_trades': 1, 'win_rate': '50.00'}
+
+
+class TestResultsCatalog(unittest.TestCase):
+    """Day and strategy rows"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.catalog = ResultsCatalog(os.path.join(self.tmp_dir, 'catalog.sqlite3'))
+
+    def tearDown(self):
+        self.catalog.close()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_days_in_date_order_last_write_wins(self):
+        for date_str in ('2024-10-03', '2024-10-01', '2024-10-02'):
+            self.catalog.record_day('strat', date_str, summary=SUMMARY, size_bytes=100, backtest_id='bt1')
+        self.catalog.record_day('strat', '2024-10-01', summary={**SUMMARY, 'total_trades': 5}, backtest_id='bt1')
+        self.catalog.record_day('other', '2024-10-01', summary=SUMMARY)
+
+        days = self.catalog.list_days('strat')
+        self.assertEqual([day['date'] for day in days], ['2024-10-01', '2024-10-02', '2024-10-03'])
+        self.assertEqual(days[0]['summary']['total_trades'], 5)
+        self.assertEqual([day['date'] for day in self.catalog.list_days('strat', start='2024-10-02')],
+                         ['2024-10-02', '2024-10-03'])
+        self.assertEqual(len(self.catalog.list_backtest_days('bt1')), 3)
+
+        self.assertEqual(self.catalog.delete_strategy('strat'), {'days': 3, 'bytes': 200})
+        self.assertFalse(self.catalog.has_days('strat'))
+        self.assertTrue(self.catalog.has_days('other'))
+
+    def test_import_summary_jsonl(self):
+        path = os.path.join(self.tmp_dir, 'summary.jsonl')
+        with open(path, 'w', encoding='utf-8') as f:
+            for date_str, trades in (('2024-10-02', 1), ('2024-10-01', 1), ('2024-10-02', 3)):
+                f.write(json.dumps({'date': date_str, 'summary': {**SUMMARY, 'total_trades': trades}}) + '\n')
+
+        self.assertEqual(self.catalog.import_summary_jsonl('strat', path), 2)
+        days = self.catalog.list_days('strat')
+        self.assertEqual([day['date'] for day in days], ['2024-10-01', '2024-10-02'])
+        self.assertEqual(days[1]['summary']['total_trades'], 3)
+        self.assertEqual(self.catalog.import_summary_jsonl('strat', os.path.join(self.tmp_dir, 'missing')), 0)
+
+
+class TestBacktestStorageCatalog(unittest.TestCase):
+    """BacktestStorage lists and expires from the catalog"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_list_and_cleanup(self):
+        storage = BacktestStorage(self.tmp_dir)
+        storage.save_metadata('u1', 'old', {'created_at': (datetime.now() - timedelta(hours=24)).isoformat()})
+        storage.save_metadata('u1', 'new', {'created_at': datetime.now().isoformat()})
+        storage.save_day_data('u1', 'old', '01-10-2024', {'summary': SUMMARY, 'positions': []})
+        storage.save_day_data('u1', 'new', '02-10-2024', {'summary': SUMMARY, 'positions': []})
+
+        self.assertEqual([day['date'] for day in storage.list_dates('u1', 'new')], ['02-10-2024'])
+        result = storage.cleanup_expired(ttl_hours=12)
+        self.assertEqual(result['deleted_strategies'], 1)
+        self.assertFalse(os.path.exists(os.path.join(self.tmp_dir, 'u1', 'old', 'metadata.json')))
+        self.assertEqual(storage.list_dates('u1', 'old'), [])
+        self.assertTrue(storage.strategy_exists('u1', 'new'))
+
+    def test_existing_folders_are_imported(self):
+        folder = os.path.join(self.tmp_dir, 'u1', 'legacy')
+        os.makedirs(folder)
+        with open(os.path.join(folder, 'metadata.json'), 'w') as f:
+            json.dump({'created_at': datetime.fromtimestamp(time.time() - 86400).isoformat()}, f)
+        with open(os.path.join(folder, '01-10-2024.json.gz'), 'wb') as f:
+            f.write(b'\x1f\x8b')
+
+        storage = BacktestStorage(self.tmp_dir)
+        self.assertEqual([day['date'] for day in storage.list_dates('u1', 'legacy')], ['01-10-2024'])
+        self.assertEqual(storage.cleanup_expired(ttl_hours=12)['deleted_strategies'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
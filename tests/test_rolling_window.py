@@ -0,0 +1,135 @@
+"""Test suite for streaming rolling-window primitives and the indicators built on them"""
+
+import random
+import unittest
+
+import numpy as np
+import pandas as pd
+
+try:
+    from src.indicators_hybrid import (
+        CTIIndicator, DONCHIANIndicator, ENTROPYIndicator, LINREGIndicator, QUANTILEIndicator,
+        STDEVIndicator, ZSCOREIndicator,
+    )
+    from src.indicators_hybrid.rolling import (
+        RollingMax, RollingMin, RollingMoments, RollingOrderStatistics, RollingRegression,
+    )
+except ImportError:  # indicators_hybrid needs pandas_ta / scipy
+    RollingMoments = None
+
+
+def _prices(count, seed=11):
+    rng = random.Random(seed)
+    price = 22000.0
+    prices = []
+    for i in range(count):
+        # Flat stretches exercise ties and constant windows
+        price = price if i % 13 < 4 else round(price + rng.uniform(-15, 15), 2)
+        prices.append(price)
+    return prices
+
+
+def _windows(prices, length):
+    for i in range(len(prices)):
+        yield i, np.array(prices[max(0, i - length + 1):i + 1])
+
+
+@unittest.skipIf(RollingMoments is None, "indicators_hybrid dependencies not installed")
+class TestRollingPrimitives(unittest.TestCase):
+    """Streaming state equals a fresh computation over the window"""
+
+    def test_extrema_and_order_statistics_exact(self):
+        prices = _prices(1500)
+        for length in (1, 2, 9, 30):
+            highest, lowest = RollingMax(length), RollingMin(length)
+            ordered = RollingOrderStatistics(length)
+            for i, window in _windows(prices, length):
+                for state in (highest, lowest, ordered):
+                    state.append(prices[i])
+                self.assertEqual(highest.value, window.max())
+                self.assertEqual(lowest.value, window.min())
+                self.assertEqual(ordered.median(), np.median(window))
+                for q in (0.1, 0.25, 0.33, 0.75, 0.9):
+                    self.assertEqual(ordered.quantile(q), np.quantile(window, q))
+                bins = min(10, length)
+                self.assertEqual(ordered.histogram(bins).tolist(), np.histogram(window, bins=bins)[0].tolist())
+
+    def test_moments_and_regression_close(self):
+        prices = _prices(1500, seed=5)
+        for length in (2, 14, 50):
+            moments, regression = RollingMoments(length), RollingRegression(length)
+            for i, window in _windows(prices, length):
+                moments.append(prices[i])
+                regression.append(prices[i])
+                self.assertAlmostEqual(moments.mean, window.mean(), delta=1e-9)
+                self.assertAlmostEqual(moments.std, window.std(), delta=1e-9)
+                if len(window) < 2:
+                    continue
+
+                x = np.arange(len(window))
+                slope, intercept = np.polyfit(x, window, 1)
+                self.assertAlmostEqual(regression.slope(), slope, delta=1e-8)
+                self.assertAlmostEqual(regression.value_at(len(window) - 1), intercept + slope * x[-1], delta=1e-7)
+                if window.std() == 0:
+                    self.assertIsNone(regression.correlation())
+                else:
+                    self.assertAlmostEqual(regression.correlation(), np.corrcoef(x, window)[0, 1], delta=1e-9)
+
+    def test_constant_window_has_zero_variance(self):
+        moments = RollingMoments(5, [1.0, 2.0, 3.0, 4.0, 5.0])
+        for _ in range(5):
+            moments.append(22000.15)
+        self.assertEqual(moments.variance, 0.0)
+
+
+@unittest.skipIf(RollingMoments is None, "indicators_hybrid dependencies not installed")
+class TestWindowedIndicators(unittest.TestCase):
+    """Indicator updates match the per-window formulas they replace"""
+
+    def _run(self, indicator, prices, warm=0):
+        """Seed state from the first `warm` candles, then update with the rest."""
+        candles = [{'open': p, 'high': p + 2.5, 'low': p - 1.5, 'close': p, 'volume': 0} for p in prices]
+        if warm:
+            indicator._initialize_state_from_dataframe(pd.DataFrame(candles[:warm]), None)
+        return [indicator.update(candle) for candle in candles[warm:]]
+
+    def test_statistics_match_window_formulas(self):
+        prices = _prices(400)
+        zscore, stdev = self._run(ZSCOREIndicator(length=20), prices), self._run(STDEVIndicator(length=20), prices)
+        entropy, quantile = self._run(ENTROPYIndicator(length=10), prices), self._run(QUANTILEIndicator(length=15, q=0.3), prices)
+
+        for i, price in enumerate(prices):
+            if i < 19:
+                self.assertIsNone(zscore[i])
+                continue
+            window = np.array(prices[i - 19:i + 1])
+            expected = (price - window.mean()) / window.std() if window.std() > 0 else 0
+            self.assertAlmostEqual(zscore[i], expected, delta=1e-6)
+            self.assertAlmostEqual(stdev[i], window.std(), delta=1e-9)
+
+            hist = np.histogram(prices[i - 9:i + 1], bins=10)[0]
+            probs = hist[hist > 0] / hist.sum()
+            self.assertEqual(entropy[i], -np.sum(probs * np.log2(probs)))
+            self.assertEqual(quantile[i], np.quantile(prices[i - 14:i + 1], 0.3))
+
+    def test_regression_and_channels_after_state_init(self):
+        prices = _prices(300, seed=2)
+        cti = self._run(CTIIndicator(length=12), prices, warm=100)
+        linreg = self._run(LINREGIndicator(length=14), prices, warm=100)
+        donchian = self._run(DONCHIANIndicator(lower_length=10, upper_length=20), prices, warm=100)
+
+        for offset, i in enumerate(range(100, len(prices))):
+            window = np.array(prices[i - 11:i + 1])
+            corr = np.corrcoef(np.arange(12), window)[0, 1] if window.std() > 0 else np.nan
+            self.assertAlmostEqual(cti[offset], 0 if np.isnan(corr) else corr * 100, delta=1e-7)
+
+            x = np.arange(14)
+            slope, intercept = np.polyfit(x, prices[i - 13:i + 1], 1)
+            self.assertAlmostEqual(linreg[offset], intercept + slope * 13, delta=1e-7)
+
+            self.assertEqual(donchian[offset]['DCU'], max(prices[i - 19:i + 1]) + 2.5)
+            self.assertEqual(donchian[offset]['DCL'], min(prices[i - 9:i + 1]) - 1.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+"""Test suite for the whole-day signal pre-screen"""
+
+import unittest
+from collections import deque
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from src.backtesting.candle_builder import CandleBuilder
+from src.backtesting.columnar_ticks import ColumnarTicks
+from src.backtesting.data_manager import DataManager
+from src.backtesting.signal_prescreen import SignalPrescreen, build_day_candles
+from src.core.condition_evaluator_v2 import ConditionEvaluator
+from src.core.expression_evaluator import ExpressionEvaluator
+
+
+class RollingMean:
+    """Minimal hybrid-style indicator (calculate_bulk + update)"""
+
+    def __init__(self, length=3):
+        self.params = {'length': length}
+        self._window = deque(maxlen=length)
+
+    def calculate_bulk(self, df):
+        return df['close'].rolling(self.params['length']).mean()
+
+    def initialize_from_dataframe(self, df):
+        self._window.extend(df['close'].tail(self.params['length']))
+
+    def update(self, candle):
+        self._window.append(candle['close'])
+        if len(self._window) < self.params['length']:
+            return None
+        return sum(self._window) / len(self._window)
+
+
+class DriftingMean(RollingMean):
+    """Incremental values disagree with calculate_bulk"""
+
+    def update(self, candle):
+        value = super().update(candle)
+        return None if value is None else value + 0.5
+
+
+def _make_ticks():
+    """NIFTY ticks every 20s from 09:15 to 09:45 following a sine wave."""
+    start = datetime(2024, 10, 1, 9, 15)
+    return [
+        {'symbol': 'NIFTY', 'timestamp': start + timedelta(seconds=20 * i),
+         'ltp': round(22000.0 + 40 * np.sin(i / 9.0), 2), 'ltq': 0, 'oi': 0}
+        for i in range(90)
+    ]
+
+
+def _history():
+    start = datetime(2024, 9, 30, 15, 0)
+    closes = 22000.0 + np.arange(30) % 7
+    return pd.DataFrame({
+        'timestamp': [start + timedelta(minutes=i) for i in range(30)],
+        'open': closes, 'high': closes + 1, 'low': closes - 1, 'close': closes,
+        'volume': np.zeros(30),
+    })
+
+
+def _comparison(lhs, operator, rhs):
+    return {'lhs': lhs, 'operator': operator, 'rhs': rhs}
+
+
+CLOSE = {'type': 'candle_data', 'field': 'Close', 'offset': -1, 'timeframeId': '1m'}
+MEAN = {'type': 'indicator', 'name': 'mean', 'offset': -1, 'timeframeId': '1m'}
+LTP = {'type': 'live_data', 'field': 'ltp', 'instrumentType': 'TI'}
+
+
+class TestSignalPrescreen(unittest.TestCase):
+    """Screens agree with per-second condition evaluation"""
+
+    def _data_manager(self, indicator):
+        dm = DataManager(cache=None, broker_name='clickhouse')
+        dm.candle_builders = {'1m': CandleBuilder(timeframe='1m')}
+        dm.indicators['NIFTY:1m'] = {'mean': indicator}
+        dm.initialize_from_historical_data('NIFTY', '1m', _history())
+        return dm
+
+    def _replay(self, dm, ticks, conditions):
+        """
+        Replay ticks through the DataManager candle path (process_tick steps
+        3-5) and yield (may_satisfy, evaluated result) per tick.
+        """
+        evaluator = ConditionEvaluator(expression_evaluator=ExpressionEvaluator())
+        for tick in ticks:
+            for timeframe, builder in dm.candle_builders.items():
+                candle = builder.process_tick(tick)
+                if candle:
+                    dm._add_to_candle_buffer('NIFTY', timeframe, candle)
+                dm._update_forming_candle_in_buffer('NIFTY', timeframe, builder.get_current_candle('NIFTY'))
+
+            context = dict(dm.get_context(), strategy_config={'symbol': 'NIFTY'},
+                           current_timestamp=tick['timestamp'])
+            evaluator.set_context(context=context)
+            expected = all(evaluator.evaluate_condition(condition) for condition in conditions)
+            yield dm.signal_prescreen.may_satisfy(conditions, context), expected
+
+    def test_day_candles_match_candle_builder(self):
+        """Vectorized day candles equal CandleBuilder output (incl. forming)"""
+        ticks = _make_ticks()
+        for timeframe in ('1m', '5m'):
+            builder = CandleBuilder(timeframe=timeframe)
+            expected = [c for c in (builder.process_tick(dict(t)) for t in ticks) if c]
+            expected.append(builder.get_current_candle('NIFTY'))
+
+            frame = build_day_candles(ColumnarTicks.from_ticks(ticks), 'NIFTY', CandleBuilder(timeframe=timeframe))
+
+            self.assertEqual(len(frame), len(expected))
+            for row, candle in zip(frame.itertuples(), expected):
+                self.assertEqual(row.timestamp.to_pydatetime(), candle['timestamp'])
+                for field in ('open', 'high', 'low', 'close'):
+                    self.assertEqual(getattr(row, field), candle[field])
+
+    def test_skips_only_false_seconds(self):
+        """Screened-out ticks always evaluate False; some ticks are screened out"""
+        ticks = _make_ticks()
+        dm = self._data_manager(RollingMean())
+        dm.signal_prescreen = SignalPrescreen.from_columnar_ticks(ColumnarTicks.from_ticks(ticks), dm)
+        conditions = [
+            _comparison(CLOSE, '>', MEAN),
+            {'groupLogic': 'OR', 'conditions': [
+                _comparison(MEAN, '>', {'type': 'constant', 'value': 22010}),
+                _comparison(dict(CLOSE, field='low', offset=-2), '<', {'type': 'constant', 'value': 21990}),
+            ]},
+        ]
+
+        outcomes = list(self._replay(dm, ticks, conditions))
+
+        for may_satisfy, expected in outcomes:
+            if not may_satisfy:
+                self.assertFalse(expected)
+        self.assertTrue(any(expected for _, expected in outcomes))
+        self.assertGreater(dm.signal_prescreen.stats['skipped'], 0)
+        self.assertEqual(dm.signal_prescreen.stats['disabled_columns'], 0)
+
+    def test_live_conditions_are_never_screened(self):
+        """A live-data branch makes the OR undecidable from candles"""
+        ticks = _make_ticks()
+        dm = self._data_manager(RollingMean())
+        dm.signal_prescreen = SignalPrescreen.from_columnar_ticks(ColumnarTicks.from_ticks(ticks), dm)
+        conditions = [{'groupLogic': 'OR', 'conditions': [
+            _comparison(CLOSE, '>', {'type': 'constant', 'value': 1e9}),
+            _comparison(LTP, '>', {'type': 'constant', 'value': 0}),
+        ]}]
+
+        for may_satisfy, _ in self._replay(dm, ticks, conditions):
+            self.assertTrue(may_satisfy)
+        self.assertEqual(dm.signal_prescreen.stats['checks'], 0)
+
+    def test_mismatch_disables_column(self):
+        """Bulk vs live buffer mismatch falls back to per-second evaluation"""
+        ticks = _make_ticks()
+        dm = self._data_manager(DriftingMean())
+        dm.signal_prescreen = SignalPrescreen.from_columnar_ticks(ColumnarTicks.from_ticks(ticks), dm)
+        conditions = [_comparison(MEAN, '>', {'type': 'constant', 'value': 1e9})]
+
+        outcomes = list(self._replay(dm, ticks, conditions))
+
+        self.assertEqual(dm.signal_prescreen.stats['disabled_columns'], 1)
+        self.assertTrue(all(may_satisfy for may_satisfy, _ in outcomes[-30:]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+"""Test suite for SymbolTable (interned symbol normalization)"""
+
+import unittest
+from datetime import datetime
+
+from src.backtesting.columnar_ticks import ColumnarTicks
+from src.backtesting.data_manager import DataManager
+from src.symbol_mapping.symbol_table import SymbolTable
+
+
+class FakeSymbolCache:
+    """Scrip master stand-in counting to_unified() lookups"""
+
+    def __init__(self, mapping):
+        self.mapping = mapping
+        self.lookups = 0
+
+    def to_unified(self, broker_name, broker_symbol):
+        self.lookups += 1
+        try:
+            return self.mapping[broker_symbol]
+        except KeyError:
+            raise KeyError(f"Symbol '{broker_symbol}' not found in {broker_name} scrip master")
+
+
+class TestSymbolTable(unittest.TestCase):
+    """Normalization rules and interning"""
+
+    def setUp(self):
+        self.cache = FakeSymbolCache({'NIFTY': 'NIFTY', 'Nifty 50': 'NIFTY'})
+        self.table = SymbolTable('clickhouse', self.cache)
+
+    def test_normalization_rules(self):
+        self.assertEqual(self.table.to_universal('NIFTY03OCT2425950CE'), 'NIFTY:2024-10-03:OPT:25950:CE')
+        self.assertEqual(self.table.to_universal('NIFTY03OCT2425950CE.NFO'), 'NIFTY:2024-10-03:OPT:25950:CE')
+        self.assertEqual(self.table.to_universal('NIFTY:2024-10-03:OPT:25950:CE'), 'NIFTY:2024-10-03:OPT:25950:CE')
+        self.assertEqual(self.table.to_universal('NIFTY'), 'NIFTY')
+
+    def test_live_broker_uses_scrip_master(self):
+        table = SymbolTable('angelone', self.cache)
+        self.assertEqual(table.to_universal('Nifty 50'), 'NIFTY')
+
+    def test_each_ticker_normalized_once(self):
+        ids = [self.table.intern('NIFTY') for _ in range(5)]
+        self.assertEqual(ids, [0] * 5)
+        for _ in range(5):
+            self.table.to_universal('NIFTY')
+        self.assertEqual(self.cache.lookups, 1)
+        self.assertEqual(self.table.get_summary()['interned'], 1)
+
+    def test_unknown_symbol(self):
+        with self.assertRaises(KeyError):
+            self.table.intern('UNKNOWN')
+        self.assertIsNone(self.table.try_intern('UNKNOWN'))
+        self.assertEqual(self.table.intern_all(['NIFTY', 'UNKNOWN']), [0, None])
+
+    def test_overflow_still_normalizes(self):
+        table = SymbolTable('clickhouse', self.cache, max_symbols=1)
+        self.assertEqual(table.intern('NIFTY'), 0)
+        self.assertIsNone(table.intern('NIFTY03OCT2425950CE'))
+        self.assertEqual(table.to_universal('NIFTY03OCT2425950CE'), 'NIFTY:2024-10-03:OPT:25950:CE')
+        self.assertEqual(table.get_summary()['symbols'], 1)
+        self.assertEqual(table.get_summary()['overflow'], 2)
+
+
+class TestProcessTick(unittest.TestCase):
+    """process_tick resolves symbol ids and raw tickers the same way"""
+
+    def setUp(self):
+        self.dm = DataManager(cache=None, broker_name='clickhouse')
+        self.cache = FakeSymbolCache({'NIFTY': 'NIFTY'})
+        self.dm.symbol_table = SymbolTable('clickhouse', self.cache)
+
+    def _tick(self, symbol, **extra):
+        return {'symbol': symbol, 'timestamp': datetime(2024, 10, 1, 9, 15, 1), 'ltp': 100.0, **extra}
+
+    def test_with_and_without_symbol_id(self):
+        row_to_tick = self.dm._interning(lambda row: self._tick(row))
+        tagged = row_to_tick('NIFTY03OCT2425950CE')
+        self.assertEqual(tagged['symbol_id'], 0)
+
+        self.assertEqual(self.dm.process_tick(tagged)['symbol'], 'NIFTY:2024-10-03:OPT:25950:CE')
+        self.assertEqual(self.dm.process_tick(self._tick('NIFTY03OCT2425950CE'))['symbol'],
+                         'NIFTY:2024-10-03:OPT:25950:CE')
+        self.assertEqual(self.dm.ltp['NIFTY:2024-10-03:OPT:25950:CE'], 100.0)
+
+    def test_rewritten_symbol_ignores_stale_id(self):
+        tick = self._tick('NIFTY', symbol_id=self.dm.symbol_table.intern('NIFTY03OCT2425950CE'))
+        self.assertEqual(self.dm.process_tick(tick)['symbol'], 'NIFTY')
+
+    def test_columnar_ticks_carry_ids(self):
+        ticks = ColumnarTicks.from_ticks([self._tick('NIFTY'), self._tick('NIFTY03OCT2425950CE')])
+        ticks.attach_symbol_ids(self.dm.symbol_table.intern_all(ticks.symbols))
+
+        batch = ticks.materialize(0, len(ticks))
+        self.assertEqual({tick['symbol']: tick['symbol_id'] for tick in batch},
+                         {'NIFTY': 0, 'NIFTY03OCT2425950CE': 1})
+        self.assertEqual([self.dm.process_tick(tick)['symbol'] for tick in batch],
+                         ['NIFTY', 'NIFTY:2024-10-03:OPT:25950:CE'])
+        self.assertEqual(self.cache.lookups, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
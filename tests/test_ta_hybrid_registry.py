@@ -0,0 +1,121 @@
+"""Test suite for the lazy, manifest-backed ta_hybrid registry"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from ta_hybrid.registry import LazyRegistry, function_names, load_manifest, write_manifest
+
+try:
+    from ta_hybrid.registry import build_manifest
+except ImportError:
+    build_manifest = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(statement):
+    """Run statement in a fresh interpreter and return its last stdout line parsed as JSON"""
+    completed = subprocess.run([sys.executable, '-c', statement], cwd=ROOT,
+                               capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+class TestFunctionNames(unittest.TestCase):
+    """Registry names derived from class names"""
+
+    def test_snake_case_and_flat_alias(self):
+        self.assertEqual(function_names('ElderRayIndicator'), ['elder_ray', 'elderray'])
+        self.assertEqual(function_names('AnchoredVWAPIndicator'), ['anchored_vwap', 'anchoredvwap'])
+
+    def test_single_name_when_identical(self):
+        self.assertEqual(function_names('RSIIndicator'), ['rsi'])
+
+
+class TestLazyRegistry(unittest.TestCase):
+    """Mapping behaviour over a small manifest"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'manifest.json')
+        write_manifest({'version': 1, 'indicators': [{
+            'names': ['ordered_dict', 'ordereddict'],
+            'module': 'collections',
+            'class': 'OrderedDict',
+            'category': None,
+            'outputs': [],
+            'params': [],
+        }]}, self.path)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_lookup_imports_module_and_caches_aliases(self):
+        """Both names resolve to the same class"""
+        from collections import OrderedDict
+
+        registry = LazyRegistry(self.path)
+        self.assertIn('ordereddict', registry)
+        self.assertEqual(registry.loaded_modules(), [])
+        self.assertIs(registry['ordered_dict'], OrderedDict)
+        self.assertIs(registry.get('ordereddict'), OrderedDict)
+        self.assertEqual(registry.loaded_modules(), ['collections'])
+
+    def test_unknown_name(self):
+        registry = LazyRegistry(self.path)
+        self.assertIsNone(registry.get('rsi'))
+        self.assertNotIn('rsi', registry)
+        self.assertEqual(len(registry), 2)
+
+    def test_version_mismatch(self):
+        with open(self.path, 'w') as f:
+            json.dump({'version': 0, 'indicators': []}, f)
+        with self.assertRaises(ValueError):
+            load_manifest(self.path)
+
+
+class TestColdImport(unittest.TestCase):
+    """What `import ta_hybrid` loads (fresh interpreters)"""
+
+    def test_import_loads_no_indicator_modules(self):
+        loaded = _run(
+            "import sys, json, ta_hybrid\n"
+            "print(json.dumps(sorted(m for m in sys.modules "
+            "if m == 'pandas_ta' or m.startswith('src.indicators_hybrid'))))"
+        )
+        self.assertEqual(loaded, [])
+
+    @unittest.skipIf(build_manifest is None, "indicators_hybrid dependencies not installed")
+    def test_lookup_loads_one_module_without_pandas_ta(self):
+        loaded = _run(
+            "import sys, json, ta_hybrid\n"
+            "cls = ta_hybrid._INDICATOR_REGISTRY['rsi']\n"
+            "print(json.dumps([cls.__name__, 'pandas_ta' in sys.modules, "
+            "sorted(m for m in sys.modules if m.startswith('src.indicators_hybrid.'))]))"
+        )
+        self.assertEqual(loaded[0], 'RSIIndicator')
+        self.assertFalse(loaded[1])
+        self.assertNotIn('src.indicators_hybrid.pivots', loaded[2])
+        self.assertIn('src.indicators_hybrid.momentum', loaded[2])
+
+
+@unittest.skipIf(build_manifest is None, "indicators_hybrid dependencies not installed")
+class TestManifestInSync(unittest.TestCase):
+    """The committed manifest matches the indicator classes and configs"""
+
+    def test_manifest_is_current(self):
+        self.assertEqual(load_manifest(), build_manifest(),
+                         "run: python scripts/generate_ta_registry.py")
+
+    def test_every_exported_class_is_registered(self):
+        import src.indicators_hybrid as indicators_module
+
+        registered = {entry['class'] for entry in load_manifest()['indicators']}
+        self.assertEqual(registered, set(indicators_module._CLASS_MODULES))
+
+
+if __name__ == '__main__':
+    unittest.main()
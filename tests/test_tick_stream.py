@@ -0,0 +1,160 @@
+"""Test suite for streaming per-second tick batches"""
+
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from src.backtesting.data_manager import DataManager
+from src.backtesting.tick_stream import TickBatchStream
+from src.storage.local_tick_store import LocalTickStore
+
+
+def _row(second, micro, symbol='NIFTY', ltp=22000.0):
+    return (symbol, datetime(2024, 10, 1, 9, 15, second, micro), ltp, 1, 0)
+
+
+class TestTickBatchStream(unittest.TestCase):
+    """Test TickBatchStream block regrouping"""
+
+    def _blocks(self):
+        # Second 1 straddles the first block boundary
+        return [
+            [_row(0, 0), _row(0, 500000), _row(1, 0)],
+            [_row(1, 400000), _row(2, 0)],
+            [_row(3, 0)],
+        ]
+
+    def _stream(self, prefetch_blocks):
+        return TickBatchStream(
+            block_source=self._blocks,
+            row_to_tick=DataManager._raw_tick_from_row,
+            prefetch_blocks=prefetch_blocks,
+        )
+
+    def test_regroups_across_block_boundaries(self):
+        """A second split across two blocks is yielded as one batch"""
+        for prefetch_blocks in (0, 1, 2):
+            stream = self._stream(prefetch_blocks)
+            batches = list(stream)
+
+            self.assertEqual([b[0].second for b in batches], [0, 1, 2, 3])
+            self.assertEqual([len(b[1]) for b in batches], [2, 2, 1, 1])
+            self.assertEqual(len(stream), 6)
+            self.assertEqual(stream.blocks_loaded, 3)
+
+    def test_source_errors_propagate(self):
+        """Errors in the background fetch surface in the consumer"""
+        def failing_source():
+            yield [_row(0, 0)]
+            raise ConnectionError("network down")
+
+        stream = TickBatchStream(
+            block_source=failing_source,
+            row_to_tick=DataManager._raw_tick_from_row,
+            prefetch_blocks=2,
+        )
+        with self.assertRaises(RuntimeError):
+            list(stream)
+
+    def test_early_close_stops_producer(self):
+        """Closing mid-stream stops the prefetch thread"""
+        stream = self._stream(prefetch_blocks=1)
+        batches = iter(stream)
+        next(batches)
+        batches.close()
+        self.assertIsNone(stream._worker)
+
+    def test_stream_ticks_uses_block_stream(self):
+        """DataManager.stream_ticks reads query_row_block_stream"""
+        dm = DataManager(cache=None, broker_name='clickhouse')
+
+        class FakeClient:
+            def query_row_block_stream(inner_self, query):
+                self.assertIn('nse_ticks_indices', query)
+                return self._blocks()
+
+        dm.clickhouse_client = FakeClient()
+        with patch('src.storage.local_tick_store.get_local_tick_store',
+                   return_value=LocalTickStore(enabled=False)):
+            stream = dm.stream_ticks(datetime(2024, 10, 1), ['NIFTY'])
+            self.assertEqual(len(list(stream)), 4)
+
+    def _store_client(self):
+        """DataManager on a fake ClickHouse whose stream reports its column names"""
+        blocks = self._blocks
+
+        class FakeResult:
+            column_names = ('symbol', 'timestamp', 'ltp', 'ltq', 'oi')
+
+            def close(inner_self):
+                pass
+
+        class FakeStream:
+            def __init__(inner_self):
+                inner_self.source = FakeResult()
+
+            def __enter__(inner_self):
+                return iter(blocks())
+
+            def __exit__(inner_self, *exc):
+                inner_self.source.close()
+
+        class FakeClient:
+            def __init__(inner_self):
+                inner_self.queries = []
+
+            def query_row_block_stream(inner_self, query):
+                inner_self.queries.append(query)
+                return FakeStream()
+
+        dm = DataManager(cache=None, broker_name='clickhouse')
+        dm.clickhouse_client = FakeClient()
+        return dm
+
+    def _tick_store(self):
+        import shutil
+        import tempfile
+
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root, True)
+        store = LocalTickStore(root=root)
+        if not store.enabled:
+            self.skipTest("pyarrow not installed")
+        return store
+
+    def test_stream_miss_stores_streamed_blocks(self):
+        """A tick store miss stores the streamed blocks without querying ClickHouse again"""
+        store = self._tick_store()
+        dm = self._store_client()
+
+        with patch('src.storage.local_tick_store.get_local_tick_store', return_value=store):
+            stream = dm.stream_ticks(datetime(2024, 10, 1), ['NIFTY', 'BANKNIFTY'])
+            self.assertEqual(len(list(stream)), 4)
+            self.assertEqual(len(dm.clickhouse_client.queries), 1)
+
+            cached = store.get_cached('nse_ticks_indices', datetime(2024, 10, 1), 'raw', ['NIFTY'])
+            self.assertEqual(len(cached), 6)
+            self.assertEqual(list(cached.columns), ['symbol', 'timestamp', 'ltp', 'ltq', 'oi'])
+            # No rows for BANKNIFTY: stored as a known-empty slice
+            self.assertEqual(len(store.get_cached('nse_ticks_indices', datetime(2024, 10, 1), 'raw', ['BANKNIFTY'])), 0)
+
+            # Next replay of the day streams from the store
+            dm.clickhouse_client = None
+            replayed = list(dm.stream_ticks(datetime(2024, 10, 1), ['NIFTY']))
+            self.assertEqual([len(batch) for _, batch in replayed], [2, 2, 1, 1])
+
+    def test_closed_stream_leaves_store_untouched(self):
+        """A stream closed before its last block stores nothing"""
+        store = self._tick_store()
+        dm = self._store_client()
+
+        with patch('src.storage.local_tick_store.get_local_tick_store', return_value=store):
+            batches = iter(dm.stream_ticks(datetime(2024, 10, 1), ['NIFTY'], prefetch_blocks=0))
+            next(batches)
+            batches.close()
+
+        self.assertIsNone(store.get_cached('nse_ticks_indices', datetime(2024, 10, 1), 'raw', ['NIFTY']))
+        self.assertEqual(list(store.root.rglob('*.tmp.*')), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+"""Test suite for the slot-backed UnifiedLTPStore and its dict-shaped views"""
+
+import unittest
+from datetime import datetime
+
+from src.backtesting.data_manager import DataManager
+from src.core.cache_manager import CacheManager
+from src.core.centralized_tick_processor import CentralizedTickProcessor
+from src.core.gps import GlobalPositionStore
+from src.core.shared_data_cache import SharedDataCache
+from src.core.unified_ltp_store import UnifiedLTPStore, from_epoch_us, to_epoch_us
+
+OPTION = 'NIFTY:2024-10-03:OPT:25950:CE'
+
+
+class TestUnifiedLTPStore(unittest.TestCase):
+    """Slots, growth and views"""
+
+    def test_update_and_dict_access(self):
+        store = UnifiedLTPStore()
+        timestamp = datetime(2024, 10, 1, 9, 15, 1, 250000)
+        store.update('NIFTY', 25000.5, timestamp, volume=10, oi=5, source='ws')
+
+        self.assertEqual(store.get_ltp('NIFTY'), 25000.5)
+        self.assertEqual(store['NIFTY'], {'ltp': 25000.5, 'timestamp': timestamp, 'volume': 10, 'oi': 5,
+                                          'source': 'ws'})
+        self.assertIn('NIFTY', store)
+        self.assertIsNone(store.get('BANKNIFTY'))
+        with self.assertRaises(ValueError):
+            store.update('NIFTY', -1)
+
+    def test_grows_past_capacity(self):
+        store = UnifiedLTPStore(capacity=2)
+        for i in range(5):
+            store.set(f'S{i}', float(i), datetime(2024, 10, 1, 9, 15, i))
+        self.assertEqual(len(store), 5)
+        self.assertEqual([store.get_ltp(f'S{i}') for i in range(5)], [0.0, 1.0, 2.0, 3.0, 4.0])
+        self.assertEqual(store.get_tick_data('S0')['timestamp'], datetime(2024, 10, 1, 9, 15, 0))
+
+    def test_set_reports_price_changes(self):
+        store = UnifiedLTPStore()
+        self.assertTrue(store.set('NIFTY', 100.0))
+        self.assertFalse(store.set('NIFTY', 100.0))
+        self.assertTrue(store.set('NIFTY', 101.0))
+        store.set('NIFTY', None)
+        self.assertIsNone(store.get_ltp('NIFTY'))
+
+    def test_views(self):
+        store = UnifiedLTPStore()
+        store.set('NIFTY', 25000.0, datetime(2024, 10, 1, 9, 15, 1), 3, 0)
+        prices = store.prices
+        records = store.records(timestamp_format='string')
+
+        self.assertEqual(dict(prices), {'NIFTY': 25000.0})
+        self.assertEqual(records['NIFTY'], {'ltp': 25000.0, 'timestamp': '2024-10-01 09:15:01.000000',
+                                            'volume': 3, 'oi': 0})
+        prices[OPTION] = 120.0
+        records['BANKNIFTY'] = {'ltp': 51000.0, 'timestamp': '2024-10-01 09:15:02.000000'}
+        self.assertEqual(store.get_ltp(OPTION), 120.0)
+        self.assertEqual(list(records), ['NIFTY', OPTION, 'BANKNIFTY'])
+        self.assertEqual(records['BANKNIFTY']['timestamp'], '2024-10-01 09:15:02.000000')
+
+    def test_epoch_round_trip(self):
+        timestamp = datetime(2024, 10, 1, 9, 15, 1, 123456)
+        self.assertEqual(from_epoch_us(to_epoch_us(timestamp)), timestamp)
+        self.assertEqual(from_epoch_us(to_epoch_us('2024-10-01 09:15:01.123456')), timestamp)
+        self.assertIsNone(from_epoch_us(to_epoch_us(None)))
+
+
+class TestSingleStore(unittest.TestCase):
+    """DataManager, SharedDataCache and the tick processor share one store"""
+
+    def test_one_write_serves_every_reader(self):
+        shared_cache = SharedDataCache()
+        dm = DataManager(cache=None, broker_name='clickhouse', shared_cache=shared_cache)
+        timestamp = datetime(2024, 10, 1, 9, 15, 1)
+        dm.process_tick({'symbol': OPTION, 'ltp': 120.0, 'timestamp': timestamp, 'volume': 0, 'oi': 7})
+
+        self.assertIs(dm.ltp_slots, shared_cache.ltp_slots)
+        self.assertEqual(dm.ltp[OPTION], 120.0)
+        self.assertEqual(dm.ltp_store[OPTION], {'ltp': 120.0, 'timestamp': '2024-10-01 09:15:01.000000',
+                                                'volume': 0, 'oi': 7})
+        self.assertEqual(shared_cache.get_ltp_with_timestamp(OPTION), (120.0, timestamp))
+        self.assertIs(dm.get_context()['ltp_store'], dm.ltp_store)
+
+    def test_processor_does_not_rewrite_shared_store(self):
+        dm = DataManager(cache=None, broker_name='clickhouse')
+        processor = CentralizedTickProcessor(CacheManager(), thread_safe=False, data_manager=dm)
+        dm.process_tick({'symbol': OPTION, 'ltp': 120.0, 'timestamp': datetime(2024, 10, 1, 9, 15, 1)})
+        processor.on_tick({'symbol': OPTION, 'ltp': 120.0, 'timestamp': datetime(2024, 10, 1, 9, 15, 59)})
+
+        self.assertIs(processor.ltp_store, dm.ltp_slots)
+        self.assertEqual(dm.ltp_slots.get_tick_data(OPTION)['timestamp'], datetime(2024, 10, 1, 9, 15, 1))
+
+
+class TestPositionRepricing(unittest.TestCase):
+    """GPS reprices open positions by direct instrument lookup"""
+
+    def test_lookup_by_instrument_and_legacy_role_key(self):
+        gps = GlobalPositionStore()
+        gps.add_position('p1', {'price': 100, 'quantity': 50, 'side': 'buy', 'instrument': OPTION},
+                         tick_time=datetime(2024, 10, 1, 9, 15))
+        store = UnifiedLTPStore()
+        store.set(OPTION, 110.0)
+        store.set('NIFTY', 25000.0)
+
+        gps.update_position_prices(store.records(timestamp_format='string'))
+        self.assertEqual(gps.get_position('p1')['current_price'], 110.0)
+        self.assertEqual(gps.get_position('p1')['unrealized_pnl'], 500.0)
+
+        gps.update_position_prices({'ltp_TI': {'ltp': 90, 'symbol': 'NIFTY'}})
+        self.assertEqual(gps.get_position('p1')['current_price'], 90)
+
+
+if __name__ == '__main__':
+    unittest.main()